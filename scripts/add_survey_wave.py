@@ -13,6 +13,11 @@ than no wave at all.
 Re-submitting a wave with an existing label replaces it, so a correction is
 just a second submission.
 
+Each wave is stored with its 95% intervals (survey.intervals) alongside the
+counts, so the results page draws error bars from data/survey.json alone.
+Raw response exports come in through ingest_survey_csv.py, which tallies them
+and records the wave here.
+
     python3 scripts/add_survey_wave.py '<json>'
 """
 
@@ -80,15 +85,23 @@ def add_wave(payload):
         print(f"  Survey wave rejected: {problem}")
         return False
 
+    try:
+        from survey import intervals
+        wave["ci"] = {qid: intervals(counts) for qid, counts in wave["results"].items()
+                      if sum(counts.values())}
+    except Exception as e:
+        print(f"  survey intervals skipped ({e})")
+
     waves = [w for w in cfg.get("waves", []) if w.get("label") != wave["label"]]
     replaced = len(waves) != len(cfg.get("waves", []))
     waves.append(wave)
     waves.sort(key=lambda w: w.get("date", ""))
     cfg["waves"] = waves
 
-    with open(CONFIG, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    # survey.json is the only copy of the results; a half-written one loses
+    # every wave, not just this one.
+    from atomic_write import write_text
+    write_text(CONFIG, json.dumps(cfg, indent=2, ensure_ascii=False) + "\n", fsync_dir=True)
 
     verb = "replaced" if replaced else "recorded"
     print(f"  Survey wave {verb}: {wave['label']} (n={wave['n']}). "
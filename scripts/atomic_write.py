@@ -0,0 +1,289 @@
+"""
+atomic_write.py
+Every generated file is written through here: the issue pages, latest.html, the
+blog index and archive pages, the feeds, the pillar and survey pages, the search
+and entity indexes, the sitemaps, and the small JSON state files beside them.
+
+Most of those used to be open(path, "w"). That truncates the file first and
+fills it second, so a run killed in between (a cancelled workflow, a runner
+out of disk, Ctrl-C during a backfill) left a half-written feed.xml or an
+empty sitemap-posts.xml behind, and a crawler fetched it before anyone
+noticed. generate-blog.py at least fsynced the post and latest.html, but it
+still wrote them in place. Three modules had grown their own "write beside it
+and rename" helper (data_export, section_patch, search_index's compare-first
+writer) and nothing else used any of them.
+
+write_text(path, text) writes a temp file in the same directory, fsyncs it and
+renames it over the target, so readers see the old file or the new one and
+never a mix. If the target already holds exactly these bytes (sha1 of both),
+nothing is written and the file keeps its mtime, its git history and its
+browser cache entry. fsync_dir=True also fsyncs the directory, so the rename
+itself survives a power cut, not just the bytes.
+
+publish() makes a set of writes one transaction:
+
+    with publish():
+        write_text("blog/feed.xml", feed)
+        write_text("sitemap-posts.xml", sitemap)
+
+Inside the block every write is staged to its temp file and nothing is
+renamed. Leaving the block normally renames them all, in the order they were
+written, and fsyncs each directory once; an exception removes the temps and
+leaves every target as it was. The renames are separate system calls, so a
+crash during that last step can still leave some swapped and some not, but the
+window is the renames, not the minutes of rendering before them. State
+manifests are written after the pages they describe, so a partial swap leaves
+the next run with work to redo rather than work it thinks is done.
+
+Code that reads back what it wrote earlier in the same publish (the sitemap
+hashes every page, related_issues reads the search index) goes through
+read_text / exists / listdir, which see the staged files. Staging belongs to
+the thread that opened publish(), so the Gemini threads' usage ledgers are
+never held back by a render on the main thread. A publish() inside another
+joins the outer one.
+"""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+
+_txn = threading.local()          # .staged: {path: temp path, or None to remove}
+
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _staged():
+    return getattr(_txn, "staged", None)
+
+
+def _key(path):
+    return os.path.normpath(path)
+
+
+def _digest_file(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def _current(path):
+    """sha1 of what `path` holds as far as this publish can see, or None."""
+    staged = _staged()
+    src = path
+    if staged is not None and _key(path) in staged:
+        src = staged[_key(path)]
+        if src is None:
+            return None
+    try:
+        return _digest_file(src)
+    except OSError:
+        return None
+
+
+def _temp(path):
+    """(fd, name) of a new temp file beside `path`, with the target's mode."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.",
+                               suffix=".tmp")
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+    os.chmod(tmp, mode)
+    return fd, tmp
+
+
+def _discard(tmp):
+    try:
+        os.remove(tmp)
+    except OSError:
+        pass
+
+
+def fsync_dir(directory):
+    """Make a rename in `directory` durable. Quietly does nothing where
+    directories cannot be opened (Windows)."""
+    try:
+        fd = os.open(directory or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _place(path, tmp, sync_dir):
+    staged = _staged()
+    if staged is not None:
+        old = staged.pop(_key(path), None)
+        if old:
+            _discard(old)
+        staged[_key(path)] = tmp
+        return True
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        _discard(tmp)
+        raise
+    if sync_dir:
+        fsync_dir(os.path.dirname(path))
+    return True
+
+
+def write_bytes(path, data, fsync_dir=False):
+    """Atomically replace `path` with `data`. Returns True if it was written,
+    False if it already held these bytes."""
+    if _current(path) == hashlib.sha1(data).digest():
+        return False
+    fd, tmp = _temp(path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        _discard(tmp)
+        raise
+    return _place(path, tmp, fsync_dir)
+
+
+def write_text(path, text, fsync_dir=False):
+    return write_bytes(path, text.encode("utf-8"), fsync_dir)
+
+
+def write_stream(path, write, newline=None, fsync_dir=False):
+    """Call write(f) on a text-mode temp file, then place it like write_text.
+    For output too large to build as one string first."""
+    fd, tmp = _temp(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline=newline) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        if _current(path) == _digest_file(tmp):
+            _discard(tmp)
+            return False
+    except BaseException:
+        _discard(tmp)
+        raise
+    return _place(path, tmp, fsync_dir)
+
+
+def remove(path):
+    """Delete `path`, or stage its deletion inside publish(). Returns True if
+    there was something to delete."""
+    staged = _staged()
+    if staged is not None:
+        old = staged.pop(_key(path), None)
+        if old:
+            _discard(old)
+        if old or os.path.exists(path):
+            staged[_key(path)] = None
+            return True
+        return False
+    if not os.path.exists(path):
+        return False
+    os.remove(path)
+    return True
+
+
+def read_text(path):
+    """The contents of `path` as this publish has left it so far."""
+    staged = _staged()
+    src = path
+    if staged is not None and _key(path) in staged:
+        src = staged[_key(path)]
+        if src is None:
+            raise FileNotFoundError(path)
+    with open(src, encoding="utf-8") as f:
+        return f.read()
+
+
+def exists(path):
+    staged = _staged()
+    if staged is not None and _key(path) in staged:
+        return staged[_key(path)] is not None
+    return os.path.exists(path)
+
+
+def getsize(path):
+    staged = _staged()
+    if staged is not None and staged.get(_key(path)):
+        return os.path.getsize(staged[_key(path)])
+    return os.path.getsize(path)
+
+
+def source(path):
+    """The file that holds `path` as this publish has left it so far: its
+    staged temp, `path` itself, or None if the publish removes it. For code
+    that needs to stat what it is about to read."""
+    staged = _staged()
+    if staged is not None and _key(path) in staged:
+        return staged[_key(path)]
+    return path
+
+
+def pending(directory):
+    """((name, True if written / False if removed), ...) staged in `directory`
+    by this publish; () outside one. A staged removal does not touch the
+    directory's mtime, so a listing cached on mtime alone would miss it."""
+    return tuple(sorted((os.path.basename(path), tmp is not None)
+                        for path, tmp in (_staged() or {}).items()
+                        if os.path.dirname(path) == _key(directory)))
+
+
+def listdir(directory):
+    """os.listdir with this publish's staged writes and removals applied, and
+    without the temp files themselves."""
+    try:
+        names = {n for n in os.listdir(directory)
+                 if not (n.startswith(".") and n.endswith(".tmp"))}
+    except OSError:
+        names = set()
+    for name, written in pending(directory):
+        (names.add if written else names.discard)(name)
+    return sorted(names)
+
+
+@contextlib.contextmanager
+def publish():
+    """Stage every write in the block; swap them all in when it ends cleanly,
+    drop them all if it raises."""
+    if _staged() is not None:
+        yield
+        return
+    _txn.staged = {}
+    try:
+        yield
+    except BaseException:
+        staged, _txn.staged = _txn.staged, None
+        for tmp in staged.values():
+            if tmp:
+                _discard(tmp)
+        raise
+    staged, _txn.staged = _txn.staged, None
+    directories = set()
+    items = list(staged.items())
+    try:
+        for i, (path, tmp) in enumerate(items):
+            if tmp:
+                os.replace(tmp, path)
+            elif os.path.exists(path):
+                os.remove(path)
+            directories.add(os.path.dirname(path))
+    except BaseException:
+        for _, tmp in items[i:]:
+            if tmp and os.path.exists(tmp):
+                _discard(tmp)
+        raise
+    for directory in sorted(directories):
+        fsync_dir(directory)
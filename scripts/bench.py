@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+"""
+bench.py
+The benchmark suite, with a committed baseline and a regression gate.
+
+bench_parse.py and bench_render.py answer "how fast is this?" for one stage
+at a time, when someone thinks to run them. Nothing answered "is this slower
+than it was?", so a pathological regex in parser.py, or a loop in
+deduplicate_spotlight_against_developments that turned quadratic, would land
+without anyone noticing, and the first sign would be a monthly run that took
+longer than usual for no reason anyone could name.
+
+This runs every stage the monthly run and a publish go through, entirely
+offline, and compares each timing with data/bench/baseline.json:
+
+  parse.*       parser.parse_issue and parse_structured_issue on every
+                recording; parse_sections alone; each of parse_developments'
+                three strategies (dated lines, numbered list, line fallback)
+                on the recordings' developments rewritten into that shape;
+                the Spotlight/developments dedupe at the issue's own size and
+                at eight times it
+  sources.*     the citation classifiers in utils (acceptable, low quality,
+                recognised, documentation, newsroom, newswire) over every
+                source the recordings cite plus a fixed list of hard cases,
+                and parser._extract_source_from_text over every development
+  render.*      create_html_blog_post (social card off) and render_page
+  og_image      one social card, written to a temp directory
+  archive.N.*   update_blog_index (cold, then again with nothing changed),
+                the feeds, the pillar page and the sitemap, over a synthetic
+                archive of N issues rendered from the recordings (one per
+                month, as the real archive is)
+
+Fixtures are the raw model outputs in data/bench/recorded/, named as
+generate-blog.py --record names them (bench_parse.py and bench_render.py read
+the same files). The first set was rebuilt from the staged August 2026 drafts
+— structured JSON from the page, text from that JSON — because no raw
+recording had been kept; a real one from --record data/bench/recorded belongs
+beside them. Adding or removing a fixture changes what the parse and render
+timings measure, so save a new baseline in the same commit.
+
+Each benchmark is run once untimed, then a number of times, and its fastest
+run kept. Not the median: on a shared runner the noise is all one way (another
+process took the core, the cache was cold), so the minimum is the number that
+moves when the code does and not when the machine is busy. A first version
+kept the median, and an unchanged tree "regressed" a dozen benchmarks by
+30-100% against its own baseline.
+
+Every number also depends on the machine, so a fixed pure-Python workload
+("calibrate") is timed just before each run, its fastest time kept the same
+way, and the benchmark is scaled by the ratio of that to the baseline's
+calibration before comparing: a runner twice as slow doubles both. Timing it
+once for the whole suite was not enough; the same runner's speed drifts by a
+third within a minute. The two minimums are taken separately. A first
+version kept the repeat with the best benchmark/calibration ratio, which
+favours exactly the repeats whose calibration was inflated by a stall (17 ms
+against a usual 8), so the baseline's calibrations came out high and an
+unchanged tree failed --compare. A benchmark regresses
+when, after scaling, it is more than --threshold (default 30%) slower than
+its baseline AND more than FLOOR_MS slower, so timer noise on a
+one-millisecond benchmark does not fail the gate. Anything that fails is
+timed a second time and keeps the better result, since a slow stretch on the
+runner is rarely slow twice. New benchmarks are reported and never fail; the
+baseline simply does not know them yet.
+
+benchmarks.yml runs --compare on every pull request that touches scripts/ and
+uploads the run, in the baseline's format, as an artifact. A change that is
+meant to be slower (a new editorial check, say) commits that file, or a fresh
+--save, as data/bench/baseline.json alongside it.
+
+    python3 scripts/bench.py                      # run and print
+    python3 scripts/bench.py --compare            # exit 1 on any regression
+    python3 scripts/bench.py --save               # write a new baseline
+    python3 scripts/bench.py --only 'parse.*' --compare
+    python3 scripts/bench.py --quick              # smallest archive only
+
+Exit codes: 0 when nothing regressed (or nothing was compared), 1 on a
+regression, 2 when there are no fixtures.
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import gc
+import glob
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+sys.path.insert(0, os.path.join(os.getcwd(), 'scripts'))
+
+from bench_parse import _coverage_date
+
+ROOT = os.path.dirname(_here)
+FIXTURE_DIR = os.path.join("data", "bench", "recorded")
+BASELINE = os.path.join("data", "bench", "baseline.json")
+
+# Archive sizes for the index, feed, pillar and sitemap builders: a year, four
+# years, and eight. The real archive is at the first; the third is where an
+# accidental O(n^2) stops hiding in the noise.
+ARCHIVE_SIZES = (12, 48, 96)
+
+THRESHOLD = 0.30
+FLOOR_MS = 0.5
+
+# Timed runs per benchmark, the fastest kept. The archive builders take
+# seconds at the largest size, so they get fewer.
+REPEAT = 15
+ARCHIVE_REPEAT = 5
+ARCHIVE_BUILDERS = ("index", "index_warm", "feeds", "pillar", "sitemap")
+
+# Citations that have each tripped one of the classifiers, for the sources.*
+# benchmarks on top of whatever the fixtures cite.
+HARD_SOURCES = (
+    "Reuters", "The Globe and Mail", "BetaKit", "CBC News", "Financial Post",
+    "OpenAI Help Center", "Google Cloud Documentation", "Microsoft Learn",
+    "NVIDIA Newsroom", "Shopify News", "CNW Group", "GlobeNewswire",
+    "PR Newswire", "Business Wire", "Medium", "LinkedIn", "YouTube",
+    "AI NEWS: Week of July 14", "Substack", "Reddit", "Government of Canada",
+    "Innovation, Science and Economic Development Canada", "Statistics Canada",
+    "BDC", "Deloitte Canada", "KPMG", "helloDarwin", "The Logic",
+    "Bloomberg", "TechCrunch", "The Verge", "VentureBeat", "", "Source",
+    "various reports", "company press release", "OSFI", "Bank of Canada",
+)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+def load_fixtures(directory=FIXTURE_DIR):
+    """[{"path", "name", "mode", "raw", "coverage", "today"}] for every
+    recording in `directory`, text and structured, in name order."""
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.txt")) +
+                       glob.glob(os.path.join(directory, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            raw = f.read()
+        coverage, today = _coverage_date(path)
+        fixtures.append({"path": path, "name": os.path.basename(path),
+                         "mode": "structured" if path.endswith(".json") else "text",
+                         "raw": raw, "coverage": coverage, "today": today})
+    return fixtures
+
+
+def _quiet():
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def _parsed(fixtures):
+    """[(fixture, issue, content)] for every fixture that parses."""
+    from parser import issue_text, parse_issue, parse_structured_issue
+    out = []
+    with _quiet():
+        for fx in fixtures:
+            if fx["mode"] == "structured":
+                issue = parse_structured_issue(fx["raw"], fx["coverage"], fx["today"])
+                content = issue_text(issue) if issue else ""
+            else:
+                issue, content = parse_issue(fx["raw"], fx["coverage"], fx["today"]), fx["raw"]
+            if issue:
+                out.append((fx, issue, content))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks. Each is {"name", "run", "setup", "teardown", "repeat"}: setup()
+# (untimed) returns what run() takes, teardown(state) cleans up after it.
+# ---------------------------------------------------------------------------
+def _case(name, run, setup=None, teardown=None, repeat=REPEAT):
+    return {"name": name, "run": run, "setup": setup, "teardown": teardown, "repeat": repeat}
+
+
+def _calibrate():
+    """A fixed pure-Python workload: string building, a regex pass, a sort and
+    a JSON round trip, in roughly the proportions the pipeline has them."""
+    words = [f"w{(i * 7919) % 10007}" for i in range(5000)]
+    text = " ".join(words)
+    found = re.findall(r"w(\d+)7\b", text)
+    ordered = sorted(words, key=lambda w: (len(w), w))
+    json.loads(json.dumps({"words": ordered, "found": found}))
+
+
+def _dev_variants(parsed):
+    """The recordings' developments, rewritten in the shape each of
+    parse_developments' strategies reads: "July 9: OpenAI — ..." lines,
+    a numbered list, and undated "July: OpenAI — ..." lines that only the
+    line-by-line fallback accepts."""
+    dated, numbered, lines = [], [], []
+    for fx, issue, _ in parsed:
+        text = issue["sections"].get("KEY AI DEVELOPMENTS", "")
+        dated.append((text, fx))
+        rows = [l for l in text.split("\n") if l.strip()]
+        numbered.append(("\n".join(f"{i}. {row}" for i, row in enumerate(rows, 1)), fx))
+        lines.append(("\n".join(re.sub(r"^([A-Z][a-z]+)\.?\s+\d{1,2}(?:st|nd|rd|th)?", r"\1", row)
+                                for row in rows), fx))
+    return {"dated": dated, "numbered": numbered, "lines": lines}
+
+
+def _scaled(items, times, key):
+    """`items` repeated `times` over, each copy's `key` field made distinct so
+    nothing collapses as a duplicate."""
+    out = []
+    for n in range(times):
+        for item in items:
+            copy = dict(item)
+            copy[key] = f"{copy.get(key, '')} {n}".strip()
+            out.append(copy)
+    return out
+
+
+def parse_cases(fixtures):
+    from parser import (_extract_source_from_text, deduplicate_spotlight_against_developments,
+                        parse_developments, parse_issue, parse_sections, parse_structured_issue)
+    parsed = _parsed(fixtures)
+    cases = []
+
+    for mode, parse in (("text", parse_issue), ("structured", parse_structured_issue)):
+        mine = [fx for fx in fixtures if fx["mode"] == mode]
+        if mine:
+            cases.append(_case(f"parse.{mode}", lambda mine=mine, parse=parse: [
+                parse(fx["raw"], fx["coverage"], fx["today"]) for fx in mine]))
+
+    texts = [fx["raw"] for fx in fixtures if fx["mode"] == "text"]
+    if texts:
+        cases.append(_case("parse.sections", lambda: [parse_sections(t) for t in texts]))
+
+    for strategy, rows in _dev_variants(parsed).items():
+        cases.append(_case(f"parse.developments.{strategy}", lambda rows=rows: [
+            parse_developments(text, fx["coverage"], fx["today"]) for text, fx in rows]))
+
+    pairs = [(issue["spotlight"], issue["developments"]) for _, issue, _ in parsed]
+    big = [(_scaled(sp, 8, "org"), _scaled(dev, 8, "company")) for sp, dev in pairs]
+    cases.append(_case("parse.dedupe", lambda: [
+        deduplicate_spotlight_against_developments(list(sp), dev) for sp, dev in pairs]))
+    cases.append(_case("parse.dedupe.x8", lambda: [
+        deduplicate_spotlight_against_developments(list(sp), dev) for sp, dev in big]))
+
+    dev_lines = [line for _, issue, _ in parsed
+                 for line in issue["sections"].get("KEY AI DEVELOPMENTS", "").split("\n") if line]
+    cases.append(_case("sources.extract", lambda: [_extract_source_from_text(l) for l in dev_lines]))
+    return cases, parsed
+
+
+def source_cases(parsed):
+    from utils import (is_acceptable_source, is_documentation_source, is_first_party_newsroom,
+                       is_low_quality_source, is_newswire, is_recognised_publication)
+    cited = []
+    for _, issue, _ in parsed:
+        for key, subject in (("developments", "company"), ("spotlight", "org"), ("adoption", None)):
+            for item in issue[key]:
+                cited.append((item.get("source_name") or "", item.get(subject) or "" if subject else ""))
+    cited += [(name, "") for name in HARD_SOURCES]
+
+    def classify():
+        for name, subject in cited:
+            is_acceptable_source(name, subject)
+            is_low_quality_source(name)
+            is_recognised_publication(name)
+            is_documentation_source(name)
+            is_first_party_newsroom(name)
+            is_newswire(name)
+
+    return [_case("sources.classify", classify)]
+
+
+def render_cases(parsed):
+    from page_template import post_page
+    from parser import extract_title_and_excerpt
+    from renderer import create_html_blog_post, issue_parts, page_values, render_page
+    from utils import get_issue_labels
+
+    post_page()     # compile once, outside every timing
+    issues = []
+    with _quiet():
+        for fx, issue, content in parsed:
+            if fx["mode"] != "text":
+                continue
+            labels = get_issue_labels(fx["coverage"])
+            title, excerpt = extract_title_and_excerpt(
+                content, labels["issue_month_year"], labels["coverage_month_name"])
+            page = page_values(content, title, excerpt, fx["coverage"])
+            issues.append((fx, issue, content, title, excerpt, issue_parts(issue), page))
+    if not issues:
+        return []
+    return [
+        _case("render.full", lambda: [
+            create_html_blog_post(content, title, excerpt, coverage_date=fx["coverage"],
+                                  issue=issue, og_card=False)
+            for fx, issue, content, title, excerpt, _, _ in issues]),
+        _case("render.page", lambda: [render_page(parts, page)
+                                      for *_, parts, page in issues]),
+    ]
+
+
+def og_cases():
+    try:
+        from og_image import _font, build_og_image
+        _font(40)
+    except Exception as e:
+        print(f"  NOTE: og_image skipped ({e})")
+        return []
+
+    def setup():
+        return tempfile.mkdtemp(prefix="bench-og-")
+
+    return [_case("og_image", lambda d: build_og_image(os.path.join(d, "card.jpg"), "August 2026"),
+                  setup=setup, teardown=lambda d: shutil.rmtree(d, ignore_errors=True))]
+
+
+def _month_end(month):
+    nxt = month.replace(year=month.year + 1, month=1) if month.month == 12 \
+        else month.replace(month=month.month + 1)
+    return nxt - timedelta(days=1)
+
+
+def build_archive(parsed, size, dest):
+    """Render `size` issues into dest/blog/posts, one per month back from the
+    newest fixture's, cycling through the recordings: the same archive shape
+    update_blog_index walks, without the site's own posts."""
+    from parser import extract_title_and_excerpt
+    from renderer import issue_parts, page_values, render_page
+    from utils import get_issue_labels
+
+    texts = [(fx, issue, content) for fx, issue, content in parsed if fx["mode"] == "text"]
+    posts = os.path.join(dest, "blog", "posts")
+    os.makedirs(posts, exist_ok=True)
+    os.makedirs(os.path.join(dest, "data"), exist_ok=True)
+    month = max(fx["coverage"] for fx, _, _ in texts)
+    with _quiet():
+        for n in range(size):
+            fx, issue, content = texts[n % len(texts)]
+            labels = get_issue_labels(month)
+            title, excerpt = extract_title_and_excerpt(
+                content, labels["issue_month_year"], labels["coverage_month_name"])
+            page = page_values(content, title, excerpt, month, published=_month_end(month))
+            with open(os.path.join(posts, f"{page['iso_date']}-{page['slug']}.html"),
+                      "w", encoding="utf-8") as f:
+                f.write(render_page(issue_parts(issue), page))
+            month = (month - timedelta(days=1)).replace(day=1)
+    return dest
+
+
+def archive_cases(parsed, sizes, workdir):
+    """update_blog_index and the builders it calls, each on a fresh copy of a
+    synthetic archive, so every run is a cold one unless it says otherwise."""
+    from blog_index import extract_post_info, update_blog_index
+    from feeds import write_feeds
+    from pillar_adoption import write_pillar
+    from post_registry import published, refresh
+    from regenerate_sitemap import regenerate_sitemap
+
+    if not any(fx["mode"] == "text" for fx, _, _ in parsed):
+        return []
+    cwd = os.getcwd()
+    cases = []
+    for size in sizes:
+        template = build_archive(parsed, size, os.path.join(workdir, f"archive-{size}"))
+
+        def setup(template=template, warm=False, posts=False):
+            root = tempfile.mkdtemp(prefix="run-", dir=workdir)
+            shutil.copytree(template, root, dirs_exist_ok=True)
+            os.chdir(root)
+            refresh()
+            state = root
+            with _quiet():
+                if warm:
+                    update_blog_index()
+                if posts:
+                    state = [extract_post_info(os.path.join("blog/posts", n))
+                             for n in published("blog/posts")]
+            return state
+
+        def teardown(_state):
+            os.chdir(cwd)
+            refresh()
+            for d in glob.glob(os.path.join(workdir, "run-*")):
+                shutil.rmtree(d, ignore_errors=True)
+
+        cases += [
+            _case(f"archive.{size}.index", lambda _: update_blog_index(),
+                  setup=setup, teardown=teardown, repeat=ARCHIVE_REPEAT),
+            _case(f"archive.{size}.index_warm", lambda _: update_blog_index(),
+                  setup=lambda s=setup: s(warm=True), teardown=teardown, repeat=ARCHIVE_REPEAT),
+            _case(f"archive.{size}.feeds", write_feeds,
+                  setup=lambda s=setup: s(posts=True), teardown=teardown, repeat=ARCHIVE_REPEAT),
+            _case(f"archive.{size}.pillar", lambda _: write_pillar(),
+                  setup=setup, teardown=teardown, repeat=ARCHIVE_REPEAT),
+            _case(f"archive.{size}.sitemap", lambda _: regenerate_sitemap(),
+                  setup=setup, teardown=teardown, repeat=ARCHIVE_REPEAT),
+        ]
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Running and comparing
+# ---------------------------------------------------------------------------
+def _timed(fn, *args):
+    gc.collect()
+    gc.disable()
+    try:
+        with _quiet():
+            start = time.perf_counter()
+            fn(*args)
+            return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def measure(case):
+    """{"ms", "calibrate_ms"} in milliseconds: case["run"]'s fastest repeat
+    and the fastest of the calibration runs, one timed just before each
+    repeat so both sample the same stretch of the machine's drifting speed.
+    Each minimum is taken on its own: choosing the repeat with the best
+    ratio picks the one whose calibration a stall happened to inflate.
+
+    One untimed run goes first (regex compiles, lru caches, imports). Setup
+    and teardown are outside the timing, and the builders' own logs are
+    silenced. The garbage collector is off while anything is timed, as timeit
+    has it: otherwise a benchmark pays for whatever the one before it left on
+    the heap."""
+    timings, calibration = [], []
+    for n in range(max(1, case["repeat"]) + 1):
+        state = case["setup"]() if case["setup"] else None
+        try:
+            if n:
+                calibration.append(_timed(_calibrate))
+            elapsed = _timed(case["run"], *(() if case["setup"] is None else (state,)))
+            if n:
+                timings.append(elapsed)
+        finally:
+            if case["teardown"]:
+                case["teardown"](state)
+    return {"ms": round(min(timings) * 1000, 3),
+            "calibrate_ms": round(min(calibration) * 1000, 3)}
+
+
+def run_suite(fixtures, sizes, only=None):
+    """{"python", "platform", "recorded", "fixtures", "results": {name:
+    {"ms", "calibrate_ms"}}}: the shape the baseline is saved in."""
+    workdir = tempfile.mkdtemp(prefix="bench-")
+    try:
+        cases, parsed = parse_cases(fixtures)
+        cases += source_cases(parsed)
+        cases += render_cases(parsed)
+        cases += og_cases()
+        wanted = [s for s in sizes if not only or any(
+            fnmatch.fnmatch(f"archive.{s}.{b}", p) for b in ARCHIVE_BUILDERS for p in only)]
+        cases += archive_cases(parsed, wanted, workdir)
+        results = {}
+        for case in cases:
+            if only and not any(fnmatch.fnmatch(case["name"], p) for p in only):
+                continue
+            results[case["name"]] = r = measure(case)
+            print(f"  {case['name']:<34} {r['ms']:10.2f} ms  (calibrate {r['calibrate_ms']:.2f} ms)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(terse=True),
+        "recorded": datetime.now().strftime("%Y-%m-%d"),
+        "fixtures": [fx["name"] for fx in fixtures],
+        "results": results,
+    }
+
+
+def load_baseline(path=BASELINE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) and isinstance(data.get("results"), dict) else None
+
+
+def compare(run, baseline, threshold=THRESHOLD, floor_ms=FLOOR_MS):
+    """[{"name", "ms", "scaled", "baseline", "change", "state"}] for every
+    benchmark in the run. state is ok, faster, REGRESSED or new. `scaled` is
+    the run's time on the baseline's machine: ms times the ratio of the
+    baseline's calibration to the one timed beside this run."""
+    rows = []
+    for name, now in run["results"].items():
+        base = baseline["results"].get(name)
+        scale = 1.0
+        if base and base.get("calibrate_ms") and now.get("calibrate_ms"):
+            scale = base["calibrate_ms"] / now["calibrate_ms"]
+        scaled = now["ms"] * scale
+        if not base:
+            rows.append({"name": name, "ms": now["ms"], "scaled": scaled, "baseline": None,
+                         "change": None, "state": "new"})
+            continue
+        was = base["ms"]
+        change = scaled / was - 1 if was else 0.0
+        if change > threshold and scaled - was > floor_ms:
+            state = "REGRESSED"
+        elif change < -threshold and was - scaled > floor_ms:
+            state = "faster"
+        else:
+            state = "ok"
+        rows.append({"name": name, "ms": now["ms"], "scaled": scaled, "baseline": was,
+                     "change": change, "state": state})
+    return rows
+
+
+def save(run, path):
+    from atomic_write import write_text
+    write_text(path, json.dumps(run, indent=1, sort_keys=True) + "\n")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--fixtures", default=os.path.join(ROOT, FIXTURE_DIR),
+                    help=f"Recorded model outputs (default {FIXTURE_DIR})")
+    ap.add_argument("--baseline", default=os.path.join(ROOT, BASELINE),
+                    help=f"Baseline to compare with or save to (default {BASELINE})")
+    ap.add_argument("--compare", action="store_true",
+                    help="Compare with the baseline; exit 1 if anything regressed")
+    ap.add_argument("--save", action="store_true",
+                    help="Write this run as the new baseline")
+    ap.add_argument("--output", metavar="PATH",
+                    help="Also write this run's results, in the baseline's format")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD,
+                    help=f"Allowed slowdown before a benchmark fails (default {THRESHOLD:.0%})")
+    ap.add_argument("--only", action="append", metavar="PATTERN",
+                    help="Run only benchmarks matching this glob; repeatable")
+    ap.add_argument("--quick", action="store_true",
+                    help=f"Only the {ARCHIVE_SIZES[0]}-issue archive")
+    args = ap.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        print(f"  No recordings in {args.fixtures}. Add some with "
+              f"generate-blog.py --record {FIXTURE_DIR} first.")
+        return 2
+
+    sizes = ARCHIVE_SIZES[:1] if args.quick else ARCHIVE_SIZES
+    print(f"Benchmarks: {len(fixtures)} recording(s), archives of {', '.join(map(str, sizes))}")
+    run = run_suite(fixtures, sizes, args.only)
+
+    if args.output:
+        save(run, args.output)
+    if args.save:
+        if args.only or args.quick:
+            # A partial run would drop every benchmark it skipped from the
+            # baseline, and the next full compare would report them as new.
+            baseline = load_baseline(args.baseline) or {"results": {}}
+            baseline["results"].update(run["results"])
+            run = dict(run, results=baseline["results"])
+        save(run, args.baseline)
+        print(f"Baseline written: {args.baseline} ({len(run['results'])} benchmarks)")
+        return 0
+    if not args.compare:
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"  NOTE: no baseline at {args.baseline}; run with --save to write one.")
+        return 0
+    rows = compare(run, baseline, args.threshold)
+    suspects = [r["name"] for r in rows if r["state"] == "REGRESSED"]
+    if suspects:
+        # One slow stretch on a shared runner can cost a benchmark all of its
+        # repeats. A real regression is slow again; noise mostly is not.
+        print(f"\n  Timing again: {', '.join(suspects)}")
+        again = run_suite(fixtures, sizes, suspects)
+        for name, now in again["results"].items():
+            old = next(r for r in rows if r["name"] == name)
+            new = compare({"results": {name: now}}, baseline, args.threshold)[0]
+            if new["scaled"] < old["scaled"]:
+                rows[rows.index(old)] = new
+    print()
+    print(f"  Against the baseline of {baseline.get('recorded', '?')} "
+          f"(Python {baseline.get('python', '?')}), scaled to its machine")
+    print(f"  {'benchmark':<34} {'now':>10} {'baseline':>10} {'change':>8}")
+    for r in rows:
+        base = f"{r['baseline']:8.2f}ms" if r["baseline"] is not None else f"{'-':>10}"
+        change = f"{r['change']:+7.0%}" if r["change"] is not None else f"{'':>7}"
+        print(f"  {r['name']:<34} {r['scaled']:8.2f}ms {base} {change}  {r['state']}")
+    missing = sorted(set(baseline["results"]) - set(run["results"]))
+    if missing and not args.only and not args.quick:
+        print(f"  Not run (in the baseline only): {', '.join(missing)}")
+
+    regressed = [r["name"] for r in rows if r["state"] == "REGRESSED"]
+    if regressed:
+        print(f"\nREGRESSED past {args.threshold:.0%}: {', '.join(regressed)}")
+        return 1
+    print(f"\nNo benchmark regressed past {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
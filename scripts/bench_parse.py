@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+bench_parse.py
+Parse time and failure rate for the two generation modes, on recorded outputs.
+
+generate-blog.py --record DIR keeps every raw model response: .txt for the
+header-delimited text mode, .json for the structured mode (--structured). This
+runs each recording through the parser its mode uses — parser.parse_issue or
+parser.parse_structured_issue — and reports, per mode:
+
+  * failures: a recording that did not load at all, or came back with any of
+    the expected sections empty (parser.ISSUE_EXPECTED — the same list the
+    renderer's MISSING SECTIONS warning is built from). An empty section is a
+    failure even though the page still renders, because the page rendering
+    without it is exactly how a missing section goes unnoticed;
+  * parse time, repeated --repeat times per file so a ~10 ms parse is not
+    measured against timer noise.
+
+Nothing is sent to Gemini. The parser's own log is silenced while timing.
+
+    python3 scripts/bench_parse.py                 # data/bench/recorded
+    python3 scripts/bench_parse.py DIR [DIR ...] [--repeat 20]
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+sys.path.insert(0, os.path.join(os.getcwd(), 'scripts'))
+
+from parser import missing_sections, parse_issue, parse_structured_issue
+
+# The committed recordings bench.py also runs on. Point --record here to add one.
+RECORD_DIR = "data/bench/recorded"
+
+
+def _coverage_date(path):
+    """Recordings are named YYYY-MM-<stamp>; the month is the coverage month.
+    The future-date filter needs it, and 'today' is pinned to the month's end
+    so a recording does not start failing as the calendar moves on."""
+    try:
+        month = datetime.strptime(os.path.basename(path)[:7], "%Y-%m")
+    except ValueError:
+        return None, None
+    nxt = month.replace(year=month.year + 1, month=1) if month.month == 12 \
+        else month.replace(month=month.month + 1)
+    return month, nxt
+
+
+def bench_file(path, repeat):
+    with open(path, encoding="utf-8") as f:
+        raw = f.read()
+    structured = path.endswith(".json")
+    coverage, today = _coverage_date(path)
+    parse = parse_structured_issue if structured else parse_issue
+
+    timings = []
+    issue = None
+    for _ in range(max(1, repeat)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            issue = parse(raw, coverage, today)
+            timings.append(time.perf_counter() - start)
+
+    gaps = ["(did not load)"] if issue is None else missing_sections(issue)
+    return {
+        "mode":    "structured" if structured else "text",
+        "file":    os.path.basename(path),
+        "ms":      statistics.median(timings) * 1000,
+        "missing": gaps,
+    }
+
+
+def summarise(rows):
+    out = {}
+    for mode in ("text", "structured"):
+        mine = [r for r in rows if r["mode"] == mode]
+        if not mine:
+            continue
+        ms = sorted(r["ms"] for r in mine)
+        failed = sum(1 for r in mine if r["missing"])
+        out[mode] = {
+            "files":        len(mine),
+            "failures":     failed,
+            "failure_rate": failed / len(mine),
+            "median_ms":    statistics.median(ms),
+            "p95_ms":       ms[min(len(ms) - 1, int(round(0.95 * (len(ms) - 1))))],
+        }
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("dirs", nargs="*", default=[RECORD_DIR])
+    ap.add_argument("--repeat", type=int, default=20,
+                    help="Parses per file; the median is reported (default 20)")
+    args = ap.parse_args()
+
+    paths = sorted(p for d in args.dirs
+                   for p in glob.glob(os.path.join(d, "*.txt")) + glob.glob(os.path.join(d, "*.json")))
+    if not paths:
+        print(f"  No recordings in {', '.join(args.dirs)}. Generate with "
+              f"--record {RECORD_DIR} (and --structured for the JSON mode) first.")
+        return 1
+
+    rows = [bench_file(p, args.repeat) for p in paths]
+    for r in rows:
+        status = "ok" if not r["missing"] else "FAIL: " + ", ".join(r["missing"])
+        print(f"  {r['mode']:<10} {r['ms']:8.2f} ms  {r['file']}  {status}")
+
+    print()
+    print(f"  {'mode':<10} {'files':>5} {'failed':>6} {'rate':>6} {'median':>9} {'p95':>9}")
+    for mode, s in summarise(rows).items():
+        print(f"  {mode:<10} {s['files']:>5} {s['failures']:>6} {s['failure_rate']:>6.0%} "
+              f"{s['median_ms']:>7.2f}ms {s['p95_ms']:>7.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
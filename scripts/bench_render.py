@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+bench_render.py
+Render time for an issue page, on recorded outputs: the full
+create_html_blog_post call against the compiled-template path a batch
+re-render uses.
+
+Each recording (generate-blog.py --record DIR, the same files bench_parse.py
+reads) is parsed once, then rendered --repeat times three ways:
+
+  full      create_html_blog_post, as the monthly run calls it — page values,
+            the editorial checks and their log, then the page. The social card
+            is skipped (og_card=False), so nothing is written.
+  page      renderer.render_page from values worked out once: the compiled
+            template plus the article blocks. This is the per-issue cost of
+            re-rendering the archive after a template change.
+  block     renderer.render_article for one block (the Desk): the cost of
+            rendering a single section without the rest of the page.
+
+The first render in a process also compiles the template; that one-off cost is
+reported separately as "compile". Nothing is sent to Gemini.
+
+    python3 scripts/bench_render.py                 # data/bench/recorded
+    python3 scripts/bench_render.py DIR [DIR ...] [--repeat 50]
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import statistics
+import sys
+import time
+
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+sys.path.insert(0, os.path.join(os.getcwd(), 'scripts'))
+
+from bench_parse import RECORD_DIR, _coverage_date
+from page_template import post_page
+from parser import extract_title_and_excerpt, issue_text, parse_issue, parse_structured_issue
+from renderer import create_html_blog_post, issue_parts, page_values, render_article, render_page
+from utils import get_issue_labels
+
+
+def _timed(fn, repeat):
+    timings = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def bench_file(path, repeat):
+    with open(path, encoding="utf-8") as f:
+        raw = f.read()
+    coverage, today = _coverage_date(path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if path.endswith(".json"):
+            issue = parse_structured_issue(raw, coverage, today)
+            content = issue_text(issue) if issue else ""
+        else:
+            issue, content = parse_issue(raw, coverage, today), raw
+    if not issue:
+        return None
+
+    labels = get_issue_labels(coverage)
+    with contextlib.redirect_stdout(io.StringIO()):
+        title, excerpt = extract_title_and_excerpt(
+            content, labels["issue_month_year"], labels["coverage_month_name"])
+        page = page_values(content, title, excerpt, coverage)
+        parts = issue_parts(issue)
+        full = _timed(lambda: create_html_blog_post(content, title, excerpt, coverage_date=coverage,
+                                                    issue=issue, og_card=False), repeat)
+        whole = _timed(lambda: render_page(parts, page), repeat)
+        block = _timed(lambda: render_article(parts, page["coverage_month_year"], only=("desk",)),
+                       repeat)
+    return {"file": os.path.basename(path), "full": full, "page": whole, "block": block,
+            "bytes": len(render_page(parts, page))}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("dirs", nargs="*", default=[RECORD_DIR])
+    ap.add_argument("--repeat", type=int, default=50,
+                    help="Renders per file and path; the median is reported (default 50)")
+    args = ap.parse_args()
+
+    paths = sorted(p for d in args.dirs
+                   for p in glob.glob(os.path.join(d, "*.txt")) + glob.glob(os.path.join(d, "*.json")))
+    if not paths:
+        print(f"  No recordings in {', '.join(args.dirs)}. Generate with "
+              f"--record {RECORD_DIR} first.")
+        return 1
+
+    post_page.cache_clear()
+    start = time.perf_counter()
+    post_page()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    rows = [r for r in (bench_file(p, args.repeat) for p in paths) if r]
+    if not rows:
+        print("  No recording parsed; nothing to render.")
+        return 1
+    print(f"  {'full':>9} {'page':>9} {'block':>9} {'kB':>6}  file")
+    for r in rows:
+        print(f"  {r['full']:7.2f}ms {r['page']:7.2f}ms {r['block']:7.2f}ms "
+              f"{r['bytes'] / 1024:6.1f}  {r['file']}")
+
+    full = statistics.median(r["full"] for r in rows)
+    page = statistics.median(r["page"] for r in rows)
+    print()
+    print(f"  compile (once per process): {compile_ms:.2f} ms")
+    print(f"  median full {full:.2f} ms, page {page:.2f} ms — {full / page:.1f}x; "
+          f"about {1000 / page:.0f} pages/s on one core for a batch re-render.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
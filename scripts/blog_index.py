@@ -1,30 +1,38 @@
 """
 blog_index.py
-Reads blog post metadata and writes the blog/index.html listing page.
+Reads blog post metadata and writes the blog/index.html listing page, the
+numbered archive pages (blog/page/<n>.html) and one page per year
+(blog/archive/<year>.html).
 """
 
 import os
 import re
 import json
+import hashlib
 from datetime import datetime
 from html import escape as escape_html
 from urllib.parse import quote
-from xml.sax.saxutils import escape as escape_xml
 from bs4 import BeautifulSoup
+from atomic_write import exists, getsize, publish, read_text, remove, write_text
+from post_registry import published
+from profiling import span
 from utils import BRAND, BRAND_SHORT, BRAND_TAGLINE, AUTHOR
 
 SITE = "https://www.imetrobert.com"
 
+# Issues per archive page. The front page lists between one and two pages'
+# worth under the latest issue; see _index_layout().
+INDEX_PAGE_SIZE = 24
+INDEX_PAGES_MANIFEST = "data/index-pages.json"
+
 
 def _permalink(post):
     """The dated URL for an issue — never latest.html.
 
-    posts[0] is read from latest.html, which is a rotating alias: the same URL
-    serves a different article every month. Sharing it produces a link that
-    silently changes what it points at, and a social preview cached against the
-    wrong article. update_blog_index() resolves the real dated file into
-    canonical_filename for exactly this reason; older entries already carry
-    their own dated filename.
+    latest.html is a rotating alias: the same URL leads to a different article
+    every month. Sharing it produces a link that silently changes what it
+    points at, and a social preview cached against the wrong article. Every
+    entry carries its own dated filename; canonical_filename, where set, wins.
     """
     return f"{SITE}/blog/posts/{post.get('canonical_filename') or post['filename']}"
 
@@ -52,23 +60,229 @@ def _share_hrefs(url, title):
     )
     return escape_html(linkedin, quote=True), escape_html(mailto, quote=True)
 
-# Noindex redirect stubs / superseded drafts — must stay excluded from the
-# index the same way regenerate_sitemap.py excludes them from the sitemap.
-# Kept as a separate literal list (not shared code) because these two
-# scripts run independently in different workflow steps.
-EXCLUDE_STUBS = {
-    "2025-10-01-key-ai-developments-this-month.html",
-    "2026-03-26-march-1-2026-openai-announces-gpt5-boasting-enhanced-reasoning-and-multimodal-capabilities.html",
-    "2026-03-27-ai-insights-for-march-2026.html",
-    "2026-05-30-ai-insights-for-may-2026.html",
-}
+# Page furniture shared by the front page and the archive pages. Kept out of
+# the f-strings so the braces are single and every page carries the same
+# stylesheet, icons and share behaviour.
+_INDEX_STYLE = """\
+    <style>
+        body { font-family: Inter, sans-serif; background: linear-gradient(160deg, #f0f4ff 0%, #e8eef8 100%); margin: 0; padding: 0; }
+        .container { max-width: 900px; margin: 0 auto; padding: 2rem 1.5rem; }
+        header { background: linear-gradient(135deg, #2563eb 0%, #1a7fb5 50%, #06b6d4 100%); color: white; padding: 4rem 0; text-align: center; margin-bottom: 2.5rem; border-radius: 20px; }
+        h1 { font-size: 2.8rem; font-weight: 800; margin-bottom: 0.5rem; letter-spacing: -0.02em; }
+        .nav-bar { background: white; padding: 1rem 0; box-shadow: 0 1px 3px rgb(0 0 0 / 0.08); position: sticky; top: 0; z-index: 100; border-bottom: 1px solid #e2e8f0; }
+        .nav-content { max-width: 900px; margin: 0 auto; padding: 0 1.5rem; display: flex; flex-wrap: wrap; align-items: center; justify-content: flex-start; gap: 0.6rem; }
+        .nav-brand { display: flex; align-items: center; gap: 0.5rem; text-decoration: none; margin-right: auto; }
+        .nav-brand img { width: 28px; height: 28px; border-radius: 9px; }
+        .nav-brand span { font-weight: 800; font-size: 0.9rem; color: #0f172a; letter-spacing: -0.01em; }
+        .brand-logo { width: 76px; height: 76px; display: block; margin: 0 auto 1.25rem; padding: 7px; box-sizing: content-box; background: rgba(255,255,255,0.96); border-radius: 23px; box-shadow: 0 10px 26px rgba(15,23,42,0.25); }
+        .nav-link { color: white; text-decoration: none; font-weight: 600; padding: 0.4rem 1rem; font-size: 0.8rem; border-radius: 20px; background: linear-gradient(135deg, #2563eb, #06b6d4); }
+        .latest-post-section { background: linear-gradient(135deg, #2563eb 0%, #1a7fb5 50%, #06b6d4 100%); color: white; padding: 2.5rem; border-radius: 20px; margin-bottom: 2rem; box-shadow: 0 8px 32px rgb(37 99 235 / 0.2); }
+        .latest-badge { background: rgba(255,255,255,0.2); color: white; padding: 0.3rem 0.9rem; border-radius: 20px; display: inline-block; margin-bottom: 1rem; font-size: 0.7rem; font-weight: 700; text-transform: uppercase; letter-spacing: 0.08em; }
+        .latest-post-title { font-size: 1.7rem; font-weight: 800; margin-bottom: 0.875rem; letter-spacing: -0.01em; }
+        .read-latest-btn { background: rgba(255,255,255,0.2); color: white; border: 1px solid rgba(255,255,255,0.35); padding: 0.65rem 1.5rem; border-radius: 25px; text-decoration: none; display: inline-block; transition: all 0.25s; font-weight: 600; font-size: 0.875rem; }
+        .read-latest-btn:hover { background: rgba(255,255,255,0.3); transform: translateY(-2px); }
+        .older-posts-section { background: white; border-radius: 20px; padding: 2rem; box-shadow: 0 4px 16px rgb(0 0 0 / 0.06); border: 1px solid #e2e8f0; }
+        .older-posts-title { font-size: 0.8rem; font-weight: 700; margin-bottom: 1.25rem; color: #94a3b8; text-transform: uppercase; letter-spacing: 0.05em; }
+        .older-post-item { border: 1px solid #f1f5f9; border-radius: 12px; margin-bottom: 0.65rem; transition: all 0.2s; }
+        .older-post-item:hover { border-color: #2563eb; box-shadow: 0 4px 12px rgb(37 99 235 / 0.08); }
+        .older-post-link { display: block; padding: 1rem 1.25rem; text-decoration: none; color: inherit; }
+        .older-post-title { font-size: 0.95rem; font-weight: 600; color: #2563eb; margin-bottom: 0.25rem; }
+        .older-post-date { font-size: 0.78rem; color: #94a3b8; }
+        .no-posts-message { text-align: center; padding: 2rem; color: #94a3b8; }
+        /* Pager and year links under the archive list. */
+        .pager { display: flex; flex-wrap: wrap; justify-content: space-between; align-items: center; gap: 0.75rem; margin-top: 1.5rem; font-size: 0.85rem; }
+        .pager a { color: #2563eb; font-weight: 600; text-decoration: none; }
+        .pager a:hover { text-decoration: underline; }
+        .year-links { display: flex; flex-wrap: wrap; align-items: center; gap: 0.4rem; color: #94a3b8; }
+        .year-links a { padding: 0.2rem 0.75rem; border: 1px solid #e2e8f0; border-radius: 20px; background: white; }
+        .archive-header { padding: 2.5rem 1.5rem; }
+        .archive-header h1 { font-size: 2rem; }
+        .blog-tagline { font-size: 0.95rem; opacity: 0.85; margin-top: 0.5rem; }
+        /* Inline SVG icons, sprite defined at the top of <body>. Stroked in
+           currentColor and sized in em so each icon matches its adjacent text. */
+        .icon { width: 1.05em; height: 1.05em; flex-shrink: 0; fill: none; stroke: currentColor; stroke-width: 1.75; stroke-linecap: round; stroke-linejoin: round; vertical-align: -0.14em; }
+        /* Share on the latest-issue card. It sits on the blue gradient, so the
+           buttons are translucent white rather than the bordered light style
+           used in the archive rows below. */
+        .latest-share { display: flex; flex-wrap: wrap; align-items: center; gap: 0.5rem; margin-top: 1.5rem; padding-top: 1.25rem; border-top: 1px solid rgba(255,255,255,0.2); }
+        .latest-share-label { font-size: 0.62rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.11em; opacity: 0.7; margin-right: 0.2rem; }
+        .latest-share .share-btn { display: inline-flex; align-items: center; justify-content: center; min-height: 36px; gap: 0.4rem; font: inherit; font-size: 0.78rem; font-weight: 600; color: white; background: rgba(255,255,255,0.15); border: 1px solid rgba(255,255,255,0.3); border-radius: 20px; padding: 0.4rem 0.9rem; text-decoration: none; cursor: pointer; transition: background 0.2s, transform 0.15s; }
+        .latest-share .share-btn:hover { background: rgba(255,255,255,0.28); transform: translateY(-1px); }
+        .latest-share .share-btn.copied { background: #16a34a; border-color: #16a34a; }
+        .share-btn[hidden] { display: none; }
+        /* Archive rows: the link keeps its full-width hit area, the buttons sit
+           beside it rather than inside it. */
+        .older-post-item { display: flex; align-items: center; gap: 0.5rem; padding-right: 0.75rem; }
+        .older-post-link { flex: 1; min-width: 0; }
+        .older-post-share { display: flex; gap: 0.3rem; flex-shrink: 0; }
+        .mini-btn { display: inline-flex; align-items: center; justify-content: center; width: 2.25rem; height: 2.25rem; border-radius: 50%; border: 1px solid #e2e8f0; background: white; color: #64748b; cursor: pointer; text-decoration: none; transition: color 0.2s, border-color 0.2s, background 0.2s; font-size: 0.85rem; }
+        .mini-btn:hover { color: #2563eb; border-color: #2563eb; }
+        .mini-btn.copied { background: #16a34a; border-color: #16a34a; color: white; }
+        @media (max-width: 640px) {
+            h1 { font-size: 2rem; }
+            .brand-logo { width: 58px; height: 58px; padding: 6px; border-radius: 18px; }
+            .container { padding: 1rem; }
+            .latest-post-section { padding: 1.5rem; }
+            .latest-post-title { font-size: 1.35rem; }
+            /* Stack the archive row so a 44px touch target for the title link
+               is never competing with the share buttons for the same tap. */
+            .older-post-item { flex-direction: column; align-items: stretch; padding-right: 0; }
+            .older-post-share { padding: 0 1.25rem 0.9rem; }
+            .mini-btn { width: 2.75rem; height: 2.75rem; }
+            .latest-share .share-btn { min-height: 44px; padding: 0.55rem 1rem; }
+            .nav-content { padding: 0 1rem; row-gap: 0.5rem; }
+        }
+    </style>"""
+
+_ICON_SPRITE = """\
+    <!-- Icon sprite. Reference a symbol by id from an svg.icon element.
+         Markers here are geometric on purpose: the brand's maple leaf is
+         illegible below ~32px, so it stays in the logo and does not get
+         shrunk down into a button glyph. -->
+    <svg xmlns="http://www.w3.org/2000/svg" style="display:none" aria-hidden="true">
+        <symbol id="i-linkedin" viewBox="0 0 24 24">
+            <path fill="currentColor" stroke="none" d="M4.98 3.5a2.5 2.5 0 1 0 0 5 2.5 2.5 0 0 0 0-5zM3 9.5h4v11H3zm7 0h3.8v1.5a4.2 4.2 0 0 1 3.7-1.9c3 0 4.5 1.9 4.5 5.3v6.1h-4v-5.4c0-1.6-.6-2.6-2-2.6s-2.2 1-2.2 2.6v5.4h-3.8z"/>
+        </symbol>
+        <symbol id="i-mail" viewBox="0 0 24 24">
+            <rect x="3" y="5" width="18" height="14" rx="2.5"/>
+            <path d="m3.5 7 8.5 6 8.5-6"/>
+        </symbol>
+        <symbol id="i-copy" viewBox="0 0 24 24">
+            <rect x="9" y="9" width="11" height="11" rx="2.5"/>
+            <path d="M6.5 15H5.5A2.5 2.5 0 0 1 3 12.5v-7A2.5 2.5 0 0 1 5.5 3h7A2.5 2.5 0 0 1 15 5.5v1"/>
+        </symbol>
+        <symbol id="i-share" viewBox="0 0 24 24">
+            <circle cx="18" cy="5" r="2.5"/><circle cx="6" cy="12" r="2.5"/><circle cx="18" cy="19" r="2.5"/>
+            <path d="m8.2 10.8 7.6-4.4M8.2 13.2l7.6 4.4"/>
+        </symbol>
+    </svg>"""
+
+_SHARE_SCRIPT = """\
+    <script>
+      // Share behaviour for the hero card and every archive row. One delegated
+      // listener, so adding issues to the page costs nothing.
+      (function () {
+        function fallbackCopy(text) {
+          var ta = document.createElement('textarea');
+          ta.value = text;
+          ta.setAttribute('readonly', '');
+          ta.style.position = 'fixed';
+          ta.style.opacity = '0';
+          document.body.appendChild(ta);
+          ta.select();
+          try { document.execCommand('copy'); } catch (e) {}
+          document.body.removeChild(ta);
+        }
+
+        function flash(btn) {
+          var label = btn.querySelector('.share-btn-text');
+          var original = label ? label.textContent : null;
+          if (label) label.textContent = 'Copied';
+          btn.classList.add('copied');
+          setTimeout(function () {
+            if (label) label.textContent = original;
+            btn.classList.remove('copied');
+          }, 1800);
+        }
+
+        // Revealed rather than rendered: a desktop visitor should never see a
+        // button that would do nothing. LinkedIn, email and copy cover them.
+        if (navigator.share) {
+          document.querySelectorAll('.share-native').forEach(function (b) {
+            b.hidden = false;
+          });
+        }
+
+        document.addEventListener('click', function (e) {
+          if (!e.target.closest) return;
+
+          var copyBtn = e.target.closest('.share-copy');
+          if (copyBtn) {
+            var url = copyBtn.dataset.shareUrl;
+            if (!url) return;
+            if (navigator.clipboard && navigator.clipboard.writeText) {
+              navigator.clipboard.writeText(url).then(
+                function () { flash(copyBtn); },
+                function () { fallbackCopy(url); flash(copyBtn); }
+              );
+            } else {
+              fallbackCopy(url);
+              flash(copyBtn);
+            }
+            if (typeof gtag === 'function') {
+              gtag('event', 'share', { method: 'copy_link' });
+            }
+            return;
+          }
+
+          var nativeBtn = e.target.closest('.share-native');
+          if (nativeBtn && navigator.share) {
+            navigator.share({
+              title: nativeBtn.dataset.shareTitle || document.title,
+              url: nativeBtn.dataset.shareUrl
+            }).then(function () {
+              if (typeof gtag === 'function') {
+                gtag('event', 'share', { method: 'web_share' });
+              }
+            }).catch(function () {
+              // Sheet dismissed. Not an error.
+            });
+          }
+        });
+      })();
+    </script>"""
+
+
+_NAV_BAR = f"""\
+    <nav class="nav-bar">
+        <div class="nav-content">
+            <a href="/blog/" class="nav-brand">
+                <img src="/blog/logo.svg" alt="" width="28" height="28">
+                <span>{BRAND_SHORT}</span>
+            </a>
+            <a href="https://www.imetrobert.com" class="nav-link">&#8592; Back to Homepage</a>
+            <a href="/blog/canadian-ai-adoption.html" class="nav-link">Adoption Data</a>
+            <a href="/blog/search.html" class="nav-link">Search</a>
+            <a href="/blog/feed.xml" class="nav-link">RSS Feed</a>
+        </div>
+    </nav>"""
+
+
+def _older_post_row(post):
+    # The share controls sit OUTSIDE the row's <a>. Interactive elements cannot
+    # be nested inside a link — browsers recover from it unpredictably, and a
+    # keyboard user ends up unable to reach the buttons at all.
+    post_url = _permalink(post)
+    li_href, mail_href = _share_hrefs(post_url, post['title'])
+    safe_title = escape_html(post['title'], quote=True)
+    href = post.get('canonical_filename') or post['filename']
+    return f'''
+                <div class="older-post-item">
+                    <a href="/blog/posts/{href}" class="older-post-link">
+                        <div class="older-post-title">{post['title']}</div>
+                        <div class="older-post-date">{post['date']}</div>
+                    </a>
+                    <div class="older-post-share">
+                        <a class="mini-btn" href="{li_href}" target="_blank" rel="noopener noreferrer"
+                           title="Share on LinkedIn" aria-label="Share &quot;{safe_title}&quot; on LinkedIn">
+                            <svg class="icon" aria-hidden="true"><use href="#i-linkedin"/></svg>
+                        </a>
+                        <a class="mini-btn" href="{mail_href}"
+                           title="Share by email" aria-label="Share &quot;{safe_title}&quot; by email">
+                            <svg class="icon" aria-hidden="true"><use href="#i-mail"/></svg>
+                        </a>
+                        <button type="button" class="mini-btn share-copy" data-share-url="{escape_html(post_url, quote=True)}"
+                           title="Copy link" aria-label="Copy link to &quot;{safe_title}&quot;">
+                            <svg class="icon" aria-hidden="true"><use href="#i-copy"/></svg>
+                        </button>
+                    </div>
+                </div>'''
 
 
 def extract_post_info(html_file):
-    if not os.path.exists(html_file) or os.path.getsize(html_file) == 0:
+    if not exists(html_file) or getsize(html_file) == 0:
         return None
-    with open(html_file, "r", encoding="utf-8") as f:
-        html_content = f.read()
+    html_content = read_text(html_file)
     soup = BeautifulSoup(html_content, "html.parser")
 
     title_tag = soup.find("h1")
@@ -106,16 +320,22 @@ def extract_post_info(html_file):
     return {"title": title, "date": date_text, "excerpt": excerpt, "filename": os.path.basename(html_file)}
 
 
-def create_blog_index_html(posts):
+def _validated(posts, posts_dir="blog/posts"):
+    return [p for p in posts if exists(os.path.join(posts_dir, p['filename']))]
+
+
+def create_blog_index_html(posts, older=None, pager_html="", head_links=""):
+    """The front page. `older` is the rows to list under the latest issue —
+    every other issue unless update_blog_index() has paged the rest out."""
     if not posts:
         return None
-    posts_dir = "blog/posts"
-    validated = [p for p in posts if os.path.exists(os.path.join(posts_dir, p['filename']))]
+    validated = _validated(posts)
     if not validated:
         return None
 
     latest = validated[0]
-    older  = validated[1:]
+    if older is None:
+        older = validated[1:]
 
     # Link the newest issue by its DATED permalink, not /blog/posts/latest.html.
     # latest.html is a rotating alias: same URL, different article every month.
@@ -130,37 +350,8 @@ def create_blog_index_html(posts):
     latest_url_attr = escape_html(latest_url, quote=True)
     latest_title_attr = escape_html(latest['title'], quote=True)
 
-    older_html = ""
     if older:
-        for post in older:
-            # The share controls sit OUTSIDE the row's <a>. Interactive
-            # elements cannot be nested inside a link — browsers recover from
-            # it unpredictably, and a keyboard user ends up unable to reach the
-            # buttons at all.
-            post_url = _permalink(post)
-            li_href, mail_href = _share_hrefs(post_url, post['title'])
-            safe_title = escape_html(post['title'], quote=True)
-            older_html += f'''
-                <div class="older-post-item">
-                    <a href="/blog/posts/{post['filename']}" class="older-post-link">
-                        <div class="older-post-title">{post['title']}</div>
-                        <div class="older-post-date">{post['date']}</div>
-                    </a>
-                    <div class="older-post-share">
-                        <a class="mini-btn" href="{li_href}" target="_blank" rel="noopener noreferrer"
-                           title="Share on LinkedIn" aria-label="Share &quot;{safe_title}&quot; on LinkedIn">
-                            <svg class="icon" aria-hidden="true"><use href="#i-linkedin"/></svg>
-                        </a>
-                        <a class="mini-btn" href="{mail_href}"
-                           title="Share by email" aria-label="Share &quot;{safe_title}&quot; by email">
-                            <svg class="icon" aria-hidden="true"><use href="#i-mail"/></svg>
-                        </a>
-                        <button type="button" class="mini-btn share-copy" data-share-url="{escape_html(post_url, quote=True)}"
-                           title="Copy link" aria-label="Copy link to &quot;{safe_title}&quot;">
-                            <svg class="icon" aria-hidden="true"><use href="#i-copy"/></svg>
-                        </button>
-                    </div>
-                </div>'''
+        older_html = "".join(_older_post_row(post) for post in older)
     else:
         older_html = '<div class="no-posts-message"><p>Previous issues will appear here.</p></div>'
 
@@ -190,8 +381,9 @@ def create_blog_index_html(posts):
     <meta name="geo.position" content="45.5017;-73.5673">
     <meta name="ICBM" content="45.5017, -73.5673">
     <meta name="DC.coverage" content="Canada">
-    <link rel="canonical" href="https://www.imetrobert.com/blog/">
+    <link rel="canonical" href="https://www.imetrobert.com/blog/">{head_links}
     <link rel="alternate" type="application/rss+xml" title="{BRAND} — RSS Feed" href="https://www.imetrobert.com/blog/feed.xml">
+    <link rel="alternate" type="application/feed+json" title="{BRAND} — JSON Feed" href="https://www.imetrobert.com/blog/feed.json">
     <meta property="og:type" content="website">
     <meta property="og:url" content="https://www.imetrobert.com/blog/">
     <meta property="og:title" content="{BRAND} | Monthly AI Briefing for Canadian Executives">
@@ -248,101 +440,11 @@ def create_blog_index_html(posts):
       gtag('js', new Date());
       gtag('config', 'G-Y0FZTVVLBS');
     </script>
-    <style>
-        body {{ font-family: Inter, sans-serif; background: linear-gradient(160deg, #f0f4ff 0%, #e8eef8 100%); margin: 0; padding: 0; }}
-        .container {{ max-width: 900px; margin: 0 auto; padding: 2rem 1.5rem; }}
-        header {{ background: linear-gradient(135deg, #2563eb 0%, #1a7fb5 50%, #06b6d4 100%); color: white; padding: 4rem 0; text-align: center; margin-bottom: 2.5rem; border-radius: 20px; }}
-        h1 {{ font-size: 2.8rem; font-weight: 800; margin-bottom: 0.5rem; letter-spacing: -0.02em; }}
-        .nav-bar {{ background: white; padding: 1rem 0; box-shadow: 0 1px 3px rgb(0 0 0 / 0.08); position: sticky; top: 0; z-index: 100; border-bottom: 1px solid #e2e8f0; }}
-        .nav-content {{ max-width: 900px; margin: 0 auto; padding: 0 1.5rem; display: flex; flex-wrap: wrap; align-items: center; justify-content: flex-start; gap: 0.6rem; }}
-        .nav-brand {{ display: flex; align-items: center; gap: 0.5rem; text-decoration: none; margin-right: auto; }}
-        .nav-brand img {{ width: 28px; height: 28px; border-radius: 9px; }}
-        .nav-brand span {{ font-weight: 800; font-size: 0.9rem; color: #0f172a; letter-spacing: -0.01em; }}
-        .brand-logo {{ width: 76px; height: 76px; display: block; margin: 0 auto 1.25rem; padding: 7px; box-sizing: content-box; background: rgba(255,255,255,0.96); border-radius: 23px; box-shadow: 0 10px 26px rgba(15,23,42,0.25); }}
-        .nav-link {{ color: white; text-decoration: none; font-weight: 600; padding: 0.4rem 1rem; font-size: 0.8rem; border-radius: 20px; background: linear-gradient(135deg, #2563eb, #06b6d4); }}
-        .latest-post-section {{ background: linear-gradient(135deg, #2563eb 0%, #1a7fb5 50%, #06b6d4 100%); color: white; padding: 2.5rem; border-radius: 20px; margin-bottom: 2rem; box-shadow: 0 8px 32px rgb(37 99 235 / 0.2); }}
-        .latest-badge {{ background: rgba(255,255,255,0.2); color: white; padding: 0.3rem 0.9rem; border-radius: 20px; display: inline-block; margin-bottom: 1rem; font-size: 0.7rem; font-weight: 700; text-transform: uppercase; letter-spacing: 0.08em; }}
-        .latest-post-title {{ font-size: 1.7rem; font-weight: 800; margin-bottom: 0.875rem; letter-spacing: -0.01em; }}
-        .read-latest-btn {{ background: rgba(255,255,255,0.2); color: white; border: 1px solid rgba(255,255,255,0.35); padding: 0.65rem 1.5rem; border-radius: 25px; text-decoration: none; display: inline-block; transition: all 0.25s; font-weight: 600; font-size: 0.875rem; }}
-        .read-latest-btn:hover {{ background: rgba(255,255,255,0.3); transform: translateY(-2px); }}
-        .older-posts-section {{ background: white; border-radius: 20px; padding: 2rem; box-shadow: 0 4px 16px rgb(0 0 0 / 0.06); border: 1px solid #e2e8f0; }}
-        .older-posts-title {{ font-size: 0.8rem; font-weight: 700; margin-bottom: 1.25rem; color: #94a3b8; text-transform: uppercase; letter-spacing: 0.05em; }}
-        .older-post-item {{ border: 1px solid #f1f5f9; border-radius: 12px; margin-bottom: 0.65rem; transition: all 0.2s; }}
-        .older-post-item:hover {{ border-color: #2563eb; box-shadow: 0 4px 12px rgb(37 99 235 / 0.08); }}
-        .older-post-link {{ display: block; padding: 1rem 1.25rem; text-decoration: none; color: inherit; }}
-        .older-post-title {{ font-size: 0.95rem; font-weight: 600; color: #2563eb; margin-bottom: 0.25rem; }}
-        .older-post-date {{ font-size: 0.78rem; color: #94a3b8; }}
-        .no-posts-message {{ text-align: center; padding: 2rem; color: #94a3b8; }}
-        .blog-tagline {{ font-size: 0.95rem; opacity: 0.85; margin-top: 0.5rem; }}
-        /* Inline SVG icons, sprite defined at the top of <body>. Stroked in
-           currentColor and sized in em so each icon matches its adjacent text. */
-        .icon {{ width: 1.05em; height: 1.05em; flex-shrink: 0; fill: none; stroke: currentColor; stroke-width: 1.75; stroke-linecap: round; stroke-linejoin: round; vertical-align: -0.14em; }}
-        /* Share on the latest-issue card. It sits on the blue gradient, so the
-           buttons are translucent white rather than the bordered light style
-           used in the archive rows below. */
-        .latest-share {{ display: flex; flex-wrap: wrap; align-items: center; gap: 0.5rem; margin-top: 1.5rem; padding-top: 1.25rem; border-top: 1px solid rgba(255,255,255,0.2); }}
-        .latest-share-label {{ font-size: 0.62rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.11em; opacity: 0.7; margin-right: 0.2rem; }}
-        .latest-share .share-btn {{ display: inline-flex; align-items: center; justify-content: center; min-height: 36px; gap: 0.4rem; font: inherit; font-size: 0.78rem; font-weight: 600; color: white; background: rgba(255,255,255,0.15); border: 1px solid rgba(255,255,255,0.3); border-radius: 20px; padding: 0.4rem 0.9rem; text-decoration: none; cursor: pointer; transition: background 0.2s, transform 0.15s; }}
-        .latest-share .share-btn:hover {{ background: rgba(255,255,255,0.28); transform: translateY(-1px); }}
-        .latest-share .share-btn.copied {{ background: #16a34a; border-color: #16a34a; }}
-        .share-btn[hidden] {{ display: none; }}
-        /* Archive rows: the link keeps its full-width hit area, the buttons sit
-           beside it rather than inside it. */
-        .older-post-item {{ display: flex; align-items: center; gap: 0.5rem; padding-right: 0.75rem; }}
-        .older-post-link {{ flex: 1; min-width: 0; }}
-        .older-post-share {{ display: flex; gap: 0.3rem; flex-shrink: 0; }}
-        .mini-btn {{ display: inline-flex; align-items: center; justify-content: center; width: 2.25rem; height: 2.25rem; border-radius: 50%; border: 1px solid #e2e8f0; background: white; color: #64748b; cursor: pointer; text-decoration: none; transition: color 0.2s, border-color 0.2s, background 0.2s; font-size: 0.85rem; }}
-        .mini-btn:hover {{ color: #2563eb; border-color: #2563eb; }}
-        .mini-btn.copied {{ background: #16a34a; border-color: #16a34a; color: white; }}
-        @media (max-width: 640px) {{
-            h1 {{ font-size: 2rem; }}
-            .brand-logo {{ width: 58px; height: 58px; padding: 6px; border-radius: 18px; }}
-            .container {{ padding: 1rem; }}
-            .latest-post-section {{ padding: 1.5rem; }}
-            .latest-post-title {{ font-size: 1.35rem; }}
-            /* Stack the archive row so a 44px touch target for the title link
-               is never competing with the share buttons for the same tap. */
-            .older-post-item {{ flex-direction: column; align-items: stretch; padding-right: 0; }}
-            .older-post-share {{ padding: 0 1.25rem 0.9rem; }}
-            .mini-btn {{ width: 2.75rem; height: 2.75rem; }}
-            .latest-share .share-btn {{ min-height: 44px; padding: 0.55rem 1rem; }}
-            .nav-content {{ padding: 0 1rem; row-gap: 0.5rem; }}
-        }}
-    </style>
+{_INDEX_STYLE}
 </head>
 <body>
-    <!-- Icon sprite. Reference a symbol by id from an svg.icon element.
-         Markers here are geometric on purpose: the brand's maple leaf is
-         illegible below ~32px, so it stays in the logo and does not get
-         shrunk down into a button glyph. -->
-    <svg xmlns="http://www.w3.org/2000/svg" style="display:none" aria-hidden="true">
-        <symbol id="i-linkedin" viewBox="0 0 24 24">
-            <path fill="currentColor" stroke="none" d="M4.98 3.5a2.5 2.5 0 1 0 0 5 2.5 2.5 0 0 0 0-5zM3 9.5h4v11H3zm7 0h3.8v1.5a4.2 4.2 0 0 1 3.7-1.9c3 0 4.5 1.9 4.5 5.3v6.1h-4v-5.4c0-1.6-.6-2.6-2-2.6s-2.2 1-2.2 2.6v5.4h-3.8z"/>
-        </symbol>
-        <symbol id="i-mail" viewBox="0 0 24 24">
-            <rect x="3" y="5" width="18" height="14" rx="2.5"/>
-            <path d="m3.5 7 8.5 6 8.5-6"/>
-        </symbol>
-        <symbol id="i-copy" viewBox="0 0 24 24">
-            <rect x="9" y="9" width="11" height="11" rx="2.5"/>
-            <path d="M6.5 15H5.5A2.5 2.5 0 0 1 3 12.5v-7A2.5 2.5 0 0 1 5.5 3h7A2.5 2.5 0 0 1 15 5.5v1"/>
-        </symbol>
-        <symbol id="i-share" viewBox="0 0 24 24">
-            <circle cx="18" cy="5" r="2.5"/><circle cx="6" cy="12" r="2.5"/><circle cx="18" cy="19" r="2.5"/>
-            <path d="m8.2 10.8 7.6-4.4M8.2 13.2l7.6 4.4"/>
-        </symbol>
-    </svg>
-    <nav class="nav-bar">
-        <div class="nav-content">
-            <a href="/blog/" class="nav-brand">
-                <img src="/blog/logo.svg" alt="" width="28" height="28">
-                <span>{BRAND_SHORT}</span>
-            </a>
-            <a href="https://www.imetrobert.com" class="nav-link">&#8592; Back to Homepage</a>
-            <a href="/blog/canadian-ai-adoption.html" class="nav-link">Adoption Data</a>
-            <a href="/blog/feed.xml" class="nav-link">RSS Feed</a>
-        </div>
-    </nav>
+{_ICON_SPRITE}
+{_NAV_BAR}
     <div class="container">
         <header>
             <img src="/blog/logo.svg" class="brand-logo" alt="{BRAND}" width="76" height="76">
@@ -376,127 +478,226 @@ def create_blog_index_html(posts):
         <section class="older-posts-section">
             <h3 class="older-posts-title">Previous Issues</h3>
             <div class="older-posts-grid">{older_html}</div>
-        </section>
+        </section>{pager_html}
     </div>
-    <script>
-      // Share behaviour for the hero card and every archive row. One delegated
-      // listener, so adding issues to the page costs nothing.
-      (function () {{
-        function fallbackCopy(text) {{
-          var ta = document.createElement('textarea');
-          ta.value = text;
-          ta.setAttribute('readonly', '');
-          ta.style.position = 'fixed';
-          ta.style.opacity = '0';
-          document.body.appendChild(ta);
-          ta.select();
-          try {{ document.execCommand('copy'); }} catch (e) {{}}
-          document.body.removeChild(ta);
-        }}
+{_SHARE_SCRIPT}
+</body>
+</html>'''
 
-        function flash(btn) {{
-          var label = btn.querySelector('.share-btn-text');
-          var original = label ? label.textContent : null;
-          if (label) label.textContent = 'Copied';
-          btn.classList.add('copied');
-          setTimeout(function () {{
-            if (label) label.textContent = original;
-            btn.classList.remove('copied');
-          }}, 1800);
-        }}
 
-        // Revealed rather than rendered: a desktop visitor should never see a
-        // button that would do nothing. LinkedIn, email and copy cover them.
-        if (navigator.share) {{
-          document.querySelectorAll('.share-native').forEach(function (b) {{
-            b.hidden = false;
-          }});
-        }}
+def _post_year(post):
+    try:
+        return datetime.strptime(post['date'], "%B %d, %Y").year
+    except Exception:
+        m = re.match(r"(\d{4})-", post.get('canonical_filename') or post['filename'])
+        return int(m.group(1)) if m else None
 
-        document.addEventListener('click', function (e) {{
-          if (!e.target.closest) return;
 
-          var copyBtn = e.target.closest('.share-copy');
-          if (copyBtn) {{
-            var url = copyBtn.dataset.shareUrl;
-            if (!url) return;
-            if (navigator.clipboard && navigator.clipboard.writeText) {{
-              navigator.clipboard.writeText(url).then(
-                function () {{ flash(copyBtn); }},
-                function () {{ fallbackCopy(url); flash(copyBtn); }}
-              );
-            }} else {{
-              fallbackCopy(url);
-              flash(copyBtn);
-            }}
-            if (typeof gtag === 'function') {{
-              gtag('event', 'share', {{ method: 'copy_link' }});
-            }}
-            return;
-          }}
+def _index_layout(validated, page_size):
+    """(front-page rows, [(page number, rows), ...], {year: rows}).
 
-          var nativeBtn = e.target.closest('.share-native');
-          if (nativeBtn && navigator.share) {{
-            navigator.share({{
-              title: nativeBtn.dataset.shareTitle || document.title,
-              url: nativeBtn.dataset.shareUrl
-            }}).then(function () {{
-              if (typeof gtag === 'function') {{
-                gtag('event', 'share', {{ method: 'web_share' }});
-              }}
-            }}).catch(function () {{
-              // Sheet dismissed. Not an error.
-            }});
-          }}
-        }});
-      }})();
+    Pages are cut from the OLDEST issue forward, in full pages only, and
+    numbered the same way — page 1 is the first page_size issues ever
+    published. A new issue therefore never shifts an existing page: it joins
+    the front page, and only when the front page holds two full pages does the
+    older of them move out as the next page number. Counting from the newest
+    end would renumber, and rewrite, every page on every publish.
+    """
+    older = validated[1:]
+    n = len(older)
+    count = max(0, n // page_size - 1)
+    pages = [(k, older[n - k * page_size:n - (k - 1) * page_size]) for k in range(1, count + 1)]
+
+    years = {}
+    for post in validated:
+        year = _post_year(post)
+        if year:
+            years.setdefault(year, []).append(post)
+    return older[:n - count * page_size], pages, years
+
+
+def _pager_html(newer=None, older=None, years=()):
+    """Previous/next links, plus links to each year page when `years` is given."""
+    left = f'<a href="{newer[0]}" rel="prev">&#8592; {newer[1]}</a>' if newer else '<span></span>'
+    right = f'<a href="{older[0]}" rel="next">{older[1]} &#8594;</a>' if older else ''
+    year_links = ""
+    if years:
+        year_links = ('<div class="year-links"><span>By year</span>'
+                      + "".join(f'<a href="/blog/archive/{y}.html">{y}</a>' for y in years)
+                      + '</div>')
+    if not (newer or older or year_links):
+        return ""
+    return f'''
+        <nav class="pager" aria-label="More issues">
+            {left}{year_links}{right}
+        </nav>'''
+
+
+def _rel_links(newer=None, older=None):
+    links = ""
+    if newer:
+        links += f'\n    <link rel="prev" href="{SITE}{newer}">'
+    if older:
+        links += f'\n    <link rel="next" href="{SITE}{older}">'
+    return links
+
+
+def create_archive_page_html(heading, description, path, rows, newer=None, older=None,
+                             robots="index, follow"):
+    """A page of older issues: a numbered page, or one year. `newer`/`older`
+    are (url path, label) for the neighbouring pages."""
+    rows_html = "".join(_older_post_row(post) for post in rows)
+    return f'''<!DOCTYPE html>
+<html lang="en-CA">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link rel="icon" type="image/svg+xml" href="/favicon.svg">
+    <link rel="apple-touch-icon" href="/apple-touch-icon.png">
+    <title>{escape_html(heading)} | {BRAND}</title>
+    <meta name="description" content="{escape_html(description, quote=True)}">
+    <meta name="author" content="Robert Simon">
+    <meta name="robots" content="{robots}">
+    <link rel="canonical" href="{SITE}{path}">{_rel_links(newer and newer[0], older and older[0])}
+    <link rel="alternate" type="application/rss+xml" title="{BRAND} — RSS Feed" href="https://www.imetrobert.com/blog/feed.xml">
+    <meta property="og:type" content="website">
+    <meta property="og:url" content="{SITE}{path}">
+    <meta property="og:title" content="{escape_html(heading, quote=True)} | {BRAND}">
+    <meta property="og:image" content="https://www.imetrobert.com/blog/og-blog.jpg">
+    <meta property="og:site_name" content="{BRAND}">
+    <script async src="https://www.googletagmanager.com/gtag/js?id=G-Y0FZTVVLBS"></script>
+    <script>
+      window.dataLayer = window.dataLayer || [];
+      function gtag(){{dataLayer.push(arguments);}}
+      gtag('js', new Date());
+      gtag('config', 'G-Y0FZTVVLBS');
     </script>
+{_INDEX_STYLE}
+</head>
+<body>
+{_ICON_SPRITE}
+{_NAV_BAR}
+    <div class="container">
+        <header class="archive-header">
+            <h1>{escape_html(heading)}</h1>
+            <p>{escape_html(description)}</p>
+        </header>
+        <section class="older-posts-section">
+            <h3 class="older-posts-title">{len(rows)} issue{"s" if len(rows) != 1 else ""}</h3>
+            <div class="older-posts-grid">{rows_html}</div>
+        </section>{_pager_html(newer, older)}
+    </div>
+{_SHARE_SCRIPT}
 </body>
 </html>'''
 
 
-def create_feed_xml(posts):
-    """RSS 2.0 feed — the explicit, machine-readable proof of the monthly
-    cadence: each item carries its own pubDate, unlike sitemap.xml which
-    only exposes lastmod."""
-    if not posts:
-        return None
+# Part of every archive page's signature, so a change to the shared page
+# furniture rebuilds them all once rather than leaving old pages stale.
+_FURNITURE = hashlib.sha1(
+    (_INDEX_STYLE + _ICON_SPRITE + _SHARE_SCRIPT + _NAV_BAR).encode("utf-8")).hexdigest()[:12]
 
-    build_date = datetime.now().strftime("%a, %d %b %Y 00:00:00 GMT")
 
-    items = []
-    for post in posts:
-        filename = post.get('canonical_filename', post['filename'])
-        url = f"https://www.imetrobert.com/blog/posts/{filename}"
-        try:
-            pub_date = datetime.strptime(post['date'], "%B %d, %Y").strftime("%a, %d %b %Y 00:00:00 GMT")
-        except Exception:
-            pub_date = build_date
-        items.append(f'''    <item>
-      <title>{escape_xml(post['title'])}</title>
-      <link>{url}</link>
-      <guid isPermaLink="true">{url}</guid>
-      <pubDate>{pub_date}</pubDate>
-      <description>{escape_xml(post['excerpt'])}</description>
-    </item>''')
-
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
-<channel>
-  <title>{BRAND} &#8212; {AUTHOR}</title>
-  <link>https://www.imetrobert.com/blog/</link>
-  <atom:link href="https://www.imetrobert.com/blog/feed.xml" rel="self" type="application/rss+xml"/>
-  <description>Monthly AI insights for Canadian business leaders. Expert analysis of AI breakthroughs, Canadian AI adoption data, and practical implementation strategies from Montreal-based AI Thought Leader Robert Simon.</description>
-  <language>en-ca</language>
-  <lastBuildDate>{build_date}</lastBuildDate>
-  <image>
-    <url>https://www.imetrobert.com/blog/og-blog.jpg</url>
-    <title>{BRAND} &#8212; {AUTHOR}</title>
-    <link>https://www.imetrobert.com/blog/</link>
-  </image>
-{chr(10).join(items)}
-</channel>
-</rss>'''
+def _signature(*parts):
+    blob = json.dumps([_FURNITURE, parts], sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:12]
+
+
+def _row_keys(rows):
+    return [(p.get('canonical_filename') or p['filename'], p['title'], p['date']) for p in rows]
+
+
+def write_archive_pages(pages, years, manifest_path=INDEX_PAGES_MANIFEST):
+    """Write blog/page/<n>.html and blog/archive/<year>.html.
+
+    Each page's signature — the rows it lists and the pages it links to — is
+    kept in data/index-pages.json, and a page is rendered only when that
+    changed or the file is missing. On a normal publish that is the current
+    year's page and nothing else; an older page is rebuilt only when an issue
+    on it is edited, renamed or removed. Returns the paths written."""
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except Exception:
+        manifest = {}
+
+    wanted = {}
+    count = len(pages)
+    for k, rows in pages:
+        newer = ("/blog/" if k == count else f"/blog/page/{k + 1}.html", "Newer issues")
+        older = (f"/blog/page/{k - 1}.html", "Older issues") if k > 1 else None
+        first, last = rows[-1]['date'], rows[0]['date']
+        wanted[f"blog/page/{k}.html"] = (
+            (_row_keys(rows), newer, older),
+            lambda k=k, rows=rows, newer=newer, older=older, first=first, last=last:
+                create_archive_page_html(
+                    f"Previous Issues, Page {k}", f"Issues from {first} to {last}.",
+                    f"/blog/page/{k}.html", rows, newer, older,
+                    # The same issues are indexed through the year pages, which
+                    # keep their URL; a numbered page is only a way through.
+                    robots="noindex, follow"))
+
+    ordered = sorted(years, reverse=True)
+    for i, year in enumerate(ordered):
+        newer = (f"/blog/archive/{ordered[i - 1]}.html", str(ordered[i - 1])) if i else None
+        older = (f"/blog/archive/{ordered[i + 1]}.html", str(ordered[i + 1])) if i + 1 < len(ordered) else None
+        rows = years[year]
+        wanted[f"blog/archive/{year}.html"] = (
+            (_row_keys(rows), newer, older),
+            lambda year=year, rows=rows, newer=newer, older=older:
+                create_archive_page_html(
+                    f"{year} Issues", f"Every {BRAND} issue published in {year}.",
+                    f"/blog/archive/{year}.html", rows, newer, older))
+
+    written, updated = [], {}
+    for path, (parts, render) in wanted.items():
+        sig = _signature(*parts)
+        updated[path] = sig
+        if manifest.get(path) == sig and os.path.exists(path):
+            continue
+        write_text(path, render())
+        written.append(path)
+
+    # Only ever delete pages this manifest wrote.
+    for gone in set(manifest) - set(wanted):
+        if remove(gone):
+            written.append(gone)
+
+    if updated != manifest:
+        write_text(manifest_path, json.dumps(updated, indent=1, sort_keys=True) + "\n")
+    return written
+
+
+def create_latest_alias(post):
+    """blog/posts/latest.html: a redirect to the newest issue's dated permalink.
+
+    It used to be a second full copy of the issue. generate-blog.py wrote and
+    fsynced it beside the dated file, approve-blog.yml copied it, related
+    blocks and the archive re-render had to keep the two in step, and this
+    index parsed both to list one issue. Now it is this stub, built from the
+    same listing the index uses and written only when the newest issue
+    changes. Old links and bookmarks to latest.html still land on the current
+    issue. It has the same shape as a renamed issue's redirect stub: noindex,
+    a canonical, and a meta refresh, with a plain link for anything that
+    follows none of them.
+    """
+    url = _permalink(post)
+    url_attr = escape_html(url, quote=True)
+    title = escape_html(post["title"])
+    return f"""<!DOCTYPE html>
+<html lang="en-CA">
+<head>
+<meta charset="utf-8">
+<meta name="robots" content="noindex, follow">
+<meta http-equiv="refresh" content="0; url={url_attr}">
+<link rel="canonical" href="{url_attr}">
+<title>{title}</title>
+</head>
+<body>
+<p>The latest issue is <a href="{url_attr}">{title}</a>.</p>
+</body>
+</html>
+"""
 
 
 def create_llms_txt(posts):
@@ -529,8 +730,10 @@ def create_llms_txt(posts):
         "",
         "- [Homepage](https://www.imetrobert.com): background, career and areas of expertise",
         f"- [{BRAND}](https://www.imetrobert.com/blog/): index of every issue",
-        "- [RSS feed](https://www.imetrobert.com/blog/feed.xml): machine-readable issue list with dates",
+        "- [RSS feed](https://www.imetrobert.com/blog/feed.xml): the latest issues in full, with dates (older ones in feed-archive.xml)",
+        "- [JSON Feed](https://www.imetrobert.com/blog/feed.json): the same, as JSON Feed 1.1",
         "- [Canadian AI adoption statistics](https://www.imetrobert.com/blog/canadian-ai-adoption.html): every adoption figure reported across the issues, by month, with sources",
+        "- [Canadian AI adoption data](https://www.imetrobert.com/blog/canadian-ai-adoption.json): the same figures as JSON (also .csv), with parsed values and trend series",
         "",
         "## Issues",
         "",
@@ -552,42 +755,31 @@ def create_llms_txt(posts):
     return "\n".join(lines)
 
 
-def update_blog_index():
+@span("blog_index.update_blog_index")
+def update_blog_index(page_size=INDEX_PAGE_SIZE):
+    """Rebuild everything that follows from the archive: the index and archive
+    pages, feeds, pillar and survey pages, search and entity indexes, related
+    blocks, llms.txt and the sitemaps. One publish(): nothing is swapped in
+    until all of it has been rendered. Any step that raises — the feeds, the
+    search index, the sitemap — propagates out of the publish(), which drops
+    every staged write, so a failed run leaves the site exactly as it was
+    instead of a new index over old feeds. Returns the posts listed."""
+    with publish():
+        return _update_blog_index(page_size)
+
+
+def _update_blog_index(page_size):
     posts_dir  = "blog/posts"
     index_file = "blog/index.html"
-    feed_file  = "blog/feed.xml"
     if not os.path.exists(posts_dir):
         return []
 
-    latest_path = os.path.join(posts_dir, "latest.html")
+    # Stubs, superseded drafts and latest.html are left out by post_registry,
+    # the same classification the sitemap and every other archive walk use.
+    # The newest issue is simply the first of them: latest.html is an alias
+    # written from this list below, never read back.
     posts = []
-    if os.path.exists(latest_path) and os.path.getsize(latest_path) > 100:
-        try:
-            info = extract_post_info(latest_path)
-            if info:
-                canonical_filename = None
-                html_files_check = sorted(
-                    [f for f in os.listdir(posts_dir)
-                     if f.endswith(".html") and f not in ("latest.html", "index.html")
-                     and not f.startswith("{") and "{" not in f
-                     and f not in EXCLUDE_STUBS],
-                    reverse=True
-                )
-                if html_files_check:
-                    canonical_filename = html_files_check[0]
-                info['filename'] = 'latest.html'
-                info['canonical_filename'] = canonical_filename or 'latest.html'
-                posts.append(info)
-        except Exception as e:
-            print(f"Warning: could not read latest.html: {e}")
-
-    html_files = [
-        f for f in os.listdir(posts_dir)
-        if f.endswith(".html") and f not in ("latest.html", "index.html")
-        and not f.startswith("{") and '{' not in f
-        and f not in EXCLUDE_STUBS
-    ]
-    for fname in sorted(html_files, reverse=True):
+    for fname in published(posts_dir):
         try:
             info = extract_post_info(os.path.join(posts_dir, fname))
             if info:
@@ -609,38 +801,73 @@ def update_blog_index():
             deduped.append(post)
             seen.add(key)
 
-    idx_html = create_blog_index_html(deduped)
+    # The front page lists the newest issues; everything older lives on
+    # numbered pages and per-year pages, which are only rewritten when an issue
+    # on them changes. Same deduped list, so stubs and month duplicates stay out
+    # of every page exactly as they stay out of the front page.
+    validated = _validated(deduped)
+    front, pages, years = _index_layout(validated, page_size) if validated else ([], [], {})
+    oldest_link = (f"/blog/page/{len(pages)}.html", "Older issues") if pages else None
+    idx_html = create_blog_index_html(
+        deduped, older=front,
+        pager_html=_pager_html(older=oldest_link, years=sorted(years, reverse=True)),
+        head_links=_rel_links(older=oldest_link and oldest_link[0]))
     if idx_html:
-        with open(index_file, "w", encoding="utf-8") as f:
-            f.write(idx_html)
-        print(f"Blog index updated ({len(deduped)} issues).")
-
-    feed_xml = create_feed_xml(deduped)
-    if feed_xml:
-        with open(feed_file, "w", encoding="utf-8") as f:
-            f.write(feed_xml)
-        print(f"RSS feed updated ({len(deduped)} items).")
+        write_text(index_file, idx_html)
+        print(f"Blog index updated ({len(front) + 1} of {len(deduped)} issues on the front page).")
+        with span("index.archive_pages"):
+            written = write_archive_pages(pages, years)
+        print(f"Archive pages: {len(pages)} numbered, {len(years)} by year "
+              f"({len(written)} written).")
+
+    # No step below is wrapped in try/except. Each used to print "... skipped"
+    # and carry on, and since they all share one publish() that meant a run
+    # whose feeds or search index failed still swapped in the new index.html
+    # over them. A failure now leaves the publish() with the exception, and
+    # nothing is swapped in.
+
+    # RSS and JSON Feed, recent and archive. Written only when they change.
+    from feeds import write_feeds
+    with span("index.feeds"):
+        write_feeds(deduped)
 
     # Evergreen pillar: rebuilt from the archive on every publish, so it gains a
     # month of data automatically instead of needing a hand edit.
-    try:
-        from pillar_adoption import write_pillar
+    from pillar_adoption import write_pillar
+    with span("index.pillar"):
         write_pillar()
-    except Exception as e:
-        print(f"Pillar page skipped ({e})")
 
     # Survey results. Writes nothing until a wave exists in data/survey.json,
     # so there is never a results page describing data not yet collected.
-    try:
-        from survey import write_survey_page
+    from survey import write_survey_page
+    with span("index.survey"):
         write_survey_page()
-    except Exception as e:
-        print(f"Survey page skipped ({e})")
+
+    # Archive search. Incremental: only the issue that changed is re-read.
+    from search_index import write_search_index
+    with span("index.search"):
+        write_search_index(deduped)
+
+    # Company timelines. Incremental like the search index.
+    from entity_index import write_entity_index
+    with span("index.entities"):
+        write_entity_index(deduped)
+
+    # Related issues read their vectors from the search index, so they follow it.
+    from related_issues import write_related
+    with span("index.related"):
+        write_related()
+
+    if write_text(os.path.join(posts_dir, "latest.html"), create_latest_alias(deduped[0])):
+        print(f"latest.html now points at {deduped[0]['filename']}.")
 
     llms_txt = create_llms_txt(deduped)
     if llms_txt:
-        with open("llms.txt", "w", encoding="utf-8") as f:
-            f.write(llms_txt)
+        write_text("llms.txt", llms_txt)
         print(f"llms.txt updated ({len(deduped)} issues).")
 
+    # Last, so every page it lists has already been written this run.
+    from regenerate_sitemap import regenerate_sitemap
+    regenerate_sitemap()
+
     return deduped
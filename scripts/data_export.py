@@ -0,0 +1,43 @@
+"""
+data_export.py
+Machine-readable copies of the data pages: blog/canadian-ai-adoption.json and
+.csv from pillar_adoption.py, blog/canadian-ai-pulse.json from survey.py.
+
+The pages were HTML only, so anything that wanted the numbers — including our
+own dashboards — scraped them, and broke whenever the markup moved. The
+exports are written in the same pass as the page, from the same rows, so the
+page and the file can never disagree.
+
+Each file is streamed to a temporary file and swapped in only if its bytes
+differ. Field order, row order and number formatting are fixed, so an
+unchanged dataset leaves an unchanged file: no commit, no new ETag, and a
+consumer polling it gets a 304.
+"""
+
+import csv
+import json
+
+
+def stream_if_changed(path, write):
+    """Call write(f) on a temporary file and move it over `path` only if the
+    content changed. Returns True if `path` was written."""
+    from atomic_write import write_stream
+    return write_stream(path, write, newline="")
+
+
+def write_json(path, obj):
+    def write(f):
+        for chunk in json.JSONEncoder(ensure_ascii=False, indent=1, sort_keys=True).iterencode(obj):
+            f.write(chunk)
+        f.write("\n")
+    return stream_if_changed(path, write)
+
+
+def write_csv(path, header, rows):
+    """`rows` may be any iterable of sequences; it is consumed as written."""
+    def write(f):
+        out = csv.writer(f, lineterminator="\n")
+        out.writerow(header)
+        for row in rows:
+            out.writerow(["" if v is None else v for v in row])
+    return stream_if_changed(path, write)
@@ -0,0 +1,327 @@
+"""
+entity_index.py
+Everything the archive has reported about one company or body, in one place:
+an index kept in data/entities.json, a timeline page per entity under
+blog/entities/, and a JSON API under blog/api/.
+
+Every development card and spotlight item already names its subject — the
+company the parser split off in parse_developments, shown as .dev-company, and
+the organisation leading a spotlight line. Nothing aggregated them, so
+"everything we have reported on OSFI" meant opening every issue. Now:
+
+  data/entities.json            per post: file hash, title, and its items
+                                (entity, item date, body, source, section)
+  blog/api/entities.json        {slug: name, count, first, last, urls} — a
+                                lookup is one dictionary hit
+  blog/api/entities/<slug>.json that entity's items, newest first
+  blog/entities/<slug>.html     the same, as a page linking back to each issue
+  blog/entities/index.html      every entity with its count
+
+Incremental: a post is re-read only when search_index.content_hash changes —
+the same hash the search index keys on, which ignores the related-issues
+block — and only the entities whose item lists changed get their page and
+JSON rewritten. A publish costs one issue and the handful of companies it
+mentions, not the archive.
+
+The pre-2026 template wrote developments as one run-on line ("April 3rd, 2026:
+Google DeepMind unveils ...") with no subject separated out. Guessing where a
+company name ends would file stories under the wrong entity, so those issues
+are not indexed.
+
+    python3 scripts/entity_index.py          # rebuild from blog/posts
+"""
+
+import html as H
+import json
+import os
+import re
+import unicodedata
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from atomic_write import exists, read_text, remove, write_text
+from parser import _resolve_item_date
+from search_index import content_hash
+from utils import BRAND
+
+BASE = "https://www.imetrobert.com"
+STORE = "data/entities.json"
+PAGES_DIR = "blog/entities"
+API_DIR = "blog/api"
+
+# Spellings the model uses interchangeably for the same body. Keys are already
+# normalised (see entity_slug), values are the slug they file under. Kept to
+# names that have actually appeared in issues; a wrong merge is worse than a
+# missed one.
+ENTITY_ALIASES = {
+    "office-of-the-superintendent-of-financial-institutions": "osfi",
+    "innovation-science-and-economic-development-canada": "ised",
+    "ised-canada": "ised",
+    "canadian-government": "government-of-canada",
+    "federal-government": "government-of-canada",
+    "ottawa": "government-of-canada",
+    "statcan": "statistics-canada",
+    "meta-platforms": "meta",
+    "open-ai": "openai",
+    "amazon-web-services": "aws",
+}
+
+# Only a trailing suffix is a legal form. Unanchored, this turned
+# "The Co-operators" into "operators", "Co:here" into "here" and
+# "Inc. Magazine" into "magazine".
+_SUFFIXES = re.compile(r"[\s,]+(inc|ltd|limited|corp|corporation|co|plc|llc)\.?$", re.I)
+
+
+def entity_slug(name):
+    """Normalised key for a subject: accents folded, legal suffixes and
+    punctuation dropped, hyphenated. "Hydro-Québec" -> "hydro-quebec",
+    "NVIDIA Corp." -> "nvidia", "Acme Co., Ltd." -> "acme", then
+    ENTITY_ALIASES."""
+    folded = unicodedata.normalize("NFKD", name or "")
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    folded, stripped = folded.replace("&", " and ").strip(), 1
+    while stripped:
+        folded, stripped = _SUFFIXES.subn("", folded)
+    slug = re.sub(r"[^a-z0-9]+", "-", folded.lower()).strip("-")
+    slug = re.sub(r"^the-", "", slug)
+    return ENTITY_ALIASES.get(slug, slug)
+
+
+def _text(node):
+    return re.sub(r"\s+", " ", node.get_text(" ")).strip() if node else ""
+
+
+def _issue_date(fname):
+    m = re.match(r"(\d{4})-(\d{2})-(\d{2})", fname)
+    return datetime(int(m.group(1)), int(m.group(2)), int(m.group(3))) if m else None
+
+
+def extract_items(source, fname):
+    """[(entity name, item), ...] for one issue's developments and spotlight."""
+    soup = BeautifulSoup(source, "html.parser")
+    issued = _issue_date(fname)
+    found = []
+
+    def item(name, date_text, body, src, section):
+        name = name.strip(" :—-")
+        if not name or not body or not entity_slug(name):
+            return
+        resolved = _resolve_item_date(date_text, issued) if issued else None
+        found.append((name, {
+            "date": resolved.strftime("%Y-%m-%d") if resolved else "",
+            "date_text": date_text, "body": body, "source": src, "section": section,
+        }))
+
+    for card in soup.select(".dev-card"):
+        item(_text(card.select_one(".dev-company")), _text(card.select_one(".dev-date")),
+             _text(card.select_one(".dev-body")), _text(card.select_one(".dev-source")),
+             "development")
+    for li in soup.select(".spot-list > li"):
+        body = _text(li.select_one(".spot-body"))
+        if " — " not in body:
+            continue
+        org, rest = body.split(" — ", 1)
+        item(org, _text(li.select_one(".spot-org")), rest,
+             _text(li.select_one(".spot-source")), "spotlight")
+    return found
+
+
+def _load_store(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) and "posts" in data else {"posts": {}}
+    except Exception:
+        return {"posts": {}}
+
+
+def _group(posts):
+    """{slug: {"name", "items"}} from the per-post store, newest item first."""
+    entities = {}
+    for fname, post in posts.items():
+        for ref in post["items"]:
+            ent = entities.setdefault(ref["entity"], {"names": {}, "items": []})
+            ent["names"][ref["name"]] = ent["names"].get(ref["name"], 0) + 1
+            ent["items"].append({**{k: v for k, v in ref.items() if k not in ("entity", "name")},
+                                 "post": fname, "title": post["title"]})
+    for ent in entities.values():
+        # The spelling used most often is the one shown.
+        ent["name"] = max(ent.pop("names").items(), key=lambda kv: (kv[1], kv[0]))[0]
+        ent["items"].sort(key=lambda i: (i["date"], i["post"]), reverse=True)
+    return entities
+
+
+def update_entities(posts, posts_dir="blog/posts", store_path=STORE):
+    """Bring the store up to date with `posts` (update_blog_index's list).
+    Returns (entity map, slugs whose items changed, posts re-read)."""
+    store = _load_store(store_path)
+    before = _group(store["posts"])
+    wanted, reread = set(), 0
+
+    for post in posts:
+        fname = post.get("canonical_filename") or post["filename"]
+        path = os.path.join(posts_dir, fname)
+        if fname == "latest.html" or not exists(path):
+            continue
+        wanted.add(fname)
+        source = read_text(path)
+        digest = content_hash(source)
+        if store["posts"].get(fname, {}).get("h") == digest:
+            continue
+        store["posts"][fname] = {
+            "h": digest, "title": post["title"],
+            "items": [{"entity": entity_slug(name), "name": name, **it}
+                      for name, it in extract_items(source, fname)],
+        }
+        reread += 1
+
+    for gone in set(store["posts"]) - wanted:
+        store["posts"].pop(gone)
+
+    after = _group(store["posts"])
+    changed = {s for s in set(before) | set(after) if before.get(s) != after.get(s)}
+
+    write_text(store_path, json.dumps(store, indent=1, ensure_ascii=False, sort_keys=True) + "\n")
+    return after, changed, reread
+
+
+def _api_entry(slug, ent):
+    return {
+        "name":  ent["name"],
+        "count": len(ent["items"]),
+        "first": min((i["date"] for i in ent["items"] if i["date"]), default=""),
+        "last":  max((i["date"] for i in ent["items"] if i["date"]), default=""),
+        "url":   f"/blog/entities/{slug}.html",
+        "json":  f"/blog/api/entities/{slug}.json",
+    }
+
+
+_STYLE = """:root { --blue:#2563eb; --cyan:#06b6d4; --navy:#0f172a; --gray:#475569; --gray-light:#94a3b8; --surface:#f8fafc; --border:#e2e8f0; --white:#fff; }
+*,*::before,*::after { margin:0; padding:0; box-sizing:border-box; }
+body { font-family:'Inter',-apple-system,BlinkMacSystemFont,sans-serif; background:linear-gradient(160deg,#f0f4ff 0%,#e8eef8 100%); color:var(--navy); line-height:1.6; -webkit-font-smoothing:antialiased; }
+.nav-bar { background:var(--white); padding:0.875rem 0; box-shadow:0 1px 3px rgb(0 0 0/0.08); border-bottom:1px solid var(--border); }
+.nav-content { max-width:900px; margin:0 auto; padding:0 1.5rem; display:flex; align-items:center; gap:0.6rem; }
+.nav-link { color:var(--white); text-decoration:none; font-weight:600; padding:0.4rem 1rem; font-size:0.8rem; border-radius:20px; background:linear-gradient(135deg,var(--blue),var(--cyan)); }
+.container { max-width:900px; margin:0 auto; padding:2.5rem 1.5rem 5rem; }
+.card { background:var(--white); border-radius:20px; box-shadow:0 8px 32px rgb(0 0 0/0.10); border:1px solid rgba(226,232,240,0.6); padding:2rem; }
+.breadcrumb { font-size:0.72rem; color:var(--gray-light); margin-bottom:1.25rem; }
+.breadcrumb a { color:var(--blue); text-decoration:none; }
+h1 { font-size:clamp(1.4rem,4vw,1.9rem); font-weight:800; letter-spacing:-0.02em; margin-bottom:0.4rem; }
+.sub { font-size:0.85rem; color:var(--gray); margin-bottom:1.75rem; }
+.entry { padding:1rem 1.25rem; margin-bottom:0.75rem; background:var(--surface); border:1px solid var(--border); border-left:3px solid var(--blue); border-radius:12px; }
+.entry-date { font-size:0.75rem; color:var(--gray-light); font-weight:700; text-transform:uppercase; letter-spacing:0.04em; }
+.entry-body { font-size:0.9rem; color:#1e293b; line-height:1.65; margin:0.3rem 0; }
+.entry-meta { font-size:0.75rem; color:var(--gray-light); }
+.entry-meta a { color:var(--blue); text-decoration:none; font-weight:600; }
+.ent-list { list-style:none; columns:2 16rem; }
+.ent-list li { margin-bottom:0.4rem; break-inside:avoid; }
+.ent-list a { color:var(--blue); text-decoration:none; font-weight:600; }
+.ent-list span { font-size:0.75rem; color:var(--gray-light); }
+@media (max-width:640px) { .container { padding:1.5rem 1rem 3rem; } .card { padding:1.25rem; } }"""
+
+
+def _page(title, description, canonical, body, robots="index, follow"):
+    return f"""<!DOCTYPE html>
+<html lang="en-CA">
+<head>
+<meta charset="utf-8"/>
+<meta content="width=device-width, initial-scale=1.0" name="viewport"/>
+<link rel="icon" type="image/svg+xml" href="/favicon.svg">
+<link rel="apple-touch-icon" href="/apple-touch-icon.png">
+<title>{H.escape(title)} | {H.escape(BRAND)}</title>
+<meta name="description" content="{H.escape(description, quote=True)}">
+<meta name="author" content="Robert Simon">
+<meta name="robots" content="{robots}">
+<link rel="canonical" href="{canonical}">
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
+<style>
+{_STYLE}
+</style>
+</head>
+<body>
+<nav class="nav-bar"><div class="nav-content">
+  <a href="/blog/" class="nav-link">&#8592; Back to Blog</a>
+  <a href="/blog/entities/" class="nav-link">All Companies</a>
+</div></nav>
+<div class="container"><div class="card">
+{body}
+</div></div>
+</body>
+</html>"""
+
+
+def build_entity_page(slug, ent):
+    name = H.escape(ent["name"])
+    entries = "".join(
+        f'<div class="entry"><div class="entry-date">{H.escape(i["date_text"] or i["date"])}</div>'
+        f'<p class="entry-body">{H.escape(i["body"])}</p>'
+        f'<div class="entry-meta">{H.escape(i["source"]) + " · " if i["source"] else ""}'
+        f'<a href="/blog/posts/{H.escape(i["post"], quote=True)}">{H.escape(i["title"])}</a></div></div>'
+        for i in ent["items"])
+    n = len(ent["items"])
+    body = f"""  <nav class="breadcrumb" aria-label="Breadcrumb">
+    <a href="{BASE}/blog/">{H.escape(BRAND)}</a> &#8250; <a href="{BASE}/blog/entities/">Companies</a> &#8250; <span>{name}</span>
+  </nav>
+  <h1>{name}</h1>
+  <p class="sub">{n} item{'' if n == 1 else 's'} reported in {H.escape(BRAND)}, newest first.</p>
+  {entries}"""
+    return _page(f"{ent['name']}: AI news timeline",
+                 f"Every {ent['name']} development reported in {BRAND}, with its source and issue.",
+                 f"{BASE}/blog/entities/{slug}.html", body)
+
+
+def build_index_page(entities):
+    ordered = sorted(entities.items(), key=lambda kv: (-len(kv[1]["items"]), kv[1]["name"].lower()))
+    lis = "".join(
+        f'<li><a href="/blog/entities/{slug}.html">{H.escape(ent["name"])}</a> '
+        f'<span>{len(ent["items"])}</span></li>' for slug, ent in ordered)
+    body = f"""  <nav class="breadcrumb" aria-label="Breadcrumb">
+    <a href="{BASE}/blog/">{H.escape(BRAND)}</a> &#8250; <span>Companies</span>
+  </nav>
+  <h1>Companies and organisations</h1>
+  <p class="sub">Everyone the archive has reported on, most-covered first. Also available as
+  <a href="/blog/api/entities.json">JSON</a>.</p>
+  <ul class="ent-list">{lis}</ul>"""
+    return _page("Companies and organisations", f"Every company and organisation reported in {BRAND}.",
+                 f"{BASE}/blog/entities/", body)
+
+
+def write_entity_index(posts, posts_dir="blog/posts"):
+    entities, changed, reread = update_entities(posts, posts_dir)
+    api_entities = os.path.join(API_DIR, "entities")
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    os.makedirs(api_entities, exist_ok=True)
+
+    for slug in changed:
+        page = os.path.join(PAGES_DIR, f"{slug}.html")
+        api = os.path.join(api_entities, f"{slug}.json")
+        ent = entities.get(slug)
+        if not ent:
+            for stale in (page, api):
+                remove(stale)
+            continue
+        write_text(page, build_entity_page(slug, ent))
+        write_text(api, json.dumps({"name": ent["name"], "items": ent["items"]},
+                                   ensure_ascii=False, indent=1))
+
+    if changed or not os.path.exists(os.path.join(API_DIR, "entities.json")):
+        write_text(os.path.join(API_DIR, "entities.json"),
+                   json.dumps({s: _api_entry(s, e) for s, e in sorted(entities.items())},
+                              ensure_ascii=False, indent=1))
+        write_text(os.path.join(PAGES_DIR, "index.html"), build_index_page(entities))
+
+    print(f"Entity index updated ({len(entities)} entities, {len(changed)} changed, "
+          f"{reread} issue(s) re-read).")
+    return entities
+
+
+if __name__ == "__main__":
+    from blog_index import extract_post_info
+    from post_registry import published
+    found = []
+    for name in published():
+        info = extract_post_info(os.path.join("blog/posts", name))
+        if info:
+            found.append(info)
+    write_entity_index(found)
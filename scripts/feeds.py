@@ -0,0 +1,236 @@
+"""
+feeds.py
+The RSS and JSON feeds: blog/feed.xml and blog/feed.json for the newest
+issues, blog/feed-archive.xml and blog/feed-archive.json for the rest.
+
+The old feed stamped lastBuildDate with the day it was built and was rewritten
+on every publish, so a rerun that changed nothing still produced a new file, a
+git diff, and a full re-download by every reader polling it. The build date is
+now the newest item's date and a feed is written only when its bytes change: an
+unchanged archive gives byte-identical feeds, and a conditional GET gets a 304.
+
+Items carry the full issue, not the 200-character excerpt, so a reader can be
+read in the reader. Extracting it means parsing the issue, so the cleaned body
+is kept in data/feed-content.json against search_index.content_hash — the same
+hash the search and entity indexes key on — and only a new or edited issue is
+parsed again.
+
+The recent feed holds the last FEED_RECENT issues and points to the archive
+feed (RFC 5005 prev-archive for RSS, next_url for JSON Feed), which changes
+only when an issue rolls off the recent one. A poller fetches a dozen issues,
+not the whole back catalogue.
+
+    python3 scripts/feeds.py          # rebuild from blog/posts
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+from xml.sax.saxutils import escape as escape_xml
+
+from atomic_write import exists, read_text, remove, write_text
+from search_index import content_hash
+from utils import BRAND, AUTHOR
+
+SITE = "https://www.imetrobert.com"
+FEED_RECENT = 12
+CONTENT_CACHE = "data/feed-content.json"
+DESCRIPTION = ("Monthly AI insights for Canadian business leaders. Expert analysis of AI "
+               "breakthroughs, Canadian AI adoption data, and practical implementation "
+               "strategies from Montreal-based AI Thought Leader Robert Simon.")
+
+# Page furniture that means nothing outside the site: icons, share and copy
+# buttons, the related-issues and "more insights" link blocks.
+_DROP_TAGS = ("script", "style", "noscript", "svg", "button", "form", "iframe")
+_DROP_CLASSES = ("related-section", "earlier-insights")
+_KEEP_ATTRS = {"href", "src", "alt", "title", "colspan", "rowspan"}
+
+
+def _post_date(post):
+    try:
+        return datetime.strptime(post["date"], "%B %d, %Y")
+    except Exception:
+        m = re.match(r"(\d{4}-\d{2}-\d{2})-", post.get("canonical_filename") or post["filename"])
+        return datetime.strptime(m.group(1), "%Y-%m-%d") if m else None
+
+
+def _url(post):
+    return f"{SITE}/blog/posts/{post.get('canonical_filename') or post['filename']}"
+
+
+def item_content(source, url):
+    """The issue body as self-contained HTML for a feed reader: the article
+    content with site furniture, classes and inline styles removed and every
+    link made absolute. None if the page has no article to take."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(source, "html.parser")
+    body = soup.find("div", class_="article-content") or soup.find("article")
+    if body is None:
+        return None
+    for tag in body.find_all(_DROP_TAGS):
+        tag.decompose()
+    for cls in _DROP_CLASSES:
+        for tag in body.find_all(class_=cls):
+            tag.decompose()
+    for tag in [body] + body.find_all(True):
+        tag.attrs = {k: v for k, v in tag.attrs.items() if k in _KEEP_ATTRS}
+        for attr in ("href", "src"):
+            if tag.get(attr) and not tag[attr].startswith(("#", "mailto:")):
+                tag[attr] = urljoin(url, tag[attr])
+    return re.sub(r"\s+", " ", body.decode_contents()).strip()
+
+
+def update_content(posts, posts_dir="blog/posts", cache_path=CONTENT_CACHE):
+    """{filename: content html} for `posts`, re-parsing only issues whose
+    content hash changed. Returns (contents, issues re-read)."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except Exception:
+        cache = {}
+
+    contents, fresh, reread = {}, {}, 0
+    for post in posts:
+        fname = post.get("canonical_filename") or post["filename"]
+        path = os.path.join(posts_dir, fname)
+        if not exists(path):
+            continue
+        source = read_text(path)
+        digest = content_hash(source)
+        entry = cache.get(fname)
+        if not entry or entry.get("h") != digest:
+            entry = {"h": digest, "html": item_content(source, _url(post))}
+            reread += 1
+        fresh[fname] = entry
+        if entry["html"]:
+            contents[fname] = entry["html"]
+
+    if fresh != cache:
+        write_text(cache_path, json.dumps(fresh, ensure_ascii=False, indent=1, sort_keys=True) + "\n")
+    return contents, reread
+
+
+def _rfc822(d):
+    return d.strftime("%a, %d %b %Y 00:00:00 GMT")
+
+
+def _cdata(text):
+    return "<![CDATA[" + text.replace("]]>", "]]]]><![CDATA[>") + "]]>"
+
+
+def create_feed_xml(posts, contents=None, archive=False, has_archive=False):
+    """RSS 2.0 feed — the explicit, machine-readable proof of the monthly
+    cadence: each item carries its own pubDate, unlike sitemap.xml which
+    only exposes lastmod."""
+    if not posts:
+        return None
+    contents = contents or {}
+    dates = [_post_date(p) for p in posts]
+    known = [d for d in dates if d]
+    build = f"\n  <lastBuildDate>{_rfc822(max(known))}</lastBuildDate>" if known else ""
+
+    items = []
+    for post, d in zip(posts, dates):
+        url = _url(post)
+        content = contents.get(post.get("canonical_filename") or post["filename"])
+        items.append(f'''    <item>
+      <title>{escape_xml(post['title'])}</title>
+      <link>{url}</link>
+      <guid isPermaLink="true">{url}</guid>{f"{chr(10)}      <pubDate>{_rfc822(d)}</pubDate>" if d else ""}
+      <description>{escape_xml(post['excerpt'])}</description>{f"{chr(10)}      <content:encoded>{_cdata(content)}</content:encoded>" if content else ""}
+    </item>''')
+
+    if archive:
+        self_url, history = f"{SITE}/blog/feed-archive.xml", (
+            f'\n  <atom:link href="{SITE}/blog/feed.xml" rel="current" type="application/rss+xml"/>'
+            '\n  <fh:archive/>')
+    else:
+        self_url, history = f"{SITE}/blog/feed.xml", (
+            f'\n  <atom:link href="{SITE}/blog/feed-archive.xml" rel="prev-archive" type="application/rss+xml"/>'
+            if has_archive else "")
+
+    return f'''<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:fh="http://purl.org/syndication/history/1.0">
+<channel>
+  <title>{BRAND} &#8212; {AUTHOR}</title>
+  <link>{SITE}/blog/</link>
+  <atom:link href="{self_url}" rel="self" type="application/rss+xml"/>{history}
+  <description>{DESCRIPTION}</description>
+  <language>en-ca</language>{build}
+  <image>
+    <url>{SITE}/blog/og-blog.jpg</url>
+    <title>{BRAND} &#8212; {AUTHOR}</title>
+    <link>{SITE}/blog/</link>
+  </image>
+{chr(10).join(items)}
+</channel>
+</rss>'''
+
+
+def create_json_feed(posts, contents=None, archive=False, has_archive=False):
+    """JSON Feed 1.1 (https://jsonfeed.org/version/1.1) with the same items."""
+    if not posts:
+        return None
+    contents = contents or {}
+    name = "feed-archive.json" if archive else "feed.json"
+    feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": f"{BRAND} — {AUTHOR}",
+        "home_page_url": f"{SITE}/blog/",
+        "feed_url": f"{SITE}/blog/{name}",
+        "description": DESCRIPTION,
+        "icon": f"{SITE}/blog/logo-512.png",
+        "favicon": f"{SITE}/favicon.svg",
+        "language": "en-CA",
+        "authors": [{"name": AUTHOR, "url": SITE}],
+    }
+    if has_archive:
+        feed["next_url"] = f"{SITE}/blog/feed-archive.json"
+    items = []
+    for post in posts:
+        url = _url(post)
+        item = {"id": url, "url": url, "title": post["title"], "summary": post["excerpt"]}
+        content = contents.get(post.get("canonical_filename") or post["filename"])
+        item["content_html"] = content or post["excerpt"]
+        d = _post_date(post)
+        if d:
+            item["date_published"] = d.strftime("%Y-%m-%dT00:00:00Z")
+        items.append(item)
+    feed["items"] = items
+    return json.dumps(feed, ensure_ascii=False, indent=1) + "\n"
+
+
+def write_feeds(posts, posts_dir="blog/posts", out_dir="blog", recent=FEED_RECENT):
+    """Write the four feeds from update_blog_index's post list. Returns the
+    number of files written."""
+    contents, reread = update_content(posts, posts_dir)
+    hot, cold = posts[:recent], posts[recent:]
+    outputs = {
+        "feed.xml": create_feed_xml(hot, contents, has_archive=bool(cold)),
+        "feed.json": create_json_feed(hot, contents, has_archive=bool(cold)),
+        "feed-archive.xml": create_feed_xml(cold, contents, archive=True),
+        "feed-archive.json": create_json_feed(cold, contents, archive=True),
+    }
+    written = 0
+    for name, text in outputs.items():
+        path = os.path.join(out_dir, name)
+        if text:
+            written += write_text(path, text)
+        else:
+            written += remove(path)
+    print(f"Feeds updated ({len(hot)} recent, {len(cold)} archived, "
+          f"{reread} issue(s) re-read, {written} file(s) written).")
+    return written
+
+
+if __name__ == "__main__":
+    from blog_index import extract_post_info
+    from post_registry import published
+    found = []
+    for name in published():
+        info = extract_post_info(os.path.join("blog/posts", name))
+        if info:
+            found.append(info)
+    write_feeds(found)
@@ -19,18 +19,14 @@ Run: python3 scripts/fix_old_posts.py
 import os
 import re
 
+from post_registry import published
+
 POSTS_DIR = "blog/posts"
 
 # Posts that use the OLD template (div.section-title, triple itemprop tags)
 # These are all posts before March 2026. The fix is safe to run on any post —
-# it's idempotent (running twice changes nothing).
-SKIP = {
-    "latest.html",
-    "index.html",
-    "2025-10-01-key-ai-developments-this-month.html",
-    "2026-03-26-march-1-2026-openai-announces-gpt5-boasting-enhanced-reasoning-and-multimodal-capabilities.html",
-    "2026-03-27-ai-insights-for-march-2026.html",
-}
+# it's idempotent (running twice changes nothing). Stubs and latest.html are
+# skipped via post_registry.
 
 
 def dedupe_itemprop_metas(html: str) -> tuple[str, int]:
@@ -171,11 +167,7 @@ def main():
         print(f"ERROR: {POSTS_DIR} not found. Run from repo root.")
         return
     
-    post_files = sorted([
-        f for f in os.listdir(POSTS_DIR)
-        if f.endswith(".html") and f not in SKIP
-        and not f.startswith("{") and "{" not in f
-    ])
+    post_files = published(POSTS_DIR, newest_first=False)
     
     print(f"Scanning {len(post_files)} blog posts for defects...\n")
     
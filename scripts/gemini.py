@@ -3,15 +3,24 @@ gemini.py
 Gemini API integration and prompt construction for the monthly blog generator.
 """
 
+import hashlib
+import re
 import time
 import requests
 from datetime import datetime, timedelta
+from page_template import compile_template, render
+from profiling import span
 from utils import (clean_ai_content, STOCK_VOICE_PHRASES, CANADIAN_HOUSEHOLD_BRANDS,
                    record_gemini_request, requests_today, load_model_config,
-                   save_model_config, new_models_available)
+                   save_model_config, new_models_available,
+                   MODEL_TOKEN_LIMITS, chars_per_token, estimate_tokens,
+                   record_token_calibration, record_cache_event,
+                   load_context_caches, update_context_caches, quota_day,
+                   _utc_stamp)
 
 
-def generate_blog_with_gemini(api_key, topic=None, coverage_date=None):
+@span("gemini.generate_blog_with_gemini")
+def generate_blog_with_gemini(api_key, topic=None, coverage_date=None, structured=False):
     # coverage_date lets a regeneration stay locked to the ORIGINAL month
     # being reported on (e.g. regenerating a June 30 post on July 2nd should
     # still search for June news, not July's). Defaults to today for a
@@ -27,13 +36,22 @@ def generate_blog_with_gemini(api_key, topic=None, coverage_date=None):
         prompt = _build_custom_prompt(topic, month_year, prev_month, is_backfill, datetime.now())
     else:
         prompt = _build_monthly_prompt(month_year, prev_month, is_backfill, datetime.now())
+    # Everything before the closing "Context: <month> edition" line is the
+    # same for every run about this issue today, so that is what is cached.
+    cache_prefix = prompt[:prompt.rfind(_PROMPT_CONTEXT_LINE)] \
+        if _PROMPT_CONTEXT_LINE in prompt else None
+    if structured:
+        prompt += _STRUCTURED_OUTPUT_OVERRIDE
 
     # The issue carries four analysis sections the old 4000-token cap never had
     # to fit (the Desk essay alone is ~450 words). At 4000 the response
     # truncated mid-section, and a truncated tail is silent: the parser just
     # renders fewer sections. Headroom is cheap; a missing "Looking Ahead" is not.
     result = _call_gemini(api_key, prompt, max_output_tokens=8192,
-                          temperature=0.55, use_search=True, min_chars=200)
+                          temperature=0.55, use_search=True, min_chars=200,
+                          response_schema=ISSUE_RESPONSE_SCHEMA if structured else None,
+                          cache_prefix=cache_prefix)
+    result["structured"] = bool(structured)
     _report_new_models(api_key)
     return result
 
@@ -76,6 +94,249 @@ _TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
 
 _BASE = "https://generativelanguage.googleapis.com/v1beta/models"
 
+# ---------------------------------------------------------------------------
+# Context caching. Every regenerate re-sends ~34,000 characters of
+# instructions that have not changed since the last run, and every redraft
+# re-sends the editorial mission and the whole issue. Gemini's cachedContents
+# API stores a prefix once, with a TTL, and a call that names the cache sends
+# only what follows it.
+#
+# What is cached is a PREFIX of the prompt, exactly as written, keyed by its
+# hash: the prompt the model sees is the same prompt, split across the cache
+# and the request. That is why the prefix is not just the editorial mission
+# and the specs — those sit between rules that name the month and today's
+# date, and pulling them out into a separate document would change the prompt
+# the issue quality was tuned against. Instead:
+#   - the monthly and custom prompts cache everything up to the closing
+#     "Context: <month> edition" line, so every regenerate of the same issue on
+#     the same day is a hit, and the first run of a new day or month a miss;
+#   - a redraft caches the voice, the mission and the issue as it stands, so
+#     a retry, or a second pass at a different section before the first is
+#     accepted, reuses it.
+#
+# Caching is an optimisation and never a dependency. Below the model's minimum
+# size, on a tier without explicit caching, or when a named cache has gone,
+# the call is sent whole, as it always was — see _context_cache.
+# ---------------------------------------------------------------------------
+_CACHE_TTL_SECONDS = 3600
+_PROMPT_CONTEXT_LINE = "\n---\nContext: "
+
+# Smallest prefix each model will cache. Below it creation is refused, so the
+# request is not worth making.
+_CACHE_MIN_TOKENS = {
+    "gemini-2.5-flash":      1024,
+    "gemini-2.5-flash-lite": 1024,
+    "gemini-2.0-flash":      4096,
+}
+
+
+def _cache_key(model, prefix, use_search):
+    # The search tool is part of the cache — a request that names a cache may
+    # not declare tools of its own — so grounded and ungrounded are different.
+    digest = hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:24]
+    return f"{model}:{'search' if use_search else 'plain'}:{digest}"
+
+
+def _context_cache(api_key, model, prefix, use_search):
+    """Name of a live cache holding `prefix` for `model`, creating one if
+    needed. Returns (name, event) with event 'hit' or 'miss', or (None, reason)
+    when the call should go uncached. Never raises."""
+    if not prefix:
+        return None, "no prefix"
+    if estimate_tokens(prefix) < _CACHE_MIN_TOKENS.get(model, 4096):
+        return None, "below minimum size"
+    caches = load_context_caches()
+    if caches["unsupported"].get(model) == quota_day():
+        return None, "unsupported today"
+
+    key = _cache_key(model, prefix, use_search)
+    entry = caches["entries"].get(key)
+    # Two minutes' margin: a cache that expires mid-request fails the request.
+    if entry and entry.get("expires", "") > _utc_stamp(120):
+        return entry["name"], "hit"
+
+    body = {
+        "model": f"models/{model}",
+        "contents": [{"role": "user", "parts": [{"text": prefix}]}],
+        "ttl": f"{_CACHE_TTL_SECONDS}s",
+    }
+    if use_search:
+        body["tools"] = [{"google_search": {}}]
+    try:
+        r = requests.post(f"{_BASE.rsplit('/', 1)[0]}/cachedContents?key={api_key}",
+                          json=body, timeout=60)
+        name = r.json().get("name") if r.status_code == 200 else None
+    except Exception as exc:
+        print(f"  NOTE: context cache not created ({exc}). Sending uncached.")
+        return None, "create failed"
+    if not name:
+        print(f"  NOTE: {model} refused a context cache ({r.status_code}). "
+              f"Sending uncached, and not asking this model again today.")
+        record_cache_event("unsupported")
+
+        def refused(data):
+            data["unsupported"][model] = quota_day()
+        update_context_caches(refused)
+        return None, "unsupported"
+
+    def created(data):
+        data["entries"][key] = {"name": name, "model": model,
+                                "expires": _utc_stamp(_CACHE_TTL_SECONDS)}
+    update_context_caches(created)
+    return name, "miss"
+
+
+def _forget_context_cache(name, model):
+    """Drop a cache that failed a request, and stop creating caches for this
+    model today — a model that rejects cached requests would otherwise be sent
+    a fresh cache, and a failed request, on every call."""
+    def forget(data):
+        data["entries"] = {k: v for k, v in data["entries"].items()
+                           if v.get("name") != name}
+        data["unsupported"][model] = quota_day()
+    update_context_caches(forget)
+
+
+def _cached_tokens(response):
+    try:
+        return int(response.json().get("usageMetadata", {}).get("cachedContentTokenCount", 0))
+    except Exception:
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# Structured generation. The text format has to be split on ALL-CAPS headers,
+# which is why parser.py carries three date-splitting strategies, an alias
+# table and a duplicate-issue cut. Asking for JSON against a schema removes the
+# splitting: each field arrives already separated, and parse_structured_issue
+# maps it onto the renderer's structures. The section SPECS are unchanged — the
+# schema only replaces the OUTPUT FORMAT, and the text parser stays the
+# fallback for a response that is not usable JSON.
+#
+# Gemini's schema dialect is an OpenAPI subset: upper-case types, enums on
+# strings, and propertyOrdering so the fields are generated in issue order —
+# which matters, because the Desk and the actions are meant to be written
+# after the developments they respond to.
+# ---------------------------------------------------------------------------
+def _obj(props, required):
+    return {"type": "OBJECT", "properties": props, "required": required,
+            "propertyOrdering": list(props)}
+
+
+_STR = {"type": "STRING"}
+_SOURCE_PROPS = {
+    "source_name":     {"type": "STRING", "description": "Publication name only"},
+    "source_headline": {"type": "STRING", "description": "Exact article headline as published"},
+}
+
+ISSUE_RESPONSE_SCHEMA = _obj({
+    "headline":          _STR,
+    "introduction":      _STR,
+    "executive_summary": {"type": "ARRAY", "items": _STR},
+    "developments": {"type": "ARRAY", "items": _obj({
+        "date":           {"type": "STRING", "description": "Month Day, e.g. August 12"},
+        "company":        _STR,
+        "body":           {"type": "STRING", "description": "What they did, then why it matters for Canadian business"},
+        "strategic_read": {"type": "STRING", "description": "Major items only; omit the four rating fields for a log entry"},
+        "importance":     {"type": "STRING", "enum": ["High", "Medium", "Low"]},
+        "horizon":        {"type": "STRING", "enum": ["Now", "3 Months", "6 Months", "12 Months"]},
+        "attention":      {"type": "STRING", "enum": ["Yes", "Monitor", "Ignore"]},
+        **_SOURCE_PROPS,
+    }, ["date", "company", "body", "source_name", "source_headline"])},
+    "spotlight": {"type": "ARRAY", "items": _obj({
+        "org":  _STR,
+        "body": _STR,
+        **_SOURCE_PROPS,
+    }, ["org", "body", "source_name", "source_headline"])},
+    "roberts_desk": {"type": "STRING", "description": "Paragraphs separated by a blank line"},
+    "actions": {"type": "ARRAY", "items": _obj({
+        "body":            _STR,
+        "owner":           _STR,
+        "owner_rationale": _STR,
+        "priority":        {"type": "STRING", "enum": ["High", "Medium", "Low"]},
+        "effort":          {"type": "STRING", "enum": ["Small", "Medium", "Large"]},
+        "impact":          {"type": "STRING", "enum": ["High", "Medium", "Low"]},
+    }, ["body", "owner", "owner_rationale", "priority", "effort", "impact"])},
+    "adoption": {"type": "ARRAY", "items": _obj({
+        "stat_number": {"type": "STRING", "description": "The figure, e.g. 30%"},
+        "stat_text":   {"type": "STRING", "description": "The rest of the stat, without the figure"},
+        "source_name": {"type": "STRING", "description": "Organization name only, e.g. BDC"},
+    }, ["stat_number", "stat_text", "source_name"])},
+    "predictions": {"type": "ARRAY", "items": _obj({
+        "horizon": {"type": "STRING", "enum": ["One month", "Six months", "One year"]},
+        "body":    _STR,
+    }, ["horizon", "body"])},
+    "question": _STR,
+}, ["headline", "introduction", "executive_summary", "developments", "spotlight",
+    "roberts_desk", "actions", "adoption", "predictions", "question"])
+
+# Appended to the normal prompt, so every spec above it still governs WHAT is
+# written; this only changes how it is packaged.
+_STRUCTURED_OUTPUT_OVERRIDE = """
+
+---
+OUTPUT FORMAT OVERRIDE — JSON. This replaces the OUTPUT FORMAT section above and
+nothing else. Do not write section headers. Return ONE JSON object whose fields
+carry the sections, each written exactly as its specification above describes:
+
+  headline           HEADLINE
+  introduction       INTRODUCTION
+  executive_summary  EXECUTIVE SUMMARY, one array entry per item
+  developments       KEY AI DEVELOPMENTS, one object per item; put the labels'
+                     values in their own fields (strategic_read, importance,
+                     horizon, attention) instead of inside body, and the
+                     citation in source_name and source_headline
+  spotlight          CANADIAN SPOTLIGHT, one object per item
+  roberts_desk       FROM ROBERTS DESK
+  actions            STRATEGIC ACTIONS FOR THIS MONTH, one object per action,
+                     with OWNER, its reason, PRIORITY, EFFORT and IMPACT as fields
+  adoption           ADOPTION SNAPSHOT, one object per data point
+  predictions        LOOKING AHEAD: THREE PREDICTIONS, one object per horizon
+  question           ONE QUESTION FOR YOUR LEADERSHIP TEAM
+
+Every rule about counts, length, dates, sources and voice still applies.
+Plain text inside every string: no markdown, no URLs.
+"""
+
+
+# Warn when prompt + reserved output reaches this share of a limit. Early on
+# purpose: the point is to see prompt growth as a trend, not to learn about it
+# from a truncated issue.
+_TOKEN_WARN_SHARE = 0.8
+
+
+def report_prompt_size(prompt, max_output_tokens, models=None):
+    """Estimated prompt tokens, printed before sending, with a warning for any
+    model whose limits prompt + max_output_tokens approaches. Returns the
+    estimate, so callers and scripts/prompt_size.py can track it."""
+    ratio, samples = chars_per_token()
+    est = estimate_tokens(prompt)
+    basis = (f"calibrated on {samples} call(s), {ratio:.2f} chars/token"
+             if samples else f"uncalibrated default, {ratio:.1f} chars/token")
+    print(f"  PROMPT SIZE: ~{est:,} tokens + {max_output_tokens:,} output reserved ({basis})")
+    for model in models or []:
+        lim = MODEL_TOKEN_LIMITS.get(model)
+        if not lim:
+            continue
+        if max_output_tokens > lim["output"]:
+            print(f"  WARNING: {model} caps output at {lim['output']:,} tokens; "
+                  f"{max_output_tokens:,} requested will be clipped.")
+        for key, what in (("input", "context window"), ("per_minute", "per-minute token limit")):
+            need = est + max_output_tokens
+            if need >= _TOKEN_WARN_SHARE * lim[key]:
+                print(f"  WARNING: ~{need:,} tokens is {need / lim[key]:.0%} of "
+                      f"{model}'s {what} ({lim[key]:,}). The prompt has grown; trim it "
+                      f"before it starts costing retries or truncated issues.")
+    return est
+
+
+def _prompt_tokens(response):
+    """promptTokenCount from usageMetadata — the calibration signal."""
+    try:
+        return int(response.json().get("usageMetadata", {}).get("promptTokenCount", 0))
+    except Exception:
+        return 0
+
 
 def _tokens_used(response):
     """Total tokens Gemini reports for a call, or 0 if it said nothing.
@@ -90,13 +351,25 @@ def _tokens_used(response):
 
 
 def _call_gemini(api_key, prompt, max_output_tokens, temperature=0.55,
-                 use_search=True, min_chars=200):
+                 use_search=True, min_chars=200, response_schema=None,
+                 cache_prefix=None):
     """Post a prompt, walking the model fallback list. Returns {content, model}.
 
     Shared by the monthly generation and the single-section redraft so both get
     the same rate-limit handling, the same ungrounded retry on 400/404, and the
     same content cleanup.
+
+    With `response_schema` the response is constrained JSON and is returned
+    UNCLEANED — clean_ai_content strips markdown and meta lines from prose and
+    has no business inside a JSON document; parser.parse_structured_issue cleans
+    field by field instead.
+
+    `cache_prefix`, when given, must be the start of `prompt`; it is served
+    from a context cache where the model and tier allow one (see
+    _context_cache) and the request carries only the rest.
     """
+    if cache_prefix and not prompt.startswith(cache_prefix):
+        cache_prefix = None
     payload = {
         "contents": [{"role": "user", "parts": [{"text": prompt}]}],
         "generationConfig": {
@@ -113,11 +386,15 @@ def _call_gemini(api_key, prompt, max_output_tokens, temperature=0.55,
     }
     if use_search:
         payload["tools"] = [{"google_search": {}}]
+    if response_schema:
+        payload["generationConfig"]["responseMimeType"] = "application/json"
+        payload["generationConfig"]["responseSchema"] = response_schema
 
     models_to_try = load_model_config().get("order") or MODELS_TO_TRY
     if models_to_try[0] != MODELS_TO_TRY[0]:
         print(f"  MODEL ORDER: leading with {models_to_try[0]} (set from the "
               f"preview page, not the built-in default).")
+    report_prompt_size(prompt, max_output_tokens, models_to_try)
 
     for attempt, model in enumerate(models_to_try):
         if attempt > 0:
@@ -127,6 +404,15 @@ def _call_gemini(api_key, prompt, max_output_tokens, temperature=0.55,
         print(f"Trying model: {model} (attempt {attempt+1}/{len(models_to_try)})")
         url = f"{_BASE}/{model}:generateContent?key={api_key}"
 
+        primary = payload
+        cache_name, cache_event = _context_cache(api_key, model, cache_prefix, use_search)
+        if cache_name:
+            primary = {k: v for k, v in payload.items() if k != "tools"}
+            primary["contents"] = [{"role": "user", "parts": [
+                {"text": prompt[len(cache_prefix):]}]}]
+            primary["cachedContent"] = cache_name
+            print(f"  CONTEXT CACHE: {cache_event} ({cache_name}).")
+
         try:
             # A 503 says the model is busy, not broken — Google's own message
             # calls the spike temporary. Dropping straight to the next model
@@ -140,7 +426,7 @@ def _call_gemini(api_key, prompt, max_output_tokens, temperature=0.55,
                     print(f"  {response.status_code} is transient — retrying "
                           f"{model} in 45 s before falling back.")
                     time.sleep(45)
-                response = requests.post(url, json=payload, timeout=180)
+                response = requests.post(url, json=primary, timeout=180)
                 # Counted here, not per run: this loop, the model fallback and
                 # the ungrounded retry below each fire their own request, and
                 # the daily quota counts requests.
@@ -149,11 +435,42 @@ def _call_gemini(api_key, prompt, max_output_tokens, temperature=0.55,
                 if response.status_code not in _TRANSIENT_STATUSES:
                     break
 
+            if cache_name and response.status_code in (400, 403, 404):
+                # A cache can be deleted or expire early, and some model
+                # versions reject a cached request the tier allowed creating.
+                # Neither is a reason to lose the model: forget the cache and
+                # send the prompt whole, then carry on as if uncached.
+                print(f"  {response.status_code} with context cache {cache_name}. "
+                      f"Forgetting it and resending uncached.")
+                _forget_context_cache(cache_name, model)
+                record_cache_event("unsupported")
+                cache_name = None
+                response = requests.post(url, json=payload, timeout=180)
+                record_gemini_request(model, _tokens_used(response))
+                print(f"  HTTP status: {response.status_code}")
+            elif cache_name and response.status_code == 200:
+                record_cache_event(cache_event, _cached_tokens(response))
+
             if response.status_code == 429:
                 print("  Rate limited. Trying next model after wait.")
                 continue
             if response.status_code == 403:
                 raise Exception("API key rejected (403). Check your GEMINI_API_KEY secret.")
+            if response.status_code in (404, 400) and response_schema and use_search:
+                # Not every model accepts a response schema alongside the search
+                # tool, and grounding is worth more than enforcement: the prompt
+                # already asks for the same JSON, so drop the constraint first
+                # and keep the search. parse_structured_issue tolerates the
+                # fenced, unenforced form this tends to come back in.
+                print(f"  {response.status_code} on {model} with a response schema. "
+                      f"Retrying grounded, with the JSON requested by prompt only.")
+                gen_cfg = {k: v for k, v in payload["generationConfig"].items()
+                           if k not in ("responseMimeType", "responseSchema")}
+                r_loose = requests.post(url, json={**payload, "generationConfig": gen_cfg},
+                                        timeout=180)
+                record_gemini_request(model, _tokens_used(r_loose))
+                if r_loose.status_code == 200:
+                    response = r_loose
             if response.status_code in (404, 400):
                 print(f"  {response.status_code} on {model}. Retrying without grounding.")
                 payload_no_ground = {k: v for k, v in payload.items() if k != "tools"}
@@ -169,6 +486,7 @@ def _call_gemini(api_key, prompt, max_output_tokens, temperature=0.55,
                 continue
 
             data       = response.json()
+            record_token_calibration(len(prompt), _prompt_tokens(response))
             candidates = data.get('candidates', [])
             if not candidates:
                 continue
@@ -186,7 +504,7 @@ def _call_gemini(api_key, prompt, max_output_tokens, temperature=0.55,
                 print(f"  Only {len(raw_text)} chars, below the {min_chars} minimum.")
                 continue
 
-            cleaned = clean_ai_content(raw_text)
+            cleaned = raw_text if response_schema else clean_ai_content(raw_text)
             print(f"  SUCCESS: {len(cleaned)} chars from {model}")
             _reqs, _toks = requests_today()
             print(f"  QUOTA: {_reqs} request(s) today from this pipeline "
@@ -239,6 +557,7 @@ REDRAFTABLE_SECTIONS = {
 }
 
 
+@span("gemini.generate_section_redraft")
 def generate_section_redraft(api_key, section, issue_text, guidance="", month_year=None):
     """Rewrite ONE section, returning just that section's plain text.
 
@@ -254,33 +573,13 @@ def generate_section_redraft(api_key, section, issue_text, guidance="", month_ye
         raise ValueError(f"'{section}' is not a redraftable section.")
 
     spec = REDRAFTABLE_SECTIONS[section]["spec"]()
-    month_line = f"This is the {month_year} issue.\n" if month_year else ""
-    guidance_block = ""
-    if guidance and guidance.strip():
-        guidance_block = (
-            "\nROBERT'S DIRECTION FOR THIS REDRAFT — this is the reason you are\n"
-            "being asked to rewrite the section, and it takes precedence over your\n"
-            "own choice of angle. It does NOT relax any rule in the specification\n"
-            "above: length, format, and the constraint against invented specifics\n"
-            "all still apply.\n\n"
-            f"{guidance.strip()}\n"
-        )
+    guidance_block = _redraft_guidance(guidance)
 
-    prompt = f"""You are rewriting ONE section of Robert Simon's monthly newsletter, Practical AI for Canadian Business. Robert is an independent AI thought leader in Montreal. His voice is direct, opinionated and grounded in business outcomes. He does not hedge.
-
-{month_line}
-{_EDITORIAL_PREAMBLE}
-
-THE ISSUE AS IT CURRENTLY STANDS — this is your source material. Do not introduce
-any event, company, statistic or date that does not already appear here. You are
-sharpening judgment, not reporting news.
-
-<issue>
-{issue_text.strip()}
-</issue>
+    context = _redraft_context(issue_text, month_year)
+    prompt = f"""{context}
 
 YOUR TASK
-Rewrite the section specified below. It must be materially different from the
+Rewrite the ONE section specified below. It must be materially different from the
 version currently in the issue — a new angle or a sharper argument, not a
 paraphrase. Everything else in the issue stays as it is.
 {guidance_block}
@@ -301,10 +600,131 @@ Plain text only — no *, no **, no #.
                                   # redraft is to land somewhere different
         use_search=False,
         min_chars=40,
+        cache_prefix=context,
     )
     return _strip_section_header(result["content"], section), result["model"]
 
 
+def _redraft_context(issue_text, month_year=None):
+    """The opening every redraft prompt shares: voice, editorial mission, and
+    the issue as it stands. One copy, so a single-section and a batch redraft
+    cannot drift onto different rules — and word for word the same for both,
+    with nothing about WHICH sections in it, so it can be served from one
+    context cache (see _context_cache). YOUR TASK, after it, says which."""
+    month_line = f"This is the {month_year} issue.\n" if month_year else ""
+    return f"""You are rewriting part of Robert Simon's monthly newsletter, Practical AI for Canadian Business. Robert is an independent AI thought leader in Montreal. His voice is direct, opinionated and grounded in business outcomes. He does not hedge.
+
+{month_line}
+{_EDITORIAL_PREAMBLE}
+
+THE ISSUE AS IT CURRENTLY STANDS — this is your source material. Do not introduce
+any event, company, statistic or date that does not already appear here. You are
+sharpening judgment, not reporting news.
+
+<issue>
+{issue_text.strip()}
+</issue>"""
+
+
+def _redraft_guidance(guidance):
+    if not (guidance and guidance.strip()):
+        return ""
+    return (
+        "\nROBERT'S DIRECTION FOR THIS REDRAFT — this is the reason you are\n"
+        "being asked to rewrite the section, and it takes precedence over your\n"
+        "own choice of angle. It does NOT relax any rule in the specification\n"
+        "above: length, format, and the constraint against invented specifics\n"
+        "all still apply.\n\n"
+        f"{guidance.strip()}\n"
+    )
+
+
+# Delimits each section in a batch redraft. Not the section's own header: the
+# monthly format's headers are exactly what clean_ai_content and the models
+# both like to reshape, and a batch that cannot be split is a batch wasted.
+_BATCH_MARKER = "=== SECTION: {key} ==="
+_BATCH_MARKER_RE = re.compile(r'^\s*=+\s*SECTION:\s*(.+?)\s*=+\s*$', re.MULTILINE)
+
+
+@span("gemini.generate_sections_redraft")
+def generate_sections_redraft(api_key, sections, issue_text, month_year=None):
+    """Rewrite SEVERAL sections in one call. `sections` maps section key to its
+    guidance (blank for none), in the order they should be written.
+
+    One request instead of one per section: a reviewer who wants the Desk, the
+    summary and the predictions redone used to pay three round-trips and three
+    units of daily quota for what the model can do in one pass — and in one
+    pass it also sees its own new Desk while writing the new summary, so the
+    two stop contradicting each other.
+
+    Returns ({section: body without header}, model). A section the response
+    does not contain is simply absent from the dict; the caller decides whether
+    a partial batch is acceptable.
+    """
+    unknown = [k for k in sections if k not in REDRAFTABLE_SECTIONS]
+    if unknown:
+        raise ValueError(f"not redraftable: {', '.join(unknown)}")
+    if not sections:
+        raise ValueError("no sections to redraft.")
+
+    blocks = []
+    for key, guidance in sections.items():
+        blocks.append(
+            f"{_BATCH_MARKER.format(key=key)}\n"
+            f"SPECIFICATION:\n\n{REDRAFTABLE_SECTIONS[key]['spec']()}\n"
+            f"{_redraft_guidance(guidance)}"
+        )
+    markers = "\n".join(_BATCH_MARKER.format(key=k) for k in sections)
+
+    context = _redraft_context(issue_text, month_year)
+    prompt = f"""{context}
+
+YOUR TASK
+Rewrite each of the {len(sections)} sections specified below. Each must be
+materially different from the version currently in the issue — a new angle or a
+sharper argument, not a paraphrase. Everything else in the issue stays as it is. The rewritten sections
+will sit side by side in the same issue, so they must agree with each other.
+
+{chr(10).join(blocks)}
+OUTPUT RULES
+Return the sections in the order above. Start each one with its marker line,
+exactly as written here and on a line of its own:
+
+{markers}
+
+After each marker, return ONLY the body of that section. Do NOT repeat the
+section header. Do not add a preamble, a sign-off, markdown, or any commentary
+about what you changed. Plain text only — no *, no **, no #.
+"""
+
+    result = _call_gemini(
+        api_key, prompt,
+        max_output_tokens=min(8192, 2048 * len(sections)),
+        temperature=0.8,
+        use_search=False,
+        min_chars=40,
+        cache_prefix=context,
+    )
+    return split_batch_redraft(result["content"], sections), result["model"]
+
+
+def split_batch_redraft(text, sections):
+    """Cut a batch response at its marker lines. Markers for keys that were not
+    requested are ignored rather than trusted."""
+    found = {}
+    hits = list(_BATCH_MARKER_RE.finditer(text))
+    wanted = {k.upper(): k for k in sections}
+    for i, m in enumerate(hits):
+        key = wanted.get(m.group(1).strip().upper())
+        if not key or key in found:
+            continue
+        end = hits[i + 1].start() if i + 1 < len(hits) else len(text)
+        body = _strip_section_header(text[m.end():end], key)
+        if body:
+            found[key] = body
+    return found
+
+
 def _strip_section_header(text, section):
     """Drop a repeated header line. The spec says not to emit one, but models
     echo the header they were just shown often enough that leaving it in would
@@ -490,8 +910,9 @@ Weak: "How can we better take advantage of AI?"
 
 Write one or two sentences maximum, ending in a question mark."""
 
-def _shared_rules_block(month_year, prev_month, is_backfill=False, today=None):
-    today_str = (today or datetime.now()).strftime('%B %d, %Y')
+def _rules_source(month_year, prev_month, today_str, backfill_notice):
+    """The rules block as written. Called ONCE, at import, with placeholder
+    slots for the four date-dependent values — see _RULES_TEMPLATE."""
     # Drawn from the one list in utils.py rather than retyped here, so the
     # names the prompt asks for and the names the renderer orders by cannot
     # drift apart. A sample, not the whole set — the point is to establish the
@@ -550,9 +971,7 @@ reported fact something that has not occurred, with a source line implying
 somebody published it. Predictions belong in LOOKING AHEAD, labelled as
 predictions, and nowhere else. Any item dated after today is discarded before
 publication, so writing one costs you the slot and gains nothing.
-{"" if not is_backfill else f'''
-BACKFILL NOTICE: This is a re-run of the {month_year} report, being regenerated after {month_year} has already ended. Today's real date is later than {month_year} — ignore that. Your search results will surface newer news by default; you must actively filter it out. Every single item, statistic, and example must be dated within {month_year}. If you cannot find 8 qualifying developments strictly from {month_year}, use fewer rather than reaching into a later month.
-'''}
+{backfill_notice}
 
 SOURCE QUALITY RULE: Only cite primary sources — official company blogs, government press releases, major news outlets (Globe and Mail, Financial Post, CBC, Reuters, Bloomberg, TechCrunch, The Verge, Wired). Do NOT cite newsletters, podcast episodes, Substack posts, Medium posts, personal or community blogs, or aggregator summaries. If a result looks like "26: GPT-5.5, Claude Mythos & What It Means" or "Episode 14: ..." it is a newsletter/podcast — skip it and find the original primary source instead.
 
@@ -809,3 +1228,35 @@ Use only real, verifiable Canadian stats from: Statistics Canada, BDC, ISED, CIR
 
 ---
 Context: {month_year} edition"""
+
+
+# ---------------------------------------------------------------------------
+# Compiled once. The rules block is ~5,000 words of f-string and every value in
+# it except four is fixed at import — the specs, the preamble, the brand list.
+# Rebuilding it per call re-evaluated all of that to change a month name, so it
+# is now built once with a {{ name }} slot where each date goes and compiled
+# with page_template's compile_template, the same splitter the issue page uses;
+# a call is one render(). _shared_rules_block() returns exactly what the
+# f-string did: same text, same order.
+# ---------------------------------------------------------------------------
+def _slot(name):
+    return "{{ %s }}" % name
+
+
+def _backfill_source(month_year):
+    return f"""
+BACKFILL NOTICE: This is a re-run of the {month_year} report, being regenerated after {month_year} has already ended. Today's real date is later than {month_year} — ignore that. Your search results will surface newer news by default; you must actively filter it out. Every single item, statistic, and example must be dated within {month_year}. If you cannot find 8 qualifying developments strictly from {month_year}, use fewer rather than reaching into a later month.
+"""
+
+
+_BACKFILL_TEMPLATE = compile_template(_backfill_source(_slot("month_year")), {})
+
+_RULES_TEMPLATE = compile_template(_rules_source(_slot("month_year"), _slot("prev_month"),
+                                                 _slot("today_str"), _slot("backfill_notice")), {})
+
+
+def _shared_rules_block(month_year, prev_month, is_backfill=False, today=None):
+    today_str = (today or datetime.now()).strftime('%B %d, %Y')
+    backfill_notice = render(_BACKFILL_TEMPLATE, {"month_year": month_year}) if is_backfill else ""
+    return render(_RULES_TEMPLATE, {"month_year": month_year, "prev_month": prev_month,
+                                    "today_str": today_str, "backfill_notice": backfill_notice})
@@ -2,12 +2,28 @@
 generate-blog.py
 Entry point for the monthly blog generator.
 Imports from modular scripts: gemini, parser, renderer, blog_index, utils.
+
+Backfill mode covers a run of past months in one invocation:
+
+    python3 scripts/generate-blog.py --backfill "June 2026..September 2026"
+
+Re-running past months used to mean one monthly-blog.yml dispatch per month,
+each a serial generate -> render -> index -> commit cycle that re-indexed the
+whole archive. Here the Gemini calls run concurrently (bounded by --workers and
+by the leader model's remaining daily quota), rendering runs on a process pool
+because it is CPU-bound BeautifulSoup and f-string work, and the index, feed,
+pillar and sitemap are rebuilt ONCE at the end instead of once per month.
+
+--profile DIR writes a cProfile dump and flame-graph stacks of the run, and
+$RUN_REPORT collects its timing spans (profiling.py).
 """
 
 import argparse
+import calendar
+import contextlib
 import os
 import sys
-import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Ensure the scripts/ directory is on the path so sibling modules resolve
@@ -17,11 +33,190 @@ _scripts = os.path.join(os.getcwd(), 'scripts')
 sys.path.insert(0, _here)
 sys.path.insert(0, _scripts)
 
-from utils import clean_filename, get_issue_labels
+from utils import clean_filename, get_issue_labels, load_model_config, model_requests_today
 from gemini import generate_blog_with_gemini
-from parser import extract_title_and_excerpt, log_model_outline
+from parser import extract_title_and_excerpt, issue_text, log_model_outline, parse_structured_issue
 from renderer import create_html_blog_post
 from blog_index import update_blog_index
+from atomic_write import publish, write_text
+from profiling import span, start as start_profiling
+
+
+# Worst case per month, not the usual one: a 503 buys the same model a second
+# attempt and a 400/404 retries without grounding, so one issue can cost three
+# requests against the leader's daily limit before any fallback kicks in.
+BACKFILL_REQUESTS_PER_MONTH = 3
+
+
+def parse_month_range(spec):
+    """'June 2026..September 2026' -> [datetime(2026, 6, 1), ..., datetime(2026, 9, 1)].
+
+    Same 'Month YYYY' format as --coverage-month. A single month with no '..'
+    is a range of one. Raises ValueError on a bad month or a reversed range
+    rather than guessing, because a guessed backfill spends real quota.
+    """
+    start_s, sep, end_s = spec.partition("..")
+    start = datetime.strptime(start_s.strip(), "%B %Y")
+    end = datetime.strptime(end_s.strip(), "%B %Y") if sep else start
+    if end < start:
+        raise ValueError(f"range runs backwards: {spec!r}")
+    months = []
+    cur = start
+    while cur <= end:
+        months.append(cur)
+        cur = cur.replace(year=cur.year + 1, month=1) if cur.month == 12 \
+            else cur.replace(month=cur.month + 1)
+    return months
+
+
+def backfill_quota(months):
+    """How many of `months` fit in the leader model's remaining daily quota."""
+    cfg = load_model_config()
+    leader = cfg["order"][0]
+    limit = int(cfg["limits"].get(leader, 0) or 0)
+    used = model_requests_today(leader)
+    if not limit:
+        return len(months), leader, used, limit
+    fits = max(0, (limit - used) // BACKFILL_REQUESTS_PER_MONTH)
+    return min(len(months), fits), leader, used, limit
+
+
+def generate_issue(api_key, topic=None, coverage_date=None, structured=False, record_dir=None):
+    """One issue from Gemini: (content, issue).
+
+    `issue` is the pre-parsed dict when structured mode produced usable JSON,
+    else None and the renderer parses `content` as text. A structured response
+    that does not load falls back to ONE text-mode generation rather than
+    failing the run — it costs a request, but an issue missing its month costs
+    more.
+    """
+    result = generate_blog_with_gemini(api_key, topic, coverage_date=coverage_date,
+                                       structured=structured)
+    _record(record_dir, result, coverage_date)
+    if not structured:
+        return result["content"], None
+    issue = parse_structured_issue(result["content"], coverage_date or datetime.now())
+    if issue is not None:
+        return issue_text(issue), issue
+    print("  Structured output unusable — regenerating once in text mode.")
+    result = generate_blog_with_gemini(api_key, topic, coverage_date=coverage_date)
+    _record(record_dir, result, coverage_date)
+    return result["content"], None
+
+
+def _record(record_dir, result, coverage_date):
+    """Keep the raw model output, for scripts/bench_parse.py. Never raises."""
+    if not record_dir:
+        return
+    try:
+        os.makedirs(record_dir, exist_ok=True)
+        stamp = (coverage_date or datetime.now()).strftime("%Y-%m")
+        ext = "json" if result.get("structured") else "txt"
+        path = os.path.join(record_dir, f"{stamp}-{datetime.now():%Y%m%d%H%M%S}.{ext}")
+        write_text(path, result["content"])
+        print(f"  Recorded raw output: {path}")
+    except Exception as e:
+        print(f"  NOTE: could not record raw output ({e})")
+
+
+def _generate_month(api_key, topic, coverage_date, structured=False, record_dir=None):
+    content, issue = generate_issue(api_key, topic, coverage_date, structured, record_dir)
+    labels = get_issue_labels(coverage_date)
+    title, excerpt = extract_title_and_excerpt(
+        content, labels["issue_month_year"], labels["coverage_month_name"]
+    )
+    return content, title, excerpt, issue
+
+
+def _write_file(path, html_content):
+    write_text(path, html_content, fsync_dir=True)
+
+
+@span("generate_blog.run_backfill")
+def run_backfill(api_key, spec, topic=None, output="posts", workers=2,
+                 structured=False, record_dir=None):
+    """Generate, render and write every month in `spec`; index once at the end.
+
+    Returns (written_paths, failed_months). A month that fails does not stop the
+    others — its quota is already spent and the rest are independent.
+    """
+    months = parse_month_range(spec)
+    fits, leader, used, limit = backfill_quota(months)
+    print(f"Backfill: {len(months)} month(s), {spec}")
+    print(f"  Quota: {leader} {used}/{limit or '?'} today, "
+          f"budgeting {BACKFILL_REQUESTS_PER_MONTH} requests per month")
+    if fits < len(months):
+        skipped = [m.strftime("%B %Y") for m in months[fits:]]
+        print(f"  WARNING: only {fits} month(s) fit in today's quota. "
+              f"Not attempting: {', '.join(skipped)}. Re-run those after the "
+              f"midnight-Pacific reset.")
+        months = months[:fits]
+    if not months:
+        return [], []
+
+    is_draft = output != "posts"
+    output_dir = os.path.join("blog", output)
+    written, failed = [], []
+
+    # Threads for Gemini (network-bound, and record_gemini_request is locked
+    # for exactly this), processes for rendering (CPU-bound). Each month is
+    # handed to the render pool the moment its generation lands, so the two
+    # stages overlap instead of running as two serial phases.
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as gen_pool, \
+         ProcessPoolExecutor(max_workers=max(1, min(len(months), os.cpu_count() or 1))) as render_pool:
+        gen_futures = {gen_pool.submit(_generate_month, api_key, topic, m, structured, record_dir): m
+                       for m in months}
+        render_futures = {}
+        for fut in as_completed(gen_futures):
+            month = gen_futures[fut]
+            label = month.strftime("%B %Y")
+            try:
+                content, title, excerpt, issue = fut.result()
+            except Exception as e:
+                print(f"  FAILED generating {label}: {e}")
+                failed.append(label)
+                continue
+            print(f"  Generated {label}: {title}")
+            # Submitted as renderer.create_html_blog_post itself: this file's
+            # hyphenated name is not importable, so a wrapper defined here
+            # could not be pickled into a spawned worker.
+            render_futures[render_pool.submit(
+                create_html_blog_post, content, title, excerpt,
+                coverage_date=month, is_draft=is_draft, issue=issue)] = (month, title)
+
+        for fut in as_completed(render_futures):
+            month, title = render_futures[fut]
+            label = month.strftime("%B %Y")
+            try:
+                html_content = fut.result()
+            except Exception as e:
+                print(f"  FAILED rendering {label}: {e}")
+                failed.append(label)
+                continue
+            # Dated on the coverage month's last day — the day the monthly
+            # run would have published it — not today, so the archive sorts
+            # and month-dedups the way it would have had the runs happened.
+            last_day = calendar.monthrange(month.year, month.month)[1]
+            iso_date = month.replace(day=last_day).strftime("%Y-%m-%d")
+            out_path = os.path.join(output_dir, f"{iso_date}-{clean_filename(title)}.html")
+            _write_file(out_path, html_content)
+            written.append(out_path)
+            print(f"  Saved: {out_path}")
+
+    return written, failed
+
+
+def finish_backfill(written, output):
+    """The once-per-backfill tail: index/feed/pillar, latest.html, sitemap."""
+    if output != "posts" or not written:
+        print("Staging mode — blog/index.html NOT updated (production unchanged)")
+        return
+    # A backfill is usually of PAST months; latest.html only moves if one of
+    # them is now the newest dated issue, which update_blog_index works out
+    # from the archive itself. Also rebuilds the sitemaps, once every page
+    # they list exists.
+    update_blog_index()
+    print("Blog index updated.")
 
 
 def main():
@@ -39,7 +234,27 @@ def main():
             "Omit for a normal run — defaults to the current month."
         ),
     )
+    parser.add_argument(
+        "--backfill",
+        help=(
+            "Generate a RANGE of past coverage months in one run, format "
+            "'Month YYYY..Month YYYY' e.g. 'June 2026..September 2026'. "
+            "Months are generated concurrently within today's quota and the "
+            "index, feed, pillar and sitemap are rebuilt once at the end."
+        ),
+    )
+    parser.add_argument("--structured", action="store_true",
+                        help="Ask Gemini for schema-constrained JSON instead of "
+                             "header-delimited text; falls back to text if unusable")
+    parser.add_argument("--record", metavar="DIR",
+                        help="Also save the raw model output to DIR, for scripts/bench_parse.py")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="Concurrent Gemini calls in --backfill mode (default 2; "
+                             "the free tier's per-minute limits make more counterproductive)")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="Write a cProfile .prof and a flame-graph .collapsed file for this run to DIR")
     args = parser.parse_args()
+    start_profiling("generate-blog.py", args.profile)
 
     print("=== Blog Generator ===")
 
@@ -48,6 +263,28 @@ def main():
         print("ERROR: GEMINI_API_KEY not set.")
         sys.exit(1)
 
+    if args.backfill:
+        # Same publish() as a single issue: the months' posts go live with
+        # the index that lists them. Staging output is not indexed, so its
+        # posts are written as each render lands.
+        try:
+            with publish() if args.output == "posts" else contextlib.nullcontext():
+                written, failed = run_backfill(api_key, args.backfill, args.topic,
+                                               args.output, args.workers,
+                                               args.structured, args.record)
+                finish_backfill(written, args.output)
+        except Exception as e:
+            print(f"FAILED: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
+        print(f"Backfill: {len(written)} written, {len(failed)} failed"
+              + (f" ({', '.join(failed)})" if failed else ""))
+        if failed or not written:
+            sys.exit(1)
+        print("SUCCESS.")
+        return
+
     coverage_date = None
     if args.coverage_month:
         try:
@@ -58,19 +295,20 @@ def main():
                   f"(expected format 'Month YYYY', e.g. 'June 2026'). Using current month instead.")
 
     try:
-        result = generate_blog_with_gemini(api_key, args.topic, coverage_date=coverage_date)
-        log_model_outline(result["content"])
+        content, issue = generate_issue(api_key, args.topic, coverage_date,
+                                        args.structured, args.record)
+        log_model_outline(content)
         labels = get_issue_labels(coverage_date)
         title, excerpt = extract_title_and_excerpt(
-            result["content"], labels["issue_month_year"], labels["coverage_month_name"]
+            content, labels["issue_month_year"], labels["coverage_month_name"]
         )
 
         print(f"Title:   {title}")
         print(f"Excerpt: {excerpt[:80]}...")
 
         html_content = create_html_blog_post(
-            result["content"], title, excerpt,
-            coverage_date=coverage_date, is_draft=(args.output != "posts")
+            content, title, excerpt,
+            coverage_date=coverage_date, is_draft=(args.output != "posts"), issue=issue
         )
 
         iso_date   = datetime.now().strftime("%Y-%m-%d")
@@ -79,30 +317,24 @@ def main():
         os.makedirs(output_dir, exist_ok=True)
 
         out_path = os.path.join(output_dir, filename)
-        with open(out_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-            f.flush()
-            os.fsync(f.fileno())
-        print(f"Saved: {out_path}")
-
-        if args.output == "posts":
-            latest_path = os.path.join("blog", "posts", "latest.html")
-            os.makedirs(os.path.dirname(latest_path), exist_ok=True)
-            with open(latest_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
-                f.flush()
-                os.fsync(f.fileno())
-            print("Updated latest.html")
-        else:
-            print("Staging mode — latest.html NOT updated (production unchanged)")
-
-        time.sleep(0.2)
 
+        # latest.html is an alias update_blog_index() writes for the newest
+        # issue; it is never a second copy of the post. The post and
+        # everything indexed from it are one publish(). The post used to be
+        # renamed into place first, so an index run that died left a live
+        # issue that no index, feed or sitemap listed. post_registry and the
+        # index's readers see the staged post through atomic_write.
         if args.output == "posts":
-            update_blog_index()
+            with publish():
+                _write_file(out_path, html_content)
+                update_blog_index()
+            print(f"Saved: {out_path}")
             print("Blog index updated.")
         else:
-            print("Staging mode — blog/index.html NOT updated (production unchanged)")
+            _write_file(out_path, html_content)
+            print(f"Saved: {out_path}")
+            print("Staging mode — blog/index.html and latest.html NOT updated "
+                  "(production unchanged)")
 
         print("SUCCESS.")
 
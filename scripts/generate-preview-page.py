@@ -3,9 +3,28 @@
 generate-preview-page.py
 Generates blog/staging/preview.html — the approval UI Robert visits to review,
 regenerate with a prompt, or approve and publish his monthly blog post.
+
+The page used to carry its whole stylesheet and script inline, about 90 KB
+rebuilt on every generate, regenerate and redraft, and downloaded again on
+every visit and every completion poll, usually over a phone connection. Now
+it is three parts:
+
+  blog/staging/assets/preview.<hash>.css, .js   static, from preview_assets/;
+                                                 only a code change renames them
+  blog/staging/preview.json                      this draft's values: filename,
+                                                 months, run id, Desk draft,
+                                                 quota snapshot, survey questions
+  blog/staging/preview.html                      the markup, with the same
+                                                 payload embedded
+
+and status.json beside them (run_status.py) marks the draft "ready", which is
+the file the open review screen polls to learn that this run has finished.
+sections.json keeps the draft's sections as text, so the next build can show
+what a regenerate or redraft changed (section_diff.py).
 """
 
 import argparse
+import hashlib
 import os
 import sys
 import json
@@ -29,6 +48,17 @@ try:
 except ImportError:
     ZoneInfo = None
 
+ROOT = os.path.dirname(_here)
+# The review screen's stylesheet and script, kept as plain files rather than
+# 1,400 lines of doubled braces in the f-string below. Published under
+# content-hashed names, so they are cached like any static file and a new
+# draft only ships its markup and payload.
+ASSET_SRC = os.path.join(_here, "preview_assets")
+ASSET_DIR = os.path.join("blog", "staging", "assets")
+ASSET_URL = "/blog/staging/assets/"
+STAGING_URL = "/blog/staging/"
+STATUS_URL = "/blog/staging/status.json"
+
 
 _QUOTA_HELP_URL = ("https://console.cloud.google.com/apis/api/"
                    "generativelanguage.googleapis.com/quotas")
@@ -164,7 +194,61 @@ def _extract_desk_draft(staging_filename: str) -> str:
     return "\n\n".join(paragraphs)
 
 
-def build_preview_html(staging_filename: str, month_year: str, run_id: str, regenerated: bool = False) -> str:
+def asset_names():
+    """{"css": name, "js": name} — the static assets under their content-hashed
+    names. A change to either file changes its name, so the page can never be
+    served with last month's script."""
+    names = {}
+    for kind in ("css", "js"):
+        with open(os.path.join(ASSET_SRC, f"preview.{kind}"), "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:10]
+        names[kind] = f"preview.{digest}.{kind}"
+    return names
+
+
+def write_assets(root=ROOT):
+    """Copy the static assets into blog/staging/assets/ under their hashed
+    names. Older copies go, except any that preview.html or the sample screen
+    still links: a reviewer holding that page open would otherwise lose its
+    script before its own stale check could tell them to reload. Returns the
+    names."""
+    from atomic_write import listdir, remove, write_bytes
+    out_dir = os.path.join(root, ASSET_DIR)
+    names = asset_names()
+    linked = set()
+    for page in ("preview.html", "preview-sample.html"):
+        try:
+            with open(os.path.join(root, "blog", "staging", page), encoding="utf-8") as f:
+                linked.update(_re.findall(r'/assets/(preview\.[0-9a-f]+\.(?:css|js))"', f.read()))
+        except OSError:
+            pass
+    for kind, name in names.items():
+        with open(os.path.join(ASSET_SRC, f"preview.{kind}"), "rb") as f:
+            write_bytes(os.path.join(out_dir, name), f.read())
+    for name in listdir(out_dir):
+        if name not in names.values() and name not in linked:
+            remove(os.path.join(out_dir, name))
+    return names
+
+
+def build_preview_html(staging_filename: str, month_year: str, run_id: str, regenerated: bool = False,
+                       **kwargs) -> str:
+    return build_preview(staging_filename, month_year, run_id, regenerated, **kwargs)[0]
+
+
+def build_preview(staging_filename: str, month_year: str, run_id: str, regenerated: bool = False,
+                  frame_dir: str = STAGING_URL, live: str = STATUS_URL, changes=None):
+    """(page html, payload) for one draft.
+
+    The page is the review screen's markup only. Its stylesheet and script are
+    static files (preview_assets/, published by write_assets()), and every
+    value the script needs for THIS draft is in the payload: embedded in the
+    page as JSON, and written beside it as preview.json for run_status.py.
+    `frame_dir` is where the draft is served and `live` the status.json the
+    script polls; the sample screen points them at a published post and at
+    nothing. `changes` is section_diff.diff() against the previous draft, shown
+    as a "What changed" panel; None when there is nothing to compare with.
+    """
     repo = os.environ.get("GITHUB_REPOSITORY", "imetrobert/imetrobert.github.io")
 
     # `month_year` arrives from the workflow as the COVERAGE month (the real
@@ -190,7 +274,6 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
     # — which is what lets the reviewer copy a share link without hunting for it
     # after the fact, and without reaching for latest.html.
     permalink = f"https://www.imetrobert.com/blog/posts/{staging_filename}"
-    permalink_json = json.dumps(permalink)
 
     # Build the wave form from the live survey config, so adding or renaming a
     # question in data/survey.json changes the form without touching this file.
@@ -198,13 +281,11 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
         _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         with open(os.path.join(_root, "data", "survey.json"), encoding="utf-8") as _f:
             _cfg = json.load(_f)
-        survey_questions_json = json.dumps(
-            [{"id": q["id"], "text": q["text"], "options": q["options"]}
-             for q in _cfg.get("questions", [])]
-        )
+        survey_questions = [{"id": q["id"], "text": q["text"], "options": q["options"]}
+                            for q in _cfg.get("questions", [])]
         _has_form = bool((_cfg.get("form_url") or "").strip())
     except Exception:
-        survey_questions_json = "[]"
+        survey_questions = []
         _has_form = False
 
     # The wave form is hidden until a form_url exists. Until one does there are
@@ -234,6 +315,9 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
             '</details>'
         )
 
+    from section_diff import render as render_changes
+    changes_panel = render_changes(changes)
+
     regen_badge = ""
     if regenerated:
         regen_badge = '<div class="regen-badge">🔄 Regenerated with custom prompt</div>'
@@ -254,9 +338,6 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
     # from nothing is a much bigger ask than editing. A localStorage draft
     # still wins over this — see initTake().
     generated_stamp = _generated_stamp()
-    generated_stamp_json = json.dumps(generated_stamp)
-    quota_baked = _quota_snapshot()
-    quota_limits_json = json.dumps(_model_daily_limits())
     quota_help_light = _quota_help_html(dark=False)
     quota_help_dark = _quota_help_html(dark=True)
 
@@ -270,7 +351,27 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
         "The model left this section empty. Whatever you type here is what publishes."
     )
 
-    return f"""<!DOCTYPE html>
+    payload = {
+        "repo": repo,
+        "filename": staging_filename,
+        "issue_month_year": issue_month_year,
+        "coverage_month_year": coverage_month_year,
+        "run_id": str(run_id),
+        "regenerated": bool(regenerated),
+        "generated": generated_stamp,
+        "permalink": permalink,
+        "desk_draft": desk_draft,
+        "quota": {"requests": _quota_snapshot(), "limits": _model_daily_limits()},
+        "survey_questions": survey_questions,
+        "frame_dir": frame_dir,
+        "live": live,
+    }
+    # "</" closes the script element wherever it appears, even inside a JSON
+    # string, and the desk draft is free text.
+    payload_json = json.dumps(payload, ensure_ascii=False).replace("</", "<\\/")
+    assets = asset_names()
+
+    html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
@@ -284,462 +385,7 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
   <meta http-equiv="Pragma" content="no-cache">
   <meta http-equiv="Expires" content="0">
   <title>Review: {issue_month_year} Issue (covers {coverage_month_name}) — Robert Simon</title>
-  <style>
-    :root {{
-      --blue:    #2563eb;
-      --cyan:    #06b6d4;
-      --navy:    #0f172a;
-      --gray:    #475569;
-      --light:   #f8fafc;
-      --border:  #e2e8f0;
-      --green:   #16a34a;
-      --red:     #dc2626;
-      --amber:   #d97706;
-      --white:   #ffffff;
-      --shadow:  0 4px 24px rgb(0 0 0 / 0.10);
-    }}
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    body {{
-      font-family: 'Inter', -apple-system, sans-serif;
-      background: linear-gradient(160deg, #f0f4ff 0%, #e8eef8 100%);
-      min-height: 100vh;
-      color: var(--navy);
-    }}
-    .topbar {{
-      background: var(--white);
-      border-bottom: 1px solid var(--border);
-      padding: 1rem 2rem;
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      position: sticky;
-      top: 0;
-      z-index: 100;
-      box-shadow: 0 1px 4px rgb(0 0 0 / 0.06);
-    }}
-    .topbar-left {{ display: flex; align-items: center; gap: 1rem; }}
-    .logo {{ font-weight: 800; font-size: 1.1rem; color: var(--blue); }}
-    .issue-label {{
-      background: linear-gradient(135deg, var(--blue), var(--cyan));
-      color: white;
-      font-size: 0.7rem;
-      font-weight: 700;
-      padding: 0.2rem 0.7rem;
-      border-radius: 12px;
-      letter-spacing: 0.06em;
-      text-transform: uppercase;
-    }}
-    .topbar-right {{ display: flex; gap: 0.75rem; align-items: center; }}
-    .btn {{
-      display: inline-flex;
-      align-items: center;
-      gap: 0.4rem;
-      padding: 0.6rem 1.25rem;
-      border-radius: 10px;
-      font-size: 0.875rem;
-      font-weight: 600;
-      cursor: pointer;
-      border: none;
-      transition: all 0.2s;
-      text-decoration: none;
-    }}
-    .btn:disabled {{ opacity: 0.5; cursor: not-allowed; }}
-    .btn-primary {{
-      background: linear-gradient(135deg, var(--green), #15803d);
-      color: white;
-      box-shadow: 0 2px 8px rgb(22 163 74 / 0.3);
-    }}
-    .btn-primary:hover:not(:disabled) {{ transform: translateY(-1px); box-shadow: 0 4px 16px rgb(22 163 74 / 0.4); }}
-    .btn-secondary {{
-      background: linear-gradient(135deg, var(--blue), var(--cyan));
-      color: white;
-      box-shadow: 0 2px 8px rgb(37 99 235 / 0.2);
-    }}
-    .btn-secondary:hover:not(:disabled) {{ transform: translateY(-1px); box-shadow: 0 4px 16px rgb(37 99 235 / 0.3); }}
-    .btn-outline {{
-      background: white;
-      color: var(--gray);
-      border: 1px solid var(--border);
-    }}
-    .btn-outline:hover {{ border-color: var(--blue); color: var(--blue); }}
-    .btn-discard-outline {{
-      background: white;
-      color: #b91c1c;
-      border: 1px solid #fecaca;
-    }}
-    .btn-discard-outline:hover:not(:disabled) {{ border-color: var(--red); background: #fef2f2; }}
-    .btn-force-refresh {{
-      background: linear-gradient(135deg, #7c3aed, #6d28d9);
-      color: white;
-      box-shadow: 0 2px 8px rgb(124 58 237 / 0.3);
-    }}
-    .btn-force-refresh:hover {{ transform: translateY(-1px); box-shadow: 0 4px 16px rgb(124 58 237 / 0.4); }}
-    .btn-force-refresh.spinning svg {{
-      animation: spin 0.7s linear infinite;
-    }}
-    @keyframes spin {{ to {{ transform: rotate(360deg); }} }}
-    .layout {{
-      display: grid;
-      grid-template-columns: 340px 1fr;
-      gap: 0;
-      min-height: calc(100vh - 65px);
-    }}
-    .sidebar {{
-      background: var(--white);
-      border-right: 1px solid var(--border);
-      padding: 1.75rem 1.5rem;
-      overflow-y: auto;
-      position: sticky;
-      top: 65px;
-      height: calc(100vh - 65px);
-    }}
-    .sidebar-section {{ margin-bottom: 2rem; }}
-    .take-hint {{ font-size: 0.72rem; color: #64748b; line-height: 1.55; margin-bottom: 0.6rem; }}
-    .take-meta {{ display: flex; justify-content: space-between; font-size: 0.68rem; color: #94a3b8; margin-top: 0.35rem; }}
-    .take-saved {{ color: #16a34a; font-weight: 600; }}
-    .perma-row {{ display: flex; align-items: center; gap: 0.5rem; background: #f8fafc; border: 1px solid #e2e8f0; border-radius: 8px; padding: 0.5rem 0.6rem; }}
-    .perma-row code {{ flex: 1; font-size: 0.66rem; word-break: break-all; color: #1e293b; }}
-    .survey-block summary {{ cursor: pointer; list-style: none; }}
-    .survey-block summary::-webkit-details-marker {{ display: none; }}
-    .survey-block summary::before {{ content: "\25B8 "; color: #94a3b8; }}
-    .survey-block[open] summary::before {{ content: "\25BE "; }}
-    .survey-label {{ display: block; font-size: 0.7rem; font-weight: 600; color: #475569; margin: 0.5rem 0 0.15rem; }}
-    .survey-input {{ width: 100%; padding: 0.4rem 0.55rem; border: 1px solid #e2e8f0; border-radius: 6px; font: inherit; font-size: 0.78rem; }}
-    .survey-q {{ margin-top: 0.9rem; padding-top: 0.6rem; border-top: 1px dashed #e2e8f0; }}
-    .survey-q-text {{ font-size: 0.72rem; font-weight: 700; color: #1e293b; margin-bottom: 0.3rem; }}
-    .survey-opt {{ display: flex; align-items: center; gap: 0.4rem; margin-bottom: 0.25rem; }}
-    .survey-opt span {{ flex: 1; font-size: 0.68rem; color: #475569; }}
-    .survey-opt input {{ width: 4.5rem; padding: 0.25rem 0.4rem; border: 1px solid #e2e8f0; border-radius: 5px; font: inherit; font-size: 0.72rem; }}
-    .sidebar-section h3 {{
-      font-size: 0.7rem;
-      font-weight: 700;
-      text-transform: uppercase;
-      letter-spacing: 0.08em;
-      color: #94a3b8;
-      margin-bottom: 1rem;
-      padding-bottom: 0.5rem;
-      border-bottom: 1px solid var(--border);
-    }}
-    .status-card {{
-      background: var(--light);
-      border: 1px solid var(--border);
-      border-radius: 10px;
-      padding: 1rem;
-      margin-bottom: 1rem;
-    }}
-    .status-row {{
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      font-size: 0.8rem;
-      margin-bottom: 0.5rem;
-    }}
-    .status-row:last-child {{ margin-bottom: 0; }}
-    .status-label {{ color: var(--gray); }}
-    .status-value {{ font-weight: 600; color: var(--navy); font-size: 0.78rem; }}
-    .badge-pending {{
-      background: #fef3c7;
-      color: var(--amber);
-      padding: 0.15rem 0.5rem;
-      border-radius: 8px;
-      font-size: 0.68rem;
-      font-weight: 700;
-    }}
-    .pat-section input {{
-      width: 100%;
-      padding: 0.6rem 0.875rem;
-      border: 1.5px solid var(--border);
-      border-radius: 8px;
-      font-size: 0.8rem;
-      font-family: monospace;
-      margin-bottom: 0.5rem;
-      transition: border-color 0.2s;
-      background: var(--light);
-    }}
-    .pat-section input:focus {{ outline: none; border-color: var(--blue); background: white; }}
-    .pat-hint {{
-      font-size: 0.72rem;
-      color: #94a3b8;
-      line-height: 1.5;
-      margin-top: 0.25rem;
-    }}
-    .pat-hint a {{ color: var(--blue); }}
-    .pat-saved {{ display: none; font-size: 0.75rem; color: var(--green); margin-top: 0.25rem; font-weight: 600; }}
-    .pat-missing-banner {{
-      background: #fef2f2;
-      border: 1px solid #fecaca;
-      border-radius: 10px;
-      padding: 0.875rem 1rem;
-      margin-bottom: 0.75rem;
-      font-size: 0.78rem;
-      color: #991b1b;
-      line-height: 1.55;
-    }}
-    .pat-missing-banner strong {{ display: block; margin-bottom: 0.3rem; color: #7f1d1d; }}
-    .pat-missing-banner a.btn {{
-      margin-top: 0.6rem;
-      width: 100%;
-      justify-content: center;
-      background: linear-gradient(135deg, var(--red), #b91c1c);
-      color: white;
-      box-shadow: 0 2px 8px rgb(220 38 38 / 0.25);
-    }}
-    .pat-missing-banner.attention {{ animation: patPulse 0.9s ease-in-out 2; }}
-    @keyframes patPulse {{
-      0%, 100% {{ box-shadow: none; }}
-      50% {{ box-shadow: 0 0 0 4px rgb(220 38 38 / 0.25); }}
-    }}
-    .prompt-area {{
-      width: 100%;
-      min-height: 120px;
-      padding: 0.75rem;
-      border: 1.5px solid var(--border);
-      border-radius: 8px;
-      font-size: 0.825rem;
-      font-family: inherit;
-      line-height: 1.6;
-      resize: vertical;
-      margin-bottom: 0.75rem;
-      transition: border-color 0.2s;
-      background: var(--light);
-    }}
-    .prompt-area:focus {{ outline: none; border-color: var(--blue); background: white; }}
-    .prompt-hint {{
-      font-size: 0.72rem;
-      color: #94a3b8;
-      margin-bottom: 0.75rem;
-      line-height: 1.5;
-    }}
-    .prompt-examples {{ margin-bottom: 0.875rem; }}
-    .prompt-examples p {{
-      font-size: 0.72rem;
-      font-weight: 600;
-      color: var(--gray);
-      margin-bottom: 0.4rem;
-    }}
-    .prompt-chip {{
-      display: inline-block;
-      background: #eff6ff;
-      color: var(--blue);
-      border: 1px solid #bfdbfe;
-      padding: 0.2rem 0.6rem;
-      border-radius: 8px;
-      font-size: 0.7rem;
-      cursor: pointer;
-      margin: 0.2rem 0.2rem 0.2rem 0;
-      transition: all 0.15s;
-    }}
-    .prompt-chip:hover {{ background: #dbeafe; border-color: var(--blue); }}
-    .approve-confirm {{
-      font-size: 0.78rem;
-      color: var(--gray);
-      line-height: 1.6;
-      margin-bottom: 0.875rem;
-    }}
-    .approve-confirm ul {{ padding-left: 1.2rem; margin-top: 0.5rem; }}
-    .approve-confirm li {{ margin-bottom: 0.3rem; }}
-    .preview-area {{
-      padding: 2rem;
-      overflow-y: auto;
-    }}
-    .preview-toolbar {{
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      margin-bottom: 1.25rem;
-      flex-wrap: wrap;
-      gap: 0.75rem;
-    }}
-    .preview-toolbar h2 {{
-      font-size: 1rem;
-      font-weight: 700;
-      color: var(--navy);
-    }}
-    .preview-meta {{ font-size: 0.78rem; color: #94a3b8; }}
-    .preview-frame {{
-      border: 1px solid var(--border);
-      border-radius: 16px;
-      overflow: hidden;
-      box-shadow: var(--shadow);
-      background: white;
-      position: relative;
-    }}
-    .preview-frame iframe {{
-      width: 100%;
-      height: calc(100vh - 220px);
-      border: none;
-      display: block;
-    }}
-    .iframe-loading {{
-      display: none;
-      position: absolute;
-      inset: 0;
-      background: rgba(248,250,252,0.85);
-      border-radius: 16px;
-      align-items: center;
-      justify-content: center;
-      flex-direction: column;
-      gap: 0.75rem;
-      z-index: 10;
-    }}
-    .iframe-loading.show {{ display: flex; }}
-    .iframe-loading-spinner {{
-      width: 36px; height: 36px;
-      border: 3px solid #e2e8f0;
-      border-top-color: #7c3aed;
-      border-radius: 50%;
-      animation: spin 0.7s linear infinite;
-    }}
-    .iframe-loading-text {{
-      font-size: 0.8rem;
-      color: var(--gray);
-      font-weight: 600;
-    }}
-    #toast {{
-      position: fixed;
-      bottom: 2rem;
-      left: 50%;
-      transform: translateX(-50%) translateY(100px);
-      background: var(--navy);
-      color: white;
-      padding: 0.875rem 1.5rem;
-      border-radius: 12px;
-      font-size: 0.875rem;
-      font-weight: 500;
-      z-index: 1000;
-      transition: transform 0.3s ease;
-      max-width: 480px;
-      text-align: center;
-      box-shadow: 0 8px 32px rgb(0 0 0 / 0.2);
-    }}
-    #toast.show {{ transform: translateX(-50%) translateY(0); }}
-    #toast.success {{ background: var(--green); }}
-    #toast.error   {{ background: var(--red); }}
-    #toast.info    {{ background: var(--blue); }}
-    #toast.purple  {{ background: #7c3aed; }}
-    #overlay {{
-      display: none;
-      position: fixed;
-      inset: 0;
-      background: rgba(15,23,42,0.6);
-      backdrop-filter: blur(4px);
-      z-index: 200;
-      align-items: center;
-      justify-content: center;
-    }}
-    #overlay.show {{ display: flex; }}
-    .overlay-card {{
-      background: white;
-      border-radius: 20px;
-      padding: 2.5rem;
-      max-width: 440px;
-      width: 90%;
-      text-align: center;
-      box-shadow: 0 20px 60px rgb(0 0 0 / 0.2);
-    }}
-    .overlay-icon {{ font-size: 3rem; margin-bottom: 1rem; }}
-    .overlay-title {{ font-size: 1.3rem; font-weight: 700; margin-bottom: 0.5rem; }}
-    .overlay-body  {{ font-size: 0.9rem; color: var(--gray); line-height: 1.65; margin-bottom: 1.5rem; }}
-    .spinner {{
-      width: 40px; height: 40px;
-      border: 3px solid #e2e8f0;
-      border-top-color: var(--blue);
-      border-radius: 50%;
-      animation: spin 0.8s linear infinite;
-      margin: 0 auto 1rem;
-    }}
-    .regen-badge {{
-      background: #fef3c7;
-      color: var(--amber);
-      border: 1px solid #fde68a;
-      padding: 0.4rem 1rem;
-      border-radius: 8px;
-      font-size: 0.78rem;
-      font-weight: 600;
-      display: inline-block;
-      margin-bottom: 0.75rem;
-    }}
-    .lock-banner {{
-      background: #fffbeb;
-      border: 1px solid #fde68a;
-      border-radius: 10px;
-      padding: 0.875rem 1rem;
-      margin-top: 0.75rem;
-      font-size: 0.78rem;
-      color: #92400e;
-      line-height: 1.55;
-    }}
-    .lock-banner strong {{ display: block; margin-bottom: 0.2rem; color: #78350f; }}
-    .lock-banner button {{
-      display: block;
-      margin-top: 0.6rem;
-      background: none;
-      border: none;
-      color: #92400e;
-      font-weight: 700;
-      font-size: 0.75rem;
-      text-decoration: underline;
-      cursor: pointer;
-      padding: 0;
-    }}
-    /* ── Mobile ───────────────────────────────────────────────────────
-       This screen is reviewed on a phone, not a desktop, so the phone layout
-       is the real one. Two things drive it:
-
-       1. The post comes FIRST. On a stacked layout the sidebar used to push
-          the actual draft 2,300px down the page — you scrolled past every
-          control, including Approve, before reaching the thing you came to
-          read. The preview is now first and the controls follow in the order
-          you need them: write your take, publish, grab the share link.
-       2. Inputs are 16px. Below that, iOS Safari zooms the viewport on focus
-          and does not zoom back out, which leaves the page stranded
-          mid-review. This is the single most common way a form breaks on
-          iPhone and it is invisible on a desktop browser. */
-    @media (max-width: 900px) {{
-      .layout {{ display: flex; flex-direction: column; }}
-      .preview-frame {{ order: 1; }}
-      .sidebar {{
-        order: 2; position: static; height: auto;
-        border-right: none; border-top: 1px solid var(--border);
-        display: flex; flex-direction: column; padding: 1.25rem 1rem 3rem;
-      }}
-      .preview-frame iframe {{ height: 78vh; }}
-
-      /* Controls in the order the review actually happens */
-      .sidebar > * {{ order: 50; }}
-      .sec-take    {{ order: 10; }}
-      .sec-approve {{ order: 20; }}
-      .sec-share   {{ order: 30; }}
-      .sec-regen   {{ order: 40; }}
-      .sec-status  {{ order: 60; }}
-      .sec-survey  {{ order: 70; }}
-      .pat-section {{ order: 80; }}
-      .sec-discard {{ order: 90; }}
-
-      .topbar {{ flex-wrap: wrap; gap: 0.5rem; padding: 0.6rem 0.9rem; height: auto; }}
-      .topbar-left {{ flex-wrap: wrap; gap: 0.5rem; }}
-      .topbar-right {{ width: 100%; justify-content: stretch; }}
-      .topbar-right .btn {{ flex: 1; text-align: center; }}
-      .sidebar {{ top: auto; }}
-
-      /* 16px stops iOS zooming on focus; 44px is the minimum comfortable tap.
-         The token field is type="password" and carries no class, so it slipped
-         past both the .pat-input and the input[type="text"] selectors and kept
-         zooming the page on focus. Kept as an explicit list rather than a bare
-         `input` so a future checkbox does not inherit a 16px font. */
-      .prompt-area, .survey-input, .pat-input, select, input[type="text"],
-      input[type="number"], input[type="password"], textarea {{ font-size: 16px; }}
-      .survey-opt input {{ width: 5.5rem; font-size: 16px; padding: 0.45rem; }}
-      .survey-opt span {{ font-size: 0.8rem; }}
-      .btn {{ min-height: 44px; }}
-      /* .btn's min-height does not reach the selects and inputs. */
-      select, .survey-input, input[type="password"] {{ min-height: 44px; }}
-      #take-input {{ min-height: 150px; }}
-      .perma-row {{ flex-wrap: wrap; }}
-      .perma-row code {{ flex-basis: 100%; font-size: 0.72rem; }}
-      .perma-row .btn {{ width: 100%; }}
-    }}
-  </style>
+  <link rel="stylesheet" href="{ASSET_URL}{assets['css']}">
 </head>
 <body>
 
@@ -877,6 +523,8 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
       </div>
     </div>
 
+    {changes_panel}
+
     <div class="sidebar-section pat-section" id="pat-section">
       <h3>GitHub Access Token</h3>
       <div id="pat-missing-banner" style="display:none;">
@@ -907,13 +555,14 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
 
     <div class="sidebar-section sec-redraft-section">
       <h3>Ask Gemini to redraft a section</h3>
-      <p class="take-hint">Rewrites one section in place. The rest of the issue,
+      <p class="take-hint">Rewrites a section in place &mdash; pick several
+      (Ctrl/Cmd-click, or long-press on a phone) to redo them in one call. The rest of the issue,
       and the filename, stay exactly as they are &mdash; use this instead of a full
       regeneration when only one section is flat. Only the judgment sections are
       listed: the reported ones went through date, source and deduplication rules
       that a one-section rewrite cannot reproduce.</p>
       <label class="survey-label">Section
-        <select id="redraft-section" class="survey-input">{redraft_options}</select>
+        <select id="redraft-section" class="survey-input" multiple size="{len(REDRAFTABLE_SECTIONS)}">{redraft_options}</select>
       </label>
       <div class="prompt-examples">
         <p>Quick steers:</p>
@@ -942,7 +591,7 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
         approval, after every model call, and never leaves this machine.
       </p>
       <button class="btn btn-secondary" id="redraft-btn" style="width:100%;" onclick="triggerRedraft()">
-        &#9998; Redraft This Section
+        &#9998; Redraft Selected Sections
       </button>
     </div>
 
@@ -1075,953 +724,13 @@ def build_preview_html(staging_filename: str, month_year: str, run_id: str, rege
   <div class="overlay-card" id="overlay-card"></div>
 </div>
 
-<script>
-  const REPO          = "{repo}";
-  const STAGING_FILE  = "{staging_filename}";
-  const ISSUE_MONTH_YEAR    = "{issue_month_year}";
-  const COVERAGE_MONTH_YEAR = "{coverage_month_year}";
-  const SURVEY_QUESTIONS = {survey_questions_json};
-  const PERMALINK        = {permalink_json};
-  const APPROVE_WF    = "approve-blog.yml";
-  const REGENERATE_WF = "regenerate-blog.yml";
-  const REDRAFT_WF    = "redraft-section.yml";
-  const DISCARD_WF    = "discard-blog.yml";
-  const GITHUB_API    = "https://api.github.com";
-
-  // ── Set iframe src with cache-busting timestamp on load ────────
-  function setIframeSrc(extraBust) {{
-    const iframe = document.getElementById("preview-iframe");
-    const ts = extraBust || Date.now();
-    iframe.src = `/blog/staging/${{STAGING_FILE}}?v=${{ts}}`;
-  }}
-
-  document.addEventListener("DOMContentLoaded", () => {{
-    loadPAT();
-    loadLastPrompt();
-    const runId = "{run_id}";
-    if (runId && runId !== "0") {{
-      const row = document.getElementById("gen-info");
-      const val = document.getElementById("gen-run");
-      if (row && val) {{
-        row.style.display = "flex";
-        val.innerHTML = `<a href="https://github.com/${{REPO}}/actions/runs/${{runId}}" target="_blank" style="color:var(--blue);">Run #${{runId}}</a>`;
-      }}
-    }}
-    // Set iframe src with cache-busting timestamp — fixes blank iframe on slow JS
-    document.getElementById("preview-iframe")
-            .addEventListener("load", onIframeLoad);
-    setIframeSrc();
-    // Show cache hint after 3 seconds in case content looks stale
-    setTimeout(() => {{
-      document.getElementById("cache-hint").style.display = "inline";
-    }}, 3000);
-    checkForStalePage();
-    loadQuota();
-    loadModelConfig();
-    // Every full page load reflects the true current staging_filename (baked
-    // in server-side at generation time) — this timestamp is how you can
-    // tell whether THIS page still matches what's actually on GitHub.
-    document.getElementById("page-loaded-time").textContent = new Date().toLocaleTimeString();
-  }});
-
-  // Is this page the one that is actually deployed?
-  //
-  // The approval screen lives at a fixed URL and is regenerated on every run,
-  // so a cached copy shows an old issue with an old generation time and gives
-  // no sign of it. That happened: a stamp read 10:38 PM for a run that had
-  // already been superseded, and the natural conclusion was that the stamp was
-  // broken rather than the page being stale.
-  //
-  // Fetch the live copy, compare the server-rendered stamp, and say so plainly
-  // if they differ. Fails silently — offline or blocked, a missing warning is
-  // better than a false one.
-  const GENERATED_STAMP = {generated_stamp_json};
-
-  // ── Gemini daily requests ───────────────────────────────────────
-  // The free tier is rate-limited per minute and per DAY, not a monthly token
-  // pool, so this tracks requests per day — the limit repeated testing hits.
-  // The count is re-fetched rather than trusted from the baked-in value,
-  // because a redraft makes requests without regenerating this page.
-  const QUOTA_BAKED = {quota_baked};
-  const QUOTA_LIMIT_KEY = "blog_preview_quota_limit";
-
-  // Google resets these quotas at midnight Pacific, so the bucket to read is
-  // today's PACIFIC date — not the browser's local date, which rolls over at
-  // the wrong moment and would read as headroom that is not there.
-  function quotaDay() {{
-    return new Date().toLocaleDateString("en-CA", {{ timeZone: "America/Los_Angeles" }});
-  }}
-
-  // Limits are per model and separate. Defaults come from the free tier; each
-  // is overridable because quotas are assigned per Google Cloud project.
-  const QUOTA_DEFAULT_LIMITS = {quota_limits_json};
-  const QUOTA_LIMIT_PREFIX = "blog_preview_quota_limit_";
-
-  function quotaLimitFor(model) {{
-    const saved = parseInt(localStorage.getItem(QUOTA_LIMIT_PREFIX + model) || "", 10);
-    if (saved > 0) return saved;
-    return QUOTA_DEFAULT_LIMITS[model] || 0;
-  }}
-
-  function quotaColour(pct) {{
-    return pct >= 85 ? "#ef4444" : (pct >= 60 ? "#f59e0b" : "#22c55e");
-  }}
-
-  function renderQuota(entry) {{
-    const total = entry && entry.requests ? entry.requests : 0;
-    const models = (entry && entry.models) ? entry.models : {{}};
-    const el = document.getElementById("quota-count");
-    const host = document.getElementById("quota-models");
-    const note = document.getElementById("quota-note");
-    if (!el || !host) return;
-    el.textContent = total;
-
-    const names = Object.keys(models).sort((a, b) => models[b] - models[a]);
-    host.innerHTML = "";
-    let worst = 0;
-    names.forEach(function (m) {{
-      const used = models[m];
-      const limit = quotaLimitFor(m);
-      const pct = limit ? Math.min(100, Math.round((used / limit) * 100)) : 0;
-      if (pct > worst) worst = pct;
-      const row = document.createElement("div");
-      row.style.cssText = "margin-bottom:0.5rem;";
-      const short = m.replace("gemini-", "");
-      row.innerHTML =
-        '<div style="display:flex;justify-content:space-between;gap:0.5rem;'
-        + 'font-size:0.7rem;color:#cbd5e1;margin-bottom:0.2rem;">'
-        + '<span style="font-family:monospace;">' + short + '</span>'
-        + '<span style="font-weight:700;color:' + quotaColour(pct) + ';">'
-        + used + (limit ? " / " : "") + '</span></div>'
-        + '<div style="height:5px;background:#1e293b;border-radius:3px;overflow:hidden;">'
-        + '<div style="height:100%;width:' + pct + '%;background:' + quotaColour(pct) + ';"></div>'
-        + '</div>';
-      // The limit is an input so a project with a different quota can correct it.
-      const input = document.createElement("input");
-      input.type = "number"; input.min = "1"; input.value = limit || "";
-      input.title = "Daily request limit for " + m;
-      input.style.cssText = "width:4.6rem;padding:0.15rem 0.3rem;font-size:0.68rem;"
-        + "border-radius:4px;border:1px solid #334155;background:#0f172a;color:#e2e8f0;";
-      input.addEventListener("input", function () {{
-        const v = parseInt(input.value, 10);
-        if (v > 0) localStorage.setItem(QUOTA_LIMIT_PREFIX + m, String(v));
-        else localStorage.removeItem(QUOTA_LIMIT_PREFIX + m);
-        loadQuota();
-      }});
-      row.querySelector("span:last-child").appendChild(input);
-      host.appendChild(row);
-    }});
-
-    if (!names.length) {{
-      note.textContent = "No requests recorded yet today. Resets at midnight Pacific.";
-    }} else if (worst >= 85) {{
-      note.textContent = worst + "% of a model's daily requests used. Stop testing — "
-        + "a single run can fire several requests when a model retries or falls back.";
-    }} else if (worst >= 60) {{
-      note.textContent = worst + "% of a model's daily requests used. Resets at midnight Pacific.";
-    }} else {{
-      note.textContent = "Well inside the daily limits. Resets at midnight Pacific.";
-    }}
-  }}
-
-  // ── Model choice ───────────────────────────────────────────────
-  // Config lives in the repo so the workflow reads it too. Written back from
-  // here with the same PAT that dispatches workflows, which is what makes
-  // adopting a new model a UI action rather than a code change.
-  const MODEL_CONFIG_PATH = "blog/model-config.json";
-  let MODEL_CFG = null;
-
-  async function loadModelConfig() {{
-    const leader = document.getElementById("model-leader");
-    const fallbacks = document.getElementById("model-fallbacks");
-    if (!leader) return;
-    let cfg = {{ order: [], limits: {{}}, available: [] }};
-    try {{
-      const res = await fetch("/" + MODEL_CONFIG_PATH + "?v=" + Date.now(),
-                              {{ cache: "no-store" }});
-      if (res.ok) cfg = await res.json();
-    }} catch (e) {{ /* no config yet — the run falls back to built-in defaults */ }}
-    MODEL_CFG = cfg;
-    const order = (cfg.order && cfg.order.length) ? cfg.order : ["(built-in default)"];
-    leader.textContent = order[0].replace("gemini-", "");
-    fallbacks.textContent = order.length > 1
-      ? "falls back to " + order.slice(1).map(m => m.replace("gemini-", "")).join(", ")
-      : "no fallback configured";
-
-    const fresh = (cfg.available || []).filter(m => !(cfg.dismissed || []).includes(m));
-    const box = document.getElementById("model-new");
-    if (fresh.length) {{
-      // A dropdown, not a label: the discovery call can return several newer
-      // models at once, and "Lead with it" silently taking the first would
-      // adopt something the reviewer never chose.
-      const sel = document.getElementById("model-new-name");
-      sel.innerHTML = "";
-      fresh.forEach(function (m) {{
-        const o = document.createElement("option");
-        o.value = m; o.textContent = m;
-        sel.appendChild(o);
-      }});
-      sel.onchange = renderModelDelta;
-      const lim = document.getElementById("model-new-limit");
-      if (lim && !lim.dataset.wired) {{
-        lim.addEventListener("input", renderModelDelta);
-        lim.dataset.wired = "1";
-      }}
-      box.style.display = "block";
-      renderModelDelta();
-    }} else {{
-      box.style.display = "none";
-    }}
-  }}
-
-  // Read-modify-write through the Contents API. The SHA is fetched immediately
-  // before the write so a config the workflow changed in between is not
-  // silently clobbered.
-  async function writeModelConfig(cfg, message) {{
-    const pat = loadPAT();
-    if (!pat) {{
-      showToast("Please add your GitHub token below first.", "error");
-      flashPatAttention();
-      return false;
-    }}
-    const url = `${{GITHUB_API}}/repos/${{REPO}}/contents/${{MODEL_CONFIG_PATH}}`;
-    const headers = {{ "Authorization": `Bearer ${{pat}}`,
-                      "Accept": "application/vnd.github+json" }};
-    let sha = null;
-    try {{
-      const cur = await fetch(url + "?ref=main", {{ headers, cache: "no-store" }});
-      if (cur.ok) sha = (await cur.json()).sha;
-      else if (cur.status !== 404) {{
-        showToast(`Could not read the config (${{cur.status}}).`, "error");
-        return false;
-      }}
-    }} catch (e) {{ showToast("Network error reading the config.", "error"); return false; }}
-
-    const body = {{
-      message: message,
-      content: btoa(unescape(encodeURIComponent(JSON.stringify(cfg, null, 2)))),
-      branch: "main"
-    }};
-    if (sha) body.sha = sha;
-    try {{
-      const res = await fetch(url, {{ method: "PUT", headers, body: JSON.stringify(body) }});
-      if (!res.ok) {{
-        const t = await res.text();
-        showToast(`Write failed (${{res.status}}). ${{t.slice(0, 120)}}`, "error");
-        return false;
-      }}
-      return true;
-    }} catch (e) {{ showToast("Network error writing the config.", "error"); return false; }}
-  }}
-
-  // Pro-tier free limits are roughly an order of magnitude below Flash, so the
-  // risk is flagged from the NAME before any number is looked up — the reviewer
-  // should know a pro model costs headroom before going to find the figure.
-  function modelTierRisk(model, currentModel) {{
-    const isPro = /(^|-)pro(-|$)/.test(model);
-    const curIsPro = /(^|-)pro(-|$)/.test(currentModel || "");
-    if (isPro && !curIsPro) {{
-      return "Pro-tier model. On the free tier Pro daily limits are typically tens "
-        + "of requests against thousands for Flash — expect a large drop in headroom. "
-        + "Confirm the number before adopting.";
-    }}
-    if (/lite/.test(model) && !/lite/.test(currentModel || "")) {{
-      return "Lite model. Lite usually carries a lower daily limit than full Flash, "
-        + "and produced a materially weaker issue the one time this pipeline fell "
-        + "back to it.";
-    }}
-    return "";
-  }}
-
-  function renderModelDelta() {{
-    const cfg = MODEL_CFG || {{}};
-    const current = (cfg.order || [])[0] || "";
-    const currentLimit = (cfg.limits || {{}})[current] || QUOTA_DEFAULT_LIMITS[current] || 0;
-    const sel = document.getElementById("model-new-name");
-    const model = sel ? sel.value : "";
-    const curName = document.getElementById("model-cur-name");
-    const curLimitEl = document.getElementById("model-cur-limit");
-    const delta = document.getElementById("model-delta");
-    const warn = document.getElementById("model-tier-warn");
-    if (!curName || !delta || !warn) return;
-    curName.textContent = current.replace("gemini-", "") || "—";
-    curLimitEl.textContent = currentLimit ? currentLimit.toLocaleString() + "/day" : "not set";
-
-    const risk = modelTierRisk(model, current);
-    warn.style.display = risk ? "block" : "none";
-    warn.textContent = risk;
-
-    const el = document.getElementById("model-new-limit");
-    const n = el ? parseInt(el.value, 10) : 0;
-    if (!n || n <= 0 || !currentLimit) {{ delta.textContent = ""; return; }}
-    const pct = Math.round(((n - currentLimit) / currentLimit) * 100);
-    if (pct >= 0) {{
-      delta.style.color = "#86efac";
-      delta.textContent = (pct === 0 ? "Same headroom" : "+" + pct + "% headroom")
-        + " — " + n.toLocaleString() + " requests/day.";
-    }} else if (pct > -50) {{
-      delta.style.color = "#fcd34d";
-      delta.textContent = pct + "% headroom — " + n.toLocaleString() + "/day instead of "
-        + currentLimit.toLocaleString() + ".";
-    }} else {{
-      delta.style.color = "#fca5a5";
-      delta.textContent = pct + "% headroom. " + n.toLocaleString() + "/day instead of "
-        + currentLimit.toLocaleString() + " — a severe cut. Adopt only if the model is "
-        + "worth losing that much testing room.";
-    }}
-  }}
-
-  async function adoptNewModel() {{
-    const cfg = MODEL_CFG || {{}};
-    const fresh = (cfg.available || []).filter(m => !(cfg.dismissed || []).includes(m));
-    if (!fresh.length) return;
-    const model = document.getElementById("model-new-name").value || fresh[0];
-    const limit = parseInt(document.getElementById("model-new-limit").value, 10);
-    if (!limit || limit <= 0) {{
-      showToast("Set the daily request limit first — it cannot be discovered.", "error");
-      return;
-    }}
-    // A severe cut is an informed decision, not a blocked one — but it has to be
-    // an explicit click, because losing most of the daily budget is not
-    // recoverable until midnight Pacific.
-    const cur0 = (cfg.order || [])[0] || "";
-    const curLim = (cfg.limits || {{}})[cur0] || QUOTA_DEFAULT_LIMITS[cur0] || 0;
-    if (curLim && limit < curLim * 0.5) {{
-      const drop = Math.abs(Math.round(((limit - curLim) / curLim) * 100));
-      if (!confirm(model + " would cut your daily requests by " + drop + "% ("
-                   + limit + "/day instead of " + curLim + "). Adopt anyway?")) return;
-    }}
-    const btn = document.getElementById("model-adopt");
-    btn.disabled = true;
-    // New model leads; the previous order becomes the fallback chain, so a bad
-    // new model degrades to what was already working instead of failing.
-    const order = [model].concat((cfg.order || []).filter(m => m !== model));
-    const next = Object.assign({{}}, cfg, {{
-      order: order,
-      limits: Object.assign({{}}, cfg.limits || {{}}, {{ [model]: limit }}),
-      known: Array.from(new Set((cfg.known || []).concat(order))),
-      available: (cfg.available || []).filter(m => m !== model)
-    }});
-    const ok = await writeModelConfig(next, `Lead with ${{model}} (set from the approval page)`);
-    btn.disabled = false;
-    if (ok) {{
-      MODEL_CFG = next;
-      showToast(`${{model}} will lead from the next run.`, "success");
-      document.getElementById("model-status").textContent =
-        "Saved. Takes effect on the next generation.";
-      loadModelConfig();
-    }}
-  }}
-
-  async function dismissNewModel() {{
-    const cfg = MODEL_CFG || {{}};
-    const fresh = (cfg.available || []).filter(m => !(cfg.dismissed || []).includes(m));
-    if (!fresh.length) return;
-    const btn = document.getElementById("model-dismiss");
-    btn.disabled = true;
-    const next = Object.assign({{}}, cfg, {{
-      dismissed: Array.from(new Set((cfg.dismissed || []).concat(fresh))),
-      known: Array.from(new Set((cfg.known || []).concat(fresh))),
-      available: []
-    }});
-    const ok = await writeModelConfig(next, "Dismiss new Gemini model(s) (from the approval page)");
-    btn.disabled = false;
-    if (ok) {{
-      MODEL_CFG = next;
-      showToast("Dismissed. It will not be offered again.", "purple");
-      loadModelConfig();
-    }}
-  }}
-
-  async function loadQuota() {{
-    let entry = {{ requests: QUOTA_BAKED, models: {{}} }};
-    try {{
-      const res = await fetch("/blog/staging/usage.json?v=" + Date.now(),
-                              {{ cache: "no-store" }});
-      if (res.ok) {{
-        const data = await res.json();
-        entry = data[quotaDay()] || {{ requests: 0, models: {{}} }};
-      }}
-    }} catch (e) {{ /* offline, or no ledger yet — fall back to the baked value */ }}
-    renderQuota(entry);
-  }}
-
-
-  async function checkForStalePage() {{
-    try {{
-      const res = await fetch("/blog/staging/preview.html?stale=" + Date.now(),
-                              {{ cache: "no-store" }});
-      if (!res.ok) return;
-      const live = await res.text();
-      const m = live.match(/Generated ([^<]+)</);
-      if (!m || m[1].trim() === GENERATED_STAMP) return;
-      // One bar only. Called once on load today, but two stacked warnings
-      // saying the same thing would read as two separate problems.
-      if (document.getElementById("stale-bar")) return;
-
-      const bar = document.createElement("div");
-      bar.id = "stale-bar";
-      bar.style.cssText = "position:sticky;top:0;z-index:9999;background:#b45309;" +
-        "color:#fff;padding:0.7rem 1rem;font-size:0.85rem;font-weight:600;" +
-        "display:flex;gap:0.75rem;align-items:center;flex-wrap:wrap;";
-      bar.innerHTML =
-        "<span>You are looking at a cached copy of this page. It was generated " +
-        GENERATED_STAMP + "; the current one was generated " + m[1].trim() + ".</span>";
-      const btn = document.createElement("button");
-      btn.textContent = "Load the current version";
-      btn.style.cssText = "background:#fff;color:#b45309;border:none;border-radius:6px;" +
-        "padding:0.4rem 0.9rem;font-weight:700;cursor:pointer;min-height:36px;";
-      btn.onclick = forceRefresh;
-      bar.appendChild(btn);
-      document.body.prepend(bar);
-    }} catch (e) {{
-      /* offline or blocked — stay quiet rather than warn wrongly */
-    }}
-  }}
-
-  function onIframeLoad() {{
-    document.getElementById("iframe-loading").classList.remove("show");
-    const btn = document.getElementById("force-refresh-btn");
-    btn.classList.remove("spinning");
-    btn.disabled = false;
-  }}
-
-  // ── Force Refresh — bypasses all browser and CDN cache ─────────
-  //
-  // This must reload THIS page, not just the iframe. It used to only re-point
-  // the iframe src, which reloads the draft but leaves the approval screen
-  // itself exactly as it was cached — including the "Generated …" stamp, which
-  // is rendered server-side into this page. So the one control whose whole job
-  // is "show me the current version" could not change the one field you would
-  // check to see whether it had worked, and neither could the stale-page bar,
-  // which calls this function.
-  //
-  // A regenerate replaces both the draft and this page, so reloading the whole
-  // thing is the correct scope in every case; a redraft leaves this page
-  // unchanged, where a full reload is merely harmless.
-  //
-  // The cache-busting query param is what makes it a real refresh:
-  // location.reload() may still be answered from the browser's copy, and
-  // GitHub Pages serves this path with a ten-minute max-age we cannot override.
-  // A URL never requested before cannot be in any cache, browser or CDN.
-  // Built from pathname, not href, so repeat presses don't stack params.
-  function forceRefresh() {{
-    const btn = document.getElementById("force-refresh-btn");
-    if (btn) {{
-      btn.classList.add("spinning");
-      btn.disabled = true;
-    }}
-    showToast("Fetching latest version, bypassing cache…", "purple");
-    flushTake();
-    location.replace(location.pathname + "?v=" + Date.now());
-  }}
-
-  // Write any pending Desk text before navigating away. initTake() debounces
-  // its save by 400ms, so the last few keystrokes before a refresh would
-  // otherwise be dropped — and this section is the one thing on the page that
-  // is genuinely Robert's, not recoverable by regenerating.
-  function flushTake() {{
-    try {{
-      const el = document.getElementById("take-input");
-      if (el) localStorage.setItem(TAKE_KEY, el.value);
-    }} catch (e) {{ /* private mode or storage full — refresh anyway */ }}
-  }}
-
-  // ── PAT management ─────────────────────────────────────────────
-  // Shows the loud "no token" banner (with a direct link to GitHub's token
-  // creation page) whenever there's nothing saved, and the quiet green
-  // checkmark otherwise. Called on load and every time the saved value
-  // changes, so clearing your cache / a new browser / a rejected token all
-  // land you back at the same clear "here's what to do" state.
-  function updatePatUI(saved) {{
-    document.getElementById("pat-saved").style.display = saved ? "block" : "none";
-    document.getElementById("pat-missing-banner").style.display = saved ? "none" : "block";
-    if (saved) document.getElementById("pat-input").value = saved;
-  }}
-
-  function flashPatAttention() {{
-    document.getElementById("pat-section").scrollIntoView({{ behavior: "smooth", block: "start" }});
-    const banner = document.getElementById("pat-missing-banner");
-    banner.classList.remove("attention");
-    void banner.offsetWidth; // restart the animation if it's already mid-flash
-    banner.classList.add("attention");
-  }}
-
-  function loadPAT() {{
-    const saved = localStorage.getItem("blog_preview_pat");
-    updatePatUI(saved);
-    return saved || "";
-  }}
-
-  // ── Last prompt persistence ─────────────────────────────────────
-  const LAST_PROMPT_KEY = "blog_preview_last_prompt";
-
-  function saveLastPrompt(prompt) {{
-    localStorage.setItem(LAST_PROMPT_KEY, prompt);
-  }}
-
-  function loadLastPrompt() {{
-    const saved = localStorage.getItem(LAST_PROMPT_KEY);
-    const box = document.getElementById("last-prompt-box");
-    const text = document.getElementById("last-prompt-text");
-    if (saved && saved.trim()) {{
-      text.textContent = saved;
-      box.style.display = "block";
-    }} else {{
-      box.style.display = "none";
-    }}
-  }}
-
-  function reuseLastPrompt() {{
-    const saved = localStorage.getItem(LAST_PROMPT_KEY);
-    if (saved) {{
-      document.getElementById("prompt-input").value = saved;
-      document.getElementById("prompt-input").focus();
-      document.getElementById("prompt-input").scrollIntoView({{ behavior: "smooth", block: "center" }});
-    }}
-  }}
-
-  function savePAT() {{
-    const val = document.getElementById("pat-input").value.trim();
-    if (!val.startsWith("ghp_") && !val.startsWith("github_pat_")) {{
-      showToast("Token should start with ghp_ or github_pat_", "error");
-      return;
-    }}
-    localStorage.setItem("blog_preview_pat", val);
-    updatePatUI(val);
-    showToast("Token saved in this browser ✓", "success");
-  }}
-
-  // ── GitHub Actions trigger ──────────────────────────────────────
-  async function triggerWorkflow(workflow, inputs) {{
-    const pat = loadPAT();
-    if (!pat) {{
-      showToast("Please add your GitHub token below first.", "error");
-      document.getElementById("pat-input").focus();
-      flashPatAttention();
-      return null;
-    }}
-    const url = `${{GITHUB_API}}/repos/${{REPO}}/actions/workflows/${{workflow}}/dispatches`;
-    try {{
-      const res = await fetch(url, {{
-        method: "POST",
-        headers: {{
-          "Authorization": `Bearer ${{pat}}`,
-          "Accept": "application/vnd.github+json",
-          "Content-Type": "application/json",
-          "X-GitHub-Api-Version": "2022-11-28"
-        }},
-        body: JSON.stringify({{ ref: "main", inputs }})
-      }});
-      if (res.status === 401) {{
-        // Confirmed dead — don't leave the misleading green "✓ Token saved"
-        // checkmark up for a token GitHub just rejected.
-        localStorage.removeItem("blog_preview_pat");
-        updatePatUI(null);
-        flashPatAttention();
-      }}
-      return res;
-    }} catch (err) {{
-      // Network drop, DNS failure, offline, blocked request — fetch throws
-      // rather than resolving, so without this the loading overlay would
-      // spin forever with no explanation.
-      hideOverlay();
-      showToast("Network error contacting GitHub — check your connection and try again.", "error");
-      return null;
-    }}
-  }}
-
-  function apiErrorMessage(res, body) {{
-    if (res.status === 401) return "GitHub rejected the token (401) — it's invalid or expired, so it's been cleared from this browser. See the banner in the sidebar to get a new one.";
-    if (res.status === 403) return `GitHub returned 403 — the token likely lacks 'workflow' scope. ${{body.message || ""}}`;
-    if (res.status === 404) return "GitHub returned 404 — check the token has 'workflow' scope and that all four workflow files are committed to the main branch.";
-    return `GitHub API returned ${{res.status}}: ${{body.message || "Unknown error"}}.`;
-  }}
-
-  // ── Lock/unlock Approve + Regenerate + Discard while a workflow run is
-  // in flight, or while this page's known staging_filename may be stale
-  // (a regenerate can rename the file — see startPolling; approve/discard
-  // both remove it entirely). Only a full page reload can safely
-  // re-establish current state, so unlocking happens via reload, not a
-  // timer.
-  let draftGone = false; // true once Approve or Discard actually succeeds — this page is done either way
-  function lockButtons(message) {{
-    document.getElementById("regenerate-btn").disabled = true;
-    document.getElementById("approve-btn").disabled = true;
-    document.getElementById("discard-btn").disabled = true;
-    const banner = document.getElementById("lock-banner");
-    if (message) document.getElementById("lock-banner-text").innerHTML = message;
-    banner.style.display = "block";
-  }}
-  function unlockButtons() {{
-    if (draftGone) return;
-    document.getElementById("regenerate-btn").disabled = false;
-    document.getElementById("approve-btn").disabled = false;
-    document.getElementById("discard-btn").disabled = false;
-    document.getElementById("lock-banner").style.display = "none";
-  }}
-
-
-  // ── Robert's Take ───────────────────────────────────────────────
-  // Kept in localStorage: a half-written take should survive a reload or an
-  // accidental navigation, since it is the one thing here nobody else can
-  // reproduce for him.
-  const TAKE_KEY = "blog_preview_take_" + STAGING_FILE;
-
-  function takeText() {{
-    const el = document.getElementById("take-input");
-    return el ? el.value.trim() : "";
-  }}
-
-  function initTake() {{
-    const el = document.getElementById("take-input");
-    if (!el) return;
-    const saved = localStorage.getItem(TAKE_KEY);
-    if (saved) el.value = saved;
-    const count = document.getElementById("take-count");
-    const savedFlag = document.getElementById("take-saved");
-    let timer = null;
-    function update() {{
-      const words = takeText() ? takeText().split(/\s+/).length : 0;
-      if (count) {{
-        // The target range is the whole point of the section — showing the
-        // count alone gives no sense of whether 180 words is short.
-        let note = " · target 300–450";
-        if (words >= 300 && words <= 450) note = " · in range";
-        else if (words > 450) note = " · over 450, consider trimming";
-        count.textContent = words + (words === 1 ? " word" : " words") + note;
-      }}
-      clearTimeout(timer);
-      timer = setTimeout(function () {{
-        localStorage.setItem(TAKE_KEY, el.value);
-        if (savedFlag) {{
-          savedFlag.textContent = "saved";
-          setTimeout(function () {{ savedFlag.textContent = ""; }}, 1500);
-        }}
-      }}, 400);
-    }}
-    el.addEventListener("input", update);
-    update();
-  }}
-
-  // ── Permalink ───────────────────────────────────────────────────
-  function copyPermalink() {{
-    navigator.clipboard.writeText(PERMALINK).then(
-      function () {{ showToast("Share link copied.", "success"); }},
-      function () {{ showToast("Could not copy — select the text manually.", "error"); }}
-    );
-  }}
-
-  // ── Survey wave form ────────────────────────────────────────────
-  function initSurvey() {{
-    const host = document.getElementById("survey-questions");
-    if (!host || !SURVEY_QUESTIONS.length) return;
-    host.innerHTML = SURVEY_QUESTIONS.map(function (q) {{
-      const opts = q.options.map(function (o) {{
-        return '<label class="survey-opt"><span>' + o + '</span>' +
-               '<input type="number" min="0" data-q="' + q.id + '" data-opt="' +
-               o.replace(/"/g, "&quot;") + '"></label>';
-      }}).join("");
-      return '<div class="survey-q"><div class="survey-q-text">' + q.text + '</div>' + opts + '</div>';
-    }}).join("");
-  }}
-
-  function surveyPayload() {{
-    const label = (document.getElementById("wave-label") || {{}}).value;
-    const n = parseInt((document.getElementById("wave-n") || {{}}).value, 10);
-    if (!label || !label.trim() || !n) return "";      // nothing entered: skip silently
-
-    const results = {{}};
-    document.querySelectorAll('#survey-questions input[type="number"]').forEach(function (inp) {{
-      const v = parseInt(inp.value, 10);
-      if (!isNaN(v) && v >= 0) {{
-        const q = inp.dataset.q;
-        results[q] = results[q] || {{}};
-        results[q][inp.dataset.opt] = v;
-      }}
-    }});
-    if (!Object.keys(results).length) return "";
-
-    const today = new Date().toISOString().slice(0, 10);
-    return JSON.stringify({{
-      label: label.trim(), date: today, field_dates: ISSUE_MONTH_YEAR,
-      n: n, results: results
-    }});
-  }}
-
-  document.addEventListener("DOMContentLoaded", function () {{
-    initTake();
-    initSurvey();
-  }});
-
-  // ── Approve ─────────────────────────────────────────────────────
-  async function triggerApprove() {{
-    showOverlay("confirming");
-  }}
-
-  async function confirmApprove() {{
-    hideOverlay();
-    lockButtons("Publishing… Approve, Regenerate, and Discard are locked while this runs.");
-    showOverlay("loading", "Publishing...", "Triggering the publish workflow on GitHub Actions.");
-    const res = await triggerWorkflow(APPROVE_WF, {{
-      staging_filename: STAGING_FILE,
-      month_year: ISSUE_MONTH_YEAR,
-      roberts_take: takeText(),
-      survey_wave: surveyPayload()
-    }});
-    if (!res) {{ unlockButtons(); return; }}
-    if (res.status === 204) {{
-      draftGone = true;
-      document.getElementById("lock-banner-text").innerHTML = "✅ Published. This staging file no longer exists, so this page stays locked — visit the live blog to see the post, or generate a new draft next month.";
-      showOverlay("success",
-        "🎉 Post queued for publishing!",
-        "The approve-blog workflow is now running. Your post will be live in ~2 minutes.",
-        `https://github.com/${{REPO}}/actions/workflows/${{APPROVE_WF}}`
-      );
-    }} else {{
-      const body = await res.json().catch(() => ({{}}));
-      unlockButtons();
-      showOverlay("error", "Publish failed", apiErrorMessage(res, body));
-    }}
-  }}
-
-  // ── Discard ─────────────────────────────────────────────────────
-  async function triggerDiscard() {{
-    showOverlay("confirming-discard");
-  }}
-
-  async function confirmDiscard() {{
-    hideOverlay();
-    lockButtons("Discarding… Approve, Regenerate, and Discard are locked while this runs.");
-    showOverlay("loading", "Discarding draft...", "Triggering the discard workflow on GitHub Actions.");
-    const res = await triggerWorkflow(DISCARD_WF, {{
-      staging_filename: STAGING_FILE
-    }});
-    if (!res) {{ unlockButtons(); return; }}
-    if (res.status === 204) {{
-      draftGone = true;
-      document.getElementById("lock-banner-text").innerHTML = "🗑️ Discarded. This staging file no longer exists, so this page stays locked — nothing was published. Wait for next month's draft, or trigger monthly-blog.yml manually with Force run.";
-      showOverlay("success",
-        "🗑️ Draft discarded",
-        "The discard-blog workflow is now running. Nothing was published — this only removed the staging draft.",
-        `https://github.com/${{REPO}}/actions/workflows/${{DISCARD_WF}}`
-      );
-    }} else {{
-      const body = await res.json().catch(() => ({{}}));
-      unlockButtons();
-      showOverlay("error", "Discard failed", apiErrorMessage(res, body));
-    }}
-  }}
-
-  // ── Regenerate ──────────────────────────────────────────────────
-  async function triggerRegenerate() {{
-    const prompt = document.getElementById("prompt-input").value.trim();
-    if (!prompt) {{
-      showToast("Please enter a prompt describing what to change.", "error");
-      document.getElementById("prompt-input").focus();
-      return;
-    }}
-    saveLastPrompt(prompt);
-    // Locked immediately, before the network round-trip: regeneration almost
-    // always produces a NEW staging filename (it's stamped with today's
-    // date), which orphans the filename this page currently knows about.
-    // Approving or re-triggering against that stale value fails or, worse,
-    // targets the wrong file — so both actions stay locked until a full
-    // page reload picks up the real current state.
-    lockButtons();
-    showOverlay("loading", "🔄 Triggering regeneration...",
-      "GitHub Actions will regenerate the post with your prompt. This takes ~5 minutes. This page will reload itself automatically once the new version is live."
-    );
-    const res = await triggerWorkflow(REGENERATE_WF, {{
-      prompt: prompt,
-      staging_filename: STAGING_FILE,
-      coverage_month: COVERAGE_MONTH_YEAR
-    }});
-    if (!res) {{ hideOverlay(); unlockButtons(); return; }}
-    if (res.status === 204) {{
-      startPolling();
-      showOverlay("regen-queued", "⏳ Regeneration queued!",
-        "This page checks every 15s for up to 10 min and reloads itself the moment the new version is live — you can close this dialog and it'll keep watching.",
-        `https://github.com/${{REPO}}/actions/workflows/${{REGENERATE_WF}}`
-      );
-    }} else {{
-      const body = await res.json().catch(() => ({{}}));
-      hideOverlay();
-      unlockButtons();
-      showToast(apiErrorMessage(res, body), "error");
-    }}
-  }}
-
-  // ── Redraft one section ─────────────────────────────────────────
-  // Unlike a full regeneration this rewrites a single section in place. The
-  // staging filename does not change, so the buttons are NOT locked the way
-  // triggerRegenerate() locks them — there is no orphaned filename to guard
-  // against, and locking Approve for a one-section edit would be a nuisance.
-  async function triggerRedraft() {{
-    const section  = document.getElementById("redraft-section").value;
-    const guidance = document.getElementById("redraft-guidance").value.trim();
-    if (!section) {{
-      showToast("Pick which section to redraft.", "error");
-      return;
-    }}
-    const label = document.getElementById("redraft-section")
-                    .selectedOptions[0].textContent;
-    showOverlay("loading", "Redrafting " + label + "...",
-      "Gemini is rewriting just this section from the issue as it already stands. Takes about a minute."
-    );
-    const res = await triggerWorkflow(REDRAFT_WF, {{
-      staging_filename: STAGING_FILE,
-      section: section,
-      guidance: guidance,
-      month_year: COVERAGE_MONTH_YEAR
-    }});
-    if (!res) {{ hideOverlay(); return; }}
-    if (res.status === 204) {{
-      startPolling();
-      showOverlay("regen-queued", "Redraft queued",
-        "This page checks every 15s and reloads once the new version is live. Every other section stays exactly as it is.",
-        `https://github.com/${{REPO}}/actions/workflows/${{REDRAFT_WF}}`
-      );
-    }} else {{
-      const body = await res.json().catch(() => ({{}}));
-      hideOverlay();
-      showToast(apiErrorMessage(res, body), "error");
-    }}
-  }}
-
-  function setRedraftGuidance(text) {{
-    const el = document.getElementById("redraft-guidance");
-    el.value = text;
-    el.focus();
-  }}
-
-  // ── Prompt chips ────────────────────────────────────────────────
-  function setPrompt(text) {{
-    document.getElementById("prompt-input").value = text;
-    document.getElementById("prompt-input").focus();
-  }}
-
-  function openStagingPost() {{
-    const bust = Date.now() + "_" + Math.random().toString(36).slice(2);
-    window.open(`/blog/staging/${{STAGING_FILE}}?v=${{bust}}`, "_blank");
-  }}
-
-  // ── Toast ────────────────────────────────────────────────────────
-  let toastTimer;
-  function showToast(msg, type = "info") {{
-    const el = document.getElementById("toast");
-    el.textContent = msg;
-    el.className = `show ${{type}}`;
-    clearTimeout(toastTimer);
-    toastTimer = setTimeout(() => {{ el.className = ""; }}, 4000);
-  }}
-
-  // ── Overlay ──────────────────────────────────────────────────────
-  function showOverlay(type, title = "", body = "", actionUrl = "") {{
-    const card = document.getElementById("overlay-card");
-    const overlay = document.getElementById("overlay");
-    let html = "";
-    if (type === "confirming") {{
-      html = `
-        <div class="overlay-icon">📤</div>
-        <div class="overlay-title">Ready to publish?</div>
-        <div class="overlay-body">This will publish <code>${{STAGING_FILE}}</code> — promote it to production, update <code>latest.html</code>, regenerate the sitemap, and ping Google. Double-check that filename matches what you've been reviewing in the frame on the right — if you regenerated recently and haven't reloaded this page, it may not.</div>
-        <div style="display:flex;gap:0.75rem;justify-content:center;">
-          <button class="btn btn-outline" onclick="hideOverlay()">Cancel</button>
-          <button class="btn btn-primary" onclick="confirmApprove()">Yes, Publish Now</button>
-        </div>`;
-    }} else if (type === "confirming-discard") {{
-      html = `
-        <div class="overlay-icon">🗑️</div>
-        <div class="overlay-title">Discard this draft?</div>
-        <div class="overlay-body">This permanently deletes <code>${{STAGING_FILE}}</code> from staging. Nothing is published or affected — it only undoes the generation. This can't be undone; you'd need to regenerate or wait for the next automatic run.</div>
-        <div style="display:flex;gap:0.75rem;justify-content:center;">
-          <button class="btn btn-outline" onclick="hideOverlay()">Cancel</button>
-          <button class="btn btn-discard-outline" style="border-color:var(--red);" onclick="confirmDiscard()">Yes, Discard It</button>
-        </div>`;
-    }} else if (type === "loading") {{
-      html = `<div class="spinner"></div><div class="overlay-title">${{title}}</div><div class="overlay-body">${{body}}</div>`;
-    }} else if (type === "success") {{
-      html = `
-        <div class="overlay-icon">✅</div>
-        <div class="overlay-title">${{title}}</div>
-        <div class="overlay-body">${{body}}</div>
-        <div style="display:flex;gap:0.75rem;justify-content:center;flex-wrap:wrap;">
-          ${{actionUrl ? `<a href="${{actionUrl}}" target="_blank" class="btn btn-secondary">View Workflow Run</a>` : ""}}
-          <a href="https://www.imetrobert.com/blog/" target="_blank" class="btn btn-primary">View Live Blog</a>
-          <button class="btn btn-outline" onclick="hideOverlay()">Close</button>
-        </div>`;
-    }} else if (type === "regen-queued") {{
-      html = `
-        <div class="overlay-icon">⏳</div>
-        <div class="overlay-title">${{title}}</div>
-        <div class="overlay-body">${{body}}</div>
-        <div style="display:flex;gap:0.75rem;justify-content:center;flex-wrap:wrap;">
-          ${{actionUrl ? `<a href="${{actionUrl}}" target="_blank" class="btn btn-secondary">Watch Workflow</a>` : ""}}
-          <button class="btn btn-outline" onclick="hideOverlay()">Dismiss (still watching)</button>
-        </div>`;
-    }} else if (type === "error") {{
-      html = `
-        <div class="overlay-icon">❌</div>
-        <div class="overlay-title">${{title}}</div>
-        <div class="overlay-body">${{body}}</div>
-        <button class="btn btn-outline" onclick="hideOverlay()">Close</button>`;
-    }}
-    card.innerHTML = html;
-    overlay.classList.add("show");
-  }}
-
-  function hideOverlay() {{
-    document.getElementById("overlay").classList.remove("show");
-  }}
-
-  // ── Auto-refresh polling after regeneration ─────────────────────
-  // Polls the freshly-pushed preview.html itself (not the iframe) and, once
-  // it sees the regen badge, does a FULL page reload — not just an iframe
-  // refresh. Regeneration renames the staging file (new date-stamped
-  // filename) essentially every time, so only a real reload of this parent
-  // page picks up the new STAGING_FILE constant baked in server-side.
-  // Refreshing just the iframe would leave Approve pointed at a filename
-  // that's already been deleted.
-  let pollInterval;
-  function startPolling() {{
-    if (pollInterval) return; // already watching — don't stack intervals
-    let checks = 0;
-    pollInterval = setInterval(async () => {{
-      checks++;
-      if (checks > 40) {{
-        clearInterval(pollInterval);
-        pollInterval = null;
-        lockButtons(
-          `Regeneration is taking longer than 10 minutes or may have failed. ` +
-          `<a href="https://github.com/${{REPO}}/actions/workflows/${{REGENERATE_WF}}" target="_blank">Check the Actions tab</a>, ` +
-          `then reload once you've confirmed it finished.`
-        );
-        showToast("Stopped auto-checking — see the sidebar for what to do next.", "error");
-        return;
-      }}
-      try {{
-        const r = await fetch(`/blog/staging/preview.html?nocache=${{Date.now()}}`, {{ cache: "no-store" }});
-        const text = await r.text();
-        if (text.includes("🔄 Regenerated with custom prompt")) {{
-          clearInterval(pollInterval);
-          pollInterval = null;
-          showToast("✅ New version ready! Reloading page…", "success");
-          // forceRefresh, not location.reload. This branch is reached because
-          // a cache-busted fetch proved a NEW page exists — reloading the
-          // same URL can still be served the old one from cache, which lands
-          // you back on the previous run's timestamp having been told the new
-          // version was ready.
-          setTimeout(forceRefresh, 1200);
-        }}
-      }} catch (e) {{}}
-    }}, 15000);
-  }}
-</script>
+<script type="application/json" id="preview-data">{payload_json}</script>
+<script src="{ASSET_URL}{assets['js']}"></script>
 
 </body>
 </html>
 """
+    return html, payload
 
 
 def main():
@@ -2032,19 +741,38 @@ def main():
     parser.add_argument("--regenerated", action="store_true", help="Flag post as regenerated")
     args = parser.parse_args()
 
-    html = build_preview_html(
+    # The draft before this one, as the last build left it, so the screen can
+    # show what this run changed instead of leaving the reviewer to find it.
+    import section_diff
+    current = section_diff.read_sections(os.path.join(ROOT, "blog", "staging", args.filename))
+    previous = section_diff.baseline(section_diff.load_snapshot(ROOT), current)
+
+    html, payload = build_preview(
         staging_filename=args.filename,
         month_year=args.month,
         run_id=args.run_id,
-        regenerated=args.regenerated
+        regenerated=args.regenerated,
+        changes=section_diff.diff(previous, current) if previous and current else None,
     )
 
-    os.makedirs("blog/staging", exist_ok=True)
-    output_path = "blog/staging/preview.html"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
-
-    print(f"Preview page written to: {output_path}")
+    # From the repo root, not the working directory: regenerate-blog.yml and
+    # redraft-section.yml run this from scripts/. Assets first, so the page is
+    # never swapped in ahead of the files it links; status.json last, so it
+    # never says "ready" about a page that is not there yet.
+    from atomic_write import publish, write_text
+    from run_status import write_status
+    staging = os.path.join(ROOT, "blog", "staging")
+    with publish():
+        assets = write_assets()
+        write_text(os.path.join(staging, "preview.json"),
+                   json.dumps(payload, ensure_ascii=False, indent=1, sort_keys=True) + "\n")
+        write_text(os.path.join(staging, "preview.html"), html)
+        if current:
+            section_diff.save_snapshot(args.filename, args.run_id, current, previous, ROOT)
+        write_status("ready", run_id=args.run_id)
+
+    print(f"Preview page written to: blog/staging/preview.html "
+          f"({len(html.encode('utf-8')) / 1024:.0f} KB; assets {assets['css']}, {assets['js']})")
 
 
 if __name__ == "__main__":
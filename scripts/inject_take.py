@@ -24,19 +24,23 @@ import html as H
 import re
 import sys
 
-# Matches whichever of the two states the renderer produced: the placeholder
-# box when the model wrote nothing usable, or the drafted section itself.
-#
-# The paragraph branch repeats. The Desk is now several paragraphs, and matching
-# only the first one would leave the model's remaining paragraphs sitting
-# underneath the reviewer's replacement — publishing both versions, under
-# Robert's byline, with no visible error.
-BODY_RE = re.compile(
-    r'(<div class="roberts-header">.*?</div>\s*</div>\s*)'      # keep the byline block
-    r'(?:<div class="roberts-placeholder">.*?</div>'            # ...then either the placeholder
-    r'|(?:<p class="roberts-body">.*?</p>\s*)+)',               # ...or every drafted paragraph
-    re.S,
-)
+from section_patch import index, patch, save
+
+# The Desk's body is whatever follows the byline block inside .roberts-take:
+# the placeholder box when the model wrote nothing usable, or every drafted
+# paragraph. All of it is replaced. The Desk is now several paragraphs, and
+# swapping only the first one would leave the model's remaining paragraphs
+# sitting underneath the reviewer's replacement — publishing both versions,
+# under Robert's byline, with no visible error.
+def desk_body(idx):
+    """(start, end) of the Desk's body in an index from section_patch, or
+    None if the page does not have the section."""
+    take = idx["inner"].get("roberts-take")
+    header = idx["blocks"].get("roberts-header")
+    if not take or not header:
+        return None
+    (start, end), (_, header_end) = take[0], header[0]
+    return (header_end, end) if start <= header[0][0] and header_end <= end else None
 
 
 def clean(text):
@@ -78,19 +82,19 @@ def inject(path, text):
     with open(path, encoding="utf-8") as f:
         src = f.read()
 
-    if not BODY_RE.search(src):
+    span = desk_body(index(src))
+    if not span:
         print("  Could not locate the From Robert's Desk block — leaving the file untouched.")
         return False
 
-    body = to_html(text)
-    updated = BODY_RE.sub(lambda m: m.group(1) + body, src, count=1)
+    updated = patch(src, [(*span, to_html(text))])
 
     if updated == src:
         print("  Nothing changed.")
         return False
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(updated)
+    if not save(path, src, updated):
+        return False
     words = len(text.split())
     print(f"  From Robert's Desk replaced with the reviewer's own text ({words} words).")
     if words < 200:
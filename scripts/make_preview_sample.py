@@ -65,12 +65,9 @@ NEUTER = """
 
 
 def newest_published():
-    posts_dir = os.path.join(ROOT, "blog", "posts")
-    names = sorted(
-        f for f in os.listdir(posts_dir)
-        if f.endswith(".html") and f != "latest.html" and "{" not in f
-    )
-    return names[-1] if names else "latest.html"
+    sys.path.insert(0, HERE)
+    from post_registry import newest
+    return newest(os.path.join(ROOT, "blog", "posts")) or "latest.html"
 
 
 def main():
@@ -81,19 +78,19 @@ def main():
     spec.loader.exec_module(gp)
 
     sample_name = newest_published()
-    html = gp.build_preview_html(sample_name, "August 2026", "sample")
-
-    # Point every staging reference at a real published post. There are two:
-    # the preview frame, and the topbar's "Open Full Post" button. Missing the
-    # second would leave one control on the sample opening a 404.
-    html = html.replace("/blog/staging/${STAGING_FILE}",
-                        "/blog/posts/" + sample_name)
+    # Point every staging reference at a real published post. There are two,
+    # the preview frame and the topbar's "Open Full Post" button, and both
+    # read frame_dir. No live payload: the stale-page check would otherwise
+    # compare this sample with whatever draft is really pending.
+    html = gp.build_preview_html(sample_name, "August 2026", "sample",
+                                 frame_dir="/blog/posts/", live="")
     html = html.replace("<body>", "<body>" + BANNER, 1)
     html = html.replace("</body>", NEUTER + "</body>", 1)
 
-    os.makedirs(os.path.dirname(OUT), exist_ok=True)
-    with open(OUT, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Same stylesheet and script as the real screen, under the same names.
+    from atomic_write import write_text
+    gp.write_assets(ROOT)
+    write_text(OUT, html)
 
     print(f"Wrote {os.path.relpath(OUT, ROOT)}")
     print(f"  preview frame shows: blog/posts/{sample_name}")
@@ -15,6 +15,7 @@ rather than shipping a broken og:image (see renderer.build_og_for_post).
 
 import os
 from PIL import Image, ImageDraw, ImageFont
+from profiling import span
 
 WIDTH, HEIGHT = 1200, 630          # LinkedIn/OG large-card spec (1.91:1)
 
@@ -67,6 +68,7 @@ def _decor(img):
     img.alpha_composite(layer)
 
 
+@span("og_image.build_og_image")
 def build_og_image(out_path, issue_label, headline="Practical AI",
                    subhead="for Canadian Business"):
     """Render the card. `issue_label` fills the badge, e.g. 'AUGUST 2026'."""
@@ -1,13 +1,21 @@
 """
 parser.py
 Parses Gemini's plain-text output into structured data for HTML rendering.
+
+Also reads the structured-JSON generation mode (gemini.ISSUE_RESPONSE_SCHEMA)
+into the SAME structures, via parse_structured_issue(), so the renderer cannot
+tell which mode an issue came from. The text parser stays the fallback.
 """
 
+import functools
+import json
 import re
 from datetime import datetime
+from profiling import span
 from utils import (
     BRAND,
     build_search_url,
+    clean_ai_content,
     is_episode_or_newsletter_item,
     is_acceptable_source,
     is_documentation_source,
@@ -99,6 +107,7 @@ def _find_header(content_upper, candidate):
     return None, 0
 
 
+@span("parser.parse_sections")
 def parse_sections(content):
     sections = {h: "" for h in SECTION_HEADERS}
     positions = {}
@@ -523,12 +532,23 @@ def _drop_low_quality_sourced(items, label_key, strict=False):
     return kept
 
 
-def _finalize_developments(items, strategy, coverage_date=None, today=None):
+def _filter_developments(items, coverage_date=None, today=None):
+    """The editorial rules every development is held to, however it was parsed."""
     items = [i for i in items if not is_meta_commentary(i.get('body', '') + ' ' + i.get('company', ''))]
     items = [i for i in items if not is_episode_or_newsletter_item(i.get('body', ''), i.get('company', ''))]
     items = [i for i in items if not is_government_entity(i.get('company', ''))]
     items = _drop_low_quality_sourced(items, 'company', strict=True)
-    items = _drop_future_dated(items, coverage_date, today)
+    return _drop_future_dated(items, coverage_date, today)
+
+
+def _filter_spotlight(items):
+    items = [i for i in items if not is_meta_commentary(i.get('body', '') + ' ' + i.get('org', ''))]
+    items = [i for i in items if not is_episode_or_newsletter_item(i.get('body', ''), i.get('org', ''))]
+    return _drop_low_quality_sourced(items, 'org')
+
+
+def _finalize_developments(items, strategy, coverage_date=None, today=None):
+    items = _filter_developments(items, coverage_date, today)
     for item in items:
         body, ratings = _extract_dev_ratings(item.get('body', ''))
         item['body'] = body
@@ -691,6 +711,7 @@ def deduplicate_spotlight_against_developments(spotlight_items, development_item
     return cleaned
 
 
+@span("parser.parse_developments")
 def parse_developments(text, coverage_date=None, today=None):
     items = []
 
@@ -902,9 +923,7 @@ def parse_spotlight_items(text):
         if len(body) > 20:
             items.append({"org": org, "body": body, "source_name": source_name, "source_url": source_url})
 
-    items = [i for i in items if not is_meta_commentary(i.get('body', '') + ' ' + i.get('org', ''))]
-    items = [i for i in items if not is_episode_or_newsletter_item(i.get('body', ''), i.get('org', ''))]
-    items = _drop_low_quality_sourced(items, 'org')
+    items = _filter_spotlight(items)
 
     if len(items) >= 2:
         return [_close_sentence(_repair_dated_spotlight(i)) for i in items[:6]]
@@ -1010,6 +1029,271 @@ def parse_adoption_stats(text):
     return items[:8]
 
 
+# ---------------------------------------------------------------------------
+# Whole-issue parsing. Both modes land in one dict shape so the renderer reads
+# an issue the same way whichever mode produced it:
+#
+#   sections      header -> raw section text (what the Desk, intro and the
+#                 headline check still read as prose)
+#   developments, spotlight, actions, adoption, summary, predictions, question
+# ---------------------------------------------------------------------------
+
+# Display name -> issue key, for the "which sections came back empty" check the
+# renderer logs and bench_parse.py counts as a failure.
+ISSUE_EXPECTED = {
+    "Executive Summary":   "summary",
+    "Key AI Developments": "developments",
+    "Canadian Spotlight":  "spotlight",
+    "From Robert's Desk":  "desk",
+    "Strategic Actions":   "actions",
+    "Adoption Snapshot":   "adoption",
+    "Looking Ahead":       "predictions",
+    "One Question":        "question",
+}
+
+
+def missing_sections(issue):
+    """Display names of the expected sections this issue has nothing for."""
+    desk = (issue.get("sections") or {}).get("FROM ROBERTS DESK", "").strip()
+    return [name for name, key in ISSUE_EXPECTED.items()
+            if not (desk if key == "desk" else issue.get(key))]
+
+
+def parse_issue(content, coverage_date=None, today=None):
+    """A text-format issue, every section parsed."""
+    sections = parse_sections(content)
+    return {
+        "sections":     sections,
+        "developments": parse_developments(sections.get("KEY AI DEVELOPMENTS", ""),
+                                           coverage_date, today),
+        "spotlight":    parse_spotlight_items(sections.get("CANADIAN SPOTLIGHT", "")),
+        "actions":      parse_actions(sections.get("STRATEGIC ACTIONS FOR THIS MONTH", "")),
+        "adoption":     parse_adoption_stats(sections.get("ADOPTION SNAPSHOT", "")),
+        "summary":      parse_list_items(sections.get("EXECUTIVE SUMMARY", ""), min_length=25)[:3],
+        "predictions":  parse_predictions(sections.get("LOOKING AHEAD: THREE PREDICTIONS", "")),
+        "question":     parse_question(sections.get("ONE QUESTION FOR YOUR LEADERSHIP TEAM", "")),
+    }
+
+
+def _field(obj, key):
+    """One string field from the model's JSON, given the same cleanup the text
+    mode gets as a whole. The schema forbids markdown, but the schema does not
+    stop a model from typing ** inside a string."""
+    value = obj.get(key) if isinstance(obj, dict) else None
+    # The Desk keeps its paragraph breaks; everything else is one line.
+    return _text(value, keep_paragraphs=(key == "roberts_desk"))
+
+
+def _text(value, keep_paragraphs=False):
+    if value is None:
+        return ""
+    value = str(value)
+    return _cleaned(value if keep_paragraphs else ' '.join(value.split()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _cleaned(value):
+    """clean_ai_content, once per distinct string. A structured issue repeats
+    the same short values over and over — "High", "Now", "Medium", the same
+    handful of publications — and each used to be cleaned every time."""
+    return clean_ai_content(value)
+
+
+def _source(obj):
+    name = _field(obj, "source_name")
+    headline = _field(obj, "source_headline")
+    url = build_search_url(name, headline) if len(headline) > 6 else ""
+    return name, url
+
+
+def _load_structured(raw):
+    """The JSON object, tolerating the ```json fence an unenforced response
+    (see gemini._call_gemini's schema fallback) tends to arrive in."""
+    if isinstance(raw, dict):
+        return raw
+    text = (raw or "").strip()
+    fenced = re.match(r'^```(?:json)?\s*(.*?)\s*```$', text, re.S | re.I)
+    if fenced:
+        text = fenced.group(1)
+    start, end = text.find('{'), text.rfind('}')
+    if start == -1 or end <= start:
+        return None
+    try:
+        data = json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def parse_structured_issue(raw, coverage_date=None, today=None):
+    """A structured-JSON issue, as the same dict parse_issue() returns.
+
+    Returns None when the response is not usable JSON, so the caller can fall
+    back to a text-mode generation. Every editorial filter the text parser
+    applies still applies here — government items out of developments, source
+    quality, future dates, meta-commentary — because those rules are about the
+    content, not about how it was split. What JSON removes is the guessing:
+    no header search, no three date-splitting strategies, no duplicate-issue
+    cut, because a second copy of the issue cannot hide inside a JSON string.
+    """
+    data = _load_structured(raw)
+    if data is None:
+        print("  structured: response is not a JSON object; falling back to text mode.")
+        return None
+
+    developments = []
+    for d in data.get("developments") or []:
+        if not isinstance(d, dict):
+            continue
+        body = _field(d, "body")
+        if len(body) <= 30:
+            continue
+        name, url = _source(d)
+        read = _field(d, "strategic_read")
+        if read and not read.rstrip('"\'\u201d\u2019)]').endswith(('.', '!', '?')):
+            read += '.'
+        if not body.endswith(('.', '!', '?')):
+            body += '.'
+        developments.append({
+            "date":           _field(d, "date"),
+            "company":        _clean_company(_field(d, "company")),
+            "body":           body,
+            "source_name":    name,
+            "source_url":     url,
+            "strategic_read": read,
+            "importance":     _titlecase_rating(_field(d, "importance")),
+            "horizon":        _titlecase_rating(_field(d, "horizon")),
+            "attention":      _titlecase_rating(_field(d, "attention")),
+        })
+    developments = _filter_developments(developments, coverage_date, today)[:8]
+    rated = sum(1 for i in developments if i.get('strategic_read'))
+    print(f"  parse_developments: structured found {len(developments)} items ({rated} with a strategic read)")
+
+    spotlight = []
+    for sp in data.get("spotlight") or []:
+        body = _field(sp, "body")
+        if len(body) <= 20:
+            continue
+        name, url = _source(sp)
+        item = {"org": _field(sp, "org"), "body": body, "source_name": name, "source_url": url}
+        date = _field(sp, "date")
+        if date:
+            item["date"] = date
+        spotlight.append(item)
+    spotlight = [_close_sentence(i) for i in _filter_spotlight(spotlight)[:6]]
+
+    actions = []
+    for a in data.get("actions") or []:
+        body = _field(a, "body")
+        if not body:
+            continue
+        rationale = _field(a, "owner_rationale")
+        if rationale and not rationale.rstrip('"\'\u201d\u2019)]').endswith(('.', '!', '?')):
+            rationale += '.'
+        actions.append({
+            "body":            body,
+            "owner":           _field(a, "owner").strip(' .,;'),
+            "owner_rationale": rationale,
+            "priority":        _titlecase_rating(_field(a, "priority")),
+            "effort":          _titlecase_rating(_field(a, "effort")),
+            "impact":          _titlecase_rating(_field(a, "impact")),
+        })
+
+    adoption = []
+    for st in data.get("adoption") or []:
+        # Same shape as parse_adoption_stats: the figure is highlighted on
+        # its own, so the text is what follows it, without a dangling "of".
+        text = re.sub(r'^of\s+', '', _field(st, "stat_text"))
+        if len(text) <= 5:
+            continue
+        adoption.append({
+            "stat_text":   text,
+            "stat_number": _field(st, "stat_number"),
+            "source_name": _field(st, "source_name"),
+            "source_url":  "",
+        })
+
+    horizons = {h.lower(): h for h in _PREDICTION_HORIZONS}
+    by_horizon = {}
+    for pr in data.get("predictions") or []:
+        h = horizons.get(_field(pr, "horizon").lower())
+        body = _field(pr, "body")
+        if h and len(body) >= 25 and h not in by_horizon:
+            by_horizon[h] = body
+    predictions = [{"horizon": h, "body": by_horizon[h]}
+                   for h in _PREDICTION_HORIZONS if h in by_horizon]
+
+    issue = {
+        "developments": developments,
+        "spotlight":    spotlight,
+        "actions":      actions[:5],
+        "adoption":     adoption[:8],
+        "summary":      [p for p in map(_text, data.get("executive_summary") or [])
+                         if len(p) >= 25][:3],
+        "predictions":  predictions,
+        "question":     parse_question(_field(data, "question")),
+    }
+    issue["sections"] = _structured_sections(data, issue)
+    print(f"  parse_actions: {len(issue['actions'])} actions "
+          f"({sum(1 for a in issue['actions'] if a['owner'])} with an assigned owner)")
+    return issue
+
+
+def _structured_sections(data, issue):
+    """The text-format section bodies, rebuilt from a structured issue.
+
+    The renderer and everything downstream of it — the headline check, reading
+    time, the title and excerpt, the raw text a redraft works from — still read
+    prose. Rebuilding it in the exact format the text prompt specifies means
+    they need no second code path, and issue_text() of a structured issue
+    parses back to the same items.
+    """
+    sections = {h: "" for h in SECTION_HEADERS}
+    sections["HEADLINE"] = _field(data, "headline")
+    sections["INTRODUCTION"] = _field(data, "introduction")
+    sections["EXECUTIVE SUMMARY"] = "\n".join(f"- {p}" for p in issue["summary"])
+
+    def _cite(item):
+        return f" Source: {item['source_name']}" if item.get("source_name") else ""
+
+    devs = []
+    for d in issue["developments"]:
+        line = f"{d['date']}: {d['company']} \u2014 {d['body']}" if d["company"] \
+            else f"{d['date']}: {d['body']}"
+        if d["strategic_read"]:
+            line += f" STRATEGIC READ: {d['strategic_read']}"
+        for label in ("importance", "horizon", "attention"):
+            if d[label]:
+                line += f" {label.upper()}: {d[label]}."
+        devs.append(line + _cite(d))
+    sections["KEY AI DEVELOPMENTS"] = "\n".join(devs)
+    sections["CANADIAN SPOTLIGHT"] = "\n".join(
+        f"{s['org']}: {s['body']}{_cite(s)}" for s in issue["spotlight"])
+    sections["FROM ROBERTS DESK"] = _field(data, "roberts_desk").strip()
+
+    acts = []
+    for i, a in enumerate(issue["actions"], 1):
+        line = f"{i}. {a['body']}"
+        if a["owner"]:
+            line += f" OWNER: {a['owner']}" + (f" \u2014 {a['owner_rationale']}" if a["owner_rationale"] else ".")
+        for label in ("priority", "effort", "impact"):
+            if a[label]:
+                line += f" {label.upper()}: {a[label]}."
+        acts.append(line)
+    sections["STRATEGIC ACTIONS FOR THIS MONTH"] = "\n".join(acts)
+    sections["ADOPTION SNAPSHOT"] = "\n".join(
+        f"{st['stat_number']} {st['stat_text']}".strip() + _cite(st) for st in issue["adoption"])
+    sections["LOOKING AHEAD: THREE PREDICTIONS"] = "\n".join(
+        f"{p['horizon']}: {p['body']}" for p in issue["predictions"])
+    sections["ONE QUESTION FOR YOUR LEADERSHIP TEAM"] = issue["question"]
+    return sections
+
+
+def issue_text(issue):
+    """The issue as text-format content: headers and section bodies, in order."""
+    return "\n\n".join(f"{h}\n{t}" for h, t in issue["sections"].items() if t)
+
+
 _GENERIC_HEADLINES = (
     "ai insights", "key ai developments", "the month in ai", "monthly ai",
     "ai news", "this month in ai", "ai roundup", "ai update", "headline",
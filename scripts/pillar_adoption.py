@@ -15,19 +15,34 @@ Robert's own reporting, not a new claim on top of it.
 Two markup eras are handled: the current template exposes .stat-text /
 .stat-source, and the older one puts the figures in a <ul class="bullet-list">
 under an "Adoption" heading.
+
+The figures are extracted once per issue into data/adoption-stats.json, a
+columnar store — one list per field (issue, stat, source, value, unit,
+population), one position per figure — keyed per issue by
+search_index.content_hash. A publish re-extracts only the new or edited issue;
+the page, its FAQ and the trend sparklines are built from the store, with the
+value and population already parsed rather than re-found by regex each time.
 """
 
-import glob
 import html as H
+import json
 import os
 import re
 from datetime import datetime
 
+from atomic_write import read_text, write_text
+from post_registry import published
+from profiling import span
+from search_index import content_hash
 from utils import BRAND
 
 BASE = "https://www.imetrobert.com"
 OUT = "blog/canadian-ai-adoption.html"
 CANONICAL = f"{BASE}/blog/canadian-ai-adoption.html"
+STORE = "data/adoption-stats.json"
+JSON_OUT = "blog/canadian-ai-adoption.json"
+CSV_OUT = "blog/canadian-ai-adoption.csv"
+COLUMNS = ("issue", "stat", "source", "value", "unit", "population")
 
 MONTHS = ("January February March April May June July August September "
           "October November December").split()
@@ -55,51 +70,179 @@ def _issue_meta(path, source):
     }
 
 
-def collect_stats():
+def extract_figures(src):
+    """[(statement, source name)] for one issue's adoption figures."""
+    found = []
+
+    # current template. Each item runs to the next one: an item with no source
+    # has no inner div to end on, and matching up to "</div></div>" swallowed
+    # it into its neighbour — every figure of a re-rendered older issue
+    # (rerender_archive.py), which never had sources, was lost that way.
+    for block in re.split(r'<div class="stat-item">', src)[1:]:
+        block = re.split(r'class="stat-note"|<div class="section', block)[0]
+        stat = _text(re.search(r'class="stat-text">(.*?)</p>', block, re.S).group(1)) \
+            if re.search(r'class="stat-text">', block) else ""
+        srcname = re.search(r'class="stat-source(?:-plain)?"[^>]*>(.*?)</div>', block, re.S)
+        if stat:
+            found.append((stat, _text(srcname.group(1)) if srcname else ""))
+
+    # older template: bullet list under the adoption heading
+    if not found:
+        sec = re.search(r"Adoption[^<]*</h2>(.*?)</ul>", src, re.S)
+        if sec:
+            for li in re.findall(r"<li>(.*?)</li>", sec.group(1), re.S):
+                stat = _text(li)
+                if stat and re.search(r"\d", stat):
+                    found.append((stat, ""))
+
+    return [(stat, srcname) for stat, srcname in found if len(stat) >= 25]
+
+
+_PCT = r"(\d{1,3}(?:\.\d+)?)\s*(?:%|percent\b|per cent\b)"
+
+# What a figure measures, for lining the same measure up across issues. Only
+# phrasings that have been used for ONE measure month after month are here —
+# "45% of Canadian businesses use GenAI" is a different survey from "22.4% have
+# adopted AI", and a sparkline joining them would invent a trend.
+_POPULATIONS = (
+    ("Financial services", r"\bfinanc"),
+    ("Manufacturing", r"\bmanufactur"),
+    ("Healthcare", r"\bhealth ?care\b"),
+    ("Personal AI use", r"\bpersonal ai usage\b"),
+    ("Businesses that have adopted AI", r"^" + _PCT + r" of canadian businesses have adopted ai\b"),
+    ("Businesses using AI to produce goods or services",
+     r"^" + _PCT + r" canadian businesses (?:reported using|used) ai to produce goods"),
+)
+
+
+def _measure(stat):
+    """(value, unit, population) for one statement; value None if there is no
+    percentage to read. "grew 4.1 percentage points to 20.8%" is 20.8."""
+    low = stat.lower()
+    m = re.search(r"percentage points? to " + _PCT, low) or re.search(_PCT, low)
+    if not m:
+        return None, "", ""
+    population = next((name for name, pat in _POPULATIONS if re.search(pat, low)), "")
+    return float(m.group(1)), "%", population
+
+
+def _load_store(path=STORE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            store = json.load(f)
+        if set(store["figures"]) == set(COLUMNS):
+            return store
+    except Exception:
+        pass
+    return {"issues": {}, "figures": {c: [] for c in COLUMNS}}
+
+
+def update_store(path=STORE):
+    """Bring the store up to date with the published issues, re-extracting
+    only those whose content hash changed. Returns (store, issues re-read)."""
+    store = _load_store(path)
+    cols = store["figures"]
+    by_issue = {}
+    for i, fname in enumerate(cols["issue"]):
+        by_issue.setdefault(fname, []).append({c: cols[c][i] for c in COLUMNS})
+
+    # Published issues only: latest.html is an alias with no figures of its own,
+    # and a redirect stub still carries its old figures.
+    issues, reread = {}, 0
+    for name in published():
+        src = read_text(os.path.join("blog/posts", name))
+        digest = content_hash(src)
+        known = store["issues"].get(name)
+        if known and known["h"] == digest:
+            issues[name] = known
+            continue
+        meta = _issue_meta(name, src)
+        issues[name] = {"h": digest, "title": meta["title"], "month": meta["month"],
+                        "date": meta["date"].strftime("%Y-%m-%d") if meta["date"] != datetime.min else ""}
+        by_issue[name] = []
+        for stat, srcname in extract_figures(src):
+            value, unit, population = _measure(stat)
+            by_issue[name].append({"issue": name, "stat": stat, "source": srcname,
+                                   "value": value, "unit": unit, "population": population})
+        reread += 1
+
+    order = sorted(issues, key=lambda n: (issues[n]["date"], n), reverse=True)
+    fresh = {"issues": issues, "figures": {c: [] for c in COLUMNS}}
+    for name in order:
+        for row in by_issue.get(name, []):
+            for c in COLUMNS:
+                fresh["figures"][c].append(row[c])
+
+    if fresh != store:
+        write_text(path, json.dumps(fresh, ensure_ascii=False, separators=(",", ":"),
+                                    sort_keys=True) + "\n")
+    return fresh, reread
+
+
+@span("pillar_adoption.collect_stats")
+def collect_stats(store=None):
+    """Rows for the page, newest issue first, from the store."""
+    if store is None:
+        store, _ = update_store()
+    cols, issues = store["figures"], store["issues"]
     rows, seen = [], set()
-
-    for path in sorted(glob.glob("blog/posts/*.html"), reverse=True):
-        if os.path.basename(path) == "latest.html":
-            continue                      # a copy of the newest issue; would double-count
-        src = open(path, encoding="utf-8").read()
-        meta = _issue_meta(path, src)
-        found = []
-
-        # current template
-        for m in re.finditer(r'<div class="stat-item">(.*?)</div>\s*</div>', src, re.S):
-            block = m.group(1)
-            stat = _text(re.search(r'class="stat-text">(.*?)</p>', block, re.S).group(1)) \
-                if re.search(r'class="stat-text">', block) else ""
-            srcname = re.search(r'class="stat-source(?:-plain)?"[^>]*>(.*?)</div>', block, re.S)
-            if stat:
-                found.append((stat, _text(srcname.group(1)) if srcname else ""))
-
-        # older template: bullet list under the adoption heading
-        if not found:
-            sec = re.search(r"Adoption[^<]*</h2>(.*?)</ul>", src, re.S)
-            if sec:
-                for li in re.findall(r"<li>(.*?)</li>", sec.group(1), re.S):
-                    stat = _text(li)
-                    if stat and re.search(r"\d", stat):
-                        found.append((stat, ""))
-
-        for stat, srcname in found:
-            if len(stat) < 25:
-                continue
-            key = re.sub(r"[^a-z0-9]", "", stat.lower())[:90]
-            if key in seen:               # the same figure repeats across issues
-                continue
-            seen.add(key)
-            rows.append({"stat": stat, "source": srcname, **meta})
-
-    rows.sort(key=lambda r: r["date"], reverse=True)
+    for i, fname in enumerate(cols["issue"]):
+        stat = cols["stat"][i]
+        key = re.sub(r"[^a-z0-9]", "", stat.lower())[:90]
+        if key in seen:                   # the same figure repeats across issues
+            continue
+        seen.add(key)
+        meta = issues[fname]
+        rows.append({
+            "stat": stat, "source": cols["source"][i],
+            "value": cols["value"][i], "unit": cols["unit"][i],
+            "population": cols["population"][i],
+            "title": meta["title"], "month": meta["month"],
+            "url": f"{BASE}/blog/posts/{fname}",
+            "date": datetime.strptime(meta["date"], "%Y-%m-%d") if meta["date"] else datetime.min,
+        })
     return rows
 
 
+def trend_series(rows):
+    """{population: [(date, month, value), ...] oldest first}, one point per
+    issue, for every measure reported in at least three issues."""
+    series = {}
+    for r in rows:
+        if r["population"] and r["value"] is not None:
+            points = series.setdefault(r["population"], {})
+            points.setdefault(r["url"], (r["date"], r["month"], r["value"]))
+    return {p: sorted(pts.values()) for p, pts in series.items() if len(pts) >= 3}
+
+
+def sparkline(values, width=160, height=36):
+    """Inline SVG polyline over `values`, scaled to their own range."""
+    lo, hi = min(values), max(values)
+    rng = (hi - lo) or 1.0
+    step = (width - 8) / max(len(values) - 1, 1)
+    pts = [(4 + i * step, height - 4 - (v - lo) / rng * (height - 8)) for i, v in enumerate(values)]
+    path = " ".join(f"{x:.1f},{y:.1f}" for x, y in pts)
+    x, y = pts[-1]
+    return (f'<svg class="spark" viewBox="0 0 {width} {height}" width="{width}" height="{height}" '
+            f'aria-hidden="true"><polyline points="{path}" fill="none" stroke="currentColor" '
+            f'stroke-width="2" stroke-linejoin="round" stroke-linecap="round"/>'
+            f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3" fill="currentColor"/></svg>')
+
+
+def _trends_html(rows):
+    out = ""
+    for population, points in sorted(trend_series(rows).items()):
+        (_, first_month, first), (_, last_month, last) = points[0], points[-1]
+        out += (
+            f'<li class="trend-row"><span class="trend-name">{H.escape(population)}</span>'
+            f'{sparkline([v for _d, _m, v in points])}'
+            f'<span class="trend-range">{first:g}% <small>{H.escape(first_month)}</small> &#8594; '
+            f'<strong>{last:g}%</strong> <small>{H.escape(last_month)}</small></span></li>')
+    return f'<ul class="trends">{out}</ul>' if out else ""
+
+
 def _faq(rows):
     latest = rows[0] if rows else None
-    pct = next((re.search(r"(\d{1,3}(?:\.\d)?%)", r["stat"]) for r in rows
-                if re.search(r"(\d{1,3}(?:\.\d)?%)", r["stat"])), None)
     items = []
     if latest:
         items.append((
@@ -122,6 +265,7 @@ def _faq(rows):
 def build_page(rows):
     generated = datetime.now().strftime("%B %d, %Y")
     faq_items = _faq(rows)
+    trends = _trends_html(rows)
 
     by_issue = []
     for r in rows:
@@ -277,7 +421,13 @@ h2.sec::before {{ content:''; position:absolute; left:0; top:0.15rem; bottom:0.1
 .faq-q {{ font-size:0.925rem; font-weight:700; color:var(--navy); margin-bottom:0.4rem; }}
 .faq-a {{ font-size:0.875rem; color:var(--gray); line-height:1.7; }}
 .updated {{ margin-top:2rem; font-size:0.75rem; color:var(--gray-light); }}
-@media (max-width:640px) {{ .container {{ padding:1.5rem 1rem 3rem; }} .card {{ padding:1.25rem; }} .brand-logo {{ width:58px; height:58px; padding:6px; border-radius:18px; }} }}
+.trends {{ list-style:none; display:grid; gap:0.6rem; }}
+.trend-row {{ display:grid; grid-template-columns:minmax(0,1fr) auto auto; align-items:center; gap:1rem; padding:0.75rem 1rem; background:var(--surface); border:1px solid var(--border); border-radius:10px; }}
+.trend-name {{ font-size:0.88rem; font-weight:700; color:var(--navy); }}
+.spark {{ color:var(--blue); display:block; }}
+.trend-range {{ font-size:0.85rem; color:var(--gray); white-space:nowrap; }}
+.trend-range small {{ font-size:0.7rem; color:var(--gray-light); }}
+@media (max-width:640px) {{ .container {{ padding:1.5rem 1rem 3rem; }} .card {{ padding:1.25rem; }} .trend-row {{ grid-template-columns:1fr; gap:0.4rem; }} .brand-logo {{ width:58px; height:58px; padding:6px; border-radius:18px; }} }}
 </style>
 </head>
 <body>
@@ -306,7 +456,9 @@ h2.sec::before {{ content:''; position:absolute; left:0; top:0.15rem; bottom:0.1
   <p class="method"><strong>How to read this.</strong> Each figure is reproduced as it was reported in that
   month's issue, with the source named there. Follow the issue link to see the original context and source
   before citing a number. Figures from earlier months are kept rather than overwritten, so a change in
-  methodology between sources stays visible instead of being smoothed away.</p>
+  methodology between sources stays visible instead of being smoothed away. The same figures are available
+  as <a href="/blog/canadian-ai-adoption.json">JSON</a> and <a href="/blog/canadian-ai-adoption.csv">CSV</a>.</p>
+  {'<h2 class="sec">Trends across issues</h2>' + trends if trends else ''}
   <h2 class="sec">The figures, by issue</h2>
   {groups if groups else '<p>No figures recorded yet.</p>'}
   <h2 class="sec">Questions about this data</h2>
@@ -322,15 +474,50 @@ def _json(s):
     return json.dumps(s, ensure_ascii=False)
 
 
+_CSV_HEADER = ("issue_date", "issue_month", "value", "unit", "population", "source",
+               "statement", "issue_url")
+
+
+def _iso(d):
+    return d.strftime("%Y-%m-%d") if d != datetime.min else ""
+
+
+def write_exports(rows):
+    """JSON and CSV copies of exactly the rows the page shows. Returns the
+    number of files written."""
+    from data_export import write_csv, write_json
+    figures = [{"issue_date": _iso(r["date"]), "issue_month": r["month"], "issue_title": r["title"],
+                "issue_url": r["url"], "statement": r["stat"], "value": r["value"], "unit": r["unit"],
+                "population": r["population"], "source": r["source"]} for r in rows]
+    trends = {p: [{"issue_date": _iso(d), "issue_month": m, "value": v} for d, m, v in pts]
+              for p, pts in trend_series(rows).items()}
+    written = write_json(JSON_OUT, {
+        "title": "Canadian AI adoption statistics, tracked monthly",
+        "url": CANONICAL,
+        "publisher": BRAND,
+        "updated": max((f["issue_date"] for f in figures), default=""),
+        "figures": figures,
+        "trends": trends,
+    })
+    written += write_csv(CSV_OUT, _CSV_HEADER, (
+        (f["issue_date"], f["issue_month"], f["value"], f["unit"], f["population"],
+         f["source"], f["statement"], f["issue_url"]) for f in figures))
+    return written
+
+
 def write_pillar():
-    rows = collect_stats()
+    store, reread = update_store()
+    rows = collect_stats(store)
     if not rows:
         print("Pillar: no adoption figures found; page not written.")
         return None
-    with open(OUT, "w", encoding="utf-8") as f:
-        f.write(build_page(rows))
+    write_text(OUT, build_page(rows))
     print(f"Pillar page updated ({len(rows)} figures from "
-          f"{len({r['url'] for r in rows})} issues).")
+          f"{len({r['url'] for r in rows})} issues, {reread} re-read).")
+    try:
+        print(f"  exports: {write_exports(rows)} of 2 file(s) written")
+    except Exception as e:
+        print(f"  pillar exports skipped ({e})")
 
     try:
         from og_image import build_og_image
@@ -0,0 +1,141 @@
+"""
+post_registry.py
+Which files in blog/posts are issues. One answer, shared by every script that
+walks the archive.
+
+The blog index, the sitemap, fix_old_posts.py and the pillar page each kept
+their own list of files to leave out, with a comment saying the lists were
+separate on purpose because the scripts ran in different workflow steps. They
+drifted: the sitemap and the index agreed, fix_old_posts missed the superseded
+May draft, and the pillar page skipped only latest.html — so it read the
+redirect stubs' leftover figures alongside the real issues.
+
+Every file is classified once per process:
+
+  published   a dated issue
+  stub        a redirect left behind when an issue was renamed. Recognised from
+              the file itself — a meta refresh, robots noindex, or a canonical
+              pointing at another file — so a new stub needs no list entry.
+  latest      latest.html, the alias that redirects to the newest issue
+  draft       a superseded draft that is still a normal-looking page (listed in
+              SUPERSEDED), or a filename with an unfilled "{...}" placeholder
+
+The listing is cached against the directory's mtime and each classification
+against the file's, so a publish that writes a new issue mid-process is seen
+by the next call without anything having to invalidate the cache. Both look
+through atomic_write: inside publish() an issue that is only staged so far is
+listed and classified from its temp file, so update_blog_index() can run in
+the same publish() as the post it is indexing.
+"""
+
+import os
+import re
+from datetime import datetime
+
+from atomic_write import listdir, pending, source
+
+POSTS_DIR = "blog/posts"
+
+# Superseded drafts that do not mark themselves as stubs. Only files that
+# cannot be classified from their own markup belong here.
+SUPERSEDED = {
+    # May 31 is the canonical May 2026 post
+    "2026-05-30-ai-insights-for-may-2026.html",
+}
+
+_REFRESH = re.compile(r'<meta\b[^>]*http-equiv="refresh"', re.I)
+_NOINDEX = re.compile(r'<meta\b(?=[^>]*name="robots")(?=[^>]*content="[^"]*noindex)[^>]*>', re.I)
+_CANONICAL = re.compile(r'<link\b(?=[^>]*rel="canonical")[^>]*href="([^"]+)"', re.I)
+
+_listing = {}     # posts_dir -> ((dir mtime, staged entries), [names])
+_kinds = {}       # path -> ((file read, mtime, size), kind)
+
+
+def _names(posts_dir):
+    try:
+        stamp = (os.stat(posts_dir).st_mtime_ns, pending(posts_dir))
+    except OSError:
+        return []
+    cached = _listing.get(posts_dir)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    names = sorted(f for f in listdir(posts_dir)
+                   if f.endswith(".html") and f != "index.html")
+    _listing[posts_dir] = (stamp, names)
+    return names
+
+
+def _read_kind(name, src):
+    if name == "latest.html":
+        return "latest"
+    if "{" in name or name in SUPERSEDED:
+        return "draft"
+    with open(src, encoding="utf-8", errors="replace") as f:
+        source = f.read()
+    head = source[:source.find("</head>")] if "</head>" in source else source
+    if _REFRESH.search(head) or _NOINDEX.search(head):
+        return "stub"
+    canonical = _CANONICAL.search(head)
+    if canonical and os.path.basename(canonical.group(1).split("#")[0]) != name:
+        return "stub"
+    return "published"
+
+
+def classify(name, posts_dir=POSTS_DIR):
+    """"published", "stub", "latest" or "draft"."""
+    path = os.path.join(posts_dir, name)
+    src = source(path)
+    try:
+        st = os.stat(src)
+        stamp = (src, st.st_mtime_ns, st.st_size)
+    except (OSError, TypeError):
+        return "draft" if name in SUPERSEDED else None
+    cached = _kinds.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    kind = _read_kind(name, src)
+    _kinds[path] = (stamp, kind)
+    return kind
+
+
+def post_date(name):
+    m = re.match(r"(\d{4}-\d{2}-\d{2})-", name)
+    try:
+        return datetime.strptime(m.group(1), "%Y-%m-%d") if m else None
+    except ValueError:
+        return None
+
+
+def _by_kind(kind, posts_dir, newest_first):
+    names = [n for n in _names(posts_dir) if classify(n, posts_dir) == kind]
+    return sorted(names, key=lambda n: (post_date(n) or datetime.min, n), reverse=newest_first)
+
+
+def published(posts_dir=POSTS_DIR, newest_first=True):
+    """Filenames of the dated issues, newest first."""
+    return _by_kind("published", posts_dir, newest_first)
+
+
+def stubs(posts_dir=POSTS_DIR):
+    return _by_kind("stub", posts_dir, True)
+
+
+def newest(posts_dir=POSTS_DIR):
+    """The newest published issue's filename, or None."""
+    found = published(posts_dir)
+    return found[0] if found else None
+
+
+def excluded(posts_dir=POSTS_DIR):
+    """Every file that is not a published issue: stubs, drafts, latest.html."""
+    return {n for n in _names(posts_dir) if classify(n, posts_dir) != "published"} | SUPERSEDED
+
+
+def refresh():
+    _listing.clear()
+    _kinds.clear()
+
+
+if __name__ == "__main__":
+    for name in _names(POSTS_DIR):
+        print(f"{classify(name):10} {name}")
@@ -0,0 +1,1026 @@
+// Review screen script. Static: the same file for every draft, served from
+// blog/staging/assets/ under a content-hashed name so a browser keeps it for
+// as long as it likes. Everything that belongs to THIS draft comes from the
+// JSON payload generate-preview-page.py writes into the page. What the
+// pipeline has done since comes from blog/staging/status.json (DRAFT.live),
+// a few hundred bytes written by run_status.py at the end of every run.
+const DRAFT = JSON.parse(document.getElementById("preview-data").textContent);
+
+const REPO          = DRAFT.repo;
+const STAGING_FILE  = DRAFT.filename;
+const ISSUE_MONTH_YEAR    = DRAFT.issue_month_year;
+const COVERAGE_MONTH_YEAR = DRAFT.coverage_month_year;
+const SURVEY_QUESTIONS = DRAFT.survey_questions;
+const PERMALINK        = DRAFT.permalink;
+// Where the draft itself is served: blog/staging/, or blog/posts/ on the
+// look-only sample screen (make_preview_sample.py).
+const FRAME_DIR     = DRAFT.frame_dir;
+const RUN_ID        = DRAFT.run_id;
+const APPROVE_WF    = "approve-blog.yml";
+const REGENERATE_WF = "regenerate-blog.yml";
+const REDRAFT_WF    = "redraft-section.yml";
+const DISCARD_WF    = "discard-blog.yml";
+const GITHUB_API    = "https://api.github.com";
+
+// ── Set iframe src with cache-busting timestamp on load ────────
+function setIframeSrc(extraBust) {
+  const iframe = document.getElementById("preview-iframe");
+  const ts = extraBust || Date.now();
+  iframe.src = `${FRAME_DIR}${STAGING_FILE}?v=${ts}`;
+}
+
+document.addEventListener("DOMContentLoaded", () => {
+  loadPAT();
+  loadLastPrompt();
+  const runId = RUN_ID;
+  if (runId && runId !== "0") {
+    const row = document.getElementById("gen-info");
+    const val = document.getElementById("gen-run");
+    if (row && val) {
+      row.style.display = "flex";
+      val.innerHTML = `<a href="https://github.com/${REPO}/actions/runs/${runId}" target="_blank" style="color:var(--blue);">Run #${runId}</a>`;
+    }
+  }
+  // Set iframe src with cache-busting timestamp — fixes blank iframe on slow JS
+  document.getElementById("preview-iframe")
+          .addEventListener("load", onIframeLoad);
+  setIframeSrc();
+  // Show cache hint after 3 seconds in case content looks stale
+  setTimeout(() => {
+    document.getElementById("cache-hint").style.display = "inline";
+  }, 3000);
+  loadStatus();
+  loadModelConfig();
+  // Every full page load reflects the true current staging_filename (baked
+  // in server-side at generation time) — this timestamp is how you can
+  // tell whether THIS page still matches what's actually on GitHub.
+  document.getElementById("page-loaded-time").textContent = new Date().toLocaleTimeString();
+});
+
+// Is this page the one that is actually deployed?
+//
+// The approval screen lives at a fixed URL and is regenerated on every run,
+// so a cached copy shows an old issue with an old generation time and gives
+// no sign of it. That happened: a stamp read 10:38 PM for a run that had
+// already been superseded, and the natural conclusion was that the stamp was
+// broken rather than the page being stale.
+//
+// Fetch status.json, compare the draft it names with this page's, and say so
+// plainly if they differ. Fails silently — offline or blocked, a missing
+// warning is better than a false one.
+const GENERATED_STAMP = DRAFT.generated;
+
+// ── Gemini daily requests ───────────────────────────────────────
+// The free tier is rate-limited per minute and per DAY, not a monthly token
+// pool, so this tracks requests per day — the limit repeated testing hits.
+// The count comes from status.json rather than the baked-in value, because
+// a failed run spends requests without regenerating this page.
+const QUOTA_BAKED = DRAFT.quota.requests;
+const QUOTA_LIMIT_KEY = "blog_preview_quota_limit";
+
+// Google resets these quotas at midnight Pacific, so the bucket to read is
+// today's PACIFIC date — not the browser's local date, which rolls over at
+// the wrong moment and would read as headroom that is not there.
+function quotaDay() {
+  return new Date().toLocaleDateString("en-CA", { timeZone: "America/Los_Angeles" });
+}
+
+// Limits are per model and separate. Defaults come from the free tier; each
+// is overridable because quotas are assigned per Google Cloud project.
+const QUOTA_DEFAULT_LIMITS = DRAFT.quota.limits;
+const QUOTA_LIMIT_PREFIX = "blog_preview_quota_limit_";
+
+function quotaLimitFor(model) {
+  const saved = parseInt(localStorage.getItem(QUOTA_LIMIT_PREFIX + model) || "", 10);
+  if (saved > 0) return saved;
+  return QUOTA_DEFAULT_LIMITS[model] || 0;
+}
+
+function quotaColour(pct) {
+  return pct >= 85 ? "#ef4444" : (pct >= 60 ? "#f59e0b" : "#22c55e");
+}
+
+function renderQuota(entry) {
+  const total = entry && entry.requests ? entry.requests : 0;
+  const models = (entry && entry.models) ? entry.models : {};
+  const el = document.getElementById("quota-count");
+  const host = document.getElementById("quota-models");
+  const note = document.getElementById("quota-note");
+  if (!el || !host) return;
+  el.textContent = total;
+
+  const names = Object.keys(models).sort((a, b) => models[b] - models[a]);
+  host.innerHTML = "";
+  let worst = 0;
+  names.forEach(function (m) {
+    const used = models[m];
+    const limit = quotaLimitFor(m);
+    const pct = limit ? Math.min(100, Math.round((used / limit) * 100)) : 0;
+    if (pct > worst) worst = pct;
+    const row = document.createElement("div");
+    row.style.cssText = "margin-bottom:0.5rem;";
+    const short = m.replace("gemini-", "");
+    row.innerHTML =
+      '<div style="display:flex;justify-content:space-between;gap:0.5rem;'
+      + 'font-size:0.7rem;color:#cbd5e1;margin-bottom:0.2rem;">'
+      + '<span style="font-family:monospace;">' + short + '</span>'
+      + '<span style="font-weight:700;color:' + quotaColour(pct) + ';">'
+      + used + (limit ? " / " : "") + '</span></div>'
+      + '<div style="height:5px;background:#1e293b;border-radius:3px;overflow:hidden;">'
+      + '<div style="height:100%;width:' + pct + '%;background:' + quotaColour(pct) + ';"></div>'
+      + '</div>';
+    // The limit is an input so a project with a different quota can correct it.
+    const input = document.createElement("input");
+    input.type = "number"; input.min = "1"; input.value = limit || "";
+    input.title = "Daily request limit for " + m;
+    input.style.cssText = "width:4.6rem;padding:0.15rem 0.3rem;font-size:0.68rem;"
+      + "border-radius:4px;border:1px solid #334155;background:#0f172a;color:#e2e8f0;";
+    input.addEventListener("input", function () {
+      const v = parseInt(input.value, 10);
+      if (v > 0) localStorage.setItem(QUOTA_LIMIT_PREFIX + m, String(v));
+      else localStorage.removeItem(QUOTA_LIMIT_PREFIX + m);
+      renderQuota(quotaEntry);
+    });
+    row.querySelector("span:last-child").appendChild(input);
+    host.appendChild(row);
+  });
+
+  if (!names.length) {
+    note.textContent = "No requests recorded yet today. Resets at midnight Pacific.";
+  } else if (worst >= 85) {
+    note.textContent = worst + "% of a model's daily requests used. Stop testing — "
+      + "a single run can fire several requests when a model retries or falls back.";
+  } else if (worst >= 60) {
+    note.textContent = worst + "% of a model's daily requests used. Resets at midnight Pacific.";
+  } else {
+    note.textContent = "Well inside the daily limits. Resets at midnight Pacific.";
+  }
+}
+
+// ── Model choice ───────────────────────────────────────────────
+// Config lives in the repo so the workflow reads it too. Written back from
+// here with the same PAT that dispatches workflows, which is what makes
+// adopting a new model a UI action rather than a code change.
+const MODEL_CONFIG_PATH = "blog/model-config.json";
+let MODEL_CFG = null;
+
+async function loadModelConfig() {
+  const leader = document.getElementById("model-leader");
+  const fallbacks = document.getElementById("model-fallbacks");
+  if (!leader) return;
+  let cfg = { order: [], limits: {}, available: [] };
+  // "no-cache" revalidates rather than re-downloads: the browser sends the
+  // ETag it holds and an unchanged config comes back as a bodiless 304. The
+  // config stays out of status.json because this page writes it itself, and
+  // a copy there would be stale from that write until the next run.
+  try {
+    const res = await fetch("/" + MODEL_CONFIG_PATH, { cache: "no-cache" });
+    if (res.ok) cfg = await res.json();
+  } catch (e) { /* no config yet — the run falls back to built-in defaults */ }
+  MODEL_CFG = cfg;
+  const order = (cfg.order && cfg.order.length) ? cfg.order : ["(built-in default)"];
+  leader.textContent = order[0].replace("gemini-", "");
+  fallbacks.textContent = order.length > 1
+    ? "falls back to " + order.slice(1).map(m => m.replace("gemini-", "")).join(", ")
+    : "no fallback configured";
+
+  const fresh = (cfg.available || []).filter(m => !(cfg.dismissed || []).includes(m));
+  const box = document.getElementById("model-new");
+  if (fresh.length) {
+    // A dropdown, not a label: the discovery call can return several newer
+    // models at once, and "Lead with it" silently taking the first would
+    // adopt something the reviewer never chose.
+    const sel = document.getElementById("model-new-name");
+    sel.innerHTML = "";
+    fresh.forEach(function (m) {
+      const o = document.createElement("option");
+      o.value = m; o.textContent = m;
+      sel.appendChild(o);
+    });
+    sel.onchange = renderModelDelta;
+    const lim = document.getElementById("model-new-limit");
+    if (lim && !lim.dataset.wired) {
+      lim.addEventListener("input", renderModelDelta);
+      lim.dataset.wired = "1";
+    }
+    box.style.display = "block";
+    renderModelDelta();
+  } else {
+    box.style.display = "none";
+  }
+}
+
+// Read-modify-write through the Contents API. The SHA is fetched immediately
+// before the write so a config the workflow changed in between is not
+// silently clobbered.
+async function writeModelConfig(cfg, message) {
+  const pat = loadPAT();
+  if (!pat) {
+    showToast("Please add your GitHub token below first.", "error");
+    flashPatAttention();
+    return false;
+  }
+  const url = `${GITHUB_API}/repos/${REPO}/contents/${MODEL_CONFIG_PATH}`;
+  const headers = { "Authorization": `Bearer ${pat}`,
+                    "Accept": "application/vnd.github+json" };
+  let sha = null;
+  try {
+    const cur = await fetch(url + "?ref=main", { headers, cache: "no-store" });
+    if (cur.ok) sha = (await cur.json()).sha;
+    else if (cur.status !== 404) {
+      showToast(`Could not read the config (${cur.status}).`, "error");
+      return false;
+    }
+  } catch (e) { showToast("Network error reading the config.", "error"); return false; }
+
+  const body = {
+    message: message,
+    content: btoa(unescape(encodeURIComponent(JSON.stringify(cfg, null, 2)))),
+    branch: "main"
+  };
+  if (sha) body.sha = sha;
+  try {
+    const res = await fetch(url, { method: "PUT", headers, body: JSON.stringify(body) });
+    if (!res.ok) {
+      const t = await res.text();
+      showToast(`Write failed (${res.status}). ${t.slice(0, 120)}`, "error");
+      return false;
+    }
+    return true;
+  } catch (e) { showToast("Network error writing the config.", "error"); return false; }
+}
+
+// Pro-tier free limits are roughly an order of magnitude below Flash, so the
+// risk is flagged from the NAME before any number is looked up — the reviewer
+// should know a pro model costs headroom before going to find the figure.
+function modelTierRisk(model, currentModel) {
+  const isPro = /(^|-)pro(-|$)/.test(model);
+  const curIsPro = /(^|-)pro(-|$)/.test(currentModel || "");
+  if (isPro && !curIsPro) {
+    return "Pro-tier model. On the free tier Pro daily limits are typically tens "
+      + "of requests against thousands for Flash — expect a large drop in headroom. "
+      + "Confirm the number before adopting.";
+  }
+  if (/lite/.test(model) && !/lite/.test(currentModel || "")) {
+    return "Lite model. Lite usually carries a lower daily limit than full Flash, "
+      + "and produced a materially weaker issue the one time this pipeline fell "
+      + "back to it.";
+  }
+  return "";
+}
+
+function renderModelDelta() {
+  const cfg = MODEL_CFG || {};
+  const current = (cfg.order || [])[0] || "";
+  const currentLimit = (cfg.limits || {})[current] || QUOTA_DEFAULT_LIMITS[current] || 0;
+  const sel = document.getElementById("model-new-name");
+  const model = sel ? sel.value : "";
+  const curName = document.getElementById("model-cur-name");
+  const curLimitEl = document.getElementById("model-cur-limit");
+  const delta = document.getElementById("model-delta");
+  const warn = document.getElementById("model-tier-warn");
+  if (!curName || !delta || !warn) return;
+  curName.textContent = current.replace("gemini-", "") || "—";
+  curLimitEl.textContent = currentLimit ? currentLimit.toLocaleString() + "/day" : "not set";
+
+  const risk = modelTierRisk(model, current);
+  warn.style.display = risk ? "block" : "none";
+  warn.textContent = risk;
+
+  const el = document.getElementById("model-new-limit");
+  const n = el ? parseInt(el.value, 10) : 0;
+  if (!n || n <= 0 || !currentLimit) { delta.textContent = ""; return; }
+  const pct = Math.round(((n - currentLimit) / currentLimit) * 100);
+  if (pct >= 0) {
+    delta.style.color = "#86efac";
+    delta.textContent = (pct === 0 ? "Same headroom" : "+" + pct + "% headroom")
+      + " — " + n.toLocaleString() + " requests/day.";
+  } else if (pct > -50) {
+    delta.style.color = "#fcd34d";
+    delta.textContent = pct + "% headroom — " + n.toLocaleString() + "/day instead of "
+      + currentLimit.toLocaleString() + ".";
+  } else {
+    delta.style.color = "#fca5a5";
+    delta.textContent = pct + "% headroom. " + n.toLocaleString() + "/day instead of "
+      + currentLimit.toLocaleString() + " — a severe cut. Adopt only if the model is "
+      + "worth losing that much testing room.";
+  }
+}
+
+async function adoptNewModel() {
+  const cfg = MODEL_CFG || {};
+  const fresh = (cfg.available || []).filter(m => !(cfg.dismissed || []).includes(m));
+  if (!fresh.length) return;
+  const model = document.getElementById("model-new-name").value || fresh[0];
+  const limit = parseInt(document.getElementById("model-new-limit").value, 10);
+  if (!limit || limit <= 0) {
+    showToast("Set the daily request limit first — it cannot be discovered.", "error");
+    return;
+  }
+  // A severe cut is an informed decision, not a blocked one — but it has to be
+  // an explicit click, because losing most of the daily budget is not
+  // recoverable until midnight Pacific.
+  const cur0 = (cfg.order || [])[0] || "";
+  const curLim = (cfg.limits || {})[cur0] || QUOTA_DEFAULT_LIMITS[cur0] || 0;
+  if (curLim && limit < curLim * 0.5) {
+    const drop = Math.abs(Math.round(((limit - curLim) / curLim) * 100));
+    if (!confirm(model + " would cut your daily requests by " + drop + "% ("
+                 + limit + "/day instead of " + curLim + "). Adopt anyway?")) return;
+  }
+  const btn = document.getElementById("model-adopt");
+  btn.disabled = true;
+  // New model leads; the previous order becomes the fallback chain, so a bad
+  // new model degrades to what was already working instead of failing.
+  const order = [model].concat((cfg.order || []).filter(m => m !== model));
+  const next = Object.assign({}, cfg, {
+    order: order,
+    limits: Object.assign({}, cfg.limits || {}, { [model]: limit }),
+    known: Array.from(new Set((cfg.known || []).concat(order))),
+    available: (cfg.available || []).filter(m => m !== model)
+  });
+  const ok = await writeModelConfig(next, `Lead with ${model} (set from the approval page)`);
+  btn.disabled = false;
+  if (ok) {
+    MODEL_CFG = next;
+    showToast(`${model} will lead from the next run.`, "success");
+    document.getElementById("model-status").textContent =
+      "Saved. Takes effect on the next generation.";
+    loadModelConfig();
+  }
+}
+
+async function dismissNewModel() {
+  const cfg = MODEL_CFG || {};
+  const fresh = (cfg.available || []).filter(m => !(cfg.dismissed || []).includes(m));
+  if (!fresh.length) return;
+  const btn = document.getElementById("model-dismiss");
+  btn.disabled = true;
+  const next = Object.assign({}, cfg, {
+    dismissed: Array.from(new Set((cfg.dismissed || []).concat(fresh))),
+    known: Array.from(new Set((cfg.known || []).concat(fresh))),
+    available: []
+  });
+  const ok = await writeModelConfig(next, "Dismiss new Gemini model(s) (from the approval page)");
+  btn.disabled = false;
+  if (ok) {
+    MODEL_CFG = next;
+    showToast("Dismissed. It will not be offered again.", "purple");
+    loadModelConfig();
+  }
+}
+
+let quotaEntry = { requests: QUOTA_BAKED, models: {} };
+
+// Today's bucket from status.json. usage.json is still read when there is no
+// status yet (a draft staged before run_status.py existed, or the sample
+// screen), which is the only time this costs a second request.
+async function loadQuota(status) {
+  if (status && status.quota) {
+    quotaEntry = status.quota.day === quotaDay()
+      ? status.quota : { requests: 0, models: {} };
+  } else {
+    try {
+      const res = await fetch("/blog/staging/usage.json", { cache: "no-cache" });
+      if (res.ok) {
+        const data = await res.json();
+        quotaEntry = data[quotaDay()] || { requests: 0, models: {} };
+      }
+    } catch (e) { /* offline, or no ledger yet — fall back to the baked value */ }
+  }
+  renderQuota(quotaEntry);
+}
+
+// ── status.json ────────────────────────────────────────────────
+// Fetched with If-None-Match (or If-Modified-Since) from the last answer and
+// no cache of the browser's own, so GitHub Pages does the comparing: an
+// unchanged status comes back as a 304 with no body, and a new one is never
+// hidden behind a ten-minute-old cached copy the way a plain fetch would be.
+// Returns { status, changed }, or null when there is nothing to ask (the
+// sample screen leaves DRAFT.live empty) or no answer.
+let statusLast = null;
+let statusValidators = {};
+async function fetchStatus() {
+  if (!DRAFT.live) return null;
+  const headers = {};
+  if (statusValidators.etag) headers["If-None-Match"] = statusValidators.etag;
+  else if (statusValidators.modified) headers["If-Modified-Since"] = statusValidators.modified;
+  const res = await fetch(DRAFT.live, { cache: "no-store", headers: headers });
+  if (res.status === 304 && statusLast) return { status: statusLast, changed: false };
+  if (!res.ok) return null;
+  statusLast = await res.json();
+  statusValidators = { etag: res.headers.get("ETag"), modified: res.headers.get("Last-Modified") };
+  return { status: statusLast, changed: true };
+}
+
+// Does status.json name a different draft from the one this page shows?
+function statusHasNewDraft(status) {
+  const d = status && status.draft;
+  return !!d && (d.file !== STAGING_FILE || d.run_id !== RUN_ID || d.generated !== GENERATED_STAMP);
+}
+
+async function loadStatus() {
+  let status = null;
+  try {
+    const got = await fetchStatus();
+    status = got && got.status;
+  } catch (e) { /* offline — the quota falls back, the stale check stays quiet */ }
+  loadQuota(status);
+  checkForStalePage(status);
+}
+
+function checkForStalePage(status) {
+  try {
+    if (!status) return;
+    let message;
+    if (statusHasNewDraft(status)) {
+      message = "You are looking at a cached copy of this page. It was generated " +
+        GENERATED_STAMP + "; the current one was generated " + status.draft.generated + ".";
+    } else if (!status.draft && (status.stage === "published" || status.stage === "discarded")) {
+      message = "This draft has already been " + status.stage + "; nothing is pending review.";
+    } else {
+      return;
+    }
+    // One bar only. Called once on load today, but two stacked warnings
+    // saying the same thing would read as two separate problems.
+    if (document.getElementById("stale-bar")) return;
+
+    const bar = document.createElement("div");
+    bar.id = "stale-bar";
+    bar.style.cssText = "position:sticky;top:0;z-index:9999;background:#b45309;" +
+      "color:#fff;padding:0.7rem 1rem;font-size:0.85rem;font-weight:600;" +
+      "display:flex;gap:0.75rem;align-items:center;flex-wrap:wrap;";
+    bar.innerHTML = "<span>" + message + "</span>";
+    const btn = document.createElement("button");
+    btn.textContent = "Load the current version";
+    btn.style.cssText = "background:#fff;color:#b45309;border:none;border-radius:6px;" +
+      "padding:0.4rem 0.9rem;font-weight:700;cursor:pointer;min-height:36px;";
+    btn.onclick = forceRefresh;
+    bar.appendChild(btn);
+    document.body.prepend(bar);
+  } catch (e) {
+    /* offline or blocked — stay quiet rather than warn wrongly */
+  }
+}
+
+function onIframeLoad() {
+  document.getElementById("iframe-loading").classList.remove("show");
+  const btn = document.getElementById("force-refresh-btn");
+  btn.classList.remove("spinning");
+  btn.disabled = false;
+}
+
+// ── Force Refresh — bypasses all browser and CDN cache ─────────
+//
+// This must reload THIS page, not just the iframe. It used to only re-point
+// the iframe src, which reloads the draft but leaves the approval screen
+// itself exactly as it was cached — including the "Generated …" stamp, which
+// is rendered server-side into this page. So the one control whose whole job
+// is "show me the current version" could not change the one field you would
+// check to see whether it had worked, and neither could the stale-page bar,
+// which calls this function.
+//
+// A regenerate replaces both the draft and this page, so reloading the whole
+// thing is the correct scope in every case; a redraft leaves this page
+// unchanged, where a full reload is merely harmless.
+//
+// The cache-busting query param is what makes it a real refresh:
+// location.reload() may still be answered from the browser's copy, and
+// GitHub Pages serves this path with a ten-minute max-age we cannot override.
+// A URL never requested before cannot be in any cache, browser or CDN.
+// Built from pathname, not href, so repeat presses don't stack params.
+function forceRefresh() {
+  const btn = document.getElementById("force-refresh-btn");
+  if (btn) {
+    btn.classList.add("spinning");
+    btn.disabled = true;
+  }
+  showToast("Fetching latest version, bypassing cache…", "purple");
+  flushTake();
+  location.replace(location.pathname + "?v=" + Date.now());
+}
+
+// Write any pending Desk text before navigating away. initTake() debounces
+// its save by 400ms, so the last few keystrokes before a refresh would
+// otherwise be dropped — and this section is the one thing on the page that
+// is genuinely Robert's, not recoverable by regenerating.
+function flushTake() {
+  try {
+    const el = document.getElementById("take-input");
+    if (el) localStorage.setItem(TAKE_KEY, el.value);
+  } catch (e) { /* private mode or storage full — refresh anyway */ }
+}
+
+// ── PAT management ─────────────────────────────────────────────
+// Shows the loud "no token" banner (with a direct link to GitHub's token
+// creation page) whenever there's nothing saved, and the quiet green
+// checkmark otherwise. Called on load and every time the saved value
+// changes, so clearing your cache / a new browser / a rejected token all
+// land you back at the same clear "here's what to do" state.
+function updatePatUI(saved) {
+  document.getElementById("pat-saved").style.display = saved ? "block" : "none";
+  document.getElementById("pat-missing-banner").style.display = saved ? "none" : "block";
+  if (saved) document.getElementById("pat-input").value = saved;
+}
+
+function flashPatAttention() {
+  document.getElementById("pat-section").scrollIntoView({ behavior: "smooth", block: "start" });
+  const banner = document.getElementById("pat-missing-banner");
+  banner.classList.remove("attention");
+  void banner.offsetWidth; // restart the animation if it's already mid-flash
+  banner.classList.add("attention");
+}
+
+function loadPAT() {
+  const saved = localStorage.getItem("blog_preview_pat");
+  updatePatUI(saved);
+  return saved || "";
+}
+
+// ── Last prompt persistence ─────────────────────────────────────
+const LAST_PROMPT_KEY = "blog_preview_last_prompt";
+
+function saveLastPrompt(prompt) {
+  localStorage.setItem(LAST_PROMPT_KEY, prompt);
+}
+
+function loadLastPrompt() {
+  const saved = localStorage.getItem(LAST_PROMPT_KEY);
+  const box = document.getElementById("last-prompt-box");
+  const text = document.getElementById("last-prompt-text");
+  if (saved && saved.trim()) {
+    text.textContent = saved;
+    box.style.display = "block";
+  } else {
+    box.style.display = "none";
+  }
+}
+
+function reuseLastPrompt() {
+  const saved = localStorage.getItem(LAST_PROMPT_KEY);
+  if (saved) {
+    document.getElementById("prompt-input").value = saved;
+    document.getElementById("prompt-input").focus();
+    document.getElementById("prompt-input").scrollIntoView({ behavior: "smooth", block: "center" });
+  }
+}
+
+function savePAT() {
+  const val = document.getElementById("pat-input").value.trim();
+  if (!val.startsWith("ghp_") && !val.startsWith("github_pat_")) {
+    showToast("Token should start with ghp_ or github_pat_", "error");
+    return;
+  }
+  localStorage.setItem("blog_preview_pat", val);
+  updatePatUI(val);
+  showToast("Token saved in this browser ✓", "success");
+}
+
+// ── GitHub Actions trigger ──────────────────────────────────────
+async function triggerWorkflow(workflow, inputs) {
+  const pat = loadPAT();
+  if (!pat) {
+    showToast("Please add your GitHub token below first.", "error");
+    document.getElementById("pat-input").focus();
+    flashPatAttention();
+    return null;
+  }
+  const url = `${GITHUB_API}/repos/${REPO}/actions/workflows/${workflow}/dispatches`;
+  try {
+    const res = await fetch(url, {
+      method: "POST",
+      headers: {
+        "Authorization": `Bearer ${pat}`,
+        "Accept": "application/vnd.github+json",
+        "Content-Type": "application/json",
+        "X-GitHub-Api-Version": "2022-11-28"
+      },
+      body: JSON.stringify({ ref: "main", inputs })
+    });
+    if (res.status === 401) {
+      // Confirmed dead — don't leave the misleading green "✓ Token saved"
+      // checkmark up for a token GitHub just rejected.
+      localStorage.removeItem("blog_preview_pat");
+      updatePatUI(null);
+      flashPatAttention();
+    }
+    return res;
+  } catch (err) {
+    // Network drop, DNS failure, offline, blocked request — fetch throws
+    // rather than resolving, so without this the loading overlay would
+    // spin forever with no explanation.
+    hideOverlay();
+    showToast("Network error contacting GitHub — check your connection and try again.", "error");
+    return null;
+  }
+}
+
+function apiErrorMessage(res, body) {
+  if (res.status === 401) return "GitHub rejected the token (401) — it's invalid or expired, so it's been cleared from this browser. See the banner in the sidebar to get a new one.";
+  if (res.status === 403) return `GitHub returned 403 — the token likely lacks 'workflow' scope. ${body.message || ""}`;
+  if (res.status === 404) return "GitHub returned 404 — check the token has 'workflow' scope and that all four workflow files are committed to the main branch.";
+  return `GitHub API returned ${res.status}: ${body.message || "Unknown error"}.`;
+}
+
+// ── Lock/unlock Approve + Regenerate + Discard while a workflow run is
+// in flight, or while this page's known staging_filename may be stale
+// (a regenerate can rename the file — see startPolling; approve/discard
+// both remove it entirely). Only a full page reload can safely
+// re-establish current state, so unlocking happens via reload, not a
+// timer.
+let draftGone = false; // true once Approve or Discard actually succeeds — this page is done either way
+function lockButtons(message) {
+  document.getElementById("regenerate-btn").disabled = true;
+  document.getElementById("approve-btn").disabled = true;
+  document.getElementById("discard-btn").disabled = true;
+  const banner = document.getElementById("lock-banner");
+  if (message) document.getElementById("lock-banner-text").innerHTML = message;
+  banner.style.display = "block";
+}
+function unlockButtons() {
+  if (draftGone) return;
+  document.getElementById("regenerate-btn").disabled = false;
+  document.getElementById("approve-btn").disabled = false;
+  document.getElementById("discard-btn").disabled = false;
+  document.getElementById("lock-banner").style.display = "none";
+}
+
+
+// ── Robert's Take ───────────────────────────────────────────────
+// Kept in localStorage: a half-written take should survive a reload or an
+// accidental navigation, since it is the one thing here nobody else can
+// reproduce for him.
+const TAKE_KEY = "blog_preview_take_" + STAGING_FILE;
+
+function takeText() {
+  const el = document.getElementById("take-input");
+  return el ? el.value.trim() : "";
+}
+
+function initTake() {
+  const el = document.getElementById("take-input");
+  if (!el) return;
+  const saved = localStorage.getItem(TAKE_KEY);
+  if (saved) el.value = saved;
+  const count = document.getElementById("take-count");
+  const savedFlag = document.getElementById("take-saved");
+  let timer = null;
+  function update() {
+    const words = takeText() ? takeText().split(/\s+/).length : 0;
+    if (count) {
+      // The target range is the whole point of the section — showing the
+      // count alone gives no sense of whether 180 words is short.
+      let note = " · target 300–450";
+      if (words >= 300 && words <= 450) note = " · in range";
+      else if (words > 450) note = " · over 450, consider trimming";
+      count.textContent = words + (words === 1 ? " word" : " words") + note;
+    }
+    clearTimeout(timer);
+    timer = setTimeout(function () {
+      localStorage.setItem(TAKE_KEY, el.value);
+      if (savedFlag) {
+        savedFlag.textContent = "saved";
+        setTimeout(function () { savedFlag.textContent = ""; }, 1500);
+      }
+    }, 400);
+  }
+  el.addEventListener("input", update);
+  update();
+}
+
+// ── Permalink ───────────────────────────────────────────────────
+function copyPermalink() {
+  navigator.clipboard.writeText(PERMALINK).then(
+    function () { showToast("Share link copied.", "success"); },
+    function () { showToast("Could not copy — select the text manually.", "error"); }
+  );
+}
+
+// ── Survey wave form ────────────────────────────────────────────
+function initSurvey() {
+  const host = document.getElementById("survey-questions");
+  if (!host || !SURVEY_QUESTIONS.length) return;
+  host.innerHTML = SURVEY_QUESTIONS.map(function (q) {
+    const opts = q.options.map(function (o) {
+      return '<label class="survey-opt"><span>' + o + '</span>' +
+             '<input type="number" min="0" data-q="' + q.id + '" data-opt="' +
+             o.replace(/"/g, "&quot;") + '"></label>';
+    }).join("");
+    return '<div class="survey-q"><div class="survey-q-text">' + q.text + '</div>' + opts + '</div>';
+  }).join("");
+}
+
+function surveyPayload() {
+  const label = (document.getElementById("wave-label") || {}).value;
+  const n = parseInt((document.getElementById("wave-n") || {}).value, 10);
+  if (!label || !label.trim() || !n) return "";      // nothing entered: skip silently
+
+  const results = {};
+  document.querySelectorAll('#survey-questions input[type="number"]').forEach(function (inp) {
+    const v = parseInt(inp.value, 10);
+    if (!isNaN(v) && v >= 0) {
+      const q = inp.dataset.q;
+      results[q] = results[q] || {};
+      results[q][inp.dataset.opt] = v;
+    }
+  });
+  if (!Object.keys(results).length) return "";
+
+  const today = new Date().toISOString().slice(0, 10);
+  return JSON.stringify({
+    label: label.trim(), date: today, field_dates: ISSUE_MONTH_YEAR,
+    n: n, results: results
+  });
+}
+
+document.addEventListener("DOMContentLoaded", function () {
+  initTake();
+  initSurvey();
+});
+
+// ── Approve ─────────────────────────────────────────────────────
+async function triggerApprove() {
+  showOverlay("confirming");
+}
+
+async function confirmApprove() {
+  hideOverlay();
+  lockButtons("Publishing… Approve, Regenerate, and Discard are locked while this runs.");
+  showOverlay("loading", "Publishing...", "Triggering the publish workflow on GitHub Actions.");
+  const res = await triggerWorkflow(APPROVE_WF, {
+    staging_filename: STAGING_FILE,
+    month_year: ISSUE_MONTH_YEAR,
+    roberts_take: takeText(),
+    survey_wave: surveyPayload()
+  });
+  if (!res) { unlockButtons(); return; }
+  if (res.status === 204) {
+    draftGone = true;
+    document.getElementById("lock-banner-text").innerHTML = "✅ Published. This staging file no longer exists, so this page stays locked — visit the live blog to see the post, or generate a new draft next month.";
+    showOverlay("success",
+      "🎉 Post queued for publishing!",
+      "The approve-blog workflow is now running. Your post will be live in ~2 minutes.",
+      `https://github.com/${REPO}/actions/workflows/${APPROVE_WF}`
+    );
+  } else {
+    const body = await res.json().catch(() => ({}));
+    unlockButtons();
+    showOverlay("error", "Publish failed", apiErrorMessage(res, body));
+  }
+}
+
+// ── Discard ─────────────────────────────────────────────────────
+async function triggerDiscard() {
+  showOverlay("confirming-discard");
+}
+
+async function confirmDiscard() {
+  hideOverlay();
+  lockButtons("Discarding… Approve, Regenerate, and Discard are locked while this runs.");
+  showOverlay("loading", "Discarding draft...", "Triggering the discard workflow on GitHub Actions.");
+  const res = await triggerWorkflow(DISCARD_WF, {
+    staging_filename: STAGING_FILE
+  });
+  if (!res) { unlockButtons(); return; }
+  if (res.status === 204) {
+    draftGone = true;
+    document.getElementById("lock-banner-text").innerHTML = "🗑️ Discarded. This staging file no longer exists, so this page stays locked — nothing was published. Wait for next month's draft, or trigger monthly-blog.yml manually with Force run.";
+    showOverlay("success",
+      "🗑️ Draft discarded",
+      "The discard-blog workflow is now running. Nothing was published — this only removed the staging draft.",
+      `https://github.com/${REPO}/actions/workflows/${DISCARD_WF}`
+    );
+  } else {
+    const body = await res.json().catch(() => ({}));
+    unlockButtons();
+    showOverlay("error", "Discard failed", apiErrorMessage(res, body));
+  }
+}
+
+// ── Regenerate ──────────────────────────────────────────────────
+async function triggerRegenerate() {
+  const prompt = document.getElementById("prompt-input").value.trim();
+  if (!prompt) {
+    showToast("Please enter a prompt describing what to change.", "error");
+    document.getElementById("prompt-input").focus();
+    return;
+  }
+  saveLastPrompt(prompt);
+  // Locked immediately, before the network round-trip: regeneration almost
+  // always produces a NEW staging filename (it's stamped with today's
+  // date), which orphans the filename this page currently knows about.
+  // Approving or re-triggering against that stale value fails or, worse,
+  // targets the wrong file — so both actions stay locked until a full
+  // page reload picks up the real current state.
+  lockButtons();
+  showOverlay("loading", "🔄 Triggering regeneration...",
+    "GitHub Actions will regenerate the post with your prompt. This takes ~5 minutes. This page will reload itself automatically once the new version is live."
+  );
+  const res = await triggerWorkflow(REGENERATE_WF, {
+    prompt: prompt,
+    staging_filename: STAGING_FILE,
+    coverage_month: COVERAGE_MONTH_YEAR
+  });
+  if (!res) { hideOverlay(); unlockButtons(); return; }
+  if (res.status === 204) {
+    startPolling();
+    showOverlay("regen-queued", "⏳ Regeneration queued!",
+      "This page keeps checking for up to 10 min and reloads itself the moment the new version is live — you can close this dialog and it'll keep watching.",
+      `https://github.com/${REPO}/actions/workflows/${REGENERATE_WF}`
+    );
+  } else {
+    const body = await res.json().catch(() => ({}));
+    hideOverlay();
+    unlockButtons();
+    showToast(apiErrorMessage(res, body), "error");
+  }
+}
+
+// ── Redraft one section ─────────────────────────────────────────
+// Unlike a full regeneration this rewrites a single section in place. The
+// staging filename does not change, so the buttons are NOT locked the way
+// triggerRegenerate() locks them — there is no orphaned filename to guard
+// against, and locking Approve for a one-section edit would be a nuisance.
+async function triggerRedraft() {
+  // Several sections go as ONE dispatch: the first as `section`, the rest
+  // as also_sections, so the workflow makes one Gemini call and one commit.
+  const picked   = Array.from(document.getElementById("redraft-section").selectedOptions);
+  const guidance = document.getElementById("redraft-guidance").value.trim();
+  if (!picked.length) {
+    showToast("Pick which section to redraft.", "error");
+    return;
+  }
+  const section = picked[0].value;
+  const also    = picked.slice(1).map(o => o.value);
+  const label   = picked.map(o => o.textContent).join(", ");
+  showOverlay("loading", "Redrafting " + label + "...",
+    "Gemini is rewriting just " + (picked.length > 1 ? "these sections" : "this section") + " from the issue as it already stands. Takes about a minute."
+  );
+  const res = await triggerWorkflow(REDRAFT_WF, {
+    staging_filename: STAGING_FILE,
+    section: section,
+    guidance: guidance,
+    also_sections: also.length ? JSON.stringify(also) : "",
+    month_year: COVERAGE_MONTH_YEAR
+  });
+  if (!res) { hideOverlay(); return; }
+  if (res.status === 204) {
+    startPolling();
+    showOverlay("regen-queued", "Redraft queued",
+      "This page keeps checking and reloads once the new version is live. Every other section stays exactly as it is.",
+      `https://github.com/${REPO}/actions/workflows/${REDRAFT_WF}`
+    );
+  } else {
+    const body = await res.json().catch(() => ({}));
+    hideOverlay();
+    showToast(apiErrorMessage(res, body), "error");
+  }
+}
+
+function setRedraftGuidance(text) {
+  const el = document.getElementById("redraft-guidance");
+  el.value = text;
+  el.focus();
+}
+
+// ── Prompt chips ────────────────────────────────────────────────
+function setPrompt(text) {
+  document.getElementById("prompt-input").value = text;
+  document.getElementById("prompt-input").focus();
+}
+
+function openStagingPost() {
+  const bust = Date.now() + "_" + Math.random().toString(36).slice(2);
+  window.open(`${FRAME_DIR}${STAGING_FILE}?v=${bust}`, "_blank");
+}
+
+// ── Toast ────────────────────────────────────────────────────────
+let toastTimer;
+function showToast(msg, type = "info") {
+  const el = document.getElementById("toast");
+  el.textContent = msg;
+  el.className = `show ${type}`;
+  clearTimeout(toastTimer);
+  toastTimer = setTimeout(() => { el.className = ""; }, 4000);
+}
+
+// ── Overlay ──────────────────────────────────────────────────────
+function showOverlay(type, title = "", body = "", actionUrl = "") {
+  const card = document.getElementById("overlay-card");
+  const overlay = document.getElementById("overlay");
+  let html = "";
+  if (type === "confirming") {
+    html = `
+      <div class="overlay-icon">📤</div>
+      <div class="overlay-title">Ready to publish?</div>
+      <div class="overlay-body">This will publish <code>${STAGING_FILE}</code> — promote it to production, update <code>latest.html</code>, regenerate the sitemap, and ping Google. Double-check that filename matches what you've been reviewing in the frame on the right — if you regenerated recently and haven't reloaded this page, it may not.</div>
+      <div style="display:flex;gap:0.75rem;justify-content:center;">
+        <button class="btn btn-outline" onclick="hideOverlay()">Cancel</button>
+        <button class="btn btn-primary" onclick="confirmApprove()">Yes, Publish Now</button>
+      </div>`;
+  } else if (type === "confirming-discard") {
+    html = `
+      <div class="overlay-icon">🗑️</div>
+      <div class="overlay-title">Discard this draft?</div>
+      <div class="overlay-body">This permanently deletes <code>${STAGING_FILE}</code> from staging. Nothing is published or affected — it only undoes the generation. This can't be undone; you'd need to regenerate or wait for the next automatic run.</div>
+      <div style="display:flex;gap:0.75rem;justify-content:center;">
+        <button class="btn btn-outline" onclick="hideOverlay()">Cancel</button>
+        <button class="btn btn-discard-outline" style="border-color:var(--red);" onclick="confirmDiscard()">Yes, Discard It</button>
+      </div>`;
+  } else if (type === "loading") {
+    html = `<div class="spinner"></div><div class="overlay-title">${title}</div><div class="overlay-body">${body}</div>`;
+  } else if (type === "success") {
+    html = `
+      <div class="overlay-icon">✅</div>
+      <div class="overlay-title">${title}</div>
+      <div class="overlay-body">${body}</div>
+      <div style="display:flex;gap:0.75rem;justify-content:center;flex-wrap:wrap;">
+        ${actionUrl ? `<a href="${actionUrl}" target="_blank" class="btn btn-secondary">View Workflow Run</a>` : ""}
+        <a href="https://www.imetrobert.com/blog/" target="_blank" class="btn btn-primary">View Live Blog</a>
+        <button class="btn btn-outline" onclick="hideOverlay()">Close</button>
+      </div>`;
+  } else if (type === "regen-queued") {
+    html = `
+      <div class="overlay-icon">⏳</div>
+      <div class="overlay-title">${title}</div>
+      <div class="overlay-body">${body}</div>
+      <div style="display:flex;gap:0.75rem;justify-content:center;flex-wrap:wrap;">
+        ${actionUrl ? `<a href="${actionUrl}" target="_blank" class="btn btn-secondary">Watch Workflow</a>` : ""}
+        <button class="btn btn-outline" onclick="hideOverlay()">Dismiss (still watching)</button>
+      </div>`;
+  } else if (type === "error") {
+    html = `
+      <div class="overlay-icon">❌</div>
+      <div class="overlay-title">${title}</div>
+      <div class="overlay-body">${body}</div>
+      <button class="btn btn-outline" onclick="hideOverlay()">Close</button>`;
+  }
+  card.innerHTML = html;
+  overlay.classList.add("show");
+}
+
+function hideOverlay() {
+  document.getElementById("overlay").classList.remove("show");
+}
+
+// ── Auto-refresh polling after regeneration ─────────────────────
+// Polls status.json, not the page or its payload, and does a FULL page
+// reload — not just an iframe refresh — only once it names a different
+// draft. Regeneration renames the staging file (new date-stamped filename)
+// essentially every time, so only a real reload of this parent page picks up
+// the new STAGING_FILE from its payload. Refreshing just the iframe would
+// leave Approve pointed at a filename that's already been deleted.
+//
+// A run takes one to five minutes and GitHub Pages another minute to deploy,
+// so the first checks come quickly and later ones back off (15s, growing by
+// half each time, to a minute apart), and a status that has not changed
+// costs a 304. A "failed" status from a run other than the one this page
+// came from ends the wait at once instead of after ten minutes.
+const POLL_FIRST_MS = 15000;
+const POLL_MAX_MS   = 60000;
+const POLL_GIVE_UP_MS = 10 * 60 * 1000;
+let pollTimer;
+function startPolling() {
+  if (pollTimer) return; // already watching — don't stack timers
+  const startedAt = Date.now();
+  const knownRun  = statusLast ? statusLast.run_id : RUN_ID;
+  let delay = POLL_FIRST_MS;
+
+  async function check() {
+    pollTimer = null;
+    if (Date.now() - startedAt > POLL_GIVE_UP_MS) {
+      lockButtons(
+        `Regeneration is taking longer than 10 minutes or may have failed. ` +
+        `<a href="https://github.com/${REPO}/actions/workflows/${REGENERATE_WF}" target="_blank">Check the Actions tab</a>, ` +
+        `then reload once you've confirmed it finished.`
+      );
+      showToast("Stopped auto-checking — see the sidebar for what to do next.", "error");
+      return;
+    }
+    let got = null;
+    try { got = await fetchStatus(); } catch (e) {}
+    const status = got && got.status;
+    if (got && got.changed) loadQuota(status);
+    if (statusHasNewDraft(status)) {
+      showToast("✅ New version ready! Reloading page…", "success");
+      // forceRefresh, not location.reload. This branch is reached because
+      // status.json proved a NEW page exists — reloading the same URL can
+      // still be served the old one from cache, which lands you back on
+      // the previous run's timestamp having been told the new version was
+      // ready.
+      setTimeout(forceRefresh, 1200);
+      return;
+    }
+    if (status && status.stage === "failed" && status.run_id !== knownRun) {
+      // The draft this page shows is still staged (a failed run leaves it
+      // alone), so it is safe to act on again.
+      unlockButtons();
+      showOverlay("error", "The run failed",
+        "Nothing was changed — this draft is still the one staged. " +
+        `<a href="https://github.com/${REPO}/actions/runs/${status.run_id}" target="_blank">See the run's log</a>.`);
+      return;
+    }
+    delay = Math.min(POLL_MAX_MS, Math.round(delay * 1.5));
+    pollTimer = setTimeout(check, delay);
+  }
+  pollTimer = setTimeout(check, delay);
+}
@@ -0,0 +1,186 @@
+"""
+profiling.py
+Where a run's time goes: named timing spans through the pipeline, and an
+opt-in profiler for generate-blog.py and redraft_section.py.
+
+Until now the only timings were the benchmarks (bench_parse.py,
+bench_render.py), which time the parser and renderer on recorded output, and
+the odd print. Nothing said how a real run's minutes split between the Gemini
+call, the parser, the renderer, the social card and the archive rebuild
+behind it. So "the monthly run got slower" could not be traced to a stage,
+and the benchmarks could not be checked against what production does.
+
+span(name) times a block, as a context manager or a decorator:
+
+    with span("index.feeds"):
+        write_feeds(posts)
+
+    @span("parser.parse_sections")
+    def parse_sections(content): ...
+
+Spans nest, per thread, and are always on: two perf_counter() calls and a
+dict update under a lock, which is nothing next to a Gemini call. totals()
+gives {name: {"calls", "seconds"}}, each span counted inclusively (a span
+inside another is also inside its parent's time). Spans inside the backfill's
+render processes are not seen from here; the parent's own span around the pool
+covers them.
+
+start(script, profile_dir) is called by the entry points' main(). At exit it
+appends one entry to the JSON run report named by $RUN_REPORT (the workflows
+point it into the runner's temp directory and upload it as an artifact):
+script, arguments, run id, start time, wall seconds and the span totals. With
+--profile DIR it also runs the whole process under cProfile and a stack
+sampler, and writes:
+
+  DIR/<script>-<stamp>.prof        cProfile stats, for pstats or snakeviz
+  DIR/<script>-<stamp>.collapsed   one "frame;frame;frame count" line per
+                                   distinct stack, sampled every 5 ms from
+                                   every thread: flamegraph.pl, speedscope and
+                                   inferno read it as-is
+
+Both are written from an atexit hook, so a run that ends in sys.exit(1) still
+reports where its time went. Nothing here ever raises into the run.
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+_lock = threading.Lock()
+_totals = {}                  # name -> [calls, seconds]
+_local = threading.local()    # .stack: (name, start) of each span open on this thread
+
+# Sampling interval for the collapsed stacks. Fine enough to see a 50 ms
+# render, coarse enough that the sampler is not what it measures.
+SAMPLE_INTERVAL = 0.005
+
+
+class span:
+    """Time a block under `name`: `with span(name):` or `@span(name)`."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append((self.name, time.perf_counter()))
+        return self
+
+    def __exit__(self, *exc):
+        name, started = _local.stack.pop()
+        elapsed = time.perf_counter() - started
+        with _lock:
+            entry = _totals.setdefault(name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+        return False
+
+    def __call__(self, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            with span(self.name):
+                return fn(*args, **kwargs)
+        return timed
+
+
+def totals():
+    """{name: {"calls", "seconds"}} for every span closed so far."""
+    with _lock:
+        return {name: {"calls": calls, "seconds": round(seconds, 4)}
+                for name, (calls, seconds) in sorted(_totals.items())}
+
+
+class _Sampler(threading.Thread):
+    """Samples every thread's Python stack into folded-stack counts."""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super().__init__(name="profiling-sampler", daemon=True)
+        self.interval = interval
+        self.counts = {}
+        self.halt = threading.Event()
+
+    def run(self):
+        me = threading.get_ident()
+        while not self.halt.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                                  f":{code.co_firstlineno})")
+                    frame = frame.f_back
+                key = ";".join(reversed(frames))
+                self.counts[key] = self.counts.get(key, 0) + 1
+
+
+def _append_report(path, entry):
+    from atomic_write import read_text, write_text
+    try:
+        runs = json.loads(read_text(path))
+        if not isinstance(runs, list):
+            runs = []
+    except (OSError, ValueError):
+        runs = []
+    runs.append(entry)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    write_text(path, json.dumps(runs, indent=1) + "\n")
+
+
+def start(script, profile_dir=None):
+    """Report this run's spans at exit, and profile it if `profile_dir` is
+    given. Call once, first thing in main()."""
+    import atexit
+    began = time.perf_counter()
+    started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    profiler = sampler = None
+    if profile_dir:
+        import cProfile
+        profiler = cProfile.Profile()
+        sampler = _Sampler()
+        sampler.start()
+        profiler.enable()
+
+    def finish():
+        wall = round(time.perf_counter() - began, 3)
+        if profiler is not None:
+            profiler.disable()
+            sampler.halt.set()
+            sampler.join()
+            try:
+                os.makedirs(profile_dir, exist_ok=True)
+                stem = os.path.join(profile_dir, f"{os.path.splitext(script)[0]}-"
+                                                 f"{datetime.now():%Y%m%d%H%M%S}")
+                profiler.dump_stats(stem + ".prof")
+                with open(stem + ".collapsed", "w", encoding="utf-8") as f:
+                    for stack, count in sorted(sampler.counts.items()):
+                        f.write(f"{stack} {count}\n")
+                print(f"Profile: {stem}.prof, {stem}.collapsed "
+                      f"({sum(sampler.counts.values())} samples)")
+            except Exception as e:
+                print(f"  NOTE: profile not written ({e})")
+        report = os.environ.get("RUN_REPORT")
+        if not report:
+            return
+        try:
+            _append_report(report, {
+                "script": script,
+                "argv": sys.argv[1:],
+                "run_id": os.environ.get("GITHUB_RUN_ID", ""),
+                "started": started,
+                "seconds": wall,
+                "spans": totals(),
+            })
+        except Exception as e:
+            print(f"  NOTE: run report not written ({e})")
+
+    atexit.register(finish)
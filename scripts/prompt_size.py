@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+prompt_size.py
+Estimated token size of the generation prompts, without calling Gemini.
+
+The monthly prompt is the single biggest cost of every run, and it only ever
+grows: each fix for a bad issue has been another paragraph of rules. This
+prints what each prompt would cost right now — using the same calibrated
+estimate _call_gemini prints before sending — so a change that adds 2,000
+tokens shows up in review rather than on the next month's bill.
+
+    python3 scripts/prompt_size.py                  # report
+    python3 scripts/prompt_size.py --max 12000      # exit 1 if any prompt is over
+
+The estimate is characters divided by the chars/token ratio measured from
+usageMetadata.promptTokenCount on real calls (blog/staging/token-calibration.json);
+until a call has been recorded it falls back to 4 chars/token.
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+sys.path.insert(0, os.path.join(os.getcwd(), 'scripts'))
+
+from gemini import (_build_monthly_prompt, _build_custom_prompt,
+                    _STRUCTURED_OUTPUT_OVERRIDE, report_prompt_size)
+
+# A representative --topic, so the custom prompt is measured at a realistic size.
+_SAMPLE_TOPIC = "How Canadian banks are deploying AI agents in customer service"
+
+
+def prompts(today=None):
+    today = today or datetime.now()
+    month_year = today.strftime("%B %Y")
+    prev_month = (today.replace(day=1) - timedelta(days=1)).strftime("%B %Y")
+    monthly = _build_monthly_prompt(month_year, prev_month, False, today)
+    return {
+        "monthly":            monthly,
+        "monthly-structured": monthly + _STRUCTURED_OUTPUT_OVERRIDE,
+        "monthly-backfill":   _build_monthly_prompt(month_year, prev_month, True, today),
+        "custom":             _build_custom_prompt(_SAMPLE_TOPIC, month_year, prev_month, False, today),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--max", type=int, default=None,
+                    help="Fail (exit 1) if any prompt is estimated above this many tokens")
+    args = ap.parse_args()
+
+    over = []
+    for name, text in prompts().items():
+        print(f"{name}  ({len(text):,} chars)")
+        est = report_prompt_size(text, 8192)
+        if args.max and est > args.max:
+            over.append(f"{name} ~{est:,}")
+
+    if over:
+        print(f"\n  OVER BUDGET ({args.max:,} tokens): {', '.join(over)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
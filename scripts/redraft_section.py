@@ -10,6 +10,11 @@ different draft of a section, optionally with a note about what to change,
 without regenerating the whole issue and losing the parts that were already
 good.
 
+Several sections can go in ONE call with --also, which takes a JSON list of
+further section keys (or an object of key -> guidance). The combined response
+is split and parsed section by section, and the file is only rewritten if every
+requested section parsed — all blocks and FAQ entries land in a single write.
+
 Only the judgment sections are redraftable — the Desk, the executive summary,
 the predictions, the closing question. The reported sections are not,
 on purpose: those items went through date rules, source-quality rules and
@@ -18,6 +23,11 @@ context. The redraft call is also ungrounded, so it can sharpen an argument but
 cannot introduce an event that was never sourced.
 
     python3 scripts/redraft_section.py <html_path> "<SECTION KEY>" "<guidance>" [--month "August 2026"]
+    python3 scripts/redraft_section.py <html_path> "<SECTION KEY>" "<guidance>" \
+        --also '["EXECUTIVE SUMMARY", "LOOKING AHEAD: THREE PREDICTIONS"]'
+
+--profile DIR writes a cProfile dump and flame-graph stacks of the run
+(profiling.py).
 
 Exit codes: 0 on success, 1 on failure. The staging file is only written once a
 redraft has been parsed and rendered successfully, so a failed run leaves the
@@ -29,20 +39,21 @@ import json
 import os
 import re
 import sys
-from html import escape as escape_html
 
 _here = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, _here)
 sys.path.insert(0, os.path.join(os.getcwd(), 'scripts'))
 
 from utils import clean_ai_content
-from gemini import REDRAFTABLE_SECTIONS, generate_section_redraft
+from gemini import REDRAFTABLE_SECTIONS, generate_section_redraft, generate_sections_redraft
 from parser import parse_list_items, parse_predictions, parse_question
 from renderer import (
     _build_summary_section,
     _build_predictions_section, _build_question_section, _build_roberts_desk,
     faq_plain, faq_join,
 )
+from section_patch import faq_edits, find_block, index, outermost, patch, save
+from profiling import span, start as start_profiling
 
 
 # Which block in the rendered page each section owns, and how to turn the
@@ -85,61 +96,11 @@ FAQ_FED_BY = {
     },
 }
 
-_DIV_TOKEN = re.compile(r'<div\b|</div\s*>', re.IGNORECASE)
-
-
 def update_faq(html, question, answer):
     """Rewrite one FAQ answer in both places it lives: the visible .faq-a and
     the FAQPage JSON-LD. Returns (html, changed_count)."""
-    if not answer:
-        return html, 0
-    changed = 0
-
-    visible = re.compile(
-        r'(<h3 class="faq-q">' + re.escape(escape_html(question, quote=False))
-        + r'</h3>\s*<p class="faq-a">)(.*?)(</p>)', re.S
-    )
-    html, n = visible.subn(
-        lambda m: m.group(1) + escape_html(answer, quote=False) + m.group(3), html
-    )
-    changed += n
-
-    schema = re.compile(
-        r'(\{"@type":"Question","name":' + re.escape(json.dumps(question))
-        + r',"acceptedAnswer":\{"@type":"Answer","text":)(".*?")(\}\})'
-    )
-    html, n = schema.subn(lambda m: m.group(1) + json.dumps(answer) + m.group(3), html)
-    changed += n
-
-    return html, changed
-
-
-def find_block(html, block_class):
-    """Span of the <div class="section X"> ... </div> that owns `block_class`.
-
-    Counts div tokens rather than pattern-matching the whole block: these
-    sections nest divs several deep and a non-greedy regex would stop at the
-    first inner </div>. Nothing inside them opens a div that is not closed —
-    the inline SVGs contain no divs — so the count is exact.
-
-    Returns (start, end) or None.
-    """
-    opening = re.search(
-        r'<div\s+class="[^"]*\b' + re.escape(block_class) + r'\b[^"]*"[^>]*>',
-        html
-    )
-    if not opening:
-        return None
-
-    depth = 0
-    for token in _DIV_TOKEN.finditer(html, opening.start()):
-        if token.group(0).lower().startswith('<div'):
-            depth += 1
-        else:
-            depth -= 1
-            if depth == 0:
-                return opening.start(), token.end()
-    return None
+    edits = faq_edits(index(html), question, answer)
+    return patch(html, edits), len(edits)
 
 
 def redraft(path, section, guidance="", month_year=None):
@@ -156,11 +117,7 @@ def redraft(path, section, guidance="", month_year=None):
     with open(path, encoding="utf-8") as f:
         html = f.read()
 
-    cfg  = SECTION_BLOCKS[section]
-    span = find_block(html, cfg["block_class"])
-    if not span:
-        print(f"  No .{cfg['block_class']} block in {os.path.basename(path)} — "
-              f"nothing to replace, leaving the file untouched.")
+    if not _blocks_present(html, [section], path):
         return False
 
     issue_text = extract_issue_text(html)
@@ -177,33 +134,114 @@ def redraft(path, section, guidance="", month_year=None):
     )
     text = clean_ai_content(text)
 
-    parsed = cfg["parse"](text)
+    parsed = SECTION_BLOCKS[section]["parse"](text)
     if not parsed:
         print(f"  The redraft did not match the format '{label}' requires "
               f"({len(text)} chars returned). Leaving the issue unchanged.")
         return False
 
-    new_block = cfg["render"](parsed)
-    start, end = span
-    html = html[:start] + new_block + html[end:]
+    if not save(path, html, apply_redrafts(html, {section: parsed})):
+        return False
+
+    print(f"  '{label}' redrafted by {model} ({len(text.split())} words).")
+    return True
+
+
+def redraft_batch(path, sections, month_year=None):
+    """Redraft every section in `sections` ({key: guidance}) with ONE call.
+
+    All or nothing: if any requested section is missing from the response or
+    fails its parser, nothing is written. A reviewer who asked for three
+    sections and got two would otherwise be looking at an issue that is half
+    new and half old with no way to tell which half is which.
+    """
+    unknown = [k for k in sections if k not in SECTION_BLOCKS]
+    if unknown:
+        print(f"  Not redraftable: {', '.join(unknown)}. Choose from: "
+              f"{', '.join(SECTION_BLOCKS)}")
+        return False
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        print("  GEMINI_API_KEY is not set.")
+        return False
+
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+
+    if not _blocks_present(html, sections, path):
+        return False
+
+    issue_text = extract_issue_text(html)
+    if len(issue_text) < 300:
+        print("  Could not read the issue body to use as context.")
+        return False
+
+    labels = [REDRAFTABLE_SECTIONS[k]["label"] for k in sections]
+    print(f"  Redrafting {len(sections)} sections in one call: {', '.join(labels)}")
+    for key, guidance in sections.items():
+        if guidance.strip():
+            print(f"    {REDRAFTABLE_SECTIONS[key]['label']}: {guidance.strip()[:90]}")
+
+    texts, model = generate_sections_redraft(api_key, sections, issue_text,
+                                             month_year=month_year)
+
+    parsed_all, words = {}, 0
+    for key in sections:
+        label = REDRAFTABLE_SECTIONS[key]["label"]
+        text = clean_ai_content(texts.get(key, ""))
+        parsed = SECTION_BLOCKS[key]["parse"](text) if text else None
+        if not parsed:
+            print(f"  '{label}' was missing from the response or did not match "
+                  f"its format ({len(text)} chars). Leaving the issue unchanged.")
+            return False
+        parsed_all[key] = parsed
+        words += len(text.split())
+
+    if not save(path, html, apply_redrafts(html, parsed_all)):
+        return False
+
+    print(f"  {len(sections)} sections redrafted by {model} ({words} words).")
+    return True
+
+
+def _blocks_present(html, sections, path):
+    idx = index(html)
+    for key in sections:
+        cls = SECTION_BLOCKS[key]["block_class"]
+        if not find_block(html, cls, idx):
+            print(f"  No .{cls} block in {os.path.basename(path)} — "
+                  f"nothing to replace, leaving the file untouched.")
+            return False
+    return True
+
+
+@span("redraft_section.apply_redrafts")
+def apply_redrafts(html, parsed_by_section):
+    """Swap each section's block for its re-rendered version and bring the
+    FAQ and its schema into step, as one set of edits against one index of
+    the page. Pure: takes and returns the page."""
+    idx = index(html)
+    edits = []
+    for key, parsed in parsed_by_section.items():
+        start, end = find_block(html, SECTION_BLOCKS[key]["block_class"], idx)
+        edits.append((start, end, SECTION_BLOCKS[key]["render"](parsed)))
 
     # Keep the FAQ and its schema in step with the section they quote.
-    faq = FAQ_FED_BY.get(section)
-    if faq:
-        html, changed = update_faq(html, faq["question"], faq["answer"](parsed))
-        if changed == 2:
+    for key, parsed in parsed_by_section.items():
+        faq = FAQ_FED_BY.get(key)
+        if not faq:
+            continue
+        found = faq_edits(idx, faq["question"], faq["answer"](parsed))
+        edits += found
+        if len(found) == 2:
             print("  FAQ answer and FAQPage schema refreshed to match.")
-        elif changed:
-            print(f"  WARNING: refreshed only {changed}/2 FAQ copies — the visible "
+        elif found:
+            print(f"  WARNING: refreshed only {len(found)}/2 FAQ copies — the visible "
                   f"answer and the schema may now disagree.")
         else:
             print("  Note: this issue has no FAQ entry for that section; nothing to sync.")
-
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(html)
-
-    print(f"  '{label}' redrafted by {model} ({len(text.split())} words).")
-    return True
+    return patch(html, edits)
 
 
 def extract_issue_text(html):
@@ -219,11 +257,9 @@ def extract_issue_text(html):
     )
     body = article.group(1) if article else html
 
-    for cls in ("share-row", "survey-cta", "faq-section"):
-        span = find_block(body, cls)
-        while span:
-            body = body[:span[0]] + body[span[1]:]
-            span = find_block(body, cls)
+    blocks = index(body)["blocks"]
+    body = patch(body, [(start, end, "") for start, end in outermost(
+        [span for cls in ("share-row", "survey-cta", "faq-section") for span in blocks.get(cls, [])])])
 
     body = re.sub(r'<(script|style)\b.*?</\1>', ' ', body, flags=re.S | re.I)
     body = re.sub(r'<[^>]+>', '\n', body)
@@ -236,6 +272,18 @@ def extract_issue_text(html):
     return body.strip()
 
 
+def _parse_also(raw, guidance):
+    """--also as {key: guidance}. A list shares the main guidance."""
+    if not raw.strip():
+        return {}
+    data = json.loads(raw)
+    if isinstance(data, list):
+        return {str(k).strip(): guidance for k in data if str(k).strip()}
+    if isinstance(data, dict):
+        return {str(k).strip(): str(v or "") for k, v in data.items() if str(k).strip()}
+    raise ValueError("expected a JSON list or object")
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("path", help="Staging HTML file to rewrite in place")
@@ -243,14 +291,32 @@ def main():
     ap.add_argument("guidance", nargs="?", default="",
                     help="Optional note on what to change")
     ap.add_argument("--month", default=None, help="Issue month, e.g. 'September 2026'")
+    ap.add_argument("--also", default="",
+                    help="More sections for the SAME call: a JSON list of keys "
+                         "(sharing the guidance above) or an object of key -> guidance")
+    ap.add_argument("--profile", metavar="DIR",
+                    help="Write a cProfile .prof and a flame-graph .collapsed file for this run to DIR")
     args = ap.parse_args()
+    start_profiling("redraft_section.py", args.profile)
 
     if not os.path.exists(args.path):
         print(f"  No such file: {args.path}")
         sys.exit(1)
 
     try:
-        ok = redraft(args.path, args.section.strip(), args.guidance or "", args.month)
+        also = _parse_also(args.also, args.guidance or "")
+    except ValueError as e:
+        print(f"  --also could not be read ({e}). The issue is unchanged.")
+        sys.exit(1)
+
+    try:
+        if also:
+            sections = {args.section.strip(): args.guidance or ""}
+            for key, guidance in also.items():
+                sections.setdefault(key, guidance)
+            ok = redraft_batch(args.path, sections, args.month)
+        else:
+            ok = redraft(args.path, args.section.strip(), args.guidance or "", args.month)
     except Exception as e:
         # A failed redraft must never destroy a draft that was fine before it.
         print(f"  Redraft failed ({e}). The issue is unchanged.")
@@ -1,68 +1,180 @@
 #!/usr/bin/env python3
-"""Regenerates sitemap.xml. Called by monthly-blog.yml when publishing directly to posts."""
-import os, re
-from datetime import datetime
+"""
+regenerate_sitemap.py
+Writes sitemap.xml as a sitemap index over three sitemaps:
+
+  sitemap-posts.xml      every dated issue
+  sitemap-pages.xml      home, blog index, year archives, the evergreen pages
+                         (adoption statistics, survey results)
+  sitemap-entities.xml   company timelines
+
+Called from update_blog_index() at the end of every publish, after every page
+it lists has been written; still runnable on its own.
+
+lastmod used to be the filename date for posts and "today" for everything
+else, on every run — so every crawl was told the homepage, the index and the
+pillar page had all just changed, and a corrected issue never said so. Now each
+URL's content hash is kept in data/sitemap.json, and lastmod moves only when
+that hash does. A sitemap file, and the index, are written only when their
+bytes change.
+
+    python3 scripts/regenerate_sitemap.py
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import datetime, timezone
+
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+sys.path.insert(0, os.path.join(os.getcwd(), 'scripts'))
+
+from atomic_write import exists, listdir, read_text, write_text
+from post_registry import published, stubs
+from profiling import span
 
 POSTS_DIR = "blog/posts"
 BASE_URL  = "https://www.imetrobert.com"
+MANIFEST  = "data/sitemap.json"
+
+# Build stamps that change on every run without the page changing: the pillar
+# and survey pages' "Last updated <date>" line and their schema dateModified.
+# Hashed with these blanked, or every page would look edited every day.
+_VOLATILE = re.compile(
+    r'Last updated [A-Z][a-z]+ \d{1,2}, \d{4}|"dateModified": "\d{4}-\d{2}-\d{2}"')
 
-# Exclude noindex redirect stubs and superseded drafts from the sitemap.
-EXCLUDE = {
-    "latest.html",
-    "index.html",
-    # Noindex redirect stubs — canonical redirects to the dated version
-    "2025-10-01-key-ai-developments-this-month.html",
-    "2026-03-26-march-1-2026-openai-announces-gpt5-boasting-enhanced-reasoning-and-multimodal-capabilities.html",
-    "2026-03-27-ai-insights-for-march-2026.html",
-    # Superseded draft — May 31 is the canonical May 2026 post
-    "2026-05-30-ai-insights-for-may-2026.html",
-}
 
 def iso_date(filename):
     m = re.match(r"(\d{4}-\d{2}-\d{2})", filename)
-    return (m.group(1) + "T00:00:00+00:00") if m else datetime.now().strftime("%Y-%m-%dT00:00:00+00:00")
-
-posts = sorted(
-    [f for f in os.listdir(POSTS_DIR)
-     if f.endswith(".html") and f not in EXCLUDE
-     and not f.startswith("{") and "{" not in f],
-    reverse=True
-)
-
-today = datetime.now().strftime("%Y-%m-%dT00:00:00+00:00")
-
-entries = [
-    (f"{BASE_URL}/",      today, "1.00"),
-    (f"{BASE_URL}/blog/", today, "0.80"),
-]
-# Evergreen pillar. High priority on purpose: unlike a dated issue it does not
-# decay, and it is the page most likely to answer a standing question.
-if os.path.exists("blog/canadian-ai-adoption.html"):
-    entries.append((f"{BASE_URL}/blog/canadian-ai-adoption.html", today, "0.85"))
-# Original survey data: the only page here nobody else can publish, so it gets
-# the highest non-homepage priority — once a wave actually exists.
-if os.path.exists("blog/canadian-ai-pulse.html"):
-    entries.append((f"{BASE_URL}/blog/canadian-ai-pulse.html", today, "0.90"))
-for i, fname in enumerate(posts):
-    priority = "0.90" if i == 0 else ("0.75" if i == 1 else "0.65")
-    entries.append((f"{BASE_URL}/blog/posts/{fname}", iso_date(fname), priority))
-
-lines = [
-    '<?xml version="1.0" encoding="UTF-8"?>',
-    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"',
-    '        xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"',
-    '        xsi:schemaLocation="http://www.sitemaps.org/schemas/sitemap/0.9',
-    '              http://www.sitemaps.org/schemas/sitemap/0.9/sitemap.xsd">',
-    "",
-]
-for loc, lastmod, priority in entries:
-    lines += ["<url>", f"  <loc>{loc}</loc>",
-              f"  <lastmod>{lastmod}</lastmod>",
-              f"  <priority>{priority}</priority>", "</url>"]
-lines.append("</urlset>")
-
-with open("sitemap.xml", "w", encoding="utf-8") as f:
-    f.write("\n".join(lines))
-
-print(f"sitemap.xml regenerated with {len(entries)} URLs ({len(posts)} blog posts)")
-print(f"Excluded noindex/redirect stubs: {sorted(EXCLUDE - {'latest.html', 'index.html'})}")
+    return (m.group(1) + "T00:00:00+00:00") if m else _today()
+
+
+def _today():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT00:00:00+00:00")
+
+
+def _page_hash(path):
+    # read_text: inside update_blog_index's publish() the page may only exist
+    # as this run's staged copy.
+    source = read_text(path)
+    if path.startswith(POSTS_DIR):
+        # Ignores the related-issues block, which changes when a NEIGHBOUR is
+        # published — the same hash the search index keys on.
+        from search_index import content_hash
+        return content_hash(source)
+    return hashlib.sha1(_VOLATILE.sub("", source).encode("utf-8")).hexdigest()[:12]
+
+
+def _sections():
+    """{sitemap name: [(url, file, priority, first-seen lastmod), ...]}"""
+    # Noindex redirect stubs, superseded drafts and latest.html stay out.
+    posts = published(POSTS_DIR)
+
+    pages = [
+        (f"{BASE_URL}/",      "index.html",      "1.00"),
+        (f"{BASE_URL}/blog/", "blog/index.html", "0.80"),
+        # Evergreen pillar. High priority on purpose: unlike a dated issue it
+        # does not decay, and it is the page most likely to answer a standing
+        # question.
+        (f"{BASE_URL}/blog/canadian-ai-adoption.html", "blog/canadian-ai-adoption.html", "0.85"),
+        # Original survey data: the only page here nobody else can publish, so
+        # it gets the highest non-homepage priority — once a wave actually exists.
+        (f"{BASE_URL}/blog/canadian-ai-pulse.html", "blog/canadian-ai-pulse.html", "0.90"),
+    ]
+    # Year archives (blog_index.py). The numbered blog/page/ pages are noindex
+    # and deliberately left out: they list the same issues as the year pages.
+    if os.path.isdir("blog/archive"):
+        for fname in sorted(listdir("blog/archive"), reverse=True):
+            if fname.endswith(".html"):
+                pages.append((f"{BASE_URL}/blog/archive/{fname}", f"blog/archive/{fname}", "0.45"))
+
+    # Company timelines (entity_index.py). Low priority: each one is a view
+    # over issues that are already in the sitemap, useful as a landing page
+    # rather than as content in its own right. blog/search.html stays out: it
+    # is noindex, and listing a noindex page only earns a Search Console error.
+    entities = [(f"{BASE_URL}/blog/entities/", "blog/entities/index.html", "0.50")]
+    if os.path.isdir("blog/entities"):
+        for fname in listdir("blog/entities"):
+            if fname.endswith(".html") and fname != "index.html":
+                entities.append((f"{BASE_URL}/blog/entities/{fname}", f"blog/entities/{fname}", "0.40"))
+
+    return {
+        "sitemap-posts.xml": [
+            (f"{BASE_URL}/blog/posts/{fname}", os.path.join(POSTS_DIR, fname),
+             "0.90" if i == 0 else ("0.75" if i == 1 else "0.65"), iso_date(fname))
+            for i, fname in enumerate(posts)],
+        "sitemap-pages.xml": [(u, f, p, _today()) for u, f, p in pages if exists(f)],
+        "sitemap-entities.xml": [(u, f, p, _today()) for u, f, p in entities if exists(f)],
+    }
+
+
+def _urlset(entries):
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"',
+        '        xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"',
+        '        xsi:schemaLocation="http://www.sitemaps.org/schemas/sitemap/0.9',
+        '              http://www.sitemaps.org/schemas/sitemap/0.9/sitemap.xsd">',
+        "",
+    ]
+    for loc, lastmod, priority in entries:
+        lines += ["<url>", f"  <loc>{loc}</loc>",
+                  f"  <lastmod>{lastmod}</lastmod>",
+                  f"  <priority>{priority}</priority>", "</url>"]
+    lines.append("</urlset>")
+    return "\n".join(lines)
+
+
+@span("regenerate_sitemap.regenerate_sitemap")
+def regenerate_sitemap(manifest_path=MANIFEST):
+    """Write sitemap.xml and its three sitemaps. Returns the files written."""
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except Exception:
+        manifest = {}
+
+    # A URL seen for the first time takes its publication date (posts) or
+    # today; after that, lastmod is the day its content hash last changed.
+    updated, written, counts, index = {}, [], {}, []
+    for name, rows in _sections().items():
+        entries = []
+        for url, path, priority, first_seen in rows:
+            digest = _page_hash(path)
+            seen = manifest.get(url)
+            if seen and seen["h"] == digest:
+                lastmod = seen["lastmod"]
+            else:
+                lastmod = _today() if seen else first_seen
+            updated[url] = {"h": digest, "lastmod": lastmod}
+            entries.append((url, lastmod, priority))
+        counts[name] = len(entries)
+        if not entries:
+            continue
+        if write_text(name, _urlset(entries)):
+            written.append(name)
+        index.append((name, max(e[1] for e in entries)))
+
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for name, lastmod in index:
+        lines += ["<sitemap>", f"  <loc>{BASE_URL}/{name}</loc>",
+                  f"  <lastmod>{lastmod}</lastmod>", "</sitemap>"]
+    lines.append("</sitemapindex>")
+    if write_text("sitemap.xml", "\n".join(lines)):
+        written.append("sitemap.xml")
+
+    if updated != manifest:
+        write_text(manifest_path, json.dumps(updated, indent=1, sort_keys=True) + "\n")
+
+    print(f"Sitemap index: {', '.join(f'{n} ({c})' for n, c in counts.items())}; "
+          f"{len(written)} file(s) written.")
+    return written
+
+
+if __name__ == "__main__":
+    regenerate_sitemap()
+    print(f"Excluded noindex/redirect stubs: {stubs(POSTS_DIR)}")
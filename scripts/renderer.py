@@ -15,14 +15,18 @@ from utils import (BRAND, BRAND_SHORT, BRAND_TAGLINE, AUTHOR,
                    household_canadian_brands, is_household_canadian_brand)
 from parser import (
     _resolve_item_date,
-    parse_sections, parse_list_items, parse_developments, parse_spotlight_items,
-    parse_adoption_stats, deduplicate_spotlight_against_developments,
-    parse_actions, parse_predictions, parse_question,
+    parse_issue, deduplicate_spotlight_against_developments,
 )
+from page_template import post_page, render
+from profiling import span
 
 
-def create_html_blog_post(content, title, excerpt, coverage_date=None, is_draft=False):
-    current_date   = datetime.now()
+def page_values(content, title, excerpt, coverage_date=None, is_draft=False, published=None):
+    """Everything on the page that is not the article: titles, dates, URLs,
+    labels and counts, escaped where they go into markup. `published` is the
+    date the page carries (today for a new issue). og_image is the static card
+    until create_html_blog_post builds the issue's own."""
+    current_date   = published or datetime.now()
     formatted_date = current_date.strftime("%B %d, %Y")
     iso_date       = current_date.strftime("%Y-%m-%d")
 
@@ -46,19 +50,8 @@ def create_html_blog_post(content, title, excerpt, coverage_date=None, is_draft=
     clean_title = re.sub(r'^[#\*\s]+', '', title).strip() or f"{BRAND} \u2014 {issue_month_year}"
     slug        = clean_filename(clean_title)
     canonical   = f"https://www.imetrobert.com/blog/posts/{iso_date}-{slug}.html"
-    # Per-issue social card. Falls back to the static one rather than risking a
-    # 404 og:image if Pillow or the fonts are unavailable in the runner.
-    og_image    = "https://www.imetrobert.com/blog/og-blog.jpg"
     og_alt      = f"{BRAND} \u2014 {issue_month_year} issue by {AUTHOR}"
-    try:
-        import os as _os
-        from og_image import build_og_image
-        _root = _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__)))
-        _rel  = f"blog/og/{iso_date}-{slug}.jpg"
-        build_og_image(_os.path.join(_root, _rel), issue_month_year)
-        og_image = f"https://www.imetrobert.com/{_rel}"
-    except Exception as _e:
-        print(f"  OG image generation unavailable ({_e}); using the static card")
+
     # Drafts sitting in blog/staging/ must never be indexable — the URL
     # differs from the eventual blog/posts/ URL, so a crawler that found a
     # draft before approval would leave a stale, permanent entry in search
@@ -90,40 +83,67 @@ def create_html_blog_post(content, title, excerpt, coverage_date=None, is_draft=
     # issue identity, brand last.
     seo_title         = f"{clean_title_html} | {BRAND_SHORT}, {issue_month_year} | {AUTHOR}"
 
-    sections = parse_sections(content)
+    return {
+        "seo_title":           seo_title,
+        "clean_title":         clean_title,
+        "clean_title_html":    clean_title_html,
+        "slug":                slug,
+        "meta_desc":           meta_desc,
+        "meta_desc_html":      meta_desc_html,
+        "excerpt_html":        excerpt_html,
+        "robots_meta":         robots_meta,
+        "canonical":           canonical,
+        "og_image":            "https://www.imetrobert.com/blog/og-blog.jpg",
+        "og_alt":              og_alt,
+        "iso_date":            iso_date,
+        "formatted_date":      formatted_date,
+        "issue_num":           issue_num,
+        "issue_month_year":    issue_month_year,
+        "coverage_month_year": coverage_month_year,
+        "coverage_month_name": coverage_month_name,
+        "word_count":          word_count,
+        "reading_time":        reading_time,
+    }
+
+
+@span("renderer.create_html_blog_post")
+def create_html_blog_post(content, title, excerpt, coverage_date=None, is_draft=False, issue=None,
+                          og_card=True):
+    current_date = datetime.now()
+    page = page_values(content, title, excerpt, coverage_date, is_draft, current_date)
+    clean_title = page["clean_title"]
 
-    intro_text      = sections.get("INTRODUCTION", "")
-    canadian_spot   = sections.get("CANADIAN SPOTLIGHT", "")
-    roberts_raw     = sections.get("FROM ROBERTS DESK", "")
-    adoption_raw    = sections.get("ADOPTION SNAPSHOT", "")
+    # Per-issue social card. Falls back to the static one rather than risking a
+    # 404 og:image if Pillow or the fonts are unavailable in the runner.
+    # og_card=False skips it (bench_render.py), so a timing run writes nothing.
+    if og_card:
+        try:
+            import os as _os
+            from og_image import build_og_image
+            _root = _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__)))
+            _rel  = f"blog/og/{page['iso_date']}-{page['slug']}.jpg"
+            build_og_image(_os.path.join(_root, _rel), page["issue_month_year"])
+            page["og_image"] = f"https://www.imetrobert.com/{_rel}"
+        except Exception as _e:
+            print(f"  OG image generation unavailable ({_e}); using the static card")
 
     # Coverage date resolves the year on a bare "August 12" so the parser can
     # tell a past item from a forward-dated one. See _drop_future_dated.
-    developments    = parse_developments(
-        sections.get("KEY AI DEVELOPMENTS", ""), coverage_date or current_date
-    )
-    spotlight_items = parse_spotlight_items(canadian_spot)
-    spotlight_items = deduplicate_spotlight_against_developments(spotlight_items, developments)
-    # Household-name Canadian brands first. This is the one section meant to
-    # feel like the reader's own market, and it had been filling with federal
-    # programs and AI vendors — credible, but not names anyone meets in daily
-    # life. The spec asks for this ordering; enforcing it here costs nothing
-    # and covers the case where the model finds the right stories and lists
-    # them in the wrong order. sort() is stable, so within each group the
-    # model's own sense of importance survives.
-    spotlight_items.sort(
-        key=lambda _s: 0 if is_household_canadian_brand(
-            (_s.get("org") or "") + " " + (_s.get("body") or "")) else 1
-    )
-    actions         = parse_actions(sections.get("STRATEGIC ACTIONS FOR THIS MONTH", ""))
-    adoption        = parse_adoption_stats(adoption_raw)
-    summary_points  = parse_list_items(sections.get("EXECUTIVE SUMMARY", ""), min_length=25)[:3]
-    predictions     = parse_predictions(sections.get("LOOKING AHEAD: THREE PREDICTIONS", ""))
-    closing_question = parse_question(sections.get("ONE QUESTION FOR YOUR LEADERSHIP TEAM", ""))
-
-    # Action bodies are what the FAQ quotes; they should never
-    # carry the OWNER/PRIORITY labels into prose meant to be read as a sentence.
-    action_bodies   = [a["body"] for a in actions]
+    # A structured-mode issue arrives already parsed (parser.parse_structured_issue)
+    # in the same shape, so nothing below knows which mode produced it.
+    if issue is None:
+        issue = parse_issue(content, coverage_date or current_date)
+    sections = issue["sections"]
+
+    parts = issue_parts(issue)
+    roberts_raw     = parts["desk"]
+    developments    = parts["developments"]
+    spotlight_items = parts["spotlight"]
+    actions         = parts["actions"]
+    adoption        = parts["adoption"]
+    summary_points  = parts["summary"]
+    predictions     = parts["predictions"]
+    closing_question = parts["question"]
 
     print(f"  Parsed: {len(developments)} developments, {len(spotlight_items)} spotlight, "
           f"{len(actions)} actions, {len(adoption)} stats, {len(summary_points)} summary points, "
@@ -357,73 +377,175 @@ def create_html_blog_post(content, title, excerpt, coverage_date=None, is_draft=
         print(f"  NOTE: From Robert's Desk is only {desk_words} words — the signature "
               f"section is meant to run 300-450. Consider rewriting it in the preview page.")
 
-    article_parts = []
+    return render_page(parts, page)
 
-    if intro_text:
-        article_parts.append(
-            f'<div class="section intro-section">'
-            f'<p class="intro-lead">{intro_text}</p>'
-            f'</div>'
-        )
 
-    if summary_points:
-        article_parts.append(_build_summary_section(summary_points))
+def issue_parts(issue):
+    """What the page is built from: the parsed issue's items, with the
+    Spotlight deduplicated against the developments and put in reading order."""
+    sections = issue["sections"]
+    developments    = issue["developments"]
+    spotlight_items = deduplicate_spotlight_against_developments(list(issue["spotlight"]), developments)
+    # Household-name Canadian brands first. This is the one section meant to
+    # feel like the reader's own market, and it had been filling with federal
+    # programs and AI vendors — credible, but not names anyone meets in daily
+    # life. The spec asks for this ordering; enforcing it here costs nothing
+    # and covers the case where the model finds the right stories and lists
+    # them in the wrong order. sort() is stable, so within each group the
+    # model's own sense of importance survives.
+    spotlight_items.sort(
+        key=lambda _s: 0 if is_household_canadian_brand(
+            (_s.get("org") or "") + " " + (_s.get("body") or "")) else 1
+    )
+    return {
+        "intro":         sections.get("INTRODUCTION", ""),
+        "canadian_spot": sections.get("CANADIAN SPOTLIGHT", ""),
+        "desk":          sections.get("FROM ROBERTS DESK", ""),
+        "developments":  developments,
+        "spotlight":     spotlight_items,
+        "actions":       issue["actions"],
+        "adoption":      issue["adoption"],
+        "summary":       issue["summary"],
+        "predictions":   issue["predictions"],
+        "question":      issue["question"],
+    }
+
 
-    if developments:
-        # Two tiers. A development the model rated is a major story and gets the
-        # full treatment; the rest are the log. The split is driven by whether
-        # the ratings are actually present, so a month where the model rates
-        # nothing degrades to the old flat list instead of rendering empty
-        # badge rows.
-        major   = [d for d in developments if d.get("strategic_read") or d.get("importance")]
-        minor   = [d for d in developments if d not in major]
-        dev_cards = ""
-
-        for d in major:
-            date_html    = f'<span class="dev-date">{d["date"]}</span>' if d["date"] else ""
-            company_html = f'<div class="dev-company">{d["company"]}</div>' if d["company"] else ""
-            dev_cards += (
-                f'<div class="dev-card dev-card-major">'
-                f'  <div class="dev-header">{date_html}{company_html}'
-                f'<span class="dev-tier">Major story</span></div>'
+# The article's blocks, in page order. The Desk sits after the facts and before
+# the analysis that leans on them, at the point in the page where attention is
+# still high. It used to close the issue, which is exactly where a reader who
+# skims stops reading.
+ARTICLE_BLOCKS = (
+    "intro", "summary", "developments", "spotlight", "desk", "actions",
+    "adoption", "predictions", "faq", "question", "survey",
+)
+
+
+def render_article(parts, coverage_month_year, only=None, faq=None):
+    """{block name: html} for the article, in ARTICLE_BLOCKS order. None means
+    the issue has nothing for that block. `only` renders just the named
+    blocks — one section for a redraft, without building the rest.
+
+    A desk of None (an archived issue that never had one) renders nothing; an
+    empty string is a new issue still waiting for Robert, and gets the
+    placeholder."""
+    if faq is None:
+        faq = faq_items(parts, coverage_month_year)
+    builders = {
+        "intro":        lambda: _build_intro_section(parts["intro"]),
+        "summary":      lambda: _build_summary_section(parts["summary"]) if parts["summary"] else None,
+        "developments": lambda: _build_developments_section(parts["developments"]),
+        "spotlight":    lambda: _build_spotlight_section(parts["spotlight"], parts["canadian_spot"]),
+        "desk":         lambda: _build_roberts_desk(parts["desk"]) if parts["desk"] is not None else None,
+        "actions":      lambda: _build_actions_section(parts["actions"]),
+        "adoption":     lambda: _build_adoption_section(parts["adoption"]),
+        "predictions":  lambda: _build_predictions_section(parts["predictions"]) if parts["predictions"] else None,
+        "faq":          lambda: _build_faq_section(faq),
+        "question":     lambda: _build_question_section(parts["question"]) if parts["question"] else None,
+        "survey":       _build_survey_cta,
+    }
+    return {name: builders[name]() for name in ARTICLE_BLOCKS if only is None or name in only}
+
+
+def render_page(parts, page):
+    """The full page. `page` holds the per-issue values create_html_blog_post
+    works out — titles, dates, URLs, counts — already escaped where they go
+    into markup; everything else comes from the compiled template."""
+    faq = faq_items(parts, page["coverage_month_year"])
+    blocks = render_article(parts, page["coverage_month_year"], faq=faq)
+    # parts["carried"] is rerender_archive.py's: sections an older template had
+    # and this one does not ("Impact on Canadian Businesses", the closing
+    # conclusion), kept verbatim after the block they followed. "start" goes
+    # before the first block and "end" after the last.
+    carried = parts.get("carried") or {}
+    article = list(carried.get("start", []))
+    for name, html in blocks.items():
+        if html is not None:
+            article.append(html)
+        article.extend(carried.get(name, []))
+    article.extend(carried.get("end", []))
+    values = dict(page)
+    values.update(
+        article_html="\n".join(article),
+        share_row=_build_share_row(page["canonical"], page["clean_title"], page["issue_month_year"]),
+        faq_schema=_build_faq_schema(faq),
+        title_json=json.dumps(page["clean_title"]),
+        description_json=json.dumps(page["meta_desc"]),
+        canonical_json=json.dumps(page["canonical"]),
+        og_image_json=json.dumps(page["og_image"]),
+    )
+    return render(post_page(), values)
+
+
+def _build_intro_section(intro_text):
+    if not intro_text:
+        return None
+    return (
+        f'<div class="section intro-section">'
+        f'<p class="intro-lead">{intro_text}</p>'
+        f'</div>'
+    )
+
+
+def _build_developments_section(developments):
+    if not developments:
+        return None
+    # Two tiers. A development the model rated is a major story and gets the
+    # full treatment; the rest are the log. The split is driven by whether
+    # the ratings are actually present, so a month where the model rates
+    # nothing degrades to the old flat list instead of rendering empty
+    # badge rows.
+    major   = [d for d in developments if d.get("strategic_read") or d.get("importance")]
+    minor   = [d for d in developments if d not in major]
+    dev_cards = ""
+
+    for d in major:
+        date_html    = f'<span class="dev-date">{d["date"]}</span>' if d["date"] else ""
+        company_html = f'<div class="dev-company">{d["company"]}</div>' if d["company"] else ""
+        dev_cards += (
+            f'<div class="dev-card dev-card-major">'
+            f'  <div class="dev-header">{date_html}{company_html}'
+            f'<span class="dev-tier">Major story</span></div>'
+            f'  <p class="dev-body">{d["body"]}</p>'
+            f'  {_build_strategic_read(d)}'
+            f'  {_build_rating_row(d)}'
+            f'  {_build_dev_source(d)}'
+            f'</div>\n'
+        )
+
+    if minor:
+        # "Also worth knowing" only means something when there is something
+        # above it. If the model rated nothing this month, every item is in
+        # this list, and the subordinate framing plus the de-emphasised card
+        # style would present the entire section as a footnote.
+        demote = bool(major)
+        minor_rows = ""
+        for d in minor:
+            date_html = f'<span class="dev-date">{d["date"]}</span>' if d["date"] else ""
+            company_html = f'<span class="dev-company">{d["company"]}</span>' if d["company"] else ""
+            minor_rows += (
+                f'<div class="dev-card{" dev-card-minor" if demote else ""}">'
+                f'  <div class="dev-header">{date_html}{company_html}</div>'
                 f'  <p class="dev-body">{d["body"]}</p>'
-                f'  {_build_strategic_read(d)}'
-                f'  {_build_rating_row(d)}'
                 f'  {_build_dev_source(d)}'
                 f'</div>\n'
             )
+        dev_cards += (
+            f'<div class="dev-log">'
+            f'<div class="dev-log-label">Also worth knowing</div>'
+            f'{minor_rows}'
+            f'</div>'
+        ) if demote else minor_rows
 
-        if minor:
-            # "Also worth knowing" only means something when there is something
-            # above it. If the model rated nothing this month, every item is in
-            # this list, and the subordinate framing plus the de-emphasised card
-            # style would present the entire section as a footnote.
-            demote = bool(major)
-            minor_rows = ""
-            for d in minor:
-                date_html = f'<span class="dev-date">{d["date"]}</span>' if d["date"] else ""
-                company_html = f'<span class="dev-company">{d["company"]}</span>' if d["company"] else ""
-                minor_rows += (
-                    f'<div class="dev-card{" dev-card-minor" if demote else ""}">'
-                    f'  <div class="dev-header">{date_html}{company_html}</div>'
-                    f'  <p class="dev-body">{d["body"]}</p>'
-                    f'  {_build_dev_source(d)}'
-                    f'</div>\n'
-                )
-            dev_cards += (
-                f'<div class="dev-log">'
-                f'<div class="dev-log-label">Also worth knowing</div>'
-                f'{minor_rows}'
-                f'</div>'
-            ) if demote else minor_rows
+    return (
+        f'<div class="section">'
+        f'<h2 class="section-title">Key AI Developments This Month</h2>'
+        f'<div class="dev-grid">{dev_cards}</div>'
+        f'</div>'
+    )
 
-        article_parts.append(
-            f'<div class="section">'
-            f'<h2 class="section-title">Key AI Developments This Month</h2>'
-            f'<div class="dev-grid">{dev_cards}</div>'
-            f'</div>'
-        )
 
+def _build_spotlight_section(spotlight_items, canadian_spot=""):
     if spotlight_items:
         spot_cards = ""
         for item in spotlight_items:
@@ -448,127 +570,132 @@ def create_html_blog_post(content, title, excerpt, coverage_date=None, is_draft=
                 f'</div>'
                 f'</li>\n'
             )
-        article_parts.append(
+        return (
             f'<div class="section canada-section">'
             f'<div class="canada-header"><span class="canada-label">Canadian Spotlight</span></div>'
             f'<h2 class="section-title canada-title">What\'s Happening in Canada</h2>'
             f'<ul class="spot-list">{spot_cards}</ul>'
             f'</div>'
         )
-    elif canadian_spot and len(canadian_spot) > 60:
-        article_parts.append(
+    if canadian_spot and len(canadian_spot) > 60:
+        return (
             f'<div class="section canada-section">'
             f'<div class="canada-header"><span class="canada-label">Canadian Spotlight</span></div>'
             f'<h2 class="section-title canada-title">What\'s Happening in Canada</h2>'
             f'<p>{canadian_spot}</p>'
             f'</div>'
         )
-
-    # The signature section sits here on purpose — immediately after the facts
-    # and before the analysis that leans on them, at the point in the page where
-    # attention is still high. It used to close the issue, which is exactly
-    # where a reader who skims stops reading.
-    article_parts.append(_build_roberts_desk(roberts_raw))
-
-    if actions:
-        action_cards = ""
-        for i, a in enumerate(actions[:5]):
-            owner_html = ""
-            if a.get("owner"):
-                rationale = (
-                    f'<div class="action-owner-why">{a["owner_rationale"]}</div>'
-                    if a.get("owner_rationale") else ""
-                )
-                owner_html = (
-                    f'<div class="action-owner">'
-                    f'<span class="action-owner-label">Owner</span>'
-                    f'<span class="action-owner-role">{a["owner"]}</span>'
-                    f'{rationale}'
-                    f'</div>'
-                )
-            action_cards += (
-                f'<div class="action-card">'
-                f'  <div class="action-num">{i+1}</div>'
-                f'  <div class="action-main">'
-                f'    <div class="action-body">{a["body"]}</div>'
-                f'    {owner_html}'
-                f'    {_build_action_meta(a)}'
-                f'  </div>'
-                f'</div>\n'
+    return None
+
+
+def _build_actions_section(actions):
+    if not actions:
+        return None
+    action_cards = ""
+    for i, a in enumerate(actions[:5]):
+        owner_html = ""
+        if a.get("owner"):
+            rationale = (
+                f'<div class="action-owner-why">{a["owner_rationale"]}</div>'
+                if a.get("owner_rationale") else ""
             )
-        article_parts.append(
-            f'<div class="section actions-section">'
-            f'<h2 class="section-title">Strategic Actions for This Month</h2>'
-            f'<div class="actions-grid">{action_cards}</div>'
-            f'</div>'
+            owner_html = (
+                f'<div class="action-owner">'
+                f'<span class="action-owner-label">Owner</span>'
+                f'<span class="action-owner-role">{a["owner"]}</span>'
+                f'{rationale}'
+                f'</div>'
+            )
+        action_cards += (
+            f'<div class="action-card">'
+            f'  <div class="action-num">{i+1}</div>'
+            f'  <div class="action-main">'
+            f'    <div class="action-body">{a["body"]}</div>'
+            f'    {owner_html}'
+            f'    {_build_action_meta(a)}'
+            f'  </div>'
+            f'</div>\n'
         )
+    return (
+        f'<div class="section actions-section">'
+        f'<h2 class="section-title">Strategic Actions for This Month</h2>'
+        f'<div class="actions-grid">{action_cards}</div>'
+        f'</div>'
+    )
 
-    if adoption:
-        stat_items_html = ""
-        for item in adoption:
-            if item["stat_number"] and item["stat_text"] and item["stat_number"] in item["stat_text"]:
-                highlighted = item["stat_text"].replace(
-                    item["stat_number"],
-                    f'<span class="stat-highlight">{item["stat_number"]}</span>',
-                    1
-                )
-                stat_content = f'<p class="stat-text">{highlighted}</p>'
-            elif item["stat_number"]:
-                stat_content = f'<p class="stat-text"><span class="stat-highlight">{item["stat_number"]}</span> {item["stat_text"]}</p>'
-            else:
-                stat_content = f'<p class="stat-text">{item["stat_text"]}</p>'
-
-            src_html = ""
-            if item.get("source_url"):
-                src_html = (
-                    f'<div class="stat-source">'
-                    f'<a href="{item["source_url"]}" target="_blank" rel="noopener noreferrer" '
-                    f'title="Search Google for this statistic">'
-                    f'<svg class="icon" aria-hidden="true"><use href="#i-search"/></svg> {item["source_name"]}'
-                    f'</a></div>'
-                )
-            elif item.get("source_name"):
-                src_html = f'<div class="stat-source-plain">{item["source_name"]}</div>'
 
-            stat_items_html += (
-                f'<div class="stat-item">'
-                f'  {stat_content}'
-                f'  {src_html}'
-                f'</div>\n'
+def _build_adoption_section(adoption):
+    if not adoption:
+        return None
+    stat_items_html = ""
+    for item in adoption:
+        if item["stat_number"] and item["stat_text"] and item["stat_number"] in item["stat_text"]:
+            highlighted = item["stat_text"].replace(
+                item["stat_number"],
+                f'<span class="stat-highlight">{item["stat_number"]}</span>',
+                1
             )
-        # Built from the sources actually cited, not a fixed list. The hardcoded
-        # version named six organisations regardless of what the section
-        # contained — an issue sourced to Statistics Canada, RSM and Deloitte
-        # still credited BDC, ISED, Vector Institute, Conference Board and Mila.
-        # A footer naming who the numbers came from has to be true, or it is
-        # worse than no footer.
-        seen, cited = set(), []
-        for item in adoption:
-            name = (item.get("source_name") or "").strip().rstrip('.,')
-            if name and name.lower() not in seen:
-                seen.add(name.lower())
-                cited.append(name)
-        note_html = (
-            f'<p class="stat-note">Sources: {", ".join(cited)}.</p>' if cited else ""
-        )
-        article_parts.append(
-            f'<div class="section adoption-section">'
-            f'<h2 class="section-title">Canadian AI Adoption Snapshot</h2>'
-            f'<div class="stat-grid">{stat_items_html}</div>'
-            f'{note_html}'
-            f'</div>'
+            stat_content = f'<p class="stat-text">{highlighted}</p>'
+        elif item["stat_number"]:
+            stat_content = f'<p class="stat-text"><span class="stat-highlight">{item["stat_number"]}</span> {item["stat_text"]}</p>'
+        else:
+            stat_content = f'<p class="stat-text">{item["stat_text"]}</p>'
+
+        src_html = ""
+        if item.get("source_url"):
+            src_html = (
+                f'<div class="stat-source">'
+                f'<a href="{item["source_url"]}" target="_blank" rel="noopener noreferrer" '
+                f'title="Search Google for this statistic">'
+                f'<svg class="icon" aria-hidden="true"><use href="#i-search"/></svg> {item["source_name"]}'
+                f'</a></div>'
+            )
+        elif item.get("source_name"):
+            src_html = f'<div class="stat-source-plain">{item["source_name"]}</div>'
+
+        stat_items_html += (
+            f'<div class="stat-item">'
+            f'  {stat_content}'
+            f'  {src_html}'
+            f'</div>\n'
         )
+    # Built from the sources actually cited, not a fixed list. The hardcoded
+    # version named six organisations regardless of what the section
+    # contained — an issue sourced to Statistics Canada, RSM and Deloitte
+    # still credited BDC, ISED, Vector Institute, Conference Board and Mila.
+    # A footer naming who the numbers came from has to be true, or it is
+    # worse than no footer.
+    seen, cited = set(), []
+    for item in adoption:
+        name = (item.get("source_name") or "").strip().rstrip('.,')
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            cited.append(name)
+    note_html = (
+        f'<p class="stat-note">Sources: {", ".join(cited)}.</p>' if cited else ""
+    )
+    return (
+        f'<div class="section adoption-section">'
+        f'<h2 class="section-title">Canadian AI Adoption Snapshot</h2>'
+        f'<div class="stat-grid">{stat_items_html}</div>'
+        f'{note_html}'
+        f'</div>'
+    )
 
-    if predictions:
-        article_parts.append(_build_predictions_section(predictions))
 
-    # Each question is answered from the section that actually addresses it.
-    # Pairing questions against whatever happened to be in `actions` produced
-    # confident non-sequiturs — fine while the FAQ was schema-only, actively
-    # misleading now that it is on the page and quotable by answer engines.
-    _plain = faq_plain
-    _join  = faq_join
+def faq_items(parts, coverage_month_year):
+    """The visible FAQ's questions and answers.
 
+    Each question is answered from the section that actually addresses it.
+    Pairing questions against whatever happened to be in `actions` produced
+    confident non-sequiturs — fine while the FAQ was schema-only, actively
+    misleading now that it is on the page and quotable by answer engines."""
+    developments, spotlight_items = parts["developments"], parts["spotlight"]
+    adoption, predictions = parts["adoption"], parts["predictions"]
+    # Action bodies are what the FAQ quotes; they should never
+    # carry the OWNER/PRIORITY labels into prose meant to be read as a sentence.
+    action_bodies = [a["body"] for a in parts["actions"]]
+    _join = faq_join
 
     faq_candidates = [
         (
@@ -596,41 +723,51 @@ def create_html_blog_post(content, title, excerpt, coverage_date=None, is_draft=
         ),
     ]
     # Only publish a Q&A when the post genuinely contains the answer.
-    faq_items = [{"question": q, "answer": a} for q, a in faq_candidates if len(a) > 60]
+    faq = [{"question": q, "answer": a} for q, a in faq_candidates if len(a) > 60]
+    # parts["faq"] is rerender_archive.py's: the FAQ as the page was published.
+    # A question these parts cannot answer — an older template's, or one whose
+    # section came back too thin — stays as it was, so a re-render never takes
+    # a question off the page or out of the FAQPage schema.
+    asked = {_faq_key(f["question"]) for f in faq}
+    faq += [f for f in parts.get("faq") or [] if _faq_key(f["question"]) not in asked]
+    return faq
+
+
+def _faq_key(question):
+    """A question without its month: a re-render may relabel "in May 2026"."""
+    return " ".join(re.sub(r"\b[A-Z][a-z]+ \d{4}\b", "", question).lower().split())
 
+
+def _build_faq_section(faq_items):
     # The FAQ must be VISIBLE, not schema-only. Google requires FAQPage content
     # to appear on the page, and an answer engine can only quote what it can
     # read — schema alone gets ignored and risks a structured-data penalty.
-    if faq_items:
-        faq_html = "".join(
-            f'<div class="faq-item">'
-            f'<h3 class="faq-q">{f["question"]}</h3>'
-            f'<p class="faq-a">{f["answer"]}</p>'
-            f'</div>'
-            for f in faq_items
-        )
-        article_parts.append(
-            f'<div class="section faq-section">'
-            f'<h2 class="section-title">Questions Canadian Leaders Are Asking</h2>'
-            f'<div class="faq-list">{faq_html}</div>'
-            f'</div>'
-        )
-
-    if closing_question:
-        article_parts.append(_build_question_section(closing_question))
-
-    article_parts.append(_build_survey_cta())
+    if not faq_items:
+        return None
+    faq_html = "".join(
+        f'<div class="faq-item">'
+        f'<h3 class="faq-q">{f["question"]}</h3>'
+        f'<p class="faq-a">{f["answer"]}</p>'
+        f'</div>'
+        for f in faq_items
+    )
+    return (
+        f'<div class="section faq-section">'
+        f'<h2 class="section-title">Questions Canadian Leaders Are Asking</h2>'
+        f'<div class="faq-list">{faq_html}</div>'
+        f'</div>'
+    )
 
-    article_html = "\n".join(article_parts)
 
-    faq_schema = ""
-    if faq_items:
-        faq_schema_items = ',\n'.join([
-            f'{{"@type":"Question","name":{json.dumps(f["question"])},'
-            f'"acceptedAnswer":{{"@type":"Answer","text":{json.dumps(f["answer"])}}}}}'
-            for f in faq_items
-        ])
-        faq_schema = f"""    <script type="application/ld+json">
+def _build_faq_schema(faq_items):
+    if not faq_items:
+        return ""
+    faq_schema_items = ',\n'.join([
+        f'{{"@type":"Question","name":{json.dumps(f["question"])},'
+        f'"acceptedAnswer":{{"@type":"Answer","text":{json.dumps(f["answer"])}}}}}'
+        for f in faq_items
+    ])
+    return f"""    <script type="application/ld+json">
     {{
       "@context": "https://schema.org",
       "@type": "FAQPage",
@@ -638,473 +775,6 @@ def create_html_blog_post(content, title, excerpt, coverage_date=None, is_draft=
     }}
     </script>"""
 
-    html = f'''<!DOCTYPE html>
-<html lang="en-CA">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <link rel="icon" type="image/svg+xml" href="/favicon.svg">
-    <link rel="apple-touch-icon" href="/apple-touch-icon.png">
-    <title>{seo_title}</title>
-    <meta name="description" content="{meta_desc_html}">
-    <meta name="keywords" content="AI Canada {issue_month_year}, Canadian AI news, artificial intelligence Canada, AI business strategy Canada, AI adoption Canada, Montreal AI, Canadian digital transformation, AI news for Canadians, AI insights {issue_month_year}, {coverage_month_year} AI recap">
-    <meta name="author" content="Robert Simon">
-    <meta name="robots" content="{robots_meta}">
-    <meta name="language" content="en-CA">
-    <meta name="geo.region" content="CA-QC">
-    <meta name="geo.placename" content="Montreal, Quebec, Canada">
-    <meta name="geo.position" content="45.5017;-73.5673">
-    <meta name="ICBM" content="45.5017, -73.5673">
-    <meta name="DC.coverage" content="Canada">
-    <link rel="canonical" href="{canonical}">
-    <meta property="og:type" content="article">
-    <meta property="og:url" content="{canonical}">
-    <meta property="og:title" content="{clean_title_html} | {BRAND}">
-    <meta property="og:description" content="{meta_desc_html}">
-    <meta property="og:image" content="{og_image}">
-    <meta property="og:image:width" content="1200">
-    <meta property="og:image:height" content="630">
-    <meta property="og:image:alt" content="{og_alt}">
-    <meta property="og:site_name" content="{BRAND}">
-    <meta property="og:locale" content="en_CA">
-    <meta property="article:published_time" content="{iso_date}T00:00:00+00:00">
-    <meta property="article:modified_time" content="{iso_date}T00:00:00+00:00">
-    <meta property="article:author" content="Robert Simon">
-    <meta property="article:section" content="AI Strategy">
-    <meta property="article:tag" content="AI Canada">
-    <meta property="article:tag" content="Canadian Business">
-    <meta property="article:tag" content="Artificial Intelligence">
-    <meta property="article:tag" content="Digital Transformation">
-    <meta property="article:tag" content="Montreal">
-    <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="{clean_title_html} | AI News for Canadian Business">
-    <meta name="twitter:description" content="{meta_desc_html}">
-    <meta name="twitter:image" content="{og_image}">
-    <meta name="twitter:image:alt" content="{og_alt}">
-    <meta name="twitter:creator" content="@thedigitalrobert">
-    <meta name="twitter:site" content="@thedigitalrobert">
-    <script type="application/ld+json">
-    {{
-      "@context": "https://schema.org",
-      "@type": "BlogPosting",
-      "headline": {json.dumps(clean_title)},
-      "description": {json.dumps(meta_desc)},
-      "datePublished": "{iso_date}",
-      "dateModified": "{iso_date}",
-      "author": {{
-        "@type": "Person",
-        "name": "Robert Simon",
-        "url": "https://www.imetrobert.com",
-        "image": "https://www.imetrobert.com/profile.jpg",
-        "jobTitle": "AI Thought Leader & Digital Transformation Expert",
-        "knowsAbout": ["Artificial Intelligence", "Digital Transformation", "AI Adoption in Canada", "AI Strategy"],
-        "sameAs": ["https://linkedin.com/in/thedigitalrobert"],
-        "address": {{"@type": "PostalAddress", "addressLocality": "Montreal", "addressRegion": "QC", "addressCountry": "CA"}}
-      }},
-      "publisher": {{
-        "@type": "Person",
-        "name": "Robert Simon",
-        "url": "https://www.imetrobert.com",
-        "logo": {{"@type": "ImageObject", "url": "https://www.imetrobert.com/blog/logo-512.png", "width": 512, "height": 512}}
-      }},
-      "mainEntityOfPage": {{"@type": "WebPage", "@id": {json.dumps(canonical)}}},
-      "url": {json.dumps(canonical)},
-      "image": {json.dumps(og_image)},
-      "inLanguage": "en-CA",
-      "about": [
-        {{"@type": "Thing", "name": "Artificial Intelligence"}},
-        {{"@type": "Thing", "name": "Canadian Business"}},
-        {{"@type": "Place", "name": "Canada"}}
-      ],
-      "keywords": "AI Canada, artificial intelligence Canada, Canadian business AI, AI news Montreal, AI strategy Canada, digital transformation Canada",
-      "articleSection": "AI Strategy",
-      "wordCount": {word_count},
-      "timeRequired": "PT{reading_time}M",
-      "isAccessibleForFree": true,
-      "speakable": {{
-        "@type": "SpeakableSpecification",
-        "cssSelector": [".intro-lead", ".summary-list li", ".faq-q", ".faq-a"]
-      }}
-    }}
-    </script>
-{faq_schema}
-    <script type="application/ld+json">
-    {{
-      "@context": "https://schema.org",
-      "@type": "BreadcrumbList",
-      "itemListElement": [
-        {{"@type": "ListItem", "position": 1, "name": "Home", "item": "https://www.imetrobert.com"}},
-        {{"@type": "ListItem", "position": 2, "name": "{BRAND}", "item": "https://www.imetrobert.com/blog/"}},
-        {{"@type": "ListItem", "position": 3, "name": {json.dumps(clean_title)}, "item": {json.dumps(canonical)}}}
-      ]
-    }}
-    </script>
-    <script async src="https://www.googletagmanager.com/gtag/js?id=G-Y0FZTVVLBS"></script>
-    <script>
-      window.dataLayer = window.dataLayer || [];
-      function gtag(){{dataLayer.push(arguments);}}
-      gtag('js', new Date());
-      gtag('config', 'G-Y0FZTVVLBS');
-    </script>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
-    <style>
-        :root {{
-            --blue:        #2563eb;
-            --blue-dark:   #1d4ed8;
-            --cyan:        #06b6d4;
-            --navy:        #0f172a;
-            --gray-dark:   #1e293b;
-            --gray:        #475569;
-            --gray-light:  #94a3b8;
-            --surface:     #f8fafc;
-            --border:      #e2e8f0;
-            --white:       #ffffff;
-            --canada-red:  #dc2626;
-            --green:       #16a34a;
-            --amber:       #d97706;
-            --shadow-sm:   0 1px 3px rgb(0 0 0 / 0.08);
-            --shadow-md:   0 4px 16px rgb(0 0 0 / 0.08);
-            --shadow-lg:   0 8px 32px rgb(0 0 0 / 0.10);
-        }}
-        *, *::before, *::after {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif; background: linear-gradient(160deg, #f0f4ff 0%, #e8eef8 100%); color: var(--navy); line-height: 1.6; -webkit-font-smoothing: antialiased; }}
-        .nav-bar {{ background: var(--white); padding: 0.875rem 0; box-shadow: var(--shadow-sm); position: sticky; top: 0; z-index: 100; border-bottom: 1px solid var(--border); }}
-        .nav-content {{ max-width: 900px; margin: 0 auto; padding: 0 1.5rem; display: flex; justify-content: space-between; align-items: center; gap: 1rem; flex-wrap: wrap; }}
-        .nav-link {{ color: var(--white); text-decoration: none; font-weight: 600; padding: 0.4rem 1rem; font-size: 0.8rem; border-radius: 20px; background: linear-gradient(135deg, var(--blue), var(--cyan)); transition: all 0.2s; letter-spacing: 0.01em; flex-shrink: 0; }}
-        .nav-link:hover {{ transform: translateY(-1px); box-shadow: 0 4px 12px rgb(37 99 235 / 0.3); }}
-        .nav-meta {{ font-size: 0.78rem; color: var(--gray-light); display: flex; align-items: center; gap: 0.5rem; }}
-        .nav-meta .brand-icon {{ width: 22px; height: 22px; border-radius: 7px; flex-shrink: 0; }}
-        .brand-logo {{ width: 76px; height: 76px; display: block; margin: 0 auto 1.5rem; padding: 7px; box-sizing: content-box; background: rgba(255,255,255,0.96); border-radius: 23px; box-shadow: 0 10px 26px rgba(15,23,42,0.25); }}
-        .header {{ background: linear-gradient(135deg, var(--blue) 0%, #1a7fb5 50%, var(--cyan) 100%); color: var(--white); padding: 4rem 0 3.5rem; text-align: center; position: relative; overflow: hidden; }}
-        .header::before {{ content: ''; position: absolute; inset: 0; background: radial-gradient(circle at 15% 85%, rgba(255,255,255,0.07) 0%, transparent 45%), radial-gradient(circle at 85% 15%, rgba(255,255,255,0.05) 0%, transparent 45%); pointer-events: none; }}
-        .header-content {{ max-width: 780px; margin: 0 auto; padding: 0 1.5rem; position: relative; z-index: 1; }}
-        .issue-badge {{ display: inline-flex; align-items: center; gap: 0.4rem; background: rgba(255,255,255,0.15); border: 1px solid rgba(255,255,255,0.25); padding: 0.3rem 0.9rem; border-radius: 20px; font-size: 0.7rem; font-weight: 700; letter-spacing: 0.08em; text-transform: uppercase; margin-bottom: 1.25rem; }}
-        .issue-badge-coverage {{ font-weight: 500; opacity: 0.75; letter-spacing: 0.04em; }}
-        .header h1 {{ font-size: clamp(1.75rem, 4.5vw, 2.6rem); font-weight: 800; line-height: 1.15; margin-bottom: 0.6rem; letter-spacing: -0.02em; }}
-        .header .subtitle {{ font-size: 0.95rem; font-weight: 500; opacity: 0.85; margin-bottom: 1rem; }}
-        .header .intro-text {{ font-size: 0.925rem; opacity: 0.8; max-width: 640px; margin: 0 auto 1.25rem; line-height: 1.65; }}
-        .reading-badge {{ display: inline-flex; align-items: center; gap: 0.3rem; background: rgba(255,255,255,0.12); padding: 0.25rem 0.75rem; border-radius: 12px; font-size: 0.72rem; font-weight: 500; opacity: 0.85; }}
-        .container {{ max-width: 900px; margin: 0 auto; padding: 2.5rem 1.5rem 5rem; }}
-        .article-card {{ background: var(--white); border-radius: 20px; box-shadow: var(--shadow-lg); overflow: hidden; border: 1px solid rgba(226,232,240,0.6); }}
-        .breadcrumb {{ font-size: 0.72rem; color: var(--gray-light); padding: 0.65rem 2rem; background: var(--surface); border-bottom: 1px solid var(--border); }}
-        .breadcrumb a {{ color: var(--blue); text-decoration: none; }}
-        .author-byline {{ display: flex; align-items: center; gap: 0.875rem; padding: 1rem 2rem; border-bottom: 1px solid var(--border); background: var(--surface); }}
-        .author-byline img {{ width: 42px; height: 42px; border-radius: 50%; object-fit: cover; flex-shrink: 0; border: 2px solid var(--border); }}
-        .author-name  {{ font-weight: 700; color: var(--navy); font-size: 0.875rem; }}
-        .author-role  {{ font-size: 0.75rem; color: var(--gray-light); margin-top: 0.1rem; }}
-        .article-content {{ padding: 2.25rem 2rem; }}
-        .section {{ margin-bottom: 3rem; }}
-        .section-title {{ font-size: 1.2rem; font-weight: 700; color: var(--navy); margin-bottom: 1.25rem; padding-left: 0.875rem; position: relative; letter-spacing: -0.01em; }}
-        .section-title::before {{ content: ''; position: absolute; left: 0; top: 0.1rem; bottom: 0.1rem; width: 3px; background: linear-gradient(to bottom, var(--blue), var(--cyan)); border-radius: 2px; }}
-        .intro-section {{ border-left: 3px solid var(--cyan); padding-left: 1.25rem; }}
-        .intro-lead {{ font-size: 1.05rem; line-height: 1.75; color: var(--gray-dark); font-weight: 400; }}
-        .dev-grid {{ display: grid; gap: 0.75rem; }}
-        .dev-card {{ padding: 1rem 1.25rem; border: 1px solid var(--border); border-radius: 12px; transition: border-color 0.2s, box-shadow 0.2s; border-left: 3px solid var(--blue); background: #fafbff; }}
-        .dev-card:hover {{ border-color: var(--blue); box-shadow: var(--shadow-md); background: var(--white); }}
-        .dev-header {{ display: flex; align-items: center; gap: 0.6rem; margin-bottom: 0.4rem; flex-wrap: wrap; }}
-        .dev-date {{ display: inline-block; background: linear-gradient(135deg, var(--blue), var(--cyan)); color: var(--white); font-size: 0.65rem; font-weight: 700; padding: 0.15rem 0.55rem; border-radius: 10px; white-space: nowrap; letter-spacing: 0.03em; }}
-        .dev-company {{ font-weight: 700; color: var(--navy); font-size: 0.85rem; }}
-        .dev-body {{ font-size: 0.875rem; color: var(--gray); line-height: 1.65; }}
-        .dev-source {{ margin-top: 0.5rem; }}
-        .dev-source a {{ font-size: 0.72rem; color: var(--blue); text-decoration: none; font-weight: 600; opacity: 0.8; transition: opacity 0.2s; }}
-        .dev-source a:hover {{ opacity: 1; text-decoration: underline; }}
-        .canada-section {{ background: linear-gradient(135deg, #fff5f5 0%, #fffbfb 100%); border: 1px solid #fecaca; border-radius: 16px; padding: 1.75rem; }}
-        .canada-header {{ margin-bottom: 0.75rem; }}
-        .canada-label {{ display: inline-flex; align-items: center; gap: 0.35rem; background: var(--canada-red); color: var(--white); font-size: 0.65rem; font-weight: 700; padding: 0.2rem 0.7rem; border-radius: 12px; letter-spacing: 0.06em; text-transform: uppercase; }}
-        /* Inline SVG icons, sprite defined at the top of <body>. Stroked in
-           currentColor and sized in em so each icon matches its adjacent text. */
-        .icon {{ width: 1.05em; height: 1.05em; flex-shrink: 0; fill: none; stroke: currentColor; stroke-width: 1.75; stroke-linecap: round; stroke-linejoin: round; vertical-align: -0.14em; }}
-        .icon-solid {{ fill: currentColor; stroke: none; }}
-        .canada-title::before {{ background: var(--canada-red) !important; }}
-        .spot-list {{ list-style: none; padding: 0; display: grid; gap: 0.875rem; }}
-        .spot-list li {{ display: flex; gap: 0.6rem; align-items: flex-start; font-size: 0.875rem; color: var(--gray); line-height: 1.65; padding: 0.875rem 1rem; background: var(--white); border-radius: 10px; border: 1px solid #fde8e8; }}
-        .spot-bullet {{ flex-shrink: 0; margin-top: 0.35rem; font-size: 0.55rem; color: var(--canada-red); display: flex; }}
-        .spot-content {{ flex: 1; }}
-        .spot-org {{ font-weight: 700; color: var(--navy); font-size: 0.85rem; margin-bottom: 0.2rem; }}
-        .spot-body {{ font-size: 0.875rem; color: var(--gray); line-height: 1.6; }}
-        .spot-source {{ margin-top: 0.4rem; }}
-        .spot-source a {{ font-size: 0.72rem; color: var(--canada-red); text-decoration: none; font-weight: 600; opacity: 0.8; transition: opacity 0.2s; }}
-        .spot-source a:hover {{ opacity: 1; text-decoration: underline; }}
-        .actions-grid {{ display: grid; gap: 0.875rem; }}
-        .action-card {{ display: flex; gap: 1rem; align-items: flex-start; padding: 1.1rem 1.25rem; background: #f8faff; border: 1px solid #dbeafe; border-radius: 12px; border-left: 3px solid var(--blue); transition: box-shadow 0.2s; }}
-        .action-card:hover {{ box-shadow: var(--shadow-md); background: var(--white); }}
-        .action-num {{ display: flex; align-items: center; justify-content: center; width: 1.75rem; height: 1.75rem; min-width: 1.75rem; background: linear-gradient(135deg, var(--blue), var(--cyan)); color: var(--white); font-size: 0.72rem; font-weight: 800; border-radius: 50%; margin-top: 0.1rem; }}
-        .action-body {{ font-size: 0.875rem; color: var(--gray-dark); line-height: 1.7; flex: 1; }}
-        .stat-grid {{ display: grid; gap: 0.75rem; }}
-        .stat-item {{ padding: 1rem 1.25rem; background: #f0fdf4; border-left: 3px solid var(--green); border-radius: 0 10px 10px 0; }}
-        .stat-text {{ font-size: 0.875rem; color: var(--gray-dark); line-height: 1.65; }}
-        .stat-highlight {{ font-weight: 800; color: var(--green); font-size: 1rem; }}
-        .stat-source {{ margin-top: 0.35rem; }}
-        .stat-source a {{ font-size: 0.7rem; color: var(--green); text-decoration: none; font-weight: 600; opacity: 0.75; transition: opacity 0.2s; }}
-        .stat-source a:hover {{ opacity: 1; text-decoration: underline; }}
-        .stat-source-plain {{ font-size: 0.7rem; color: var(--gray-light); margin-top: 0.35rem; }}
-        .stat-note {{ font-size: 0.72rem; color: var(--gray-light); margin-top: 0.875rem; font-style: italic; }}
-        .roberts-take {{ background: linear-gradient(135deg, #1e3a6e 0%, #1a5276 100%); border-radius: 16px; padding: 1.75rem; color: var(--white); }}
-        .roberts-header {{ display: flex; align-items: center; gap: 0.875rem; margin-bottom: 1.1rem; padding-bottom: 1rem; border-bottom: 1px solid rgba(255,255,255,0.12); }}
-        .roberts-header img {{ width: 38px; height: 38px; border-radius: 50%; object-fit: cover; border: 2px solid rgba(255,255,255,0.25); flex-shrink: 0; }}
-        .roberts-label {{ font-size: 0.62rem; text-transform: uppercase; letter-spacing: 0.1em; opacity: 0.6; margin-bottom: 0.1rem; }}
-        .roberts-name {{ margin: 0; font-weight: 700; font-size: 0.9rem; }}
-        .roberts-body {{ font-size: 0.925rem; line-height: 1.85; color: #ffffff; font-style: normal; font-weight: 400; }}
-        .roberts-placeholder {{ font-size: 0.825rem; line-height: 1.7; opacity: 0.65; border: 1px dashed rgba(255,255,255,0.25); padding: 1rem 1.25rem; border-radius: 10px; }}
-        .roberts-placeholder strong {{ color: var(--white); opacity: 1; font-style: normal; }}
-        .roberts-body + .roberts-body {{ margin-top: 0.9rem; }}
-        /* Executive summary — the three things, above the fold. */
-        .summary-section {{ background: var(--surface); border: 1px solid var(--border); border-left: 3px solid var(--navy); border-radius: 12px; padding: 1.4rem 1.6rem; }}
-        .summary-label {{ margin: 0 0 0.85rem; font-size: 0.62rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.11em; color: var(--navy); opacity: 0.75; }}
-        .summary-list {{ list-style: none; padding: 0; display: grid; gap: 0.7rem; counter-reset: summary; }}
-        .summary-list li {{ position: relative; padding-left: 1.9rem; font-size: 0.9rem; line-height: 1.6; color: var(--gray-dark); font-weight: 500; counter-increment: summary; }}
-        .summary-list li::before {{ content: counter(summary); position: absolute; left: 0; top: 0.05rem; width: 1.3rem; height: 1.3rem; display: flex; align-items: center; justify-content: center; background: var(--navy); color: var(--white); border-radius: 50%; font-size: 0.65rem; font-weight: 800; }}
-        /* Major stories carry judgment and ratings; the log below does not. */
-        .dev-card-major {{ padding: 1.25rem 1.4rem; }}
-        .dev-tier {{ margin-left: auto; font-size: 0.58rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.09em; color: var(--blue); opacity: 0.7; }}
-        .dev-read {{ margin-top: 0.85rem; padding: 0.9rem 1.1rem; background: var(--white); border: 1px solid #dbeafe; border-left: 3px solid var(--cyan); border-radius: 0 10px 10px 0; }}
-        .dev-read-label {{ display: block; font-size: 0.58rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.1em; color: var(--cyan); margin-bottom: 0.35rem; }}
-        .dev-read p {{ font-size: 0.86rem; line-height: 1.7; color: var(--gray-dark); margin: 0; }}
-        .dev-log {{ margin-top: 1.25rem; padding-top: 1.1rem; border-top: 1px dashed var(--border); display: grid; gap: 0.6rem; }}
-        .dev-log-label {{ font-size: 0.6rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.1em; color: var(--gray-light); }}
-        .dev-card-minor {{ padding: 0.8rem 1rem; background: var(--white); border-left-color: var(--border); }}
-        .dev-card-minor .dev-body {{ font-size: 0.83rem; }}
-        .dev-card-minor .dev-company {{ font-size: 0.8rem; }}
-        /* Rating badges. Label above value so a badge reads without a legend. */
-        .badge-row {{ display: flex; flex-wrap: wrap; gap: 0.5rem; margin-top: 0.9rem; }}
-        .badge {{ display: inline-flex; flex-direction: column; gap: 0.1rem; padding: 0.35rem 0.7rem; border-radius: 8px; border: 1px solid var(--border); background: var(--white); min-width: 5.5rem; }}
-        .badge-label {{ font-size: 0.55rem; font-weight: 700; text-transform: uppercase; letter-spacing: 0.07em; color: var(--gray-light); }}
-        .badge-value {{ font-size: 0.8rem; font-weight: 800; color: var(--navy); line-height: 1.2; }}
-        .badge.tone-high {{ background: #fff7ed; border-color: #fed7aa; }}
-        .badge.tone-high .badge-value {{ color: #c2410c; }}
-        .badge.tone-mid {{ background: #eff6ff; border-color: #bfdbfe; }}
-        .badge.tone-mid .badge-value {{ color: #1d4ed8; }}
-        .badge.tone-low {{ background: var(--surface); border-color: var(--border); }}
-        .badge.tone-low .badge-value {{ color: var(--gray); }}
-        .badge.tone-neutral .badge-value {{ color: var(--gray-dark); }}
-        .badge-row-action {{ margin-top: 0.75rem; }}
-        /* Actions: body, then who owns it and why, then the triage badges. */
-        .action-main {{ flex: 1; }}
-        .action-owner {{ margin-top: 0.75rem; padding: 0.6rem 0.85rem; background: var(--white); border: 1px solid #dbeafe; border-radius: 8px; }}
-        .action-owner-label {{ font-size: 0.55rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.09em; color: var(--gray-light); margin-right: 0.45rem; }}
-        .action-owner-role {{ font-size: 0.8rem; font-weight: 800; color: var(--navy); }}
-        .action-owner-why {{ font-size: 0.78rem; line-height: 1.6; color: var(--gray); margin-top: 0.3rem; }}
-        /* Looking ahead — three predictions, explicitly labelled as such. */
-        .pred-note {{ font-size: 0.78rem; color: var(--gray-light); line-height: 1.6; margin-bottom: 1.1rem; font-style: italic; }}
-        .pred-grid {{ display: grid; gap: 0.75rem; }}
-        .pred-card {{ padding: 1rem 1.25rem; background: var(--surface); border: 1px solid var(--border); border-left: 3px solid var(--navy); border-radius: 0 10px 10px 0; }}
-        .pred-horizon {{ font-size: 0.6rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.1em; color: var(--navy); opacity: 0.7; margin-bottom: 0.35rem; }}
-        .pred-body {{ font-size: 0.875rem; line-height: 1.7; color: var(--gray-dark); margin: 0; }}
-        /* The closing question. Deliberately the largest type in the article. */
-        .question-section {{ border: 2px solid var(--navy); border-radius: 16px; padding: 1.75rem 2rem; background: var(--white); }}
-        .question-label {{ margin: 0 0 0.7rem; font-size: 0.62rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.11em; color: var(--navy); opacity: 0.7; }}
-        .question-body {{ font-size: 1.15rem; line-height: 1.6; font-weight: 600; color: var(--navy); margin: 0; letter-spacing: -0.01em; }}
-        .faq-section {{ background: var(--surface); border: 1px solid var(--border); border-radius: 16px; padding: 1.75rem; }}
-        .faq-list {{ display: grid; gap: 1rem; }}
-        .faq-item {{ padding: 1rem 1.25rem; background: var(--white); border: 1px solid var(--border); border-radius: 12px; border-left: 3px solid var(--blue); }}
-        .faq-q {{ font-size: 0.925rem; font-weight: 700; color: var(--navy); margin-bottom: 0.4rem; line-height: 1.45; }}
-        .faq-a {{ font-size: 0.875rem; color: var(--gray); line-height: 1.7; margin: 0; }}
-        .survey-cta {{ background: linear-gradient(135deg, var(--blue) 0%, var(--cyan) 100%); color: var(--white); border-radius: 16px; padding: 1.75rem; }}
-        .survey-cta .section-title {{ color: var(--white); }}
-        .survey-cta .section-title::before {{ background: rgba(255,255,255,0.85); }}
-        .survey-body {{ font-size: 0.9rem; line-height: 1.75; color: rgba(255,255,255,0.94); margin-bottom: 1.25rem; }}
-        .survey-body strong {{ color: var(--white); }}
-        .survey-actions {{ display: flex; align-items: center; gap: 1rem; flex-wrap: wrap; }}
-        .survey-btn {{ display: inline-block; background: var(--white); color: var(--blue); font-weight: 700; font-size: 0.85rem; padding: 0.6rem 1.4rem; border-radius: 25px; text-decoration: none; transition: transform 0.15s; }}
-        .survey-btn:hover {{ transform: translateY(-1px); }}
-        .survey-results {{ color: rgba(255,255,255,0.92); font-size: 0.8rem; font-weight: 600; text-decoration: underline; }}
-        /* Share row. Sits at the end of the issue — the point at which a reader
-           who found the issue useful decides to pass it on. */
-        .share-row {{ margin-top: 1.75rem; padding-top: 1.5rem; border-top: 1px solid var(--border); }}
-        .share-label {{ font-size: 0.62rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.11em; color: var(--gray-light); margin-bottom: 0.8rem; }}
-        .share-actions {{ display: flex; flex-wrap: wrap; gap: 0.5rem; }}
-        .share-btn {{ display: inline-flex; align-items: center; gap: 0.45rem; font: inherit; font-size: 0.8rem; font-weight: 600; color: var(--navy); background: var(--white); border: 1px solid var(--border); border-radius: 22px; padding: 0.5rem 1rem; text-decoration: none; cursor: pointer; transition: border-color 0.2s, box-shadow 0.2s, transform 0.15s; }}
-        .share-btn:hover {{ border-color: var(--blue); color: var(--blue); box-shadow: var(--shadow-md); transform: translateY(-1px); }}
-        .share-btn .icon {{ width: 1.1em; height: 1.1em; }}
-        .share-btn.copied {{ background: var(--green); border-color: var(--green); color: var(--white); }}
-        .share-btn[hidden] {{ display: none; }}
-        p {{ margin-bottom: 1rem; line-height: 1.75; color: var(--gray); font-size: 0.9rem; }}
-        strong {{ color: var(--navy); font-weight: 600; }}
-        @media (max-width: 640px) {{
-            .header {{ padding: 2.5rem 0 2.25rem; }}
-            .header h1 {{ font-size: 1.6rem; }}
-            .brand-logo {{ width: 58px; height: 58px; padding: 6px; border-radius: 18px; margin-bottom: 1.1rem; }}
-            .container {{ padding: 1.5rem 1rem 3rem; }}
-            .article-content {{ padding: 1.5rem 1.25rem; }}
-            .nav-content {{ flex-direction: column; align-items: flex-start; gap: 0.35rem; }}
-            .author-byline {{ padding: 0.875rem 1.25rem; }}
-            .breadcrumb {{ padding: 0.5rem 1.25rem; }}
-            .canada-section {{ padding: 1.25rem; }}
-            .action-card {{ flex-direction: column; gap: 0.6rem; }}
-            .action-num {{ width: 1.5rem; height: 1.5rem; min-width: 1.5rem; }}
-            .summary-section {{ padding: 1.1rem 1.2rem; }}
-            .question-section {{ padding: 1.25rem 1.35rem; }}
-            .question-body {{ font-size: 1rem; }}
-            .dev-tier {{ margin-left: 0; flex-basis: 100%; }}
-            /* Badges go full width rather than wrapping into ragged rows. */
-            .badge {{ flex: 1 1 auto; min-width: 6.5rem; }}
-        }}
-    </style>
-</head>
-<body>
-    <!-- Icon sprite. Reference a symbol by id from an svg.icon element.
-         Markers here are geometric on purpose: the brand's maple leaf is
-         illegible below ~32px, so it stays in the logo and does not get
-         shrunk down into list bullets. -->
-    <svg xmlns="http://www.w3.org/2000/svg" style="display:none" aria-hidden="true">
-        <symbol id="i-search" viewBox="0 0 24 24">
-            <circle cx="10.5" cy="10.5" r="6.5"/>
-            <path d="m15.5 15.5 4.5 4.5"/>
-        </symbol>
-        <symbol id="i-clock" viewBox="0 0 24 24">
-            <circle cx="12" cy="12" r="8.5"/>
-            <path d="M12 7v5.2l3.2 2"/>
-        </symbol>
-        <symbol id="i-copy" viewBox="0 0 24 24">
-            <rect x="9" y="9" width="11" height="11" rx="2.5"/>
-            <path d="M6.5 15H5.5A2.5 2.5 0 0 1 3 12.5v-7A2.5 2.5 0 0 1 5.5 3h7A2.5 2.5 0 0 1 15 5.5v1"/>
-        </symbol>
-        <symbol id="i-linkedin" viewBox="0 0 24 24">
-            <path fill="currentColor" stroke="none" d="M4.98 3.5a2.5 2.5 0 1 0 0 5 2.5 2.5 0 0 0 0-5zM3 9.5h4v11H3zm7 0h3.8v1.5a4.2 4.2 0 0 1 3.7-1.9c3 0 4.5 1.9 4.5 5.3v6.1h-4v-5.4c0-1.6-.6-2.6-2-2.6s-2.2 1-2.2 2.6v5.4h-3.8z"/>
-        </symbol>
-        <symbol id="i-mail" viewBox="0 0 24 24">
-            <rect x="3" y="5" width="18" height="14" rx="2.5"/>
-            <path d="m3.5 7 8.5 6 8.5-6"/>
-        </symbol>
-        <symbol id="i-share" viewBox="0 0 24 24">
-            <circle cx="18" cy="5" r="2.5"/><circle cx="6" cy="12" r="2.5"/><circle cx="18" cy="19" r="2.5"/>
-            <path d="m8.2 10.8 7.6-4.4M8.2 13.2l7.6 4.4"/>
-        </symbol>
-        <symbol id="i-pencil" viewBox="0 0 24 24">
-            <path d="M4 20h4l10.5-10.5a2.1 2.1 0 0 0-3-3L5 17z"/>
-            <path d="m14.5 6 3 3"/>
-        </symbol>
-        <symbol id="i-diamond" viewBox="0 0 24 24">
-            <path d="M12 4.5 19.5 12 12 19.5 4.5 12Z"/>
-        </symbol>
-    </svg>
-    <nav class="nav-bar">
-        <div class="nav-content">
-            <a href="https://www.imetrobert.com/blog/" class="nav-link">&#8592; Back to Blog</a>
-            <div class="nav-meta">
-                <img src="/blog/logo.svg" class="brand-icon" alt="" width="22" height="22">
-                <span>{BRAND}</span>
-                <span>&#8226;</span>
-                <span>{formatted_date}</span>
-            </div>
-        </div>
-    </nav>
-    <header class="header">
-        <div class="header-content">
-            <img src="/blog/logo.svg" class="brand-logo" alt="{BRAND}" width="76" height="76">
-            <div class="issue-badge">Issue #{issue_num} &nbsp;&#8226;&nbsp; {issue_month_year} <span class="issue-badge-coverage">&mdash; Covering {coverage_month_name}</span></div>
-            <h1>{clean_title_html}</h1>
-            <div class="subtitle">{BRAND_TAGLINE}</div>
-            <div class="intro-text">{excerpt_html}</div>
-            <div class="reading-badge"><svg class="icon" aria-hidden="true"><use href="#i-clock"/></svg> {reading_time} min read</div>
-        </div>
-    </header>
-    <div class="container">
-        <article class="article-card" itemscope itemtype="https://schema.org/BlogPosting">
-            <meta itemprop="headline"      content="{clean_title_html}">
-            <meta itemprop="datePublished" content="{iso_date}">
-            <meta itemprop="dateModified"  content="{iso_date}">
-            <meta itemprop="author"        content="Robert Simon">
-            <meta itemprop="description"   content="{meta_desc_html}">
-            <nav class="breadcrumb" aria-label="Breadcrumb">
-                <a href="https://www.imetrobert.com">Home</a> &#8250;
-                <a href="https://www.imetrobert.com/blog/">{BRAND}</a> &#8250;
-                <span>{clean_title_html}</span>
-            </nav>
-            <div class="author-byline">
-                <img src="https://imetrobert.github.io/profile.jpg" alt="Robert Simon" loading="lazy">
-                <div>
-                    <div class="author-name">Robert Simon</div>
-                    <div class="author-role">AI Thought Leader &amp; Digital Transformation Expert &mdash; Montreal, QC</div>
-                </div>
-            </div>
-            <div class="article-content" itemprop="articleBody">
-                {article_html}
-                {_build_share_row(canonical, clean_title, issue_month_year)}
-            </div>
-        </article>
-    </div>
-    <script>
-      // Share behaviour: copy-to-clipboard and the OS share sheet. Delegated,
-      // so it costs one listener no matter how many share controls a post has.
-      (function () {{
-        function fallbackCopy(text) {{
-          var ta = document.createElement('textarea');
-          ta.value = text;
-          ta.setAttribute('readonly', '');
-          ta.style.position = 'fixed';
-          ta.style.opacity = '0';
-          document.body.appendChild(ta);
-          ta.select();
-          try {{ document.execCommand('copy'); }} catch (e) {{}}
-          document.body.removeChild(ta);
-        }}
-
-        function flash(btn) {{
-          var label = btn.querySelector('.share-btn-text');
-          if (!label) return;
-          var original = label.textContent;
-          label.textContent = 'Copied';
-          btn.classList.add('copied');
-          setTimeout(function () {{
-            label.textContent = original;
-            btn.classList.remove('copied');
-          }}, 1800);
-        }}
-
-        document.addEventListener('click', function (e) {{
-          var btn = e.target.closest ? e.target.closest('.share-copy') : null;
-          if (!btn) return;
-
-          // The canonical permalink, baked in at build time. Never
-          // location.href — this same article is also served at latest.html,
-          // which points at a different issue next month.
-          var text = btn.dataset.shareUrl || '';
-          if (!text) return;
-
-          if (navigator.clipboard && navigator.clipboard.writeText) {{
-            navigator.clipboard.writeText(text).then(function () {{ flash(btn); }},
-                                                     function () {{ fallbackCopy(text); flash(btn); }});
-          }} else {{
-            fallbackCopy(text);
-            flash(btn);
-          }}
-
-          if (typeof gtag === 'function') {{
-            gtag('event', 'share', {{ method: 'copy_link' }});
-          }}
-        }});
-
-        // The OS share sheet, where the browser has one. Revealed rather than
-        // rendered, so a desktop visitor never sees a button that would do
-        // nothing — LinkedIn, email and copy already cover that case.
-        if (navigator.share) {{
-          document.querySelectorAll('.share-native').forEach(function (b) {{
-            b.hidden = false;
-          }});
-        }}
-
-        document.addEventListener('click', function (e) {{
-          var btn = e.target.closest ? e.target.closest('.share-native') : null;
-          if (!btn || !navigator.share) return;
-          navigator.share({{
-            title: btn.dataset.shareTitle || document.title,
-            url: btn.dataset.shareUrl
-          }}).then(function () {{
-            if (typeof gtag === 'function') {{
-              gtag('event', 'share', {{ method: 'web_share' }});
-            }}
-          }}).catch(function () {{
-            // The user dismissed the sheet. Not an error, and not worth a message.
-          }});
-        }});
-      }})();
-    </script>
-</body>
-</html>'''
-
-    return html
-
 
 def _build_survey_cta():
     """Invitation to the reader survey, rendered only once a form URL is set.
@@ -1221,9 +891,9 @@ def _build_share_row(canonical, title, issue_month_year):
     """Share controls for a published issue.
 
     Every link is built from `canonical`, never from the page's own address.
-    A post is served at BOTH its dated permalink and at latest.html, and
-    latest.html is a rotating alias — same URL, a different article every
-    month. Sharing the address the reader happens to be at means a link that
+    A post used to be served at BOTH its dated permalink and at latest.html,
+    and latest.html is still a rotating alias — same URL, a different article
+    every month. Sharing the address the reader happens to be at means a link that
     silently points at next month's issue, and social platforms cache Open
     Graph data per URL essentially forever, so the preview stays wrong too.
 
@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+rerender_archive.py
+Re-renders every published issue through the current renderer.
+
+Until now a template change only ever reached new issues. Old ones were
+patched one migration at a time with regex — fix_old_posts.py, the homepage
+anchor workflow — because there was nothing to re-render them FROM: the model's
+output is gone once the page is written. So the archive drifted across markup
+eras (a September 2025 issue has bullet lists under "Key AI Developments This
+Month"; a July 2026 one has dev-cards and a Canadian Spotlight), and every
+reader of the posts — pillar_adoption.py, blog_index.extract_post_info — had to
+handle each era separately.
+
+Each issue's structured content is reconstructed once and kept beside the
+site in data/issues/<post>.json:
+
+  page    title, excerpt, text, coverage month, publication date, canonical
+          URL and og:image, as the page was published. The URL and the date
+          never move; the titles, labels and counts are worked out again by
+          renderer.page_values, so a change there reaches every issue.
+  parts   what renderer.issue_parts returns for a new issue: intro, the
+          developments, the Spotlight, the actions, the adoption figures, the
+          Desk, and so on.
+
+The first run back-extracts both from the page itself (BeautifulSoup, every
+era the archive has). Sections a retired template had and the current one
+does not — "Impact on Canadian Businesses", the closing conclusion, a Robert's
+Take too short to be a Desk — are kept verbatim in parts["carried"], placed
+after the block they followed, rather than lost. A block that follows one
+which is rebuilt (the FAQ, the survey invitation) is placed after that
+block's replacement, and anything the card holds after .article-content goes
+after the last block (parts["carried"]["end"]).
+
+The FAQ and its schema are rebuilt from the parts, so the two agree on every
+issue. A published question the parts cannot answer — the first structured
+template asked "How do global AI trends affect Canadian competitiveness?" —
+is kept as it was, in parts["faq"], on the page and in the schema; a page
+whose FAQ would still come out shorter is not written. The related-issues
+block is carried over from the page as it was; related_issues.py owns it.
+
+A sidecar is keyed on the page's content hash (search_index.content_hash), so
+an issue that was edited since — a redraft, a hand fix — is extracted again,
+and an unchanged one never is. After a page is rewritten its sidecar takes the
+new hash.
+
+Pages are rendered on a process pool and written only when their bytes change,
+all in one atomic_write.publish(): a crash leaves the old archive. latest.html
+is only an alias (blog_index.create_latest_alias), so it has nothing to
+re-render.
+
+    python3 scripts/rerender_archive.py                  # every published issue
+    python3 scripts/rerender_archive.py --dry-run        # report, write nothing
+    python3 scripts/rerender_archive.py 2025-09-30-key-ai-developments-this-month.html
+    python3 scripts/rerender_archive.py --reextract --workers 4
+
+Exit codes: 0 when every issue rendered, 1 when any was skipped.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from html import escape as escape_html
+
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+sys.path.insert(0, os.path.join(os.getcwd(), 'scripts'))
+
+from post_registry import post_date, published
+
+POSTS_DIR  = "blog/posts"
+ISSUES_DIR = "data/issues"
+BASE_URL   = "https://www.imetrobert.com"
+
+# Section headings of the first template (September 2025 – April 2026), which
+# had no section classes: the heading is the only thing that says what a
+# block is.
+_LEGACY_TITLES = {
+    "Key AI Developments This Month":                  "developments",
+    "Strategic Recommendations for Canadian Leaders":  "actions",
+    "Canadian Business AI Adoption Metrics":           "adoption",
+}
+
+# Section class -> block. "" is rebuilt from the parts (the FAQ, the survey
+# invitation, the share row) or owned by another script (related issues), so
+# it is dropped.
+_SECTION_CLASSES = (
+    ("related-section",  ""),
+    ("share-row",        ""),
+    ("faq-section",      ""),
+    ("survey-cta",       ""),
+    ("intro-section",    "intro"),
+    ("summary-section",  "summary"),
+    ("desk-section",     "desk"),
+    ("canada-section",   "spotlight"),
+    ("actions-section",  "actions"),
+    ("adoption-section", "adoption"),
+    ("pred-section",     "predictions"),
+    ("question-section", "question"),
+)
+
+# Where a dropped block's replacement renders, so whatever followed it on the
+# page follows the replacement. The related block has none; related_issues.py
+# places it.
+_REBUILT_SLOT = {"faq-section": "faq", "survey-cta": "survey", "share-row": "end"}
+
+_MONTHS = ("January|February|March|April|May|June|July|August|September|"
+           "October|November|December")
+# "April 3rd, 2026: ...", "October 4: ..." and "<strong>September 3:</strong> ..."
+_DATED = re.compile(r"^\s*((?:" + _MONTHS + r")\s+\d{1,2}(?:st|nd|rd|th)?(?:,\s*\d{4})?)\s*:\s*")
+_ACTION_PREFIX = re.compile(r"^\s*<strong>\s*Strategic Action \d+:?\s*</strong>\s*:?\s*", re.I)
+_FIGURE = re.compile(r"\$?\d[\d,.]*(?:%| percent\b)?")
+_ISSUE_MONTH = re.compile(r"for ((?:" + _MONTHS + r") \d{4})\s*$")
+
+_DEV_BADGES    = {"Strategic importance": "importance", "Time horizon": "horizon",
+                  "Executive attention": "attention"}
+_ACTION_BADGES = {"Priority": "priority", "Effort": "effort", "Impact": "impact"}
+
+
+# ── Back-extraction ─────────────────────────────────────────────────────────
+
+def _inner(el):
+    """An element's markup without its own tag, for fields the renderer
+    inserts as-is."""
+    return el.decode_contents().strip() if el is not None else ""
+
+
+def _text(el):
+    """Escaped text, for fields the renderer inserts as-is but that were
+    plain text on the page (labels, figures, source names)."""
+    return escape_html(" ".join(el.get_text().split()), quote=False) if el is not None else ""
+
+
+def _source(el, selector):
+    a = el.select_one(f"{selector} a")
+    if a is None:
+        return "", ""
+    return a.get("href", ""), _text(a)
+
+
+def _badges(el, keys):
+    found = {}
+    for badge in el.select(".badge"):
+        label, value = badge.select_one(".badge-label"), badge.select_one(".badge-value")
+        key = keys.get(label.get_text(strip=True) if label else "")
+        if key and value is not None:
+            found[key] = value.get_text(strip=True)
+    return found
+
+
+def _dated(li):
+    """(date, body html) for a first-template development bullet."""
+    first = next((c for c in li.contents if getattr(c, "name", None) or str(c).strip()), None)
+    if getattr(first, "name", None) == "strong" and _DATED.match(first.get_text() + " "):
+        date = _DATED.match(first.get_text() + " ").group(1)
+        first.extract()
+        return date, _inner(li)
+    body = _inner(li)
+    m = _DATED.match(body)
+    return (m.group(1), body[m.end():]) if m else ("", body)
+
+
+def _take_intro(el, parts):
+    lead = el.select_one(".intro-lead")
+    paras = [lead] if lead is not None else el.find_all("p")
+    parts["intro"] = " ".join(_inner(p) for p in paras if _inner(p))
+    return bool(parts["intro"])
+
+
+def _take_developments(el, parts):
+    for card in el.select(".dev-card"):
+        url, name = _source(card, ".dev-source")
+        read = card.select_one(".dev-read p")
+        d = {"date": _text(card.select_one(".dev-date")),
+             "company": _text(card.select_one(".dev-company")),
+             "body": _inner(card.select_one(".dev-body")),
+             "source_url": url, "source_name": name}
+        if read is not None:
+            d["strategic_read"] = read.get_text(" ", strip=True)
+        d.update(_badges(card, _DEV_BADGES))
+        parts["developments"].append(d)
+    if not parts["developments"]:
+        for li in el.find_all("li"):
+            date, body = _dated(li)
+            parts["developments"].append({"date": date, "company": "", "body": body,
+                                          "source_url": "", "source_name": ""})
+    return bool(parts["developments"])
+
+
+def _take_spotlight(el, parts):
+    for li in el.select(".spot-list > li"):
+        url, name = _source(li, ".spot-source")
+        parts["spotlight"].append({"org": _inner(li.select_one(".spot-org")),
+                                   "body": _inner(li.select_one(".spot-body")),
+                                   "source_url": url, "source_name": name})
+    if not parts["spotlight"]:
+        parts["canadian_spot"] = " ".join(_inner(p) for p in el.find_all("p"))
+    return bool(parts["spotlight"] or len(parts["canadian_spot"]) > 60)
+
+
+def _take_desk(el, parts):
+    take = el.select_one(".roberts-take")
+    if take is None or take.select_one(".roberts-placeholder") is not None:
+        return False
+    text = "\n\n".join(p.get_text(" ", strip=True) for p in take.select(".roberts-body"))
+    # Shorter than this, the renderer would show the "write this section"
+    # placeholder; the old two-sentence take is carried as it was instead.
+    if len(text) < 120:
+        return False
+    parts["desk"] = text
+    return True
+
+
+def _take_actions(el, parts):
+    for card in el.select(".action-card"):
+        a = {"body": _inner(card.select_one(".action-body"))}
+        if card.select_one(".action-owner-role") is not None:
+            a["owner"] = _inner(card.select_one(".action-owner-role"))
+            a["owner_rationale"] = _inner(card.select_one(".action-owner-why"))
+        a.update(_badges(card, _ACTION_BADGES))
+        parts["actions"].append(a)
+    if not parts["actions"]:
+        parts["actions"] = [{"body": _ACTION_PREFIX.sub("", _inner(li))} for li in el.find_all("li")]
+    return bool(parts["actions"])
+
+
+def _take_adoption(el, parts):
+    for item in el.select(".stat-item"):
+        url, name = _source(item, ".stat-source")
+        if not name:
+            name = _text(item.select_one(".stat-source-plain"))
+        parts["adoption"].append({"stat_number": _text(item.select_one(".stat-highlight")),
+                                  "stat_text": _text(item.select_one(".stat-text")),
+                                  "source_url": url, "source_name": name})
+    if not parts["adoption"]:
+        for li in el.find_all("li"):
+            text = _text(li)
+            strong = li.find("strong")
+            figure = _text(strong) if strong is not None else ""
+            if not figure:
+                m = _FIGURE.search(text)
+                figure = m.group(0) if m else ""
+            parts["adoption"].append({"stat_number": figure, "stat_text": text,
+                                      "source_url": "", "source_name": ""})
+    return bool(parts["adoption"])
+
+
+def _take_summary(el, parts):
+    parts["summary"] = [_inner(li) for li in el.select(".summary-list > li")]
+    return bool(parts["summary"])
+
+
+def _take_predictions(el, parts):
+    parts["predictions"] = [{"horizon": _inner(c.select_one(".pred-horizon")),
+                             "body": _inner(c.select_one(".pred-body"))}
+                            for c in el.select(".pred-card")]
+    return bool(parts["predictions"])
+
+
+def _take_question(el, parts):
+    parts["question"] = _inner(el.select_one(".question-body"))
+    return bool(parts["question"])
+
+
+_TAKE = {
+    "intro": _take_intro, "developments": _take_developments, "spotlight": _take_spotlight,
+    "desk": _take_desk, "actions": _take_actions, "adoption": _take_adoption,
+    "summary": _take_summary, "predictions": _take_predictions, "question": _take_question,
+}
+
+
+def _block_of(el, first):
+    """Which block a top-level element of .article-content is: a name from
+    _TAKE, "" for one that is rebuilt, or None for one that is carried."""
+    classes = el.get("class") or []
+    for cls, name in _SECTION_CLASSES:
+        if cls in classes:
+            return name
+    if el.select_one(".roberts-take") is not None:
+        return "desk"
+    if el.select_one(".dev-grid") is not None:
+        return "developments"
+    h2 = el.find("h2")
+    if h2 is not None:
+        return _LEGACY_TITLES.get(h2.get_text(" ", strip=True))
+    # The first template's intro: the article's first section, one paragraph
+    # and no heading.
+    if first and "section" in classes and el.find(["ul", "div"]) is None:
+        return "intro"
+    return None
+
+
+def _plain(parts):
+    """The issue's words, for the word count and reading time: what the parts
+    say, not the headings around them, which a re-render may rename."""
+    from bs4 import BeautifulSoup
+    chunks = [parts["intro"], parts["canadian_spot"], parts["desk"] or "", parts["question"]]
+    for key in ("developments", "spotlight", "actions", "adoption", "predictions"):
+        for item in parts[key]:
+            chunks.extend(v for v in item.values() if isinstance(v, str) and not v.startswith("http"))
+    chunks += parts["summary"]
+    chunks += [html for block in parts["carried"].values() for html in block]
+    return " ".join(BeautifulSoup(" ".join(chunks), "html.parser").get_text(" ").split())
+
+
+def _coverage(title, published_on):
+    """The month an issue covers: the month before the one in its title
+    ("AI Insights for May 2026" covers April), else its publication month."""
+    m = _ISSUE_MONTH.search(title)
+    if m:
+        issue = datetime.strptime(m.group(1), "%B %Y")
+        return (issue - timedelta(days=1)).replace(day=1)
+    return published_on.replace(day=1)
+
+
+def _meta(soup, **attrs):
+    tag = soup.find("meta", attrs=attrs)
+    return (tag.get("content") or "").strip() if tag is not None else ""
+
+
+def extract(source, fname):
+    """{"page": ..., "parts": ...} reconstructed from a published page."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(source, "html.parser")
+    article = soup.select_one(".article-content")
+    if article is None:
+        raise ValueError("no .article-content")
+
+    parts = {"intro": "", "canadian_spot": "", "desk": None, "developments": [],
+             "spotlight": [], "actions": [], "adoption": [], "summary": [],
+             "predictions": [], "question": "", "carried": {}, "faq": []}
+    taken, last = set(), "start"
+    for i, el in enumerate(article.find_all(recursive=False)):
+        name = _block_of(el, i == 0)
+        if name == "":
+            # Not `continue` alone: on 2026-07-31 the conclusion follows the
+            # FAQ, and anchored to the last block taken it re-rendered in the
+            # middle of the article, right after the Desk.
+            classes = el.get("class") or []
+            last = next((_REBUILT_SLOT[c] for c in classes if c in _REBUILT_SLOT), last)
+            if "faq-section" in classes:
+                parts["faq"] = [{"question": _text(item.select_one(".faq-q")),
+                                 "answer": _inner(item.select_one(".faq-a"))}
+                                for item in el.select(".faq-item")
+                                if item.select_one(".faq-q") and item.select_one(".faq-a")]
+            continue
+        if name and name not in taken and _TAKE[name](el, parts):
+            taken.add(name)
+            last = name
+            continue
+        parts["carried"].setdefault(last, []).append(str(el))
+    if not taken:
+        raise ValueError("no section the renderer knows")
+    # Whatever follows .article-content inside the card. On 2026-05-31 and
+    # 2026-07-03 the closing "The Bottom Line" conclusion sits there, beside
+    # the article rather than in it, and the older issues keep their "More AI
+    # Insights" links there; walking only the article's children lost both.
+    # Carried as "end", after the last block.
+    for el in article.find_next_siblings():
+        if el.get_text(strip=True):
+            parts["carried"].setdefault("end", []).append(str(el))
+
+    h1 = soup.find("h1")
+    title = h1.get_text(" ", strip=True) if h1 is not None else ""
+    stamp = (_meta(soup, property="article:published_time")
+             or _meta(soup, itemprop="datePublished"))[:10]
+    published_on = (datetime.strptime(stamp, "%Y-%m-%d") if stamp
+                    else post_date(fname) or datetime.now())
+    header_intro = soup.select_one(".header .intro-text")
+    excerpt = (header_intro.get_text(" ", strip=True) if header_intro is not None
+               else BeautifulSoup(parts["intro"], "html.parser").get_text(" ", strip=True)
+               or _meta(soup, name="description"))
+    canonical = soup.find("link", rel="canonical")
+    page = {
+        "title":     title,
+        "excerpt":   excerpt,
+        "text":      _plain(parts),
+        "coverage":  _coverage(title, published_on).strftime("%Y-%m-%d"),
+        "published": published_on.strftime("%Y-%m-%d"),
+        "canonical": (canonical.get("href") if canonical is not None else "")
+                     or f"{BASE_URL}/blog/posts/{fname}",
+        "og_image":  _meta(soup, property="og:image") or f"{BASE_URL}/blog/og-blog.jpg",
+    }
+    return {"page": page, "parts": parts}
+
+
+# ── Rendering ───────────────────────────────────────────────────────────────
+
+def render_issue(issue):
+    from renderer import page_values, render_page
+    meta = issue["page"]
+    page = page_values(meta["text"], meta["title"], meta["excerpt"],
+                       datetime.strptime(meta["coverage"], "%Y-%m-%d"),
+                       published=datetime.strptime(meta["published"], "%Y-%m-%d"))
+    # The URL and the card an issue was published with never move: every
+    # share, feed entry and search result points at them.
+    page.update(canonical=meta["canonical"], og_image=meta["og_image"])
+    return render_page(issue["parts"], page)
+
+
+def rerender_one(fname, posts_dir=POSTS_DIR, issues_dir=ISSUES_DIR, reextract=False):
+    """Render one issue. Runs in a worker: reads, never writes. Returns
+    {"file", "old", "html" (None when unchanged), "issue", "extracted", "error"}."""
+    from related_issues import apply_block
+    from section_patch import find_block
+    from search_index import content_hash
+
+    out = {"file": fname, "old": 0, "html": None, "issue": None, "extracted": False, "error": None}
+    try:
+        with open(os.path.join(posts_dir, fname), encoding="utf-8") as f:
+            source = f.read()
+        out["old"] = len(source.encode("utf-8"))
+        digest = content_hash(source)
+
+        issue = None
+        if not reextract:
+            try:
+                with open(os.path.join(issues_dir, fname[:-5] + ".json"), encoding="utf-8") as f:
+                    issue = json.load(f)
+                if issue.get("h") != digest:
+                    issue = None
+            except (OSError, ValueError):
+                issue = None
+        if issue is None:
+            issue = dict(extract(source, fname), h=digest)
+            out["extracted"] = True
+
+        html = render_issue(issue)
+        span = find_block(source, "related-section")
+        if span:
+            html = apply_block(html, source[span[0]:span[1]]) or html
+        if html.count('class="faq-q"') < source.count('class="faq-q"'):
+            raise ValueError("re-render would drop FAQ entries")
+        if html != source:
+            out["html"] = html
+            issue = dict(issue, h=content_hash(html))
+        out["issue"] = issue
+    except Exception as e:
+        out["error"] = str(e) or type(e).__name__
+    return out
+
+
+def rerender_archive(names=None, posts_dir=POSTS_DIR, issues_dir=ISSUES_DIR,
+                     workers=None, dry_run=False, reextract=False):
+    """Re-render `names` (every published issue by default). Returns the
+    per-file results."""
+    from atomic_write import publish
+    from data_export import write_json
+    from section_patch import write_atomic
+
+    names = list(names or published(posts_dir))
+    workers = max(1, workers or os.cpu_count() or 1)
+    start = time.perf_counter()
+    args = ([posts_dir] * len(names), [issues_dir] * len(names), [reextract] * len(names))
+    if workers == 1 or len(names) < 2:
+        results = list(map(rerender_one, names, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(rerender_one, names, *args,
+                                    chunksize=max(1, len(names) // (workers * 4))))
+    elapsed = time.perf_counter() - start
+
+    changed = [r for r in results if r["html"] is not None]
+    failed = [r for r in results if r["error"]]
+    for r in failed:
+        print(f"  {r['file']} skipped ({r['error']})")
+    if not dry_run:
+        # One publish: pages and sidecars are swapped in together after the
+        # last of them is written, never half an archive.
+        with publish():
+            for r in results:
+                if r["error"]:
+                    continue
+                if r["html"] is not None:
+                    write_atomic(os.path.join(posts_dir, r["file"]), r["html"])
+                write_json(os.path.join(issues_dir, r["file"][:-5] + ".json"), r["issue"])
+
+    old = sum(r["old"] for r in changed)
+    new = sum(len(r["html"].encode("utf-8")) for r in changed)
+    extracted = sum(1 for r in results if r["extracted"])
+    print(f"  {len(names)} issue(s) rendered in {elapsed:.2f}s "
+          f"({len(names) / elapsed if elapsed else 0:.1f} files/s, {workers} worker(s)); "
+          f"{extracted} back-extracted, {len(results) - extracted - len(failed)} from sidecars.")
+    print(f"  {'Would change' if dry_run else 'Changed'} {len(changed)} file(s): "
+          f"{old:,} -> {new:,} bytes ({new - old:+,}); "
+          f"{len(results) - len(changed) - len(failed)} unchanged, {len(failed)} skipped.")
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("posts", nargs="*", help="Post filenames (default: every published issue)")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Processes to render on (default: one per CPU)")
+    ap.add_argument("--reextract", action="store_true",
+                    help="Ignore the sidecars and extract every issue from its page again")
+    ap.add_argument("--dry-run", action="store_true",
+                    help="Report what would change; write nothing")
+    args = ap.parse_args()
+
+    results = rerender_archive([os.path.basename(p) for p in args.posts] or None,
+                               workers=args.workers, dry_run=args.dry_run,
+                               reextract=args.reextract)
+    return 1 if any(r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+run_status.py
+Writes blog/staging/status.json: what the pipeline last did to the staging
+area, in a few hundred bytes, for the review screen to poll.
+
+After a Regenerate or a Redraft the review screen used to find out that the
+run had finished by downloading the whole of preview.html every 15 seconds
+(later its payload, preview.json, which still carries the Desk draft and the
+survey questions) and comparing stamps, and on load it fetched usage.json for
+the quota counters as well. On a phone that is most of the page's traffic,
+spent asking "anything new?" and being told "no".
+
+status.json answers that question and nothing else:
+
+  run_id, workflow   the GitHub Actions run that wrote it
+  stage              ready      a draft is staged and preview.html shows it
+                     failed     the run failed; whatever was staged before
+                                is still there (see "draft")
+                     published  approve-blog.yml promoted the draft
+                     discarded  discard-blog.yml deleted it
+  started, updated   UTC; started is the run's first step (RUN_STARTED, set
+                     by each workflow), updated is when this was written
+  draft              {"file", "run_id", "generated"} of the staged draft,
+                     from preview.json, or null when nothing is pending
+  quota              today's usage.json bucket plus its "day"
+
+The page compares "draft" with its own payload and reloads only when they
+differ, so a failed run never triggers a reload and a finished one always
+does. GitHub Pages answers a matching If-None-Match with a bodiless 304,
+which is what most polls now cost.
+
+Every workflow that touches blog/staging/ writes it before committing. The
+preview page's own generator writes the "ready" status in the same publish()
+as the page, so the two cannot disagree. Never raises: a status file that
+failed to write must not fail the run it describes.
+
+    python3 scripts/run_status.py failed
+    python3 scripts/run_status.py published --run-id 123456
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+
+ROOT = os.path.dirname(_here)
+STATUS_PATH = os.path.join("blog", "staging", "status.json")
+STAGES = ("ready", "failed", "published", "discarded")
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _staged_draft(root):
+    """{"file", "run_id", "generated"} of the draft preview.html shows, or
+    None if there is no payload or its draft file is gone."""
+    from atomic_write import exists, read_text
+    staging = os.path.join(root, "blog", "staging")
+    try:
+        payload = json.loads(read_text(os.path.join(staging, "preview.json")))
+    except (OSError, ValueError):
+        return None
+    name = payload.get("filename") or ""
+    if not name or not exists(os.path.join(staging, name)):
+        return None
+    return {"file": name, "run_id": str(payload.get("run_id") or ""),
+            "generated": payload.get("generated") or ""}
+
+
+def _quota(root):
+    from utils import USAGE_LEDGER_PATH, _read_ledger, quota_day
+    day = quota_day()
+    entry = _read_ledger(os.path.join(root, USAGE_LEDGER_PATH)).get(day) or {}
+    return {"day": day,
+            "requests": int(entry.get("requests", 0)),
+            "tokens": int(entry.get("tokens", 0)),
+            "models": entry.get("models") or {}}
+
+
+def build_status(stage, run_id=None, workflow=None, root=ROOT):
+    if stage not in STAGES:
+        raise ValueError(f"unknown stage {stage!r}; expected one of {', '.join(STAGES)}")
+    updated = _now()
+    return {
+        "run_id": str(run_id or os.environ.get("GITHUB_RUN_ID") or "0"),
+        "workflow": workflow or os.environ.get("GITHUB_WORKFLOW") or "",
+        "stage": stage,
+        "started": os.environ.get("RUN_STARTED") or updated,
+        "updated": updated,
+        "draft": _staged_draft(root),
+        "quota": _quota(root),
+    }
+
+
+def write_status(stage, run_id=None, workflow=None, root=ROOT):
+    """Write status.json for `stage`. Returns the status written, or None if
+    it could not be — with a note, never an exception."""
+    try:
+        from atomic_write import write_text
+        status = build_status(stage, run_id, workflow, root)
+        write_text(os.path.join(root, STATUS_PATH),
+                   json.dumps(status, separators=(",", ":"), sort_keys=True) + "\n")
+        return status
+    except Exception as exc:
+        print(f"  NOTE: status.json not written ({exc}). The review screen will "
+              f"fall back to its slower checks.")
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("stage", choices=STAGES)
+    parser.add_argument("--run-id", default=None,
+                        help="GitHub Actions run ID (default: $GITHUB_RUN_ID)")
+    parser.add_argument("--workflow", default=None,
+                        help="Workflow name (default: $GITHUB_WORKFLOW)")
+    args = parser.parse_args()
+
+    status = write_status(args.stage, args.run_id, args.workflow)
+    if status:
+        draft = status["draft"]["file"] if status["draft"] else "nothing pending"
+        print(f"status.json: {status['stage']} (run {status['run_id']}; {draft}; "
+              f"{status['quota']['requests']} request(s) today)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,406 @@
+"""
+search_index.py
+Builds the archive's full-text search: an inverted index in blog/search/ and
+the static page that queries it, blog/search.html.
+
+Why prebuilt and sharded: the site is static, so search has to run in the
+browser, and the obvious version — one JSON file of every issue's text — is a
+download that grows by ~40 KB a month and is paid in full by every visitor who
+types one word. Instead the index is split three ways, so what a query loads
+depends on the query, not on the size of the archive:
+
+  meta.json          doc count, doc-block size, and the list of shards that
+                     exist — the only file every search fetches;
+  t-<xy>.json        postings for every term starting with the two characters
+                     <xy>. A one-word query loads one shard; the last word is
+                     also prefix-matched from that same shard, so search works
+                     as you type;
+  docs-<n>.json      title, date, excerpt and URL for doc ids n*256 .. n*256+255,
+                     fetched only for the ids that made the first page of results.
+
+Postings are [gap, weight, gap, weight, ...] with doc ids ascending and stored
+as the gap from the previous id — small integers, which is most of the size
+saving over {"doc": weight} objects.
+
+What is indexed: the title and the four sections a reader searches for —
+developments, the Canadian spotlight, From Robert's Desk, and the actions —
+weighted in that spirit (a word in the title or a development says more about
+an issue than the same word in passing in the Desk). The pre-2026 template has
+none of those blocks, so its section text is indexed as a whole, minus the
+"earlier insights" links that would otherwise make every issue match the titles
+of its neighbours (the same goes for related_issues.py's block).
+
+Incremental: update_blog_index() hands over the post list it already walked.
+Doc ids are stable — an issue keeps its id for life, a new one takes the next —
+and each doc records a hash of its content (content_hash), so a publish
+re-reads only the issue that changed and rewrites only the shards whose
+postings moved.
+
+    python3 scripts/search_index.py          # rebuild from blog/posts
+"""
+
+import hashlib
+import html as H
+import json
+import os
+import re
+import unicodedata
+
+from bs4 import BeautifulSoup
+
+from atomic_write import exists, getsize, listdir, read_text, remove, write_text
+from utils import BRAND
+
+BASE = "https://www.imetrobert.com"
+OUT_DIR = "blog/search"
+PAGE = "blog/search.html"
+DOC_BLOCK = 256
+
+# (field, CSS selector, weight). Selectors are the renderer's own class names.
+FIELDS = (
+    ("title",        "h1",            4),
+    ("developments", ".dev-card",     2),
+    ("spotlight",    ".spot-bullet",  2),
+    ("desk",         ".roberts-body", 1),
+    ("actions",      ".action-card",  1),
+)
+
+# Words too common to tell one issue from another. Kept short on purpose: in
+# this archive "ai" and "canadian" are in every issue too, but they are also
+# exactly what a reader types, and idf already weights them to almost nothing.
+_STOPWORDS = frozenset("""
+a an and are as at be been but by can for from had has have how if in into is
+it its more not of on or our so than that the their them there these they this
+to was we were what when which who will with would you your
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_COMBINING_RE = re.compile(r"[\u0300-\u036f]")
+
+
+def tokens(text):
+    """Lower-case ASCII words, accents folded ("Québec" -> "quebec").
+
+    The search page runs the same steps in JavaScript — NFKD, strip combining
+    marks, lower-case, [a-z0-9]+ — so a query and the index agree on what a
+    word is. Change one and the other must change with it.
+    """
+    folded = _COMBINING_RE.sub("", unicodedata.normalize("NFKD", text or "")).lower()
+    return [t for t in _TOKEN_RE.findall(folded)
+            if 1 < len(t) <= 30 and t not in _STOPWORDS]
+
+
+def _text(node):
+    return re.sub(r"\s+", " ", node.get_text(" ")).strip()
+
+
+def doc_terms(source):
+    """{term: weight} for one issue's HTML."""
+    soup = BeautifulSoup(source, "html.parser")
+    for junk in soup.select("script, style, .earlier-insights, .related-section"):
+        junk.decompose()
+
+    weights = {}
+
+    def add(text, weight):
+        for t in tokens(text):
+            weights[t] = weights.get(t, 0) + weight
+
+    found_body = False
+    for field, selector, weight in FIELDS:
+        nodes = soup.select(selector)
+        if field != "title" and nodes:
+            found_body = True
+        for node in nodes:
+            add(_text(node), weight)
+
+    if not found_body:
+        # Older template: headed sections of bullet lists, no per-section classes.
+        for node in soup.select(".section, .intro"):
+            add(_text(node), 1)
+    return weights
+
+
+def content_hash(source):
+    """Hash of an issue's HTML WITHOUT its related-issues block. That block is
+    rewritten whenever a neighbour changes (related_issues.py) and says nothing
+    about the issue itself, so it must not make the issue look edited."""
+    from section_patch import find_block
+    span = find_block(source, "related-section")
+    if span:
+        source = source[:span[0]] + source[span[1]:]
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+
+
+def _shard_key(term):
+    return term[:2]
+
+
+def _read_json(path, default):
+    try:
+        return json.loads(read_text(path))
+    except Exception:
+        return default
+
+
+def _write_if_changed(path, data):
+    """Write only when the bytes differ, so an unchanged shard keeps its git
+    history and its browser cache entry. Returns True if written."""
+    return write_text(path, json.dumps(data, ensure_ascii=False, separators=(",", ":"),
+                                       sort_keys=True))
+
+
+def _load_index(out_dir):
+    """(docs by id, postings {term: {doc id: weight}}) from what is on disk."""
+    meta = _read_json(os.path.join(out_dir, "meta.json"), {})
+    docs = {}
+    for block in range(meta.get("blocks", 0)):
+        for offset, doc in enumerate(_read_json(os.path.join(out_dir, f"docs-{block}.json"), [])):
+            if doc:
+                docs[block * DOC_BLOCK + offset] = doc
+
+    postings = {}
+    for key in meta.get("shards", []):
+        for term, flat in _read_json(os.path.join(out_dir, f"t-{key}.json"), {}).items():
+            doc, row = 0, {}
+            for i in range(0, len(flat) - 1, 2):
+                doc += flat[i]
+                row[doc] = flat[i + 1]
+            postings[term] = row
+    return docs, postings
+
+
+def build_search_index(posts, posts_dir="blog/posts", out_dir=OUT_DIR):
+    """Bring blog/search/ up to date with `posts` (update_blog_index's list).
+    Returns (docs indexed, docs re-read, files written)."""
+    os.makedirs(out_dir, exist_ok=True)
+    docs, postings = _load_index(out_dir)
+    by_file = {d["f"]: i for i, d in docs.items()}
+    next_id = max(_read_json(os.path.join(out_dir, "meta.json"), {}).get("next", 0),
+                  max(docs, default=-1) + 1)
+
+    wanted, reread = set(), 0
+    for post in posts:
+        fname = post.get("canonical_filename") or post["filename"]
+        path = os.path.join(posts_dir, fname)
+        if fname == "latest.html" or not exists(path):
+            continue
+        wanted.add(fname)
+        source = read_text(path)
+        digest = content_hash(source)
+        doc_id = by_file.get(fname)
+        if doc_id is not None and docs[doc_id].get("h") == digest:
+            continue
+
+        if doc_id is None:
+            doc_id, next_id = next_id, next_id + 1
+        else:
+            for row in postings.values():
+                row.pop(doc_id, None)
+        for term, weight in doc_terms(source).items():
+            postings.setdefault(term, {})[doc_id] = weight
+        docs[doc_id] = {"f": fname, "t": post["title"], "d": post["date"],
+                        "x": post.get("excerpt", ""), "h": digest}
+        reread += 1
+
+    # Issues that left the archive (an issue turned into a redirect stub, a
+    # deleted draft) drop out; their ids are not reused.
+    for fname, doc_id in by_file.items():
+        if fname not in wanted:
+            docs.pop(doc_id, None)
+            for row in postings.values():
+                row.pop(doc_id, None)
+
+    shards = {}
+    for term in sorted(postings):
+        row = postings[term]
+        if not row:
+            continue
+        flat, prev = [], 0
+        for doc_id in sorted(row):
+            flat += [doc_id - prev, row[doc_id]]
+            prev = doc_id
+        shards.setdefault(_shard_key(term), {})[term] = flat
+
+    written = 0
+    for key, terms in shards.items():
+        written += _write_if_changed(os.path.join(out_dir, f"t-{key}.json"), terms)
+    blocks = (max(docs) // DOC_BLOCK + 1) if docs else 0
+    for block in range(blocks):
+        rows = [docs.get(i) for i in range(block * DOC_BLOCK, (block + 1) * DOC_BLOCK)]
+        while rows and rows[-1] is None:
+            rows.pop()
+        written += _write_if_changed(os.path.join(out_dir, f"docs-{block}.json"), rows)
+    for name in listdir(out_dir):
+        stale = (name.startswith("t-") and name[2:-5] not in shards) or \
+                (name.startswith("docs-") and name[5:-5].isdigit() and int(name[5:-5]) >= blocks)
+        if stale:
+            written += remove(os.path.join(out_dir, name))
+
+    written += _write_if_changed(os.path.join(out_dir, "meta.json"), {
+        "docs": len(docs), "block": DOC_BLOCK, "blocks": blocks,
+        "next": next_id, "shards": sorted(shards),
+    })
+    return len(docs), reread, written
+
+
+def build_page():
+    return f"""<!DOCTYPE html>
+<html lang="en-CA">
+<head>
+<meta charset="utf-8"/>
+<meta content="width=device-width, initial-scale=1.0" name="viewport"/>
+<link rel="icon" type="image/svg+xml" href="/favicon.svg">
+<link rel="apple-touch-icon" href="/apple-touch-icon.png">
+<title>Search the archive | {H.escape(BRAND)}</title>
+<meta name="description" content="Search every issue of {H.escape(BRAND)} by company, topic or phrase.">
+<meta name="robots" content="noindex, follow">
+<link rel="canonical" href="{BASE}/blog/search.html">
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
+<style>
+:root {{ --blue:#2563eb; --cyan:#06b6d4; --navy:#0f172a; --gray:#475569; --gray-light:#94a3b8; --surface:#f8fafc; --border:#e2e8f0; --white:#fff; }}
+*,*::before,*::after {{ margin:0; padding:0; box-sizing:border-box; }}
+body {{ font-family:'Inter',-apple-system,BlinkMacSystemFont,sans-serif; background:linear-gradient(160deg,#f0f4ff 0%,#e8eef8 100%); color:var(--navy); line-height:1.6; -webkit-font-smoothing:antialiased; }}
+.nav-bar {{ background:var(--white); padding:0.875rem 0; box-shadow:0 1px 3px rgb(0 0 0/0.08); border-bottom:1px solid var(--border); }}
+.nav-content {{ max-width:900px; margin:0 auto; padding:0 1.5rem; display:flex; align-items:center; gap:0.6rem; }}
+.nav-link {{ color:var(--white); text-decoration:none; font-weight:600; padding:0.4rem 1rem; font-size:0.8rem; border-radius:20px; background:linear-gradient(135deg,var(--blue),var(--cyan)); }}
+.container {{ max-width:900px; margin:0 auto; padding:2.5rem 1.5rem 5rem; }}
+.card {{ background:var(--white); border-radius:20px; box-shadow:0 8px 32px rgb(0 0 0/0.10); border:1px solid rgba(226,232,240,0.6); padding:2rem; }}
+h1 {{ font-size:clamp(1.4rem,4vw,1.9rem); font-weight:800; letter-spacing:-0.02em; margin-bottom:1rem; }}
+#q {{ width:100%; font:inherit; font-size:1rem; padding:0.8rem 1rem; border:1px solid var(--border); border-radius:12px; background:var(--surface); }}
+#q:focus {{ outline:2px solid var(--blue); outline-offset:1px; }}
+#status {{ font-size:0.78rem; color:var(--gray-light); margin:0.75rem 0 1.25rem; min-height:1.2em; }}
+.hit {{ display:block; padding:1rem 1.25rem; margin-bottom:0.75rem; background:var(--surface); border:1px solid var(--border); border-left:3px solid var(--blue); border-radius:12px; text-decoration:none; color:inherit; }}
+.hit:hover {{ border-left-color:var(--cyan); }}
+.hit-title {{ font-weight:700; color:var(--navy); }}
+.hit-date {{ font-size:0.75rem; color:var(--gray-light); font-weight:600; margin:0.15rem 0 0.4rem; }}
+.hit-excerpt {{ font-size:0.86rem; color:var(--gray); line-height:1.65; }}
+@media (max-width:640px) {{ .container {{ padding:1.5rem 1rem 3rem; }} .card {{ padding:1.25rem; }} }}
+</style>
+</head>
+<body>
+<nav class="nav-bar"><div class="nav-content">
+  <a href="/blog/" class="nav-link">&#8592; Back to Blog</a>
+</div></nav>
+<div class="container"><div class="card">
+  <h1>Search the archive</h1>
+  <form role="search" onsubmit="return false;">
+    <label for="q" style="position:absolute;left:-9999px;">Search every issue</label>
+    <input id="q" type="search" autocomplete="off" placeholder="A company, a topic, a phrase — e.g. OSFI, Cohere, agents">
+  </form>
+  <div id="status" aria-live="polite"></div>
+  <div id="results"></div>
+  <noscript><p>Search needs JavaScript. Every issue is also listed on the <a href="/blog/">blog index</a>.</p></noscript>
+</div></div>
+<script>
+(function () {{
+  // Must tokenise exactly as search_index.tokens() does.
+  var STOP = new Set({json.dumps(sorted(_STOPWORDS))});
+  function tokens(s) {{
+    var m = (s || "").normalize("NFKD").replace(/[\\u0300-\\u036f]/g, "").toLowerCase().match(/[a-z0-9]+/g) || [];
+    return m.filter(function (t) {{ return t.length > 1 && t.length <= 30 && !STOP.has(t); }});
+  }}
+  var cache = {{}};
+  function load(path) {{
+    if (!cache[path]) {{
+      cache[path] = fetch("/blog/search/" + path).then(function (r) {{
+        if (!r.ok) throw new Error(r.status);
+        return r.json();
+      }});
+    }}
+    return cache[path];
+  }}
+  function esc(s) {{
+    return String(s).replace(/[&<>"]/g, function (c) {{
+      return {{"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}}[c];
+    }});
+  }}
+  var box = document.getElementById("q"), status = document.getElementById("status"),
+      out = document.getElementById("results"), seq = 0;
+
+  async function run(query) {{
+    var mine = ++seq, terms = tokens(query);
+    if (!terms.length) {{ out.innerHTML = ""; status.textContent = ""; return; }}
+    var meta = await load("meta.json"), shards = new Set(meta.shards), total = null;
+    for (var i = 0; i < terms.length; i++) {{
+      var term = terms[i], key = term.slice(0, 2), scores = {{}};
+      if (shards.has(key)) {{
+        var shard = await load("t-" + key + ".json");
+        // The last word is matched as a prefix, so results appear while typing.
+        var keys = i === terms.length - 1
+          ? Object.keys(shard).filter(function (k) {{ return k.indexOf(term) === 0; }}).slice(0, 50)
+          : (shard[term] ? [term] : []);
+        keys.forEach(function (k) {{
+          var flat = shard[k], idf = Math.log(1 + meta.docs / (flat.length / 2)), doc = 0;
+          for (var j = 0; j < flat.length; j += 2) {{
+            doc += flat[j];
+            scores[doc] = (scores[doc] || 0) + flat[j + 1] * idf;
+          }}
+        }});
+      }}
+      if (total === null) total = scores;
+      else {{
+        var both = {{}};
+        Object.keys(total).forEach(function (d) {{ if (d in scores) both[d] = total[d] + scores[d]; }});
+        total = both;
+      }}
+    }}
+    if (mine !== seq) return;
+    var ids = Object.keys(total).sort(function (a, b) {{ return total[b] - total[a]; }});
+    var top = ids.slice(0, 20);
+    var docs = await Promise.all(top.map(function (id) {{
+      return load("docs-" + Math.floor(id / meta.block) + ".json").then(function (rows) {{
+        return rows[id % meta.block];
+      }});
+    }}));
+    if (mine !== seq) return;
+    status.textContent = ids.length
+      ? ids.length + " issue" + (ids.length === 1 ? "" : "s") + (ids.length > top.length ? ", top " + top.length + " shown" : "")
+      : "No issue mentions that.";
+    out.innerHTML = docs.filter(Boolean).map(function (d) {{
+      return '<a class="hit" href="/blog/posts/' + encodeURIComponent(d.f) + '">' +
+        '<div class="hit-title">' + esc(d.t) + '</div>' +
+        '<div class="hit-date">' + esc(d.d) + '</div>' +
+        '<div class="hit-excerpt">' + esc(d.x) + '</div></a>';
+    }}).join("");
+  }}
+
+  var timer;
+  box.addEventListener("input", function () {{
+    clearTimeout(timer);
+    timer = setTimeout(function () {{
+      var url = new URL(location.href);
+      if (box.value) url.searchParams.set("q", box.value); else url.searchParams.delete("q");
+      history.replaceState(null, "", url);
+      run(box.value).catch(function () {{ status.textContent = "Search is unavailable right now."; }});
+    }}, 150);
+  }});
+  var initial = new URLSearchParams(location.search).get("q");
+  if (initial) {{ box.value = initial; box.dispatchEvent(new Event("input")); }}
+  box.focus();
+}})();
+</script>
+</body>
+</html>"""
+
+
+def write_search_index(posts, posts_dir="blog/posts"):
+    total, reread, written = build_search_index(posts, posts_dir)
+    write_text(PAGE, build_page())
+    names = listdir(OUT_DIR)
+    size = sum(getsize(os.path.join(OUT_DIR, n)) for n in names)
+    print(f"Search index updated ({total} issues, {reread} re-read, "
+          f"{written} file(s) written, {size / 1024:.0f} KB across "
+          f"{len(names)} files).")
+    return total
+
+
+if __name__ == "__main__":
+    from blog_index import extract_post_info
+    from post_registry import published
+    found = []
+    for name in published():
+        info = extract_post_info(os.path.join("blog/posts", name))
+        if info:
+            found.append(info)
+    write_search_index(found)
@@ -0,0 +1,228 @@
+"""
+section_diff.py
+What changed between the staged draft and the one before it, section by
+section, for the review screen.
+
+A Regenerate replaces the whole staging file, and a Redraft rewrites sections
+in place. Either way the review screen then showed the new issue and nothing
+else, so finding out what the run had actually changed meant re-reading about
+2,500 words on a phone against a memory of the last version. Often the change
+could not be found, and the reviewer regenerated again to be safe. That is a
+full Gemini call, and a day's quota, spent because a difference was invisible.
+
+Each time generate-preview-page.py builds the screen it parses the staged
+issue into its sections (section_patch.index, the same span index the
+patchers use) and keeps their plain text in blog/staging/sections.json. The
+next build diffs the new draft against that snapshot:
+
+  - on the TEXT, not the markup, so a template change or a re-ordered class
+    attribute is not a change to the reader
+  - word by word, with difflib's SequenceMatcher (autojunk off: with it on,
+    every "the" and "AI" in a long section counts as junk and the matcher
+    gives up on the alignment)
+  - per section, matched by what the section is, so a section that moved is
+    compared with itself
+
+Changed sections are shown open, with deletions struck through and
+insertions marked, and long unchanged runs between edits folded to a count.
+Unchanged sections are listed under one collapsed heading. The FAQ is left
+out: it is assembled from the other sections, so it changes whenever they do
+and would only show each edit twice.
+
+The snapshot also keeps the sections it was itself compared against, so
+building the screen again for the same draft (a re-run workflow) shows the
+same changes rather than an empty diff. approve-blog.yml and discard-blog.yml
+remove it with the draft, so next month's first draft is not compared with
+last month's issue.
+"""
+
+import difflib
+import json
+import os
+import re
+from html import escape as escape_html, unescape
+
+SNAPSHOT_PATH = os.path.join("blog", "staging", "sections.json")
+
+# Section class -> (key, label), in the order renderer.render_page lays them
+# out. Key AI Developments has no class of its own; it is the .section that
+# holds the .dev-grid (see sections()).
+_SECTIONS = (
+    ("intro-section",    "intro",       "Introduction"),
+    ("summary-section",  "summary",     "Executive Summary"),
+    ("desk-section",     "desk",        "From Robert's Desk"),
+    ("canada-section",   "spotlight",   "Canadian Spotlight"),
+    ("actions-section",  "actions",     "Strategic Actions"),
+    ("adoption-section", "adoption",    "Adoption Snapshot"),
+    ("pred-section",     "predictions", "Looking Ahead"),
+    ("question-section", "question",    "One Question"),
+)
+_DEVELOPMENTS = ("developments", "Key AI Developments")
+
+# Words of unchanged text kept either side of an edit before the rest of the
+# run is folded away.
+CONTEXT = 8
+
+_BREAK = re.compile(r"<br\s*/?>|</(?:p|li|div|h[1-6]|blockquote)\s*>", re.I)
+_RAW = re.compile(r"<(script|style)\b.*?</\1\s*>", re.S | re.I)
+_TOKEN = re.compile(r"\n|[^\s]+")
+
+
+def _text(fragment):
+    """A section's words, one line per paragraph, list item or card."""
+    fragment = _BREAK.sub("\n", _RAW.sub(" ", fragment))
+    lines = (" ".join(unescape(re.sub(r"<[^>]+>", " ", line)).split())
+             for line in fragment.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def sections(html):
+    """[{"key", "label", "text"}] for each section of a rendered issue, in
+    page order."""
+    from section_patch import index
+    blocks = index(html)["blocks"]
+    found = {}
+    for cls, key, label in _SECTIONS:
+        for span in blocks.get(cls, [])[:1]:
+            found[span] = (key, label)
+    grids = blocks.get("dev-grid", [])
+    for span in blocks.get("section", []):
+        if span not in found and any(span[0] < g[0] and g[1] <= span[1] for g in grids):
+            found[span] = _DEVELOPMENTS
+            break
+    return [{"key": key, "label": label, "text": _text(html[start:end])}
+            for (start, end), (key, label) in sorted(found.items())]
+
+
+def read_sections(path):
+    """sections() of the file at `path`, or [] if it cannot be read."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return sections(f.read())
+    except OSError:
+        return []
+
+
+def load_snapshot(root="."):
+    """The snapshot the last build left, or None."""
+    from atomic_write import read_text
+    try:
+        data = json.loads(read_text(os.path.join(root, SNAPSHOT_PATH)))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def baseline(snapshot, current):
+    """The sections to compare `current` with: the snapshot's own, unless
+    they are `current` exactly (the same draft built again), in which case
+    whatever that build was compared with."""
+    if not snapshot:
+        return None
+    if snapshot.get("sections") == current:
+        return snapshot.get("previous")
+    return snapshot.get("sections")
+
+
+def save_snapshot(filename, run_id, current, previous, root="."):
+    from atomic_write import write_text
+    write_text(os.path.join(root, SNAPSHOT_PATH),
+               json.dumps({"file": filename, "run_id": str(run_id),
+                           "sections": current, "previous": previous},
+                          ensure_ascii=False, indent=1) + "\n")
+
+
+def _words(tokens):
+    return " ".join("<br>" if t == "\n" else escape_html(t, quote=False) for t in tokens)
+
+
+def _count(tokens):
+    return sum(1 for t in tokens if t != "\n")
+
+
+def _markup(a, b):
+    """(html, words added, words removed) for the word diff of a into b."""
+    ops = difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+    out, added, removed = [], 0, 0
+    for n, (tag, i1, i2, j1, j2) in enumerate(ops):
+        if tag == "equal":
+            run = a[i1:i2]
+            head = run[:CONTEXT] if n else []
+            tail = run[-CONTEXT:] if n < len(ops) - 1 else []
+            folded = _count(run) - _count(head) - _count(tail)
+            if folded > 3:
+                out += [_words(head),
+                        f'<span class="diff-skip">&hellip; {folded} unchanged words &hellip;</span>',
+                        _words(tail)]
+            else:
+                out.append(_words(run))
+            continue
+        if i2 > i1:
+            out.append(f"<del>{_words(a[i1:i2])}</del>")
+            removed += _count(a[i1:i2])
+        if j2 > j1:
+            out.append(f"<ins>{_words(b[j1:j2])}</ins>")
+            added += _count(b[j1:j2])
+    return " ".join(p for p in out if p), added, removed
+
+
+def _entry(section, state, a, b):
+    html, added, removed = ("", 0, 0) if state == "unchanged" else _markup(a, b)
+    return {"key": section["key"], "label": section["label"], "state": state,
+            "html": html, "added": added, "removed": removed}
+
+
+def diff(previous, current):
+    """[{"key", "label", "state", "html", "added", "removed"}], one per
+    section of either draft: current order first, then any section only the
+    previous draft had. state is changed, unchanged, added or removed."""
+    before = {s["key"]: s for s in previous or []}
+    out = []
+    for s in current:
+        b = _TOKEN.findall(s["text"])
+        old = before.pop(s["key"], None)
+        if old is None:
+            out.append(_entry(s, "added", [], b))
+            continue
+        a = _TOKEN.findall(old["text"])
+        out.append(_entry(s, "unchanged" if a == b else "changed", a, b))
+    for s in before.values():
+        out.append(_entry(s, "removed", _TOKEN.findall(s["text"]), []))
+    return out
+
+
+def render(changes):
+    """The review screen's "What changed" panel for diff() output, or "" when
+    there is nothing to compare against."""
+    if not changes:
+        return ""
+    edited = [c for c in changes if c["state"] != "unchanged"]
+    same = [c for c in changes if c["state"] == "unchanged"]
+    if not edited:
+        hint = "Every section reads exactly as it did in the previous draft."
+    else:
+        hint = (f"{len(edited)} of {len(changes)} sections differ from the previous draft. "
+                f"Struck-through words were removed, highlighted words are new.")
+    parts = [
+        '<details class="sidebar-section diff-block sec-changes" open>',
+        '<summary><h3 style="display:inline;">What changed</h3></summary>',
+        f'<p class="take-hint">{hint}</p>',
+    ]
+    for c in edited:
+        counts = {"added": "new section", "removed": "section dropped"}.get(
+            c["state"], f'+{c["added"]} &minus;{c["removed"]} words')
+        parts.append(
+            f'<details class="diff-section diff-{c["state"]}" open>'
+            f'<summary>{escape_html(c["label"], quote=False)}'
+            f'<span class="diff-count">{counts}</span></summary>'
+            f'<div class="diff-body">{c["html"]}</div></details>'
+        )
+    if same:
+        names = ", ".join(escape_html(c["label"], quote=False) for c in same)
+        parts.append(
+            f'<details class="diff-section diff-unchanged">'
+            f'<summary>{len(same)} unchanged<span class="diff-count">&nbsp;</span></summary>'
+            f'<div class="diff-body">{names}</div></details>'
+        )
+    parts.append("</details>")
+    return "".join(parts)
@@ -0,0 +1,170 @@
+"""
+section_patch.py
+Finds the sections of a rendered issue and patches them in place. This is the
+one place where a page gets cut apart: redraft_section.py, inject_take.py,
+related_issues.py and rerender_archive.py all go through here.
+
+There used to be three separate surgeries on the same file. find_block counted
+div tokens from a regex. update_faq rewrote the visible answer with a second
+regex and the FAQPage JSON-LD with a third. inject_take.BODY_RE had its own
+pattern for the Desk. Each one re-scanned the whole page and rewrote it, and
+none of them knew the others existed. A redraft of the predictions could
+therefore leave the schema answering a question the page no longer answered,
+and nothing would notice.
+
+index(html) reads the page once, with one tokenizer, and returns:
+
+  blocks   {class: [(start, end), ...]} for every div that carries the class,
+           tags included, in document order
+  inner    {class: [(start, end), ...]} the same divs' contents
+  faq      [{"question", "q", "a"}] for the visible FAQ entries: the question
+           as text, and the spans of the question's and the answer's markup
+  schema   [{"question", "a"}] for the FAQPage JSON-LD entries, where "a" is
+           the span of the answer's JSON string, quotes included
+  ld       [(start, end)] for every JSON-LD <script> element
+
+Scripts, styles and comments are skipped whole, so a "<div" inside a string in
+the share script can never unbalance the count.
+
+patch(html, edits) applies every (start, end, text) edit, all taken against the
+same index, in one join. Overlapping edits are an error, not a guess. save()
+writes the result atomically: temp file, fsync, rename. It refuses to write a
+page whose visible FAQ and FAQPage schema stopped agreeing. A page that already
+disagreed is written with a warning, since this edit did not cause that.
+"""
+
+import json
+import os
+import re
+from html import escape as escape_html, unescape
+from profiling import span
+
+_TOKEN = re.compile(
+    r'<!--.*?-->'
+    r'|<(?P<raw>script|style)\b(?P<attrs>[^>]*)>(?P<body>.*?)</(?P=raw)\s*>'
+    r'|<div\b(?P<div>[^>]*)>'
+    r'|</div\s*>'
+    r'|<h3 class="faq-q">(?P<q>.*?)</h3>\s*<p class="faq-a">(?P<a>.*?)</p>',
+    re.S | re.I,
+)
+_CLASS = re.compile(r'\bclass\s*=\s*"([^"]*)"', re.I)
+_JSON_STR = r'"(?:[^"\\]|\\.)*"'
+# The shape renderer._build_faq_schema writes, one entry per question.
+_SCHEMA_ENTRY = re.compile(
+    r'\{"@type":"Question","name":(' + _JSON_STR + r'),'
+    r'"acceptedAnswer":\{"@type":"Answer","text":(' + _JSON_STR + r')\}\}'
+)
+
+
+def index(html):
+    """Every span the patchers need, from one pass over the page."""
+    blocks, inner, faq, schema, ld = {}, {}, [], [], []
+    stack = []                                   # (start, content start, classes)
+    for m in _TOKEN.finditer(html):
+        if m.group("raw"):
+            if m.group("raw").lower() == "script" and "ld+json" in m.group("attrs"):
+                ld.append(m.span())
+                body, offset = m.group("body"), m.start("body")
+                if '"FAQPage"' in body:
+                    for e in _SCHEMA_ENTRY.finditer(body):
+                        schema.append({"question": json.loads(e.group(1)),
+                                       "a": (offset + e.start(2), offset + e.end(2))})
+        elif m.group("div") is not None:
+            cls = _CLASS.search(m.group("div"))
+            stack.append((m.start(), m.end(), cls.group(1).split() if cls else []))
+        elif m.group("q") is not None:
+            faq.append({"question": _plain(m.group("q")),
+                        "q": m.span("q"), "a": m.span("a")})
+        elif m.group(0).startswith("</") and stack:
+            start, body_start, classes = stack.pop()
+            for c in classes:
+                blocks.setdefault(c, []).append((start, m.end()))
+                inner.setdefault(c, []).append((body_start, m.start()))
+    # Closed inner-first; callers want document order.
+    for spans in (*blocks.values(), *inner.values()):
+        spans.sort()
+    return {"blocks": blocks, "inner": inner, "faq": faq, "schema": schema, "ld": ld}
+
+
+def find_block(html, block_class, idx=None):
+    """(start, end) of the first div carrying `block_class`, tags included,
+    or None."""
+    spans = (idx or index(html))["blocks"].get(block_class)
+    return spans[0] if spans else None
+
+
+def outermost(spans):
+    """`spans` without any span that sits inside an earlier one."""
+    kept = []
+    for s in sorted(spans):
+        if not kept or s[0] >= kept[-1][1]:
+            kept.append(s)
+    return kept
+
+
+def patch(html, edits):
+    """Apply [(start, end, text)] edits, all against the same source, in one
+    join. Raises ValueError if two edits overlap."""
+    out, pos = [], 0
+    for start, end, text in sorted(edits, key=lambda e: (e[0], e[1])):
+        if start < pos:
+            raise ValueError(f"overlapping edits at {start}")
+        out += [html[pos:start], text]
+        pos = end
+    out.append(html[pos:])
+    return "".join(out)
+
+
+def faq_edits(idx, question, answer):
+    """Edits that set one FAQ answer in both places it lives: the visible
+    .faq-a and the FAQPage JSON-LD."""
+    if not answer:
+        return []
+    edits = [(*e["a"], escape_html(answer, quote=False))
+             for e in idx["faq"] if e["question"] == question]
+    edits += [(*e["a"], json.dumps(answer))
+              for e in idx["schema"] if e["question"] == question]
+    return edits
+
+
+def _plain(fragment):
+    return " ".join(unescape(re.sub(r"<[^>]+>", " ", fragment)).split())
+
+
+def faq_mismatches(html, idx=None):
+    """Ways the visible FAQ and the FAQPage schema disagree, as sentences.
+    Empty when they match question for question and answer for answer, or
+    when the page has neither."""
+    idx = idx or index(html)
+    visible = [(e["question"], _plain(html[e["a"][0]:e["a"][1]])) for e in idx["faq"]]
+    schema = [(e["question"], _plain(json.loads(html[e["a"][0]:e["a"][1]])))
+              for e in idx["schema"]]
+    if [q for q, _ in visible] != [q for q, _ in schema]:
+        return [f"{len(visible)} visible question(s) against {len(schema)} in the schema, "
+                f"or in a different order"]
+    return [f"answers differ for '{q}'"
+            for (q, a), (_, b) in zip(visible, schema) if a != b]
+
+
+def write_atomic(path, html):
+    """Write beside the target and rename over it, so a crash mid-write leaves
+    the old page rather than half of the new one. Staged like every other
+    write while a publish() is open (atomic_write.py)."""
+    from atomic_write import write_text
+    write_text(path, html)
+
+
+@span("section_patch.save")
+def save(path, before, after):
+    """Write `after` over `path`, as long as the edit has not made the FAQ
+    and its schema disagree. Returns True if the file was written."""
+    broken = faq_mismatches(after)
+    if broken:
+        if not faq_mismatches(before):
+            print(f"  The edit would put the FAQ and its FAQPage schema out of step "
+                  f"({'; '.join(broken)}). Leaving {os.path.basename(path)} unchanged.")
+            return False
+        print(f"  WARNING: the FAQ and its FAQPage schema already disagreed in "
+              f"{os.path.basename(path)} ({'; '.join(broken)}).")
+    write_atomic(path, after)
+    return True
@@ -10,7 +10,8 @@ and the quote has to name where it came from.
 
 Collection is off-site: GitHub Pages is static and cannot receive form posts, so
 responses are gathered with an external form and the tallies are recorded in
-data/survey.json.
+data/survey.json — typed in from the preview page (add_survey_wave.py) or
+counted from the form's CSV export (ingest_survey_csv.py).
 
 Two rules enforced here, both about not overclaiming:
   * the page is written only when a wave actually exists, so there is never a
@@ -22,15 +23,28 @@ Two rules enforced here, both about not overclaiming:
 
 import html as H
 import json
+import math
 import os
 from datetime import datetime
 
+from atomic_write import write_text
 from utils import BRAND
 
 BASE = "https://www.imetrobert.com"
 OUT = "blog/canadian-ai-pulse.html"
 CANONICAL = f"{BASE}/blog/canadian-ai-pulse.html"
 CONFIG = "data/survey.json"
+JSON_OUT = "blog/canadian-ai-pulse.json"
+
+# 95% intervals. Wilson rather than the normal approximation: at a readership
+# sample's size an option picked by 3 of 80 would otherwise get an interval
+# running below zero.
+Z = 1.96
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 BLUE, CYAN = "#2563eb", "#06b6d4"
 
@@ -47,10 +61,56 @@ def _pct(counts):
     return {k: round(v * 100 / total, 1) for k, v in counts.items()}
 
 
-def _bars(question, counts):
+def wilson(counts, total, z=Z):
+    """Wilson score intervals, in percent, for every count out of `total` —
+    one vectorised pass per question."""
+    if not total:
+        return [(0.0, 0.0) for _ in counts]
+    if np is not None:
+        k = np.asarray(counts, dtype=float)
+        p = k / total
+        denom = 1 + z * z / total
+        centre = (p + z * z / (2 * total)) / denom
+        half = z * np.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denom
+        lo = np.clip(centre - half, 0, 1) * 100
+        hi = np.clip(centre + half, 0, 1) * 100
+        return [(round(float(a), 1), round(float(b), 1)) for a, b in zip(lo, hi)]
+    out = []
+    denom = 1 + z * z / total
+    for k in counts:
+        p = k / total
+        centre = (p + z * z / (2 * total)) / denom
+        half = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denom
+        out.append((round(max(0.0, centre - half) * 100, 1),
+                    round(min(1.0, centre + half) * 100, 1)))
+    return out
+
+
+def intervals(counts):
+    """{option: [lo, hi]} for one question's counts, on the same denominator
+    as _pct — the respondents who answered it."""
+    opts = list(counts)
+    return {o: list(ci) for o, ci in zip(opts, wilson([counts[o] for o in opts],
+                                                         sum(counts.values())))}
+
+
+def _ci(wave, qid):
+    """The wave's stored intervals for a question. Waves recorded before the
+    intervals were stored get them computed from their counts."""
+    stored = (wave.get("ci") or {}).get(qid)
+    if stored:
+        return stored
+    counts = wave["results"].get(qid)
+    return intervals(counts) if counts else {}
+
+
+def _bars(question, counts, ci=None):
     """Inline SVG bar chart. No charting library: it would be a third-party
-    request on a page whose whole purpose is to be quotable and fast."""
+    request on a page whose whole purpose is to be quotable and fast.
+
+    `ci` ({option: [lo, hi]}) adds a 95% interval whisker to each bar."""
     pcts = _pct(counts)
+    ci = ci or {}
     opts = [o for o in question["options"] if o in counts]
     row_h, gap, label_w, chart_w = 30, 10, 250, 300
     height = len(opts) * (row_h + gap)
@@ -59,10 +119,21 @@ def _bars(question, counts):
         y = i * (row_h + gap)
         pct = pcts[opt]
         w = max(2, pct / 100 * chart_w)
+        end = w
+        whisker = ""
+        if opt in ci:
+            lo, hi = (label_w + v / 100 * chart_w for v in ci[opt])
+            end = max(w, hi - label_w)
+            whisker = (
+                f'<path d="M{lo:.1f} {y + 15}H{hi:.1f}M{lo:.1f} {y + 10}V{y + 20}'
+                f'M{hi:.1f} {y + 10}V{y + 20}" class="bar-ci">'
+                f'<title>95% interval {ci[opt][0]}–{ci[opt][1]}%</title></path>'
+            )
         rows += (
             f'<text x="0" y="{y + 20}" class="bar-label">{H.escape(opt)}</text>'
             f'<rect x="{label_w}" y="{y + 6}" width="{w:.1f}" height="18" rx="4" fill="url(#barGrad)"/>'
-            f'<text x="{label_w + w + 8:.1f}" y="{y + 20}" class="bar-value">{pct}%</text>'
+            f'{whisker}'
+            f'<text x="{label_w + end + 8:.1f}" y="{y + 20}" class="bar-value">{pct}%</text>'
         )
     return (
         f'<svg class="chart" viewBox="0 0 {label_w + chart_w + 60} {height}" '
@@ -101,8 +172,9 @@ def build_page(cfg, waves):
         charts += (
             f'<section class="q-block">'
             f'<h3 class="q-text">{H.escape(q["text"])}</h3>'
-            f'{_bars(q, counts)}'
-            f'<p class="q-note">n={n}. Percentages may not total 100 due to rounding.</p>'
+            f'{_bars(q, counts, _ci(latest, q["id"]))}'
+            f'<p class="q-note">n={n}. Whiskers show 95% intervals (Wilson). '
+            f'Percentages may not total 100 due to rounding.</p>'
             f'</section>'
         )
 
@@ -237,6 +309,7 @@ h2.sec::before {{ content:''; position:absolute; left:0; top:0.15rem; bottom:0.1
 .chart {{ width:100%; height:auto; overflow:visible; }}
 .bar-label {{ font-size:13px; fill:#1e293b; }}
 .bar-value {{ font-size:13px; font-weight:700; fill:var(--blue); }}
+.bar-ci {{ stroke:#1e293b; stroke-width:1.5; fill:none; opacity:.55; }}
 .q-note {{ font-size:0.72rem; color:var(--gray-light); margin-top:0.5rem; }}
 .table-wrap {{ overflow-x:auto; }}
 table.trend {{ border-collapse:collapse; width:100%; font-size:0.85rem; }}
@@ -270,7 +343,8 @@ table.trend th {{ font-size:0.72rem; text-transform:uppercase; letter-spacing:0.
   <h2 class="sec">Results</h2>
   {charts}
   {trend}
-  <div class="cite"><h3>Cite this</h3><code>{H.escape(cite)}</code></div>
+  <div class="cite"><h3>Cite this</h3><code>{H.escape(cite)}</code>
+  <p class="q-note">Every wave's counts are also available as <a href="/blog/canadian-ai-pulse.json">JSON</a>.</p></div>
   <h2 class="sec">Questions about this data</h2>
   {faq_html}
   <p class="updated">Last updated {generated}.</p>
@@ -279,6 +353,34 @@ table.trend th {{ font-size:0.72rem; text-transform:uppercase; letter-spacing:0.
 </html>"""
 
 
+def dataset(cfg, waves):
+    """The published results as plain data: every wave's counts and the same
+    rounded percentages the charts print, options in questionnaire order."""
+    out = []
+    for w in waves:
+        results = {}
+        for q in cfg["questions"]:
+            counts = w["results"].get(q["id"])
+            if not counts:
+                continue
+            pcts, ci = _pct(counts), _ci(w, q["id"])
+            results[q["id"]] = [{"option": o, "count": counts[o], "pct": pcts[o],
+                                 "ci95": ci.get(o)}
+                                for o in q["options"] if o in counts]
+        prod, _ = _headline(cfg, w)
+        out.append({"label": w.get("label", ""), "n": w["n"],
+                    "field_dates": w.get("field_dates", w.get("date", "")),
+                    "in_production_pct": prod, "results": results})
+    return {
+        "survey": cfg["survey_name"],
+        "audience": cfg.get("audience", ""),
+        "url": CANONICAL,
+        "questions": [{"id": q["id"], "text": q["text"], "options": q["options"]}
+                      for q in cfg["questions"]],
+        "waves": out,
+    }
+
+
 def write_survey_page():
     cfg = load()
     if not cfg:
@@ -288,9 +390,14 @@ def write_survey_page():
         print("Survey: no published waves yet; results page not written.")
         return None
 
-    with open(OUT, "w", encoding="utf-8") as f:
-        f.write(build_page(cfg, waves))
+    write_text(OUT, build_page(cfg, waves))
     print(f"Survey results page updated ({len(waves)} wave(s), latest n={waves[-1]['n']}).")
+    try:
+        from data_export import write_json
+        if write_json(JSON_OUT, dataset(cfg, waves)):
+            print(f"  {JSON_OUT} written")
+    except Exception as e:
+        print(f"  survey export skipped ({e})")
 
     try:
         from og_image import build_og_image
@@ -4,6 +4,7 @@ Shared helper functions used across the blog generation pipeline.
 """
 
 import re
+import threading
 import requests
 from datetime import datetime
 
@@ -126,8 +127,8 @@ def save_model_config(cfg, path=None):
         directory = os.path.dirname(path)
         if directory:
             os.makedirs(directory, exist_ok=True)
-        with open(path, "w") as fh:
-            json.dump(cfg, fh, indent=2, sort_keys=True)
+        from atomic_write import write_text
+        write_text(path, json.dumps(cfg, indent=2, sort_keys=True))
         return True
     except Exception as exc:
         print(f"  NOTE: could not write {path} ({exc}).")
@@ -253,34 +254,68 @@ def _read_ledger(path=None):
         return {}
 
 
+# The ledger is read-modify-write. One issue at a time never noticed, but a
+# backfill generates several months on threads, and two requests finishing
+# together would each read the same count and write back one increment between
+# them — undercounting exactly the quota a backfill is most likely to exhaust.
+_LEDGER_LOCK = threading.Lock()
+
+
 def record_gemini_request(model="", tokens=0, path=None):
     """Count one HTTP request against today's quota bucket.
 
     Never raises: a ledger write failing must not lose a generated issue.
     Keeps 60 days and drops the rest, so the file cannot grow without bound.
     """
+    with _LEDGER_LOCK:
+        return _record_gemini_request(model, tokens, path)
+
+
+def _record_gemini_request(model, tokens, path):
+    def bump(entry):
+        entry["requests"] = int(entry.get("requests", 0)) + 1
+        entry["tokens"] = int(entry.get("tokens", 0)) + int(tokens or 0)
+        if model:
+            entry.setdefault("models", {})
+            entry["models"][model] = int(entry["models"].get(model, 0)) + 1
+    return _update_ledger(bump, path, "the request ledger")
+
+
+def record_cache_event(event, cached_tokens=0, path=None):
+    """Count one context-cache outcome in today's bucket: 'hit' (an existing
+    cache served the call), 'miss' (one had to be created first) or
+    'unsupported' (the model or tier refused, and the call went uncached).
+
+    cached_tokens is usageMetadata.cachedContentTokenCount — the input tokens
+    the cache actually saved re-sending. Never raises.
+    """
+    def bump(entry):
+        cache = entry.setdefault("cache", {})
+        cache[event] = int(cache.get(event, 0)) + 1
+        cache["cached_tokens"] = int(cache.get("cached_tokens", 0)) + int(cached_tokens or 0)
+    with _LEDGER_LOCK:
+        return _update_ledger(bump, path, "the cache counts")
+
+
+def _update_ledger(bump, path, what):
     import json, os
     path = path or USAGE_LEDGER_PATH
     try:
         day = quota_day()
         data = _read_ledger(path)
         entry = data.get(day) or {"requests": 0, "tokens": 0, "models": {}}
-        entry["requests"] = int(entry.get("requests", 0)) + 1
-        entry["tokens"] = int(entry.get("tokens", 0)) + int(tokens or 0)
-        if model:
-            entry.setdefault("models", {})
-            entry["models"][model] = int(entry["models"].get(model, 0)) + 1
+        bump(entry)
         data[day] = entry
         for old in sorted(data)[:-60]:
             data.pop(old, None)
         directory = os.path.dirname(path)
         if directory:
             os.makedirs(directory, exist_ok=True)
-        with open(path, "w") as fh:
-            json.dump(data, fh, indent=2, sort_keys=True)
+        from atomic_write import write_text
+        write_text(path, json.dumps(data, indent=2, sort_keys=True))
         return entry
     except Exception as exc:
-        print(f"  NOTE: could not update the request ledger ({exc}). "
+        print(f"  NOTE: could not update {what} ({exc}). "
               f"Generation is unaffected.")
         return None
 
@@ -291,6 +326,142 @@ def requests_today(path=None):
     return int(entry.get("requests", 0)), int(entry.get("tokens", 0))
 
 
+def model_requests_today(model, path=None):
+    """Requests this pipeline has made to one model in the current quota day.
+
+    The daily limits are per model, so this — not requests_today() — is the
+    number to hold against load_model_config()["limits"][model].
+    """
+    entry = _read_ledger(path).get(quota_day()) or {}
+    return int((entry.get("models") or {}).get(model, 0))
+
+
+# ---------------------------------------------------------------------------
+# Prompt size, known BEFORE sending. Gemini reports promptTokenCount only after
+# the fact, so prompt growth went unnoticed until a run cost more or truncated.
+# There is no offline tokenizer for Gemini, so the estimate is characters
+# divided by a ratio — and the ratio is calibrated from the promptTokenCount
+# of real calls rather than assumed, because this prompt (long English prose,
+# many em dashes, quoted examples) does not tokenise like average text.
+#
+# Limits are per model and, like MODEL_DAILY_LIMITS, are defaults as of August
+# 2026: the context window, the output ceiling, and the free tier's tokens per
+# MINUTE — which is the one a ~9k-token prompt plus 8,192 output tokens can
+# actually approach when a backfill runs several months at once.
+# ---------------------------------------------------------------------------
+TOKEN_CALIBRATION_PATH = "blog/staging/token-calibration.json"
+_DEFAULT_CHARS_PER_TOKEN = 4.0
+
+MODEL_TOKEN_LIMITS = {
+    "gemini-2.5-flash":      {"input": 1048576, "output": 65536, "per_minute": 250000},
+    "gemini-2.5-flash-lite": {"input": 1048576, "output": 65536, "per_minute": 250000},
+    "gemini-2.0-flash":      {"input": 1048576, "output": 8192,  "per_minute": 1000000},
+}
+
+
+def chars_per_token(path=None):
+    """Calibrated characters per prompt token, and how many calls back it."""
+    import json
+    try:
+        with open(path or TOKEN_CALIBRATION_PATH) as fh:
+            samples = json.load(fh).get("samples") or []
+        chars = sum(int(c) for c, _t in samples)
+        tokens = sum(int(t) for _c, t in samples)
+        if chars and tokens:
+            return chars / tokens, len(samples)
+    except Exception:
+        pass
+    return _DEFAULT_CHARS_PER_TOKEN, 0
+
+
+def estimate_tokens(text, path=None):
+    ratio, _n = chars_per_token(path)
+    return int(len(text or "") / ratio) + 1
+
+
+def record_token_calibration(chars, prompt_tokens, path=None):
+    """Add one (prompt characters, reported promptTokenCount) pair. Keeps the
+    last 50, so the ratio follows the prompt as it changes. Never raises."""
+    import json, os
+    if not chars or not prompt_tokens:
+        return
+    path = path or TOKEN_CALIBRATION_PATH
+    with _LEDGER_LOCK:
+        try:
+            try:
+                with open(path) as fh:
+                    data = json.load(fh)
+            except Exception:
+                data = {}
+            samples = (data.get("samples") or []) + [[int(chars), int(prompt_tokens)]]
+            data["samples"] = samples[-50:]
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            from atomic_write import write_text
+            write_text(path, json.dumps(data, indent=2, sort_keys=True))
+        except Exception as exc:
+            print(f"  NOTE: could not update token calibration ({exc}).")
+
+
+# ---------------------------------------------------------------------------
+# Gemini context caches this pipeline has created, so the next workflow run —
+# a regenerate ten minutes after the monthly run, say — can find and reuse one
+# instead of uploading the same 30,000 characters of instructions again.
+# Lives beside the ledger in blog/staging/, which every workflow commits.
+#
+#   {"entries":     {key: {"name", "model", "expires"}},
+#    "unsupported": {model: quota day it refused}}
+#
+# "unsupported" exists because explicit caching is not on every tier: a model
+# that refused once today is not asked again until tomorrow, so a free-tier key
+# pays for one rejected request a day rather than one per call.
+# ---------------------------------------------------------------------------
+CONTEXT_CACHE_PATH = "blog/staging/gemini-cache.json"
+
+
+def _utc_stamp(seconds_from_now=0):
+    from datetime import timedelta, timezone
+    return (datetime.now(timezone.utc) + timedelta(seconds=seconds_from_now)
+            ).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def load_context_caches(path=None):
+    import json
+    try:
+        with open(path or CONTEXT_CACHE_PATH) as fh:
+            data = json.load(fh)
+        if isinstance(data, dict):
+            data.setdefault("entries", {})
+            data.setdefault("unsupported", {})
+            return data
+    except Exception:
+        pass
+    return {"entries": {}, "unsupported": {}}
+
+
+def update_context_caches(change, path=None):
+    """Read, apply change(data), and write back, under the ledger lock — a
+    backfill creates caches from several threads. Expired entries are dropped
+    on every write. Never raises."""
+    import json, os
+    path = path or CONTEXT_CACHE_PATH
+    with _LEDGER_LOCK:
+        try:
+            data = load_context_caches(path)
+            change(data)
+            now = _utc_stamp()
+            data["entries"] = {k: v for k, v in data["entries"].items()
+                               if v.get("expires", "") > now}
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            from atomic_write import write_text
+            write_text(path, json.dumps(data, indent=2, sort_keys=True))
+        except Exception as exc:
+            print(f"  NOTE: could not update the context cache registry ({exc}).")
+
+
 def clean_filename(title, max_len=70):
     """Slug for the post URL. Capped at a word boundary: topical headlines are
     longer than the old "AI Insights for August 2026" titles, and an uncapped
@@ -303,38 +474,58 @@ def clean_filename(title, max_len=70):
     return clean.strip('-')
 
 
-def clean_ai_content(content):
-    content = re.sub(r'\[\d+\]', '', content)
-    content = re.sub(r'\*\*(.*?)\*\*', r'\1', content)
-    content = re.sub(r'\*(.*?)\*', r'\1', content)
-    content = re.sub(r'^#{1,6}\s*', '', content, flags=re.MULTILINE)
-    content = re.sub(r'•\s*[-–—]\s*', '', content)
-    content = re.sub(r'[-–—]\s*•\s*', '', content)
-    content = re.sub(r'\nBusinesses\s*\n', '\n', content)
-    content = re.sub(r'^Businesses\s*$', '', content, flags=re.MULTILINE)
-    content = re.sub(r'##\s*', '', content)
-    content = re.sub(r'###\s*', '', content)
-    content = re.sub(r' +', ' ', content)
-    content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
-
-    meta_patterns = [
-        r'(?:^|\n)\s*(?:Correction|Note|Self-check|Self check|Clarification|Update|Revision)'
-        r'[:\s][^\n]{10,400}(?:\n[^\n]{0,300}){0,5}',
-        r'[^.\n]*\bI (?:will|have|am going to) (?:remove|replace|delete|correct|fix|update)'
-        r'[^.\n]*\.?',
-        r'[^.\n]*\b(?:listed|appears?|appeared|duplicated?|repeated?)\s+in\s+both\s+sections[^.\n]*\.?',
-        r'[^.\n]*and replace it with a (?:different|new|another)[^.\n]*\.?',
-        r'(?:^|\n)\s*(?:MANDATORY )?SELF-CHECK[^\n]*(?:\n[^\n]{0,200}){0,10}',
-        r'(?:^|\n)MANDATORY SELF-CHECK.*?(?=\n[A-Z]{4,}|\Z)',
-        r'(?:^|\n)List every news event.*?(?=\n[A-Z]{4,}|\Z)',
-        r'(?:^|\n)Then list every news event.*?(?=\n[A-Z]{4,}|\Z)',
-        r'(?:^|\n)Compare the two lists.*?(?=\n[A-Z]{4,}|\Z)',
-    ]
-    for pattern in meta_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.MULTILINE)
+_CLEANUP = [(re.compile(p, f), r) for p, r, f in (
+    (r'\[\d+\]', '', 0),
+    (r'\*\*(.*?)\*\*', r'\1', 0),
+    (r'\*(.*?)\*', r'\1', 0),
+    (r'^#{1,6}\s*', '', re.MULTILINE),
+    (r'•\s*[-–—]\s*', '', 0),
+    (r'[-–—]\s*•\s*', '', 0),
+    (r'\nBusinesses\s*\n', '\n', 0),
+    (r'^Businesses\s*$', '', re.MULTILINE),
+    (r'##\s*', '', 0),
+    (r'###\s*', '', 0),
+    (r' +', ' ', 0),
+    (r'\n\s*\n\s*\n+', '\n\n', 0),
+)]
+
+# Meta-commentary the model leaves in its own output, each with the phrase that
+# must be present for it to match at all. Three of these open with [^.\n]* so
+# they can take the whole sentence around the phrase, which makes them
+# quadratic in the sentence: tried at every offset, each attempt scans to the
+# next full stop. Across a text issue that is one pass, but the structured
+# mode cleans each of its hundred-odd fields separately, and these three were
+# most of its parse time. Searching for the phrase first is linear, and the
+# full pattern only runs on the rare field that has it.
+_META_PATTERNS = [(re.compile(p, re.IGNORECASE | re.MULTILINE),
+                   re.compile(t, re.IGNORECASE) if t else None) for p, t in (
+    (r'(?:^|\n)\s*(?:Correction|Note|Self-check|Self check|Clarification|Update|Revision)'
+     r'[:\s][^\n]{10,400}(?:\n[^\n]{0,300}){0,5}', None),
+    (r'[^.\n]*\bI (?:will|have|am going to) (?:remove|replace|delete|correct|fix|update)'
+     r'[^.\n]*\.?',
+     r'\bI (?:will|have|am going to) (?:remove|replace|delete|correct|fix|update)'),
+    (r'[^.\n]*\b(?:listed|appears?|appeared|duplicated?|repeated?)\s+in\s+both\s+sections[^.\n]*\.?',
+     r'\bin\s+both\s+sections'),
+    (r'[^.\n]*and replace it with a (?:different|new|another)[^.\n]*\.?',
+     r'and replace it with a (?:different|new|another)'),
+    (r'(?:^|\n)\s*(?:MANDATORY )?SELF-CHECK[^\n]*(?:\n[^\n]{0,200}){0,10}', None),
+    (r'(?:^|\n)MANDATORY SELF-CHECK.*?(?=\n[A-Z]{4,}|\Z)', None),
+    (r'(?:^|\n)List every news event.*?(?=\n[A-Z]{4,}|\Z)', None),
+    (r'(?:^|\n)Then list every news event.*?(?=\n[A-Z]{4,}|\Z)', None),
+    (r'(?:^|\n)Compare the two lists.*?(?=\n[A-Z]{4,}|\Z)', None),
+)]
+_SPACES = re.compile(r' +')
+_BLANK_LINES = re.compile(r'\n\s*\n\s*\n+')
 
-    content = re.sub(r' +', ' ', content)
-    content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
+
+def clean_ai_content(content):
+    for pattern, repl in _CLEANUP:
+        content = pattern.sub(repl, content)
+    for pattern, trigger in _META_PATTERNS:
+        if trigger is None or trigger.search(content):
+            content = pattern.sub('', content)
+    content = _SPACES.sub(' ', content)
+    content = _BLANK_LINES.sub('\n\n', content)
     return content.strip()
 
 
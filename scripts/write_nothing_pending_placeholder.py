@@ -7,10 +7,13 @@ they were operating on is gone and nothing is left to review — otherwise
 that URL would show a bare 404 until the next draft is generated.
 
 generate-preview-page.py unconditionally overwrites this file the next
-time a real draft is generated, so this placeholder is self-clearing.
+time a real draft is generated, so this placeholder is self-clearing. The
+draft's payload, preview.json, goes with the page it described, so
+run_status.py reports nothing pending rather than the draft that just left,
+and so does its section snapshot, so the next draft is not diffed against
+this one (section_diff.py).
 """
 
-import os
 from datetime import date, timedelta
 
 
@@ -46,8 +49,10 @@ def build_html(next_date):
 
 
 if __name__ == "__main__":
-    os.makedirs("blog/staging", exist_ok=True)
+    from atomic_write import publish, remove, write_text
     next_date = next_generation_date()
-    with open("blog/staging/preview.html", "w", encoding="utf-8") as f:
-        f.write(build_html(next_date))
+    with publish():
+        write_text("blog/staging/preview.html", build_html(next_date))
+        remove("blog/staging/preview.json")
+        remove("blog/staging/sections.json")
     print(f"Wrote 'nothing pending' placeholder — next generation: {next_date}")